@@ -9,6 +9,7 @@ __author__ = "Multi-Tool Platform Team"
 
 from .models import PromptTemplate, PromptComponent, PromptVersion
 from .service import PromptMakerService
+from .async_service import AsyncPromptMakerService
 from .prompt_generator import PromptGenerator
 
 __all__ = [
@@ -16,5 +17,6 @@ __all__ = [
     'PromptComponent',
     'PromptVersion',
     'PromptMakerService',
+    'AsyncPromptMakerService',
     'PromptGenerator'
 ]
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Async Prompt Maker Service
+
+asyncio 기반 서비스에서 PromptMakerService를 쓰기 위한 비동기 래퍼
+
+파일 I/O가 있는 작업은 크기가 제한된 스레드 풀에서 실행하므로 느린 디스크
+읽기가 이벤트 루프를 막지 않습니다. 저장 형식과 검증 규칙은 감싼 동기 서비스를
+그대로 쓰므로 동기 서비스와 같은 디렉토리를 함께 사용할 수 있습니다.
+
+    async with await AsyncPromptMakerService.create(templates_dir="...") as service:
+        template = await service.load_template(template_id)
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+
+from .models import PromptTemplate
+from .service import PromptMakerService
+from . import pagination
+
+
+class AsyncPromptMakerService:
+    """PromptMakerService 비동기 래퍼
+
+    같은 템플릿 ID를 동시에 로드하면 파일은 한 번만 읽고 결과를 함께 돌려줍니다.
+    하나의 이벤트 루프에서 사용해야 합니다.
+    """
+
+    def __init__(self, service: Optional[PromptMakerService] = None, max_workers: int = 4,
+                 **service_kwargs):
+        """비동기 서비스 초기화
+
+        Args:
+            service: 감쌀 동기 서비스 (None이면 service_kwargs로 생성, 생성 중 파일 I/O가
+                있으므로 이벤트 루프 안에서는 create()를 사용)
+            max_workers: 파일 I/O를 실행할 최대 스레드 수
+            **service_kwargs: PromptMakerService 생성 인자
+
+        Raises:
+            ValueError: max_workers가 1보다 작은 경우
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1: {max_workers}")
+
+        self.service = service if service is not None else PromptMakerService(**service_kwargs)
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prompt-maker-io")
+
+        # 진행 중인 로드 (template_id -> Future), 같은 ID의 동시 로드를 하나로 합침
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._closed = False
+
+    @classmethod
+    async def create(cls, max_workers: int = 4, **service_kwargs) -> "AsyncPromptMakerService":
+        """동기 서비스 생성(설정 확인, 캐시 예열)을 스레드 풀에서 실행해 비동기 서비스 생성"""
+        loop = asyncio.get_running_loop()
+        service = await loop.run_in_executor(None, functools.partial(PromptMakerService, **service_kwargs))
+        return cls(service, max_workers=max_workers)
+
+    async def __aenter__(self) -> "AsyncPromptMakerService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """진행 중인 작업을 마치고 스레드 풀 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """동기 서비스 메서드를 스레드 풀에서 실행"""
+        if self._closed:
+            raise RuntimeError("AsyncPromptMakerService is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def _threadsafe_progress(self, progress: Optional[Callable[[int, int], None]]
+                             ) -> Optional[Callable[[int, int], None]]:
+        """작업 스레드에서 보고한 진행 상황을 이벤트 루프에서 호출하도록 감쌈"""
+        if progress is None:
+            return None
+        loop = asyncio.get_running_loop()
+        return lambda done, total: loop.call_soon_threadsafe(progress, done, total)
+
+    async def load_template(self, template_id: str) -> Optional[PromptTemplate]:
+        """템플릿 로드 (PromptMakerService.load_template 참고)
+
+        같은 ID의 로드가 진행 중이면 새로 읽지 않고 그 결과를 기다립니다. 기다리던
+        호출이 취소되어도 다른 호출자를 위한 로드는 계속됩니다.
+        """
+        future = self._loading.get(template_id)
+        if future is None:
+            future = asyncio.ensure_future(self._run(self.service.load_template, template_id))
+            self._loading[template_id] = future
+            future.add_done_callback(functools.partial(self._finish_load, template_id))
+        return await asyncio.shield(future)
+
+    def _finish_load(self, template_id: str, future: asyncio.Future):
+        if self._loading.get(template_id) is future:
+            del self._loading[template_id]
+
+    async def save_template(self, template: PromptTemplate, overwrite: bool = True,
+                            change: Optional[Dict[str, Any]] = None) -> bool:
+        """템플릿 저장 (PromptMakerService.save_template 참고)"""
+        return await self._run(self.service.save_template, template, overwrite, change)
+
+    async def delete_template(self, template_id: str) -> bool:
+        """템플릿 삭제 (PromptMakerService.delete_template 참고)"""
+        return await self._run(self.service.delete_template, template_id)
+
+    async def list_templates(self, category: Optional[str] = None,
+                             tags: Optional[List[str]] = None, sort: str = pagination.DEFAULT_SORT,
+                             limit: Optional[int] = None, cursor: Optional[str] = None,
+                             tag_match: str = "any") -> List[Dict[str, Any]]:
+        """템플릿 목록 (PromptMakerService.list_templates 참고)"""
+        return await self._run(self.service.list_templates, category, tags, sort, limit, cursor, tag_match)
+
+    async def list_templates_page(self, category: Optional[str] = None,
+                                  tags: Optional[List[str]] = None, sort: str = pagination.DEFAULT_SORT,
+                                  limit: Optional[int] = 50, cursor: Optional[str] = None,
+                                  tag_match: str = "any") -> Dict[str, Any]:
+        """템플릿 목록 한 페이지 (PromptMakerService.list_templates_page 참고)"""
+        return await self._run(self.service.list_templates_page, category, tags, sort, limit, cursor, tag_match)
+
+    async def get_tag_counts(self, category: Optional[str] = None) -> Dict[str, int]:
+        """태그별 템플릿 수 (PromptMakerService.get_tag_counts 참고)"""
+        return await self._run(self.service.get_tag_counts, category)
+
+    async def search_templates(self, query: str, current_versions_only: bool = True) -> List[Dict[str, Any]]:
+        """템플릿 검색 (PromptMakerService.search_templates 참고)"""
+        return await self._run(self.service.search_templates, query, current_versions_only)
+
+    async def import_templates(self, source: Union[str, Path, BinaryIO], overwrite: bool = False,
+                               workers: Optional[int] = None, batch_size: int = 500) -> Dict[str, Any]:
+        """템플릿 일괄 가져오기 (PromptMakerService.import_templates 참고)
+
+        파일 객체를 넘기면 작업 스레드에서 읽습니다.
+        """
+        return await self._run(self.service.import_templates, source, overwrite, workers, batch_size)
+
+    async def export_templates(self, destination: Union[str, Path, BinaryIO], export_format: str = "jsonl",
+                               category: Optional[str] = None, tags: Optional[List[str]] = None,
+                               updated_after: Union[datetime, str, None] = None,
+                               updated_before: Union[datetime, str, None] = None,
+                               member_format: str = "json", include_all_versions: bool = False,
+                               progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """템플릿 일괄 내보내기 (PromptMakerService.export_templates 참고)
+
+        progress는 이벤트 루프 스레드에서 호출됩니다.
+        """
+        return await self._run(
+            self.service.export_templates, destination, export_format, category, tags,
+            updated_after, updated_before, member_format, include_all_versions,
+            self._threadsafe_progress(progress)
+        )
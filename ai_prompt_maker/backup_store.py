@@ -0,0 +1,310 @@
+"""
+Backup Store
+
+삭제된 템플릿을 내용 해시로 주소를 매긴 압축 블롭으로 보관하는 백업 저장소
+
+    backup/
+    ├── index.json              # template_id -> 백업 세대 목록
+    └── objects/ab/<sha256>.gz  # gzip으로 압축한 템플릿 파일 내용
+
+같은 내용은 블롭 하나만 저장하므로 같은 템플릿을 다시 삭제해도 추가 용량이 들지
+않습니다. 보관 정책(세대 수, 보관 기간)을 벗어난 세대는 정리 시 인덱스에서 빠지고,
+어느 세대도 참조하지 않는 블롭은 삭제됩니다.
+"""
+import gzip
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .file_lock import atomic_write, index_lock
+
+
+# 이전 방식의 타임스탬프 백업 파일 (<template_id>_YYYYmmdd_HHMMSS.json)
+_LEGACY_NAME = re.compile(r"^(?P<id>.+)_(?P<ts>\d{8}_\d{6})\.json$")
+
+
+class BackupStore:
+    """내용 주소 기반 압축 백업 저장소
+
+    인덱스는 디렉토리 색인 잠금(file_lock.index_lock)을 잡고 디스크에서 다시 읽은 뒤
+    원자적으로 교체하므로 여러 프로세스가 같은 백업 디렉토리를 공유할 수 있습니다.
+    """
+
+    INDEX_FILENAME = "index.json"
+    OBJECTS_DIR = "objects"
+    FORMAT_VERSION = 1
+    COMPRESS_LEVEL = 6
+
+    def __init__(self, root: Path, keep_generations: Optional[int] = 10,
+                 max_age_days: Optional[float] = None, fsync: bool = False):
+        """백업 저장소 초기화
+
+        Args:
+            root: 백업 디렉토리
+            keep_generations: 템플릿별로 보관할 최대 세대 수 (None이면 제한 없음)
+            max_age_days: 세대 보관 기간(일) (None이면 제한 없음)
+            fsync: 블롭/인덱스를 쓸 때 디스크에 동기화할지 여부
+        """
+        if keep_generations is not None and keep_generations < 1:
+            raise ValueError("keep_generations must be at least 1")
+        if max_age_days is not None and max_age_days < 0:
+            raise ValueError("max_age_days must not be negative")
+
+        self.root = Path(root)
+        self.index_path = self.root / self.INDEX_FILENAME
+        self.keep_generations = keep_generations
+        self.max_age_days = max_age_days
+        self.fsync = fsync
+
+    def add(self, template_id: str, data: bytes, name: Optional[str] = None) -> int:
+        """템플릿 파일 내용을 백업하고 세대 번호 반환
+
+        최신 세대와 내용이 같으면 새 세대를 만들지 않고 삭제 시각만 갱신합니다.
+
+        Args:
+            template_id: 템플릿 ID
+            data: 템플릿 파일 내용
+            name: 목록 표시용 템플릿 이름 (선택)
+
+        Returns:
+            백업 세대 번호
+        """
+        digest = hashlib.sha256(data).hexdigest()
+
+        # 다른 프로세스의 정리가 인덱스에 오르기 전 블롭을 지우지 않도록 잠금 안에서 기록
+        with index_lock(self.root):
+            self._write_blob(digest, data)
+            index = self._read_index()
+            generations = index.setdefault(template_id, [])
+            now = datetime.now().isoformat()
+
+            if generations and generations[-1]["hash"] == digest:
+                generations[-1]["deleted_at"] = now
+                generation = generations[-1]["generation"]
+            else:
+                generation = generations[-1]["generation"] + 1 if generations else 1
+                generations.append({
+                    "generation": generation,
+                    "hash": digest,
+                    "size": len(data),
+                    "name": name,
+                    "deleted_at": now,
+                })
+
+            # 이 템플릿에 보관 정책 적용 (방금 만든 세대는 항상 유지)
+            dropped = self._apply_retention(generations, datetime.now(), keep_latest=True)
+            if not generations:
+                del index[template_id]
+            self._write_index(index)
+            self._remove_unreferenced(index, dropped)
+
+        return generation
+
+    def get(self, template_id: str, generation: Optional[int] = None) -> Optional[bytes]:
+        """백업된 템플릿 파일 내용
+
+        Args:
+            template_id: 템플릿 ID
+            generation: 세대 번호 (None이면 최신 세대)
+
+        Returns:
+            파일 내용 또는 None (백업이 없는 경우)
+
+        Raises:
+            ValueError: 블롭이 손상된 경우
+        """
+        entry = self._find(self._read_index().get(template_id, []), generation)
+        if entry is None:
+            return None
+
+        try:
+            data = gzip.decompress(self._blob_path(entry["hash"]).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError) as e:
+            raise ValueError(f"Backup blob is corrupt ({template_id}#{entry['generation']}): {e}")
+
+        if hashlib.sha256(data).hexdigest() != entry["hash"]:
+            raise ValueError(f"Backup blob hash mismatch ({template_id}#{entry['generation']})")
+        return data
+
+    def list_generations(self, template_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """백업 세대 목록 (최신 삭제가 먼저)
+
+        Args:
+            template_id: 특정 템플릿만 조회 (None이면 전체)
+        """
+        index = self._read_index()
+        ids = [template_id] if template_id is not None else list(index)
+
+        result = [
+            {"template_id": tid, **entry}
+            for tid in ids
+            for entry in index.get(tid, [])
+        ]
+        result.sort(key=lambda e: e["deleted_at"], reverse=True)
+        return result
+
+    def prune(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """보관 정책 적용, 이전 방식 백업 파일 가져오기, 참조 없는 블롭 삭제
+
+        Args:
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            {"imported": int, "generations_removed": int, "blobs_removed": int, "bytes_freed": int}
+        """
+        now = now or datetime.now()
+        result = {"imported": 0, "generations_removed": 0, "blobs_removed": 0, "bytes_freed": 0}
+
+        with index_lock(self.root):
+            index = self._read_index()
+            result["imported"] = self._import_legacy(index)
+
+            dropped: Set[str] = set()
+            for template_id in list(index):
+                generations = index[template_id]
+                before = len(generations)
+                dropped |= self._apply_retention(generations, now)
+                result["generations_removed"] += before - len(generations)
+                if not generations:
+                    del index[template_id]
+
+            self._write_index(index)
+
+            # 인덱스가 참조하지 않는 모든 블롭 (중단된 이전 정리의 잔여물 포함)
+            objects_dir = self.root / self.OBJECTS_DIR
+            if objects_dir.exists():
+                dropped |= {blob.name[:-len(".gz")] for blob in objects_dir.glob("*/*.gz")}
+            removed, freed = self._remove_unreferenced(index, dropped)
+            result["blobs_removed"] = removed
+            result["bytes_freed"] = freed
+
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """백업 통계 (세대 수, 블롭 수, 원본/압축 바이트)"""
+        index = self._read_index()
+        hashes = {entry["hash"]: entry["size"] for entries in index.values() for entry in entries}
+
+        stored = 0
+        for digest in hashes:
+            try:
+                stored += self._blob_path(digest).stat().st_size
+            except OSError:
+                pass
+
+        return {
+            "templates": len(index),
+            "generations": sum(len(entries) for entries in index.values()),
+            "blobs": len(hashes),
+            "original_bytes": sum(hashes.values()),
+            "stored_bytes": stored,
+        }
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / self.OBJECTS_DIR / digest[:2] / f"{digest}.gz"
+
+    def _write_blob(self, digest: str, data: bytes):
+        """블롭이 없을 때만 압축해 저장 (같은 내용은 한 번만 저장)"""
+        path = self._blob_path(digest)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # mtime=0으로 같은 내용이 항상 같은 압축 결과가 되도록 함
+        atomic_write(path, gzip.compress(data, self.COMPRESS_LEVEL, mtime=0), fsync=self.fsync)
+
+    def _read_index(self) -> Dict[str, List[Dict[str, Any]]]:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            print(f"백업 인덱스 읽기 실패: {e}")
+            return {}
+        if not isinstance(data, dict) or not isinstance(data.get("templates"), dict):
+            return {}
+        return data["templates"]
+
+    def _write_index(self, index: Dict[str, List[Dict[str, Any]]]):
+        """인덱스 원자적 교체 (색인 잠금은 호출자가 관리)"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(
+            {"format": self.FORMAT_VERSION, "templates": index}, ensure_ascii=False, indent=1
+        )
+        atomic_write(self.index_path, data.encode("utf-8"), fsync=self.fsync)
+
+    @staticmethod
+    def _find(generations: List[Dict[str, Any]], generation: Optional[int]) -> Optional[Dict[str, Any]]:
+        if not generations:
+            return None
+        if generation is None:
+            return generations[-1]
+        return next((entry for entry in generations if entry["generation"] == generation), None)
+
+    def _apply_retention(self, generations: List[Dict[str, Any]], now: datetime,
+                         keep_latest: bool = False) -> Set[str]:
+        """보관 정책을 벗어난 세대를 제거하고 제거된 세대의 블롭 해시 반환"""
+        keep = list(generations)
+
+        if self.max_age_days is not None:
+            cutoff = (now - timedelta(days=self.max_age_days)).isoformat()
+            latest = keep[-1] if keep else None
+            keep = [entry for entry in keep
+                    if entry["deleted_at"] >= cutoff or (keep_latest and entry is latest)]
+
+        if self.keep_generations is not None and len(keep) > self.keep_generations:
+            keep = keep[-self.keep_generations:]
+
+        dropped = {entry["hash"] for entry in generations if entry not in keep}
+        generations[:] = keep
+        return dropped
+
+    def _remove_unreferenced(self, index: Dict[str, List[Dict[str, Any]]],
+                             candidates: Set[str]) -> tuple:
+        """후보 중 어느 세대도 참조하지 않는 블롭 삭제 (삭제 수, 해제 바이트)"""
+        referenced = {entry["hash"] for entries in index.values() for entry in entries}
+        removed = freed = 0
+
+        for digest in candidates - referenced:
+            path = self._blob_path(digest)
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+            freed += size
+
+        return removed, freed
+
+    def _import_legacy(self, index: Dict[str, List[Dict[str, Any]]]) -> int:
+        """이전 방식의 타임스탬프 백업 파일을 블롭으로 옮김 (색인 잠금은 호출자가 관리)"""
+        legacy = []
+        for path in self.root.glob("*.json"):
+            match = _LEGACY_NAME.match(path.name)
+            if match and path.name != self.INDEX_FILENAME:
+                deleted_at = datetime.strptime(match.group("ts"), "%Y%m%d_%H%M%S").isoformat()
+                legacy.append((deleted_at, match.group("id"), path))
+
+        for deleted_at, template_id, path in sorted(legacy):
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            self._write_blob(digest, data)
+
+            generations = index.setdefault(template_id, [])
+            # 인덱스 안에서는 삭제 시각 순서를 유지
+            generations.append({
+                "generation": max((e["generation"] for e in generations), default=0) + 1,
+                "hash": digest,
+                "size": len(data),
+                "name": None,
+                "deleted_at": deleted_at,
+            })
+            generations.sort(key=lambda e: e["deleted_at"])
+            path.unlink()
+
+        return len(legacy)
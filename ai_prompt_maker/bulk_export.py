@@ -0,0 +1,195 @@
+"""
+Bulk Export
+
+템플릿 전체(또는 필터로 고른 일부)를 하나의 파일로 스트리밍 내보내는 도구
+
+- jsonl: 한 줄에 템플릿 JSON 하나 (`import_templates`로 다시 가져올 수 있음)
+- zip: 템플릿마다 JSON(<id>.json) 또는 Markdown(<id>.md) 항목 하나
+- text: 모든 템플릿의 텍스트 내보내기를 이어 붙인 파일
+
+작성기는 템플릿을 하나 받을 때마다 바로 기록하므로 메모리 사용량은 템플릿
+하나 크기로 제한됩니다. 템플릿 목록 조회와 로드는 서비스
+(`PromptMakerService.export_templates`)가 수행합니다.
+"""
+import json
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+from .export_service import components_to_markdown
+from .models import PromptTemplate
+
+
+EXPORT_FORMATS = ("jsonl", "zip", "text")
+ZIP_MEMBER_FORMATS = ("json", "markdown")
+
+_SEPARATOR = "=" * 80
+
+
+def template_to_text(template: PromptTemplate, include_all_versions: bool = False) -> str:
+    """템플릿을 텍스트로 변환
+
+    Args:
+        template: 템플릿
+        include_all_versions: 모든 버전 포함 여부 (False면 현재 버전만)
+    """
+    export_lines = []
+    export_lines.append(f"템플릿 이름: {template.name}")
+    export_lines.append(f"카테고리: {template.category.value}")
+    export_lines.append(f"태그: {', '.join(template.tags)}")
+    export_lines.append(_SEPARATOR)
+    export_lines.append("")
+
+    if include_all_versions:
+        # 모든 버전 포함
+        for version in template.versions:
+            export_lines.append(f"버전 {version.version}")
+            if version.description:
+                export_lines.append(f"설명: {version.description}")
+            export_lines.append(f"생성일: {version.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            export_lines.append("-" * 80)
+            export_lines.append(version.generated_prompt)
+            export_lines.append("")
+            export_lines.append(_SEPARATOR)
+            export_lines.append("")
+    else:
+        # 현재 버전만
+        current_version = template.get_current_version()
+        if current_version:
+            export_lines.append(f"버전 {current_version.version} (현재)")
+            if current_version.description:
+                export_lines.append(f"설명: {current_version.description}")
+            export_lines.append(f"생성일: {current_version.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            export_lines.append("-" * 80)
+            export_lines.append(current_version.generated_prompt)
+
+    return "\n".join(export_lines)
+
+
+def template_to_markdown(template: PromptTemplate) -> str:
+    """템플릿의 현재 버전을 Markdown으로 변환 (메타데이터 + 컴포넌트 섹션)"""
+    lines = [
+        f"<!-- template_id: {template.template_id} -->",
+        f"**템플릿**: {template.name}  ",
+        f"**카테고리**: {template.category.value}  ",
+        f"**태그**: {', '.join(template.tags)}",
+        "",
+    ]
+
+    current_version = template.get_current_version()
+    if current_version:
+        lines.append(f"**버전**: {current_version.version} "
+                     f"({current_version.created_at.strftime('%Y-%m-%d %H:%M:%S')})")
+        lines.append("")
+        lines.append(components_to_markdown(current_version.components))
+
+    return "\n".join(lines)
+
+
+def normalize_timestamp(value: Union[datetime, str, None]) -> Optional[str]:
+    """날짜 필터 값을 요약의 ISO 형식 문자열과 비교할 수 있도록 변환"""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+class TemplateExportWriter:
+    """템플릿을 하나씩 기록하는 스트리밍 작성기
+
+    경로를 받으면 파일을 직접 열고 닫으며, 스트림을 받으면 닫지 않습니다.
+    """
+
+    def __init__(self, destination: Union[str, Path, BinaryIO], export_format: str = "jsonl",
+                 member_format: str = "json", include_all_versions: bool = False):
+        """작성기 초기화
+
+        Args:
+            destination: 출력 파일 경로 또는 바이너리 스트림
+            export_format: EXPORT_FORMATS 중 하나
+            member_format: zip 항목 형식 (ZIP_MEMBER_FORMATS 중 하나)
+            include_all_versions: text 형식에서 모든 버전 포함 여부
+
+        Raises:
+            ValueError: 지원하지 않는 형식
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format} (expected one of {EXPORT_FORMATS})")
+        if member_format not in ZIP_MEMBER_FORMATS:
+            raise ValueError(f"Unsupported zip member format: {member_format} (expected one of {ZIP_MEMBER_FORMATS})")
+
+        self.export_format = export_format
+        self.member_format = member_format
+        self.include_all_versions = include_all_versions
+        self.count = 0
+        self.bytes_written = 0
+
+        if isinstance(destination, (str, Path)):
+            self._stream = open(destination, "wb")
+            self._owns_stream = True
+        else:
+            self._stream = destination
+            self._owns_stream = False
+
+        # 탐색할 수 없는 스트림에도 데이터 기술자 방식으로 기록됨
+        self._archive = (
+            zipfile.ZipFile(self._stream, "w", compression=zipfile.ZIP_DEFLATED)
+            if export_format == "zip" else None
+        )
+
+    def write(self, template: PromptTemplate):
+        """템플릿 하나를 기록"""
+        if self._archive is not None:
+            if self.member_format == "json":
+                name, data = f"{template.template_id}.json", template.to_json()
+            else:
+                name, data = f"{template.template_id}.md", template_to_markdown(template)
+            encoded = data.encode("utf-8")
+            self._archive.writestr(name, encoded)
+        else:
+            if self.export_format == "jsonl":
+                data = json.dumps(template.to_dict(), ensure_ascii=False) + "\n"
+            else:
+                data = template_to_text(template, self.include_all_versions) + "\n\n"
+                if self.count:
+                    data = f"\n{_SEPARATOR}\n\n" + data
+            encoded = data.encode("utf-8")
+            self._stream.write(encoded)
+
+        self.count += 1
+        self.bytes_written += len(encoded)
+
+    def close(self):
+        """ZIP 중앙 디렉토리를 기록하고 직접 연 파일을 닫음"""
+        try:
+            if self._archive is not None:
+                self._archive.close()
+            self._stream.flush()
+        finally:
+            if self._owns_stream:
+                self._stream.close()
+
+    def __enter__(self) -> "TemplateExportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def filter_by_date(summaries: List[Dict[str, Any]], updated_after: Union[datetime, str, None] = None,
+                   updated_before: Union[datetime, str, None] = None) -> List[Dict[str, Any]]:
+    """수정 시각 범위로 템플릿 요약 필터링 (경계 포함)"""
+    after = normalize_timestamp(updated_after)
+    before = normalize_timestamp(updated_before)
+    if after is None and before is None:
+        return summaries
+
+    result = []
+    for summary in summaries:
+        updated_at = summary.get("updated_at") or ""
+        if after is not None and updated_at < after:
+            continue
+        if before is not None and updated_at > before:
+            continue
+        result.append(summary)
+    return result
@@ -0,0 +1,203 @@
+"""
+Bulk Import
+
+JSONL 또는 ZIP 템플릿 아카이브를 스트리밍으로 읽어 검증하는 일괄 가져오기 도구
+
+- JSONL: 한 줄에 템플릿 JSON 하나 (`PromptTemplate.to_dict()` 형식)
+- ZIP: 템플릿 파일(*.json, 헤더 우선/gzip 형식 포함) 또는 JSONL(*.jsonl) 항목
+
+레코드는 일정 개수씩 묶어 읽고, 각 묶음을 작업자 프로세스에서 전체 검증한 뒤
+검증된 딕셔너리만 돌려받으므로 메모리 사용량은 묶음 크기로 제한됩니다.
+작업자는 spawn 방식으로 시작하고(스레드가 있는 프로세스를 fork하면 잠금이 복사되어
+멈출 수 있음), 읽은 레코드가 PARALLEL_MIN_RECORDS개가 될 때까지는 현재 프로세스에서
+검증하므로 작은 가져오기는 작업자를 만들지 않습니다.
+저장은 서비스(`PromptMakerService.import_templates`)가 묶음 단위로 수행합니다.
+"""
+import gzip
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, List, Optional, Tuple, Union
+
+from . import template_io
+
+
+MAX_RECORD_SIZE = 1_000_000  # PromptTemplate.from_json 크기 제한과 동일
+MAX_DECOMPRESSED_SIZE = 16 * MAX_RECORD_SIZE  # 압축된 템플릿 파일을 풀었을 때의 상한
+
+# 작업자 프로세스를 쓰기 시작하는 누적 레코드 수 (spawn 작업자는 인터프리터와 패키지를
+# 새로 import하므로 이보다 적으면 현재 프로세스에서 검증하는 편이 빠름)
+PARALLEL_MIN_RECORDS = 5000
+_ZIP_MAGIC = b"PK\x03\x04"
+
+# 보고서 상태
+ACCEPTED = "accepted"
+REJECTED = "rejected"
+DUPLICATE = "duplicate"
+
+
+def iter_records(source: Union[str, Path, BinaryIO]) -> Iterator[Tuple[str, Optional[bytes], Optional[str]]]:
+    """아카이브의 레코드를 하나씩 읽기 (형식 자동 감지)
+
+    Args:
+        source: 파일 경로 또는 바이너리 스트림 (JSONL 또는 ZIP)
+
+    Yields:
+        (위치, 레코드 바이트, 오류) - 읽기 단계에서 거부된 레코드는 바이트가 None
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            yield from iter_records(f)
+        return
+
+    head = source.read(len(_ZIP_MAGIC))
+    if head == _ZIP_MAGIC:
+        yield from _iter_zip(head, source)
+    else:
+        yield from _iter_lines(source, _to_bytes(head))
+
+
+def _to_bytes(data: Union[bytes, str]) -> bytes:
+    # 텍스트 스트림도 JSONL로 받을 수 있도록 변환
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def _iter_lines(stream, head: bytes = b"", prefix: str = ""):
+    """JSONL 줄 단위 읽기 (너무 긴 줄은 끝까지 건너뛰고 거부)"""
+    number = 0
+    while True:
+        line = head + _to_bytes(stream.readline(MAX_RECORD_SIZE + 1))
+        head = b""
+        if not line:
+            return
+        number += 1
+        where = f"{prefix}line {number}"
+
+        if len(line) > MAX_RECORD_SIZE:
+            # 줄의 나머지를 버림
+            while line and not line.endswith(b"\n"):
+                line = _to_bytes(stream.readline(MAX_RECORD_SIZE))
+            yield where, None, f"Record too large (> {MAX_RECORD_SIZE} bytes)"
+            continue
+
+        line = line.strip()
+        if line:
+            yield where, line, None
+
+
+def _iter_zip(head: bytes, stream: BinaryIO):
+    """ZIP 항목 읽기 (탐색할 수 없는 스트림은 임시 파일에 옮긴 뒤 읽음)"""
+    spooled = None
+    try:
+        if stream.seekable():
+            stream.seek(-len(head), os.SEEK_CUR)
+            archive_file = stream
+        else:
+            spooled = tempfile.TemporaryFile()
+            spooled.write(head)
+            shutil.copyfileobj(stream, spooled)
+            spooled.seek(0)
+            archive_file = spooled
+
+        with zipfile.ZipFile(archive_file) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                name = info.filename
+                if name.endswith(".jsonl"):
+                    with archive.open(info) as member:
+                        yield from _iter_lines(member, prefix=f"{name}: ")
+                elif name.endswith(".json"):
+                    if info.file_size > MAX_RECORD_SIZE:
+                        yield name, None, f"Record too large ({info.file_size} > {MAX_RECORD_SIZE} bytes)"
+                        continue
+                    with archive.open(info) as member:
+                        yield name, member.read(MAX_RECORD_SIZE + 1), None
+    finally:
+        if spooled is not None:
+            spooled.close()
+
+
+def parse_record(data: bytes) -> Tuple[str, Any]:
+    """레코드 하나를 전체 검증 (작업자 프로세스에서 실행)
+
+    Returns:
+        (ACCEPTED, 검증된 템플릿 딕셔너리) 또는 (REJECTED, 오류 메시지)
+    """
+    try:
+        if template_io.detect_compression(data) == "gzip":
+            # 압축 폭탄을 막기 위해 상한까지만 풀어봄
+            with gzip.GzipFile(fileobj=io.BytesIO(data)) as f:
+                data = f.read(MAX_DECOMPRESSED_SIZE + 1)
+            if len(data) > MAX_DECOMPRESSED_SIZE:
+                raise ValueError(f"Decompressed record too large (> {MAX_DECOMPRESSED_SIZE} bytes)")
+
+        template = template_io.loads_template(data)
+        # 헤더 우선 파일의 지연 목록도 모든 버전을 만들어 버전 본문까지 검증
+        versions = [version.to_dict() for version in template.versions]
+        result = template.to_dict()
+        result["versions"] = versions
+        return ACCEPTED, result
+    except Exception as e:
+        return REJECTED, f"{type(e).__name__}: {e}"
+
+
+def validate_batches(records: Iterator[Tuple[str, Optional[bytes], Optional[str]]],
+                     batch_size: int = 500, workers: Optional[int] = None,
+                     parallel_threshold: Optional[int] = None
+                     ) -> Iterator[List[Tuple[str, str, Any]]]:
+    """레코드를 묶음 단위로 병렬 검증
+
+    Args:
+        records: iter_records() 결과
+        batch_size: 한 번에 읽고 검증할 레코드 수 (메모리 사용량 상한)
+        workers: 작업자 프로세스 수 (None이면 CPU 수, 1 이하이면 현재 프로세스에서 검증)
+        parallel_threshold: 읽은 레코드가 이만큼 될 때까지는 현재 프로세스에서 검증
+            (None이면 PARALLEL_MIN_RECORDS)
+
+    Yields:
+        [(위치, 상태, 템플릿 딕셔너리 또는 오류 메시지), ...] 묶음
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if parallel_threshold is None:
+        parallel_threshold = PARALLEL_MIN_RECORDS
+
+    executor: Optional[ProcessPoolExecutor] = None
+    read = 0
+    try:
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                return
+
+            read += len(batch)
+            if executor is None and workers > 1 and read >= parallel_threshold:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+
+            datas = [data for _, data, _ in batch if data is not None]
+            if executor is not None:
+                chunksize = max(1, len(datas) // (workers * 4))
+                parsed = iter(executor.map(parse_record, datas, chunksize=chunksize))
+            else:
+                parsed = iter(map(parse_record, datas))
+
+            results = []
+            for where, data, error in batch:
+                if data is None:
+                    results.append((where, REJECTED, error))
+                else:
+                    status, payload = next(parsed)
+                    results.append((where, status, payload))
+            yield results
+    finally:
+        if executor is not None:
+            executor.shutdown()
@@ -0,0 +1,285 @@
+"""
+Template Cache
+
+항목 수와 추정 메모리 크기로 제한되는 템플릿 캐시 (교체 정책 선택 가능)
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from .models import PromptTemplate, LazyVersionList
+
+
+class EvictionPolicy:
+    """캐시 교체 정책 인터페이스"""
+
+    def on_insert(self, key: Hashable):
+        raise NotImplementedError
+
+    def on_access(self, key: Hashable):
+        raise NotImplementedError
+
+    def on_remove(self, key: Hashable):
+        raise NotImplementedError
+
+    def victim(self) -> Hashable:
+        """다음에 내보낼 키"""
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class LRUPolicy(EvictionPolicy):
+    """가장 오래 사용되지 않은 항목부터 교체"""
+
+    def __init__(self):
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def on_insert(self, key: Hashable):
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def on_access(self, key: Hashable):
+        self._order.move_to_end(key)
+
+    def on_remove(self, key: Hashable):
+        self._order.pop(key, None)
+
+    def victim(self) -> Hashable:
+        return next(iter(self._order))
+
+    def clear(self):
+        self._order.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """사용 빈도가 가장 낮은 항목부터 교체 (같은 빈도에서는 LRU)
+
+    빈도별 버킷을 유지해 모든 연산이 O(1)입니다.
+    """
+
+    def __init__(self):
+        self._freq: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_freq = 0
+
+    def on_insert(self, key: Hashable):
+        self.on_remove(key)
+        self._freq[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def on_access(self, key: Hashable):
+        freq = self._freq.get(key)
+        if freq is None:
+            return
+
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def on_remove(self, key: Hashable):
+        freq = self._freq.pop(key, None)
+        if freq is None:
+            return
+
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = min(self._buckets) if self._buckets else 0
+
+    def victim(self) -> Hashable:
+        return next(iter(self._buckets[self._min_freq]))
+
+    def clear(self):
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+
+EVICTION_POLICIES = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+}
+
+
+def estimate_template_size(template: PromptTemplate) -> int:
+    """템플릿이 차지하는 메모리 추정치 (바이트)
+
+    문자열 길이 기반의 근사값이며 한글 문자는 2바이트로 계산합니다.
+    지연 버전 목록은 아직 생성되지 않은 버전을 원본 크기로 계산합니다.
+    """
+    size = 512 + 2 * (len(template.name) + sum(len(tag) for tag in template.tags))
+
+    versions = template.versions
+    if isinstance(versions, LazyVersionList):
+        size += versions.estimated_size()
+        versions = [versions[i] for i in range(len(versions)) if versions.is_materialized(i)]
+
+    for version in versions:
+        components = version.components
+        text_length = (
+            len(version.generated_prompt) + len(version.description)
+            + len(components.goal) + len(components.document) + len(components.output)
+            + sum(len(item) for item in components.role)
+            + sum(len(item) for item in components.context)
+            + sum(len(item) for item in components.rule)
+        )
+        size += 256 + 2 * text_length
+
+    return size
+
+
+class TemplateCache:
+    """항목 수와 추정 바이트 수로 제한되는 캐시
+
+    `dict`와 비슷한 인터페이스를 제공하며, `get()`과 `[]` 조회만 적중/실패로 집계합니다
+    (`in` 검사는 집계하지 않음).
+
+    여러 스레드에서 함께 쓸 수 있습니다. 조회도 교체 정책의 순서를 바꾸므로 모든 연산이
+    짧은 잠금 하나를 거치며, 템플릿 크기 추정처럼 오래 걸리는 계산은 잠금 밖에서 합니다.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024,
+                 policy: str = "lru"):
+        """캐시 초기화
+
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 추정 메모리 (바이트)
+            policy: 교체 정책 ("lru" 또는 "lfu")
+        """
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("Cache limits must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy_name = policy
+        self._policy = EVICTION_POLICIES[policy]()
+
+        self._lock = threading.Lock()
+        self._data: Dict[Hashable, Any] = {}
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                raise KeyError(key)
+            self.hits += 1
+            self._policy.on_access(key)
+            return self._data[key]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.put(key, value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """조회 (적중/실패 집계)"""
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._policy.on_access(key)
+                return self._data[key]
+
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None):
+        """저장 (한도를 넘으면 교체 정책에 따라 내보냄)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            size: 추정 크기 (None이면 템플릿 기준으로 계산)
+        """
+        if size is None:
+            size = estimate_template_size(value) if isinstance(value, PromptTemplate) else 0
+
+        with self._lock:
+            self._pop(key, None)
+
+            # 단일 항목이 한도를 넘으면 캐시하지 않음
+            if size > self.max_bytes:
+                return
+
+            # 새 항목이 바로 교체 대상이 되지 않도록 먼저 공간 확보
+            while self._data and (len(self._data) >= self.max_entries
+                                  or self._bytes + size > self.max_bytes):
+                victim = self._policy.victim()
+                self._pop(victim, None)
+                self.evictions += 1
+
+            self._data[key] = value
+            self._sizes[key] = size
+            self._bytes += size
+            self._policy.on_insert(key)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목 제거 (교체로 집계하지 않음)"""
+        with self._lock:
+            return self._pop(key, default)
+
+    def _pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목 제거 (잠금은 호출자가 관리)"""
+        if key not in self._data:
+            return default
+
+        self._policy.on_remove(key)
+        self._bytes -= self._sizes.pop(key)
+        return self._data.pop(key)
+
+    def clear(self):
+        """전체 비우기 (통계는 유지)"""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._policy.clear()
+            self._bytes = 0
+
+    def keys(self):
+        with self._lock:
+            return list(self._data.keys())
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+            stats = {
+                "policy": self.policy_name,
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "evictions": self.evictions,
+            }
+        lookups = hits + misses
+        stats["hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+        return stats
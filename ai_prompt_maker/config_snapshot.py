@@ -0,0 +1,153 @@
+"""
+Config Snapshot
+
+설정 파일(data/config.json)을 한 번 읽어 미리 계산해 둔 읽기 전용 스냅샷
+
+도메인별 키워드/확장 맵, 카테고리, 활성 도메인 목록을 로드 시점에 한 번만 만들고
+(레거시 구조는 이때 game_dev 도메인으로 변환), 조회는 만들어 둔 값을 그대로
+돌려줍니다. 설정이 바뀌면 서비스가 새 스냅샷을 만들어 참조를 통째로 바꾸므로
+조회하는 쪽은 잠금 없이 항상 한 시점의 일관된 설정을 봅니다.
+
+스냅샷 안의 dict/list는 FrozenDict/FrozenList라서 dict/list처럼 읽고 비교할 수
+있지만 변경하면 TypeError가 납니다. 고쳐 쓰려면 dict(...)/list(...)로 복사합니다.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional
+
+
+DEFAULT_DOMAIN = "game_dev"
+
+# 도메인 구조가 없는 레거시 설정을 옮겨 담을 기본 도메인 정보
+LEGACY_DOMAIN_INFO = {
+    "name": "게임 개발",
+    "description": "게임 기획, 개발, QA 관련 프롬프트",
+    "icon": "🎮",
+    "enabled": True,
+}
+
+EXPANSION_KINDS = ("goal_expansions", "context_expansions", "rule_expansions")
+
+# 설정 파일을 읽을 수 없을 때 쓰는 최소 설정
+FALLBACK_CONFIG = {
+    "keywords": {
+        "role": ["게임 기획자"],
+        "goal": ["기능 분석"],
+        "context": ["신규 기능 개발"],
+        "output": ["보고서"],
+        "rule": ["상세 분석 필수"]
+    },
+    "categories": ["전체"]
+}
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only; copy it before modifying")
+
+
+class FrozenDict(dict):
+    """변경할 수 없는 dict (copy()는 일반 dict를 돌려줌)"""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self) -> Dict:
+        return dict(self)
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class FrozenList(list):
+    """변경할 수 없는 list (copy()는 일반 list를 돌려줌)"""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """JSON 값을 재귀적으로 FrozenDict/FrozenList로 변환"""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """컴파일된 설정 스냅샷
+
+    Attributes:
+        raw: 설정 파일 전체 (읽기 전용)
+        keywords: 최상위 키워드 (레거시 구조, 없으면 빈 dict)
+        categories: 카테고리 목록
+        category_set: 카테고리 포함 여부 확인용 집합
+        domains: 도메인 ID -> 도메인 설정 (레거시 구조는 game_dev 하나로 변환)
+        domain_list: 활성 도메인 요약 목록 [{'id', 'name', 'description', 'icon'}, ...]
+        mtime: 읽은 설정 파일의 수정 시간 (파일을 읽지 못했으면 None)
+        loaded_at: 스냅샷을 만든 시각 (time.monotonic)
+    """
+    raw: FrozenDict
+    keywords: FrozenDict
+    categories: FrozenList
+    category_set: FrozenSet[str]
+    domains: FrozenDict
+    domain_list: FrozenList
+    mtime: Optional[float] = None
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def compile(cls, config: Dict[str, Any], mtime: Optional[float] = None) -> "ConfigSnapshot":
+        """설정 dict에서 스냅샷 생성 (조회에 필요한 값을 모두 미리 계산)"""
+        raw = freeze(config)
+
+        if "domains" in raw:
+            domains = FrozenDict(raw.get("domains") or {})
+        else:
+            # 레거시 구조 (도메인 없음) - 자동 마이그레이션
+            legacy = dict(LEGACY_DOMAIN_INFO, keywords=raw.get("keywords", FrozenDict()))
+            for kind in EXPANSION_KINDS:
+                legacy[kind] = raw.get(kind, FrozenDict())
+            domains = FrozenDict({DEFAULT_DOMAIN: FrozenDict(legacy)})
+
+        domain_list = FrozenList(
+            FrozenDict({
+                "id": domain_id,
+                "name": domain_data.get("name", domain_id),
+                "description": domain_data.get("description", ""),
+                "icon": domain_data.get("icon", "📁"),
+            })
+            for domain_id, domain_data in domains.items()
+            if domain_data.get("enabled", True)
+        )
+
+        categories = raw.get("categories", FrozenList(["전체"]))
+        return cls(
+            raw=raw,
+            keywords=raw.get("keywords", FrozenDict()),
+            categories=categories,
+            category_set=frozenset(categories),
+            domains=domains,
+            domain_list=domain_list,
+            mtime=mtime,
+        )
+
+    def domain(self, domain_id: str) -> FrozenDict:
+        """도메인 설정 (없는 도메인이면 game_dev, 그것도 없으면 빈 dict)"""
+        config = self.domains.get(domain_id)
+        if config is None:
+            config = self.domains.get(DEFAULT_DOMAIN, FrozenDict())
+        return config
+
+    def expansions(self, domain_id: str, kind: str) -> FrozenDict:
+        """도메인의 확장 맵 (kind: goal_expansions/context_expansions/rule_expansions)"""
+        return self.domain(domain_id).get(kind, FrozenDict())
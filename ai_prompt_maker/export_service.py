@@ -13,6 +13,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 
 from .models import PromptComponent
+from .tracing import traced
 
 # 조건부 import - reportlab이 없어도 서비스는 동작
 try:
@@ -26,6 +27,56 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
 
 
+def components_to_markdown(components: PromptComponent) -> str:
+    """프롬프트 컴포넌트를 Markdown 문자열로 변환
+
+    Args:
+        components: 프롬프트 컴포넌트
+
+    Returns:
+        Markdown 형식의 문자열
+    """
+    lines = []
+
+    # 제목 (Goal)
+    lines.append(f"# {components.goal}\n")
+
+    # Role
+    if components.role:
+        lines.append("## Role")
+        for role in components.role:
+            lines.append(f"- {role}")
+        lines.append("")
+
+    # Context
+    if components.context:
+        lines.append("## Context")
+        for ctx in components.context:
+            lines.append(f"- {ctx}")
+        lines.append("")
+
+    # Document
+    if components.document:
+        lines.append("## Document")
+        lines.append(components.document)
+        lines.append("")
+
+    # Output
+    if components.output:
+        lines.append("## Output")
+        lines.append(components.output)
+        lines.append("")
+
+    # Rules
+    if components.rule:
+        lines.append("## Rules")
+        for rule in components.rule:
+            lines.append(f"- {rule}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
 class ExportError(Exception):
     """내보내기 관련 오류"""
     pass
@@ -54,6 +105,7 @@ class ExportService:
         if REPORTLAB_AVAILABLE:
             self._register_korean_font()
 
+    @traced("ExportService.export_to_markdown")
     def export_to_markdown(self, components: PromptComponent,
                           filename: str,
                           output_dir: str = ".") -> str:
@@ -89,6 +141,7 @@ class ExportService:
 
         return str(output_path)
 
+    @traced("ExportService.export_to_json")
     def export_to_json(self, components: PromptComponent,
                       filename: str,
                       output_dir: str = ".",
@@ -135,6 +188,7 @@ class ExportService:
 
         return str(output_path)
 
+    @traced("ExportService.export_to_pdf")
     def export_to_pdf(self, components: PromptComponent,
                      filename: str,
                      output_dir: str = ".") -> str:
@@ -233,45 +287,7 @@ class ExportService:
         Returns:
             Markdown 형식의 문자열
         """
-        lines = []
-
-        # 제목 (Goal)
-        lines.append(f"# {components.goal}\n")
-
-        # Role
-        if components.role:
-            lines.append("## Role")
-            for role in components.role:
-                lines.append(f"- {role}")
-            lines.append("")
-
-        # Context
-        if components.context:
-            lines.append("## Context")
-            for ctx in components.context:
-                lines.append(f"- {ctx}")
-            lines.append("")
-
-        # Document
-        if components.document:
-            lines.append("## Document")
-            lines.append(components.document)
-            lines.append("")
-
-        # Output
-        if components.output:
-            lines.append("## Output")
-            lines.append(components.output)
-            lines.append("")
-
-        # Rules
-        if components.rule:
-            lines.append("## Rules")
-            for rule in components.rule:
-                lines.append(f"- {rule}")
-            lines.append("")
-
-        return "\n".join(lines)
+        return components_to_markdown(components)
 
     def _register_korean_font(self) -> None:
         """한글 폰트 등록
@@ -0,0 +1,197 @@
+"""
+File Locks and Atomic Writes
+
+여러 프로세스(Streamlit 워커)가 같은 템플릿 디렉토리를 공유할 때 사용하는
+권고(advisory) 파일 잠금과 임시 파일 + 교체 방식의 원자적 쓰기
+
+잠금 파일은 `templates_dir/.locks/` 아래에 템플릿별(<id>.lock)과 디렉토리 색인용
+(index.lock)으로 만들어집니다. 같은 프로세스 안에서는 스레드 단위로 재진입이
+가능하며, 배타 잠금을 가진 스레드는 공유 잠금을 다시 요청할 수 있습니다.
+"""
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+LOCK_DIR = ".locks"
+INDEX_LOCK_NAME = "index"
+
+
+class LockTimeoutError(TimeoutError):
+    """잠금 대기 시간 초과"""
+    pass
+
+
+class _LockState:
+    """프로세스 안에서 잠금 파일 하나의 보유 상태"""
+
+    def __init__(self):
+        self.thread_lock = threading.RLock()
+        self.fd: Optional[int] = None
+        self.depth = 0
+        self.exclusive = False
+
+
+_states: Dict[str, _LockState] = {}
+_states_lock = threading.Lock()
+
+
+def _state_for(path: Path) -> _LockState:
+    key = os.path.abspath(path)
+    with _states_lock:
+        state = _states.get(key)
+        if state is None:
+            state = _states[key] = _LockState()
+        return state
+
+
+class FileLock:
+    """권고 파일 잠금 (컨텍스트 매니저)
+
+    같은 프로세스의 스레드끼리는 공유/배타 구분 없이 하나씩 진입하고,
+    프로세스 사이에서는 공유(읽기) 잠금을 동시에 가질 수 있습니다.
+    """
+
+    def __init__(self, path: Union[str, Path], shared: bool = False,
+                 timeout: Optional[float] = None, poll_interval: float = 0.01):
+        """잠금 초기화
+
+        Args:
+            path: 잠금 파일 경로 (없으면 생성)
+            shared: True면 공유 잠금, False면 배타 잠금
+            timeout: 최대 대기 시간(초), None이면 무제한
+            poll_interval: 제한 시간이 있을 때 재시도 간격(초)
+        """
+        self.path = Path(path)
+        self.shared = shared
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._state = _state_for(self.path)
+
+    def acquire(self):
+        """잠금 획득
+
+        Raises:
+            LockTimeoutError: 제한 시간 안에 획득하지 못한 경우
+            RuntimeError: 공유 잠금을 가진 상태에서 배타 잠금을 요청한 경우
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        state = self._state
+
+        if not state.thread_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+            raise LockTimeoutError(f"잠금 대기 시간 초과: {self.path}")
+
+        try:
+            if state.depth == 0:
+                state.fd = self._lock_file(deadline)
+                state.exclusive = not self.shared
+            elif not self.shared and not state.exclusive:
+                raise RuntimeError(f"공유 잠금을 배타 잠금으로 바꿀 수 없습니다: {self.path}")
+        except BaseException:
+            state.thread_lock.release()
+            raise
+
+        state.depth += 1
+        return self
+
+    def release(self):
+        """잠금 해제"""
+        state = self._state
+        state.depth -= 1
+        if state.depth == 0:
+            fd, state.fd = state.fd, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+        state.thread_lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def _lock_file(self, deadline: Optional[float]) -> int:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+
+        try:
+            while True:
+                try:
+                    if fcntl is not None:
+                        mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+                        fcntl.flock(fd, mode if deadline is None else mode | fcntl.LOCK_NB)
+                    else:
+                        # Windows는 공유 잠금이 없으므로 항상 배타 잠금
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                    return fd
+                except OSError:
+                    if fcntl is not None and deadline is None:
+                        raise
+                    if deadline is not None and time.monotonic() >= deadline:
+                        raise LockTimeoutError(f"잠금 대기 시간 초과: {self.path}")
+                    time.sleep(self.poll_interval)
+        except BaseException:
+            os.close(fd)
+            raise
+
+
+def template_lock(templates_dir: Union[str, Path], template_id: str, shared: bool = False,
+                  timeout: Optional[float] = None) -> FileLock:
+    """템플릿 하나에 대한 잠금 (스냅샷과 저널 파일을 함께 보호)"""
+    return FileLock(Path(templates_dir) / LOCK_DIR / f"{template_id}.lock", shared, timeout)
+
+
+def index_lock(templates_dir: Union[str, Path], shared: bool = False,
+               timeout: Optional[float] = None) -> FileLock:
+    """디렉토리 색인(매니페스트) 잠금"""
+    return FileLock(Path(templates_dir) / LOCK_DIR / f"{INDEX_LOCK_NAME}.lock", shared, timeout)
+
+
+def atomic_write(path: Union[str, Path], data: bytes, fsync: bool = False):
+    """임시 파일에 쓴 뒤 교체해 읽는 쪽이 중간 상태를 보지 않도록 저장
+
+    Args:
+        path: 대상 파일 경로
+        data: 기록할 바이트
+        fsync: True면 파일과 디렉토리를 디스크에 동기화 (전원 장애 대비)
+    """
+    path = Path(path)
+    # 프로세스/스레드마다 다른 임시 파일 이름 사용
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(str(path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -0,0 +1,136 @@
+"""
+Template Filter Index
+
+카테고리/태그 필터용 보조 색인 (카테고리 -> 템플릿 ID 집합, 태그 -> 템플릿 ID 집합)
+
+목록 필터와 태그별 개수를 템플릿 전체를 훑지 않고 집합 교집합/합집합으로
+계산합니다. 저장/삭제 때 put()/remove()로 해당 템플릿의 행만 갱신합니다.
+잠금은 없으므로 여러 스레드가 쓰면 호출자가 잠금으로 보호해야 합니다.
+"""
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+# 태그 일치 방식: "any"는 하나라도 있으면(OR), "all"은 모두 있어야(AND) 포함
+TAG_MATCHES = ("any", "all")
+
+# 필터 없음으로 취급하는 카테고리 값
+ALL_CATEGORIES = "전체"
+
+
+def check_tag_match(tag_match: str) -> str:
+    """태그 일치 방식 검증
+
+    Raises:
+        ValueError: 지원하지 않는 방식
+    """
+    if tag_match not in TAG_MATCHES:
+        raise ValueError(f"Unknown tag match: {tag_match} (expected one of {', '.join(TAG_MATCHES)})")
+    return tag_match
+
+
+class TemplateFilterIndex:
+    """카테고리/태그 보조 색인"""
+
+    def __init__(self):
+        self._categories: Dict[str, Set[str]] = {}
+        self._tags: Dict[str, Set[str]] = {}
+        # 템플릿 ID -> (카테고리, 태그) (교체/삭제 시 이전 행을 지우기 위해 보관)
+        self._rows: Dict[str, Tuple[Optional[str], Tuple[str, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, template_id: str) -> bool:
+        return template_id in self._rows
+
+    def clear(self):
+        self._categories.clear()
+        self._tags.clear()
+        self._rows.clear()
+
+    def put(self, template_id: str, category: Optional[str], tags: Iterable[str] = ()):
+        """템플릿 행 추가/교체"""
+        self.remove(template_id)
+        tags = tuple(dict.fromkeys(tags or ()))
+        self._rows[template_id] = (category, tags)
+        self._categories.setdefault(category, set()).add(template_id)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(template_id)
+
+    def remove(self, template_id: str):
+        """템플릿 행 삭제 (없으면 무시)"""
+        row = self._rows.pop(template_id, None)
+        if row is None:
+            return
+        category, tags = row
+        self._discard(self._categories, category, template_id)
+        for tag in tags:
+            self._discard(self._tags, tag, template_id)
+
+    @staticmethod
+    def _discard(index: Dict[Optional[str], Set[str]], key: Optional[str], template_id: str):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(template_id)
+            if not ids:
+                del index[key]
+
+    def select(self, category: Optional[str] = None, tags: Optional[Iterable[str]] = None,
+               tag_match: str = "any") -> Optional[Set[str]]:
+        """필터에 맞는 템플릿 ID 집합
+
+        Args:
+            category: 카테고리 필터 ("전체" 또는 None이면 필터 없음)
+            tags: 태그 필터 (비어 있으면 필터 없음)
+            tag_match: "any"(하나라도 일치) 또는 "all"(모두 일치)
+
+        Returns:
+            템플릿 ID 집합 (호출자가 수정해도 되는 새 집합), 필터가 없으면 None
+
+        Raises:
+            ValueError: 지원하지 않는 tag_match
+        """
+        check_tag_match(tag_match)
+        tags = list(dict.fromkeys(tags or ()))
+        has_category = bool(category) and category != ALL_CATEGORIES
+        if not has_category and not tags:
+            return None
+
+        # 작은 집합부터 교집합
+        groups = []
+        if tags:
+            tag_sets = [self._tags.get(tag, set()) for tag in tags]
+            if tag_match == "all":
+                groups.extend(tag_sets)
+            else:
+                groups.append(set().union(*tag_sets))
+        if has_category:
+            groups.append(self._categories.get(category, set()))
+
+        groups.sort(key=len)
+        result = set(groups[0])
+        for group in groups[1:]:
+            if not result:
+                break
+            result &= group
+        return result
+
+    def tag_counts(self, category: Optional[str] = None) -> Dict[str, int]:
+        """태그별 템플릿 수 (태그 클라우드용, 많은 순)
+
+        Args:
+            category: 이 카테고리의 템플릿만 셈 ("전체" 또는 None이면 전체)
+        """
+        if category and category != ALL_CATEGORIES:
+            in_category = self._categories.get(category, set())
+            counts = {tag: len(ids & in_category) for tag, ids in self._tags.items()}
+        else:
+            counts = {tag: len(ids) for tag, ids in self._tags.items()}
+        return dict(sorted(
+            ((tag, count) for tag, count in counts.items() if count),
+            key=lambda item: (-item[1], item[0])
+        ))
+
+    def category_counts(self) -> Dict[str, int]:
+        """카테고리별 템플릿 수"""
+        return {category: len(ids) for category, ids in self._categories.items()}
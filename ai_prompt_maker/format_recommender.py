@@ -0,0 +1,204 @@
+"""
+Output Format Recommender
+
+선택한 목표/컨텍스트/규칙으로 출력 형식을 추천하는 엔진
+
+출력 형식의 keywords(와 이름)를 검색 색인과 같은 방식으로 토큰화해 가중치 있는
+역색인(토큰 -> [(형식 번호, 가중치)])을 만들고, 설정 파일의 도메인별 키워드와
+확장 문장은 로드 시점에 미리 형식 점수 벡터로 바꿔 둡니다. 추천 요청은 선택한
+키워드의 점수 벡터를 더해 상위 k개를 고르기만 하므로 파일이나 텍스트 처리 없이
+끝납니다. 설정이나 형식 파일이 바뀌면 서비스가 새 추천기를 만듭니다.
+"""
+import heapq
+import math
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .config_snapshot import ConfigSnapshot
+from .output_formats import OutputFormatRegistry
+from .search_index import tokenize
+
+
+# 형식 쪽 토큰 가중치 (keywords가 형식 이름보다 중요)
+KEYWORD_WEIGHT = 1.0
+NAME_WEIGHT = 0.5
+
+# 선택 항목 종류별 가중치와 확장 문장 가중치
+SOURCE_WEIGHTS = {"goal": 1.0, "context": 0.6, "rule": 0.4}
+EXPANSION_WEIGHT = 0.5
+
+# 구성 요소 필드 -> 설정 파일 확장 맵 이름
+_EXPANSION_KINDS = {"goal": "goal_expansions", "context": "context_expansions", "rule": "rule_expansions"}
+
+# 점수 벡터 (형식 번호 -> 점수)와 일치 판정용 토큰 집합
+ScoreVector = Dict[int, float]
+
+
+def _unit_vector(text: str) -> Dict[str, float]:
+    """텍스트의 토큰 빈도 벡터를 길이 1로 정규화 (긴 확장 문장이 점수를 독차지하지 않도록)"""
+    counts = Counter(tokenize(text))
+    norm = math.sqrt(sum(count * count for count in counts.values()))
+    return {token: count / norm for token, count in counts.items()} if norm else {}
+
+
+def _as_list(value: Any) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [item for item in value if item]
+
+
+class FormatRecommender:
+    """출력 형식 추천기 (만든 뒤에는 읽기만 하므로 여러 스레드가 함께 사용 가능)
+
+    Args:
+        registry: 출력 형식 레지스트리
+        config: 설정 스냅샷 (도메인별 키워드/확장 맵을 미리 점수 벡터로 변환)
+    """
+
+    def __init__(self, registry: OutputFormatRegistry, config: Optional[ConfigSnapshot] = None):
+        self.registry = registry
+        self.config = config
+
+        self._format_ids: List[str] = list(registry.formats)
+        self._format_keywords: List[Tuple[Tuple[str, FrozenSet[str]], ...]] = []
+
+        # 형식별 토큰 가중치 (tf-idf, 형식마다 길이 1로 정규화)
+        weights: List[Dict[str, float]] = []
+        for format_id in self._format_ids:
+            format_data = registry.formats[format_id]
+            vector: Dict[str, float] = {}
+            keywords = []
+            for keyword in format_data.get("keywords", ()):
+                tokens = tokenize(keyword)
+                keywords.append((keyword, frozenset(tokens)))
+                for token in tokens:
+                    vector[token] = vector.get(token, 0.0) + KEYWORD_WEIGHT
+            for token in tokenize(format_data.get("name", "")):
+                vector[token] = vector.get(token, 0.0) + NAME_WEIGHT
+            weights.append(vector)
+            self._format_keywords.append(tuple(keywords))
+
+        document_frequency = Counter(token for vector in weights for token in vector)
+        total = len(weights)
+        self._postings: Dict[str, List[Tuple[int, float]]] = {}
+        for index, vector in enumerate(weights):
+            for token in vector:
+                vector[token] *= math.log(1 + total / document_frequency[token])
+            norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+            for token, value in vector.items():
+                self._postings.setdefault(token, []).append((index, value / norm))
+
+        # 도메인 -> 필드 -> 키워드 -> (점수 벡터, 토큰 집합)
+        self._keyword_vectors: Dict[str, Dict[str, Dict[str, Tuple[ScoreVector, FrozenSet[str]]]]] = {}
+        if config is not None:
+            for domain_id, domain_config in config.domains.items():
+                keywords = domain_config.get("keywords", {})
+                by_field = self._keyword_vectors[domain_id] = {}
+                for field_name, kind in _EXPANSION_KINDS.items():
+                    expansions = domain_config.get(kind, {})
+                    # 키워드 목록에 없더라도 확장 맵에 있는 항목은 미리 계산
+                    items = dict.fromkeys(list(keywords.get(field_name, ())) + list(expansions))
+                    by_field[field_name] = {
+                        item: self._item_vector(item, expansions.get(item)) for item in items
+                    }
+
+    def __len__(self) -> int:
+        return len(self._format_ids)
+
+    def _score_terms(self, terms: Mapping[str, float]) -> ScoreVector:
+        """토큰 가중치 벡터를 역색인으로 형식 점수 벡터로 변환"""
+        scores: ScoreVector = {}
+        for token, weight in terms.items():
+            for index, format_weight in self._postings.get(token, ()):
+                scores[index] = scores.get(index, 0.0) + weight * format_weight
+        return scores
+
+    def _item_vector(self, item: str, expansion: Optional[str] = None) -> Tuple[ScoreVector, FrozenSet[str]]:
+        """선택 항목 하나(와 그 확장 문장)의 형식 점수 벡터와 토큰 집합"""
+        terms = _unit_vector(item)
+        if expansion:
+            for token, weight in _unit_vector(expansion).items():
+                terms[token] = terms.get(token, 0.0) + EXPANSION_WEIGHT * weight
+        return self._score_terms(terms), frozenset(terms)
+
+    def _lookup(self, domain: str, field_name: str, item: str,
+                memo: Dict[Tuple[str, str], Tuple[ScoreVector, FrozenSet[str]]]
+                ) -> Tuple[ScoreVector, FrozenSet[str]]:
+        """미리 계산한 항목 벡터 (설정에 없는 직접 입력은 계산 후 memo에 보관)"""
+        precomputed = self._keyword_vectors.get(domain, {}).get(field_name, {}).get(item)
+        if precomputed is not None:
+            return precomputed
+        key = (field_name, item)
+        if key not in memo:
+            expansions = self.config.domain(domain).get(_EXPANSION_KINDS[field_name], {}) if self.config else {}
+            memo[key] = self._item_vector(item, expansions.get(item))
+        return memo[key]
+
+    def _recommend(self, components: Any, domain: str, top_k: int,
+                   memo: Dict[Tuple[str, str], Tuple[ScoreVector, FrozenSet[str]]]) -> List[Dict[str, Any]]:
+        scores: ScoreVector = {}
+        terms = set()
+        for field_name, source_weight in SOURCE_WEIGHTS.items():
+            if isinstance(components, Mapping):
+                value = components.get(field_name)
+            else:
+                value = getattr(components, field_name, None)
+            for item in _as_list(value):
+                vector, item_terms = self._lookup(domain, field_name, item, memo)
+                terms |= item_terms
+                for index, score in vector.items():
+                    scores[index] = scores.get(index, 0.0) + source_weight * score
+
+        # 같은 점수면 형식 파일 순서
+        ranked = heapq.nlargest(top_k, scores.items(), key=lambda entry: (entry[1], -entry[0]))
+        results = []
+        for index, score in ranked:
+            if score <= 0:
+                break
+            format_id = self._format_ids[index]
+            format_data = self.registry.formats[format_id]
+            results.append({
+                "format_id": format_id,
+                "name": format_data.get("name", format_id),
+                "category": format_data.get("category"),
+                "score": score,
+                "matched_keywords": [keyword for keyword, tokens in self._format_keywords[index]
+                                     if tokens and tokens <= terms],
+            })
+        return results
+
+    def recommend(self, goal: Optional[str] = None, context: Sequence[str] = (),
+                  rule: Sequence[str] = (), domain: str = "game_dev", top_k: int = 3) -> List[Dict[str, Any]]:
+        """선택 항목에 맞는 출력 형식 상위 top_k개
+
+        Args:
+            goal: 선택한 목표
+            context: 선택한 컨텍스트 목록
+            rule: 선택한 규칙 목록
+            domain: 확장 문장을 찾을 도메인 ID
+            top_k: 돌려줄 최대 개수
+
+        Returns:
+            점수 내림차순 [{"format_id", "name", "category", "score", "matched_keywords"}, ...]
+            (점수가 0인 형식은 제외)
+        """
+        return self._recommend({"goal": goal, "context": context, "rule": rule}, domain, top_k, {})
+
+    def recommend_batch(self, component_sets: Iterable[Any], domain: str = "game_dev",
+                        top_k: int = 3) -> List[List[Dict[str, Any]]]:
+        """여러 구성 요소 묶음을 한 번에 추천
+
+        설정에 없는 직접 입력 항목의 벡터는 묶음 전체에서 한 번만 계산합니다.
+
+        Args:
+            component_sets: {"goal", "context", "rule"} 매핑 또는 PromptComponent 목록
+            domain: 확장 문장을 찾을 도메인 ID
+            top_k: 묶음마다 돌려줄 최대 개수
+
+        Returns:
+            입력 순서대로 recommend()와 같은 형식의 결과 목록
+        """
+        memo: Dict[Tuple[str, str], Tuple[ScoreVector, FrozenSet[str]]] = {}
+        return [self._recommend(components, domain, top_k, memo) for components in component_sets]
@@ -0,0 +1,288 @@
+"""
+Template Journal
+
+템플릿 변경(현재 버전 지정, 버전 추가/삭제/수정)을 파일 전체를 다시 쓰지 않고
+템플릿별 추가 전용(append-only) 저널에 기록합니다.
+
+저널 레코드는 스냅샷(템플릿 파일)의 snapshot_id를 함께 기록하며, 읽을 때는 같은
+스냅샷에 속한 레코드만 순서대로 재생합니다. 스냅샷을 새로 쓰면 이전 저널은 자동으로
+무효가 되므로, 스냅샷 기록 후 저널 삭제 전에 중단되어도 변경이 두 번 적용되지 않습니다.
+"""
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .file_lock import template_lock
+from .models import PromptTemplate, PromptVersion, LazyVersionList, validate_version_data
+from .template_io import encode_delta, apply_delta, loads_template_with_header
+
+
+JOURNAL_DIR = ".journal"
+JOURNAL_OPS = ("set_current", "add_version", "delete_version", "update_version")
+
+
+def _version_dict(template: PromptTemplate, version_number: int) -> Optional[Dict[str, Any]]:
+    """버전 번호의 직렬화 딕셔너리 (지연 목록의 미생성 버전은 원본 사용)"""
+    position = template._version_position(version_number)
+    if position is None:
+        return None
+    if isinstance(template.versions, LazyVersionList):
+        return template.versions.raw(position)
+    return template.versions[position].to_dict()
+
+
+def make_record(template: PromptTemplate, change: Dict[str, Any],
+                previous: Optional[PromptTemplate] = None) -> Dict[str, Any]:
+    """변경이 적용된 템플릿에서 저널 레코드 생성
+
+    Args:
+        template: 변경이 이미 적용된 템플릿
+        change: {"op": 작업, "version": 버전 번호, "base": 기준 버전(add_version, 선택)}
+        previous: 변경 전 템플릿 (update_version 델타 계산용, 선택)
+
+    Returns:
+        저널 레코드 (snapshot 필드는 기록 시 추가)
+
+    Raises:
+        ValueError: 알 수 없는 작업이거나 버전을 찾을 수 없는 경우
+    """
+    op = change.get("op")
+    number = change.get("version")
+    if op not in JOURNAL_OPS or not isinstance(number, int):
+        raise ValueError(f"Invalid journal change: {change}")
+
+    record: Dict[str, Any] = {"op": op, "version": number}
+    if op in ("set_current", "delete_version"):
+        return record
+
+    data = _version_dict(template, number)
+    if data is None:
+        raise ValueError(f"Version not found: {number}")
+
+    # 기준 버전이 있으면 바뀐 섹션만 기록
+    if op == "add_version":
+        base_number = change.get("base")
+        base = _version_dict(template, base_number) if isinstance(base_number, int) else None
+    else:
+        base_number = number
+        base = _version_dict(previous, number) if previous is not None else None
+
+    if base is None:
+        record["data"] = data
+    else:
+        record["base"] = base_number
+        record["delta"] = encode_delta(data, base)["delta"]
+
+    return record
+
+
+def apply_record(template: PromptTemplate, record: Dict[str, Any]):
+    """저널 레코드를 템플릿에 적용
+
+    Raises:
+        ValueError: 레코드를 적용할 수 없는 경우
+    """
+    op = record.get("op")
+    number = record.get("version")
+
+    if op == "set_current":
+        if template.get_version(number) is None:
+            raise ValueError(f"Version not found: {number}")
+        template.current_version = number
+        return
+
+    if op == "delete_version":
+        if not template.delete_version(number):
+            raise ValueError(f"Cannot delete version: {number}")
+        return
+
+    if op not in ("add_version", "update_version"):
+        raise ValueError(f"Unknown journal op: {op}")
+
+    if "delta" in record:
+        base = _version_dict(template, record.get("base"))
+        if base is None:
+            raise ValueError(f"Base version not found: {record.get('base')}")
+        data = apply_delta({"version": number, "delta": record["delta"]}, base)
+    else:
+        data = record.get("data")
+
+    validate_version_data(data)
+    version = PromptVersion.from_dict(data)
+
+    if op == "add_version":
+        template.versions.append(version)
+        template.current_version = number
+    else:
+        position = template._version_position(number)
+        if position is None:
+            raise ValueError(f"Version not found: {number}")
+        template.versions[position] = version
+
+
+class TemplateJournal:
+    """템플릿별 저널 파일 관리 (templates_dir/.journal/<id>.jsonl)
+
+    잠금은 호출자가 템플릿 잠금(file_lock.template_lock)으로 관리합니다.
+    """
+
+    def __init__(self, templates_dir: Path, fsync: bool = False):
+        """저널 초기화
+
+        Args:
+            templates_dir: 템플릿 디렉토리
+            fsync: 레코드를 추가할 때마다 디스크에 동기화할지 여부
+        """
+        self.journal_dir = Path(templates_dir) / JOURNAL_DIR
+        self.fsync = fsync
+
+    def path_for(self, template_id: str) -> Path:
+        return self.journal_dir / f"{template_id}.jsonl"
+
+    def exists(self, template_id: str) -> bool:
+        return self.path_for(template_id).exists()
+
+    def append(self, template_id: str, snapshot_id: str, record: Dict[str, Any]) -> int:
+        """레코드 추가
+
+        Returns:
+            추가한 바이트 수
+        """
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({**record, "snapshot": snapshot_id}, ensure_ascii=False,
+                          separators=(",", ":")).encode("utf-8") + b"\n"
+
+        with open(self.path_for(template_id), "ab+") as f:
+            # 이전 기록이 중간에 끊겼으면 새 줄에서 시작
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        return len(line)
+
+    def records(self, template_id: str, snapshot_id: Optional[str]) -> List[Dict[str, Any]]:
+        """스냅샷에 속한 레코드 목록 (끊긴 줄은 건너뜀)"""
+        path = self.path_for(template_id)
+        if snapshot_id is None or not path.exists():
+            return []
+
+        records = []
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and record.get("snapshot") == snapshot_id:
+                    records.append(record)
+        return records
+
+    def replay(self, template_id: str, template: PromptTemplate,
+               snapshot_id: Optional[str]) -> int:
+        """스냅샷 위에 저널 재생
+
+        Returns:
+            적용한 레코드 수
+        """
+        applied = 0
+        for record in self.records(template_id, snapshot_id):
+            try:
+                apply_record(template, record)
+                applied += 1
+            except Exception as e:
+                print(f"저널 레코드 적용 실패 ({template_id}): {e}")
+        return applied
+
+    def load(self, template_id: str, template_path: Path,
+             signing_key: Optional[bytes] = None) -> Tuple[PromptTemplate, int, int]:
+        """스냅샷 파일을 읽고 저널 재생 (잠금은 호출자가 관리)
+
+        Returns:
+            (템플릿, 적용한 레코드 수, 읽은 바이트 수)
+        """
+        data = Path(template_path).read_bytes()
+        template, header = loads_template_with_header(data, signing_key)
+        snapshot_id = header.get("snapshot_id") if header else None
+        return template, self.replay(template_id, template, snapshot_id), len(data)
+
+    def discard(self, template_id: str):
+        """저널 삭제 (스냅샷에 반영된 후 호출)"""
+        try:
+            self.path_for(template_id).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"저널 삭제 실패 ({template_id}): {e}")
+
+    def template_ids(self) -> List[str]:
+        """저널이 있는 템플릿 ID 목록"""
+        if not self.journal_dir.exists():
+            return []
+        return sorted(path.stem for path in self.journal_dir.glob("*.jsonl"))
+
+
+def read_template(templates_dir: Path, template_path: Path,
+                  signing_key: Optional[bytes] = None) -> PromptTemplate:
+    """저널까지 반영한 템플릿 파일 읽기 (템플릿 공유 잠금 사용)
+
+    서비스 밖에서 템플릿 디렉토리를 읽는 곳(SQLite 이전, 세션 저장소)용입니다.
+    template_io.read_template()은 스냅샷만 읽으므로 저널에만 기록된 변경이 빠집니다.
+    """
+    template_id = Path(template_path).stem
+    with template_lock(templates_dir, template_id, shared=True):
+        return TemplateJournal(templates_dir).load(template_id, template_path, signing_key)[0]
+
+
+class JournalCompactor:
+    """백그라운드 스레드에서 저널을 스냅샷으로 합치는 작업자"""
+
+    def __init__(self, fold: Callable[[str], None]):
+        """작업자 초기화
+
+        Args:
+            fold: 템플릿 ID를 받아 저널을 스냅샷으로 합치는 함수
+        """
+        self._fold = fold
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, template_id: str):
+        """합치기 예약 (이미 대기 중이면 무시)"""
+        with self._lock:
+            if template_id in self._pending:
+                return
+            self._pending.add(template_id)
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="template-journal-compactor", daemon=True
+                )
+                self._thread.start()
+
+        self._queue.put(template_id)
+
+    def flush(self):
+        """예약된 작업이 모두 끝날 때까지 대기"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            template_id = self._queue.get()
+            with self._lock:
+                self._pending.discard(template_id)
+            try:
+                self._fold(template_id)
+            except Exception as e:
+                print(f"저널 합치기 실패 ({template_id}): {e}")
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,218 @@
+"""
+Template Layout
+
+템플릿 파일을 디렉토리에 배치하는 방식
+
+    flat:    templates/<template_id>.json
+    sharded: templates/<ab>/<template_id>.json   (ab = sha1(template_id)의 앞 두 자리)
+
+샤딩 배치는 템플릿을 256개 하위 디렉토리에 고르게 나눠 담아 디렉토리 하나의
+항목 수를 줄입니다. 어느 배치를 쓰든 파일 위치는 두 배치를 모두 확인해 찾으므로
+migrate()로 변환하는 동안에도 다른 프로세스가 계속 읽고 쓸 수 있습니다.
+선택한 배치는 `.index/layout.json`에 기록되어 이후에 시작한 프로세스가 따릅니다.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .file_lock import atomic_write, template_lock
+
+
+LAYOUTS = ("flat", "sharded")
+LAYOUT_FILE = Path(".index") / "layout.json"
+
+TEMPLATE_SUFFIX = ".json"
+_HEX = frozenset("0123456789abcdef")
+
+
+def shard_of(template_id: str) -> str:
+    """템플릿 ID의 샤드 디렉토리 이름 (16진수 두 자리)"""
+    return hashlib.sha1(template_id.encode("utf-8")).hexdigest()[:2]
+
+
+def _is_shard_name(name: str) -> bool:
+    return len(name) == 2 and set(name) <= _HEX
+
+
+class TemplateLayout:
+    """템플릿 ID와 파일 경로 사이의 변환
+
+    템플릿 ID는 호출자가 먼저 검증(영문/숫자/-/_)해야 하며, 그러면 두 배치의
+    경로 모두 템플릿 디렉토리 안에 머뭅니다.
+    """
+
+    SHARD_COUNT = 256
+
+    def __init__(self, templates_dir: Path, layout: Optional[str] = None):
+        """배치 초기화
+
+        Args:
+            templates_dir: 템플릿 디렉토리
+            layout: "flat" 또는 "sharded" (None이면 기록된 배치, 기록이 없으면 flat)
+
+        Raises:
+            ValueError: 지원하지 않는 배치
+        """
+        self.templates_dir = Path(templates_dir)
+        layout = layout or self.read_recorded(self.templates_dir) or "flat"
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown template layout: {layout}")
+        self.name = layout
+
+    @staticmethod
+    def read_recorded(templates_dir: Path) -> Optional[str]:
+        """디렉토리에 기록된 배치 (없거나 읽을 수 없으면 None)"""
+        try:
+            data = json.loads((Path(templates_dir) / LAYOUT_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        layout = data.get("layout") if isinstance(data, dict) else None
+        return layout if layout in LAYOUTS else None
+
+    def record(self, fsync: bool = False):
+        """현재 배치를 디렉토리에 기록 (이후 시작하는 프로세스가 따름)"""
+        path = self.templates_dir / LAYOUT_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps({"layout": self.name}).encode("utf-8"), fsync=fsync)
+
+    def path_for(self, template_id: str, layout: Optional[str] = None) -> Path:
+        """배치 규칙에 따른 템플릿 파일 경로 (새 템플릿을 만들 위치)"""
+        if (layout or self.name) == "sharded":
+            return self.templates_dir / shard_of(template_id) / f"{template_id}{TEMPLATE_SUFFIX}"
+        return self.templates_dir / f"{template_id}{TEMPLATE_SUFFIX}"
+
+    def resolve(self, template_id: str) -> Path:
+        """기존 파일 위치 (현재 배치 -> 다른 배치 순서, 둘 다 없으면 현재 배치 경로)
+
+        기존 템플릿은 찾은 위치에 다시 쓰므로 배치 설정이 다른 프로세스가 섞여
+        있어도 같은 템플릿 파일이 두 곳에 생기지 않습니다.
+        """
+        preferred = self.path_for(template_id)
+        if preferred.exists():
+            return preferred
+        other = self.path_for(template_id, "flat" if self.name == "sharded" else "sharded")
+        if other.exists():
+            return other
+        return preferred
+
+    def template_id_of(self, path: Path) -> Optional[str]:
+        """템플릿 파일 경로이면 템플릿 ID, 아니면 None (두 배치 모두 인식)"""
+        path = Path(path)
+        if not path.name.endswith(TEMPLATE_SUFFIX) or path.name.startswith("."):
+            return None
+        template_id = path.name[:-len(TEMPLATE_SUFFIX)]
+        if path.parent == self.templates_dir:
+            return template_id
+        if path.parent.parent == self.templates_dir and path.parent.name == shard_of(template_id):
+            return template_id
+        return None
+
+    def directories(self) -> List[Path]:
+        """템플릿 파일이 있을 수 있는 모든 디렉토리 (최상위 + 샤드 256개)"""
+        return [self.templates_dir] + [
+            self.templates_dir / f"{n:02x}" for n in range(self.SHARD_COUNT)
+        ]
+
+    def ensure_directories(self):
+        """샤딩 배치의 샤드 디렉토리를 미리 생성 (파일 감시기가 모두 감시할 수 있도록)"""
+        if self.name == "sharded":
+            for directory in self.directories()[1:]:
+                directory.mkdir(parents=True, exist_ok=True)
+
+    def scan(self) -> Iterator[os.DirEntry]:
+        """모든 템플릿 파일 항목 (같은 ID가 두 배치에 있으면 resolve()와 같은 쪽만)
+
+        디렉토리마다 scandir 한 번으로 읽으며, 항목의 stat은 호출자가 필요할 때만 합니다.
+        """
+        flat: Dict[str, os.DirEntry] = {}
+        shard_dirs = []
+
+        with os.scandir(self.templates_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(TEMPLATE_SUFFIX) and not entry.name.startswith("."):
+                    if entry.is_file():
+                        flat[entry.name[:-len(TEMPLATE_SUFFIX)]] = entry
+                elif _is_shard_name(entry.name) and entry.is_dir():
+                    shard_dirs.append(entry.path)
+
+        sharded_ids = set()
+        for shard_dir in sorted(shard_dirs):
+            with os.scandir(shard_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(TEMPLATE_SUFFIX) or entry.name.startswith("."):
+                        continue
+                    template_id = entry.name[:-len(TEMPLATE_SUFFIX)]
+                    if shard_of(template_id) != os.path.basename(shard_dir) or not entry.is_file():
+                        continue
+                    if self.name == "flat" and template_id in flat:
+                        continue
+                    sharded_ids.add(template_id)
+                    yield entry
+
+        for template_id, entry in flat.items():
+            if self.name == "sharded" and template_id in sharded_ids:
+                continue
+            yield entry
+
+    def migrate(self, layout: str, fsync: bool = False,
+                on_move: Optional[Callable[[str], None]] = None) -> Dict[str, int]:
+        """다른 배치로 온라인 변환
+
+        배치 기록을 먼저 바꾼 뒤 템플릿별 잠금을 잡고 파일을 하나씩 옮깁니다
+        (같은 파일 시스템 안의 원자적 이름 변경). 옮기는 동안 읽는 쪽은 resolve()로
+        두 위치를 모두 확인하므로 템플릿이 사라져 보이지 않습니다.
+
+        Args:
+            layout: 변환할 배치 ("flat" 또는 "sharded")
+            fsync: 배치 기록을 디스크에 동기화할지 여부
+            on_move: 파일을 옮긴 직후 템플릿 잠금 안에서 호출할 함수 (템플릿 ID를 받음)
+
+        Returns:
+            {"moved": int, "skipped": int, "conflicts": int}
+            (conflicts: 두 위치에 모두 있어 옮기지 않은 템플릿)
+
+        Raises:
+            ValueError: 지원하지 않는 배치
+        """
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown template layout: {layout}")
+
+        self.name = layout
+        self.record(fsync=fsync)
+        self.ensure_directories()
+
+        result = {"moved": 0, "skipped": 0, "conflicts": 0}
+        # 목록을 먼저 만들어 두면 옮긴 파일을 다시 만나지 않음
+        sources = [Path(entry.path) for entry in self.scan()]
+
+        for source in sources:
+            template_id = self.template_id_of(source)
+            target = self.path_for(template_id)
+            if source == target:
+                result["skipped"] += 1
+                continue
+
+            with template_lock(self.templates_dir, template_id):
+                if not source.exists():
+                    # 그 사이 다른 프로세스가 삭제함
+                    continue
+                if target.exists():
+                    result["conflicts"] += 1
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, target)
+                if on_move is not None:
+                    on_move(template_id)
+            result["moved"] += 1
+
+        if layout == "flat":
+            # 비어 있는 샤드 디렉토리 정리
+            for directory in self.directories()[1:]:
+                try:
+                    directory.rmdir()
+                except OSError:
+                    pass
+
+        return result
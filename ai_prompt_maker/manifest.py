@@ -0,0 +1,456 @@
+"""
+Template Manifest
+
+템플릿 디렉토리 옆에 템플릿별 요약 정보를 유지하는 매니페스트
+"""
+import heapq
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
+
+from .file_lock import index_lock
+from .filter_index import TemplateFilterIndex
+from .layout import TemplateLayout
+
+
+def _same_file(entry: Optional[Dict[str, Any]], other: Optional[Dict[str, Any]]) -> bool:
+    """두 매니페스트 항목이 같은 파일 상태를 가리키는지 (둘 다 없으면 같음)"""
+    if entry is None or other is None:
+        return entry is other
+    return entry["mtime_ns"] == other["mtime_ns"] and entry["size"] == other["size"]
+
+
+class TemplateManifest:
+    """템플릿 요약 매니페스트
+
+    `templates_dir/.index/manifest.jsonl`에 추가 전용(append-only) 로그로 기록합니다.
+    각 줄은 템플릿 하나의 요약(put) 또는 삭제(del) 레코드이며, 파일의 mtime과 크기를
+    함께 기록해 디렉토리와 어긋난 항목만 다시 요약합니다. 목록 조회는 매니페스트
+    파일 한 번 읽기와 디렉토리 스캔으로 끝나며 템플릿 본문을 파싱하지 않습니다.
+
+    로그 기록과 압축은 디렉토리 색인 잠금을 잡고 수행하므로 여러 프로세스가 같은
+    디렉토리를 공유해도 레코드가 유실되지 않습니다.
+
+    같은 프로세스의 여러 스레드에서 함께 쓸 수 있습니다. 항목은 교체만 하고 제자리에서
+    고치지 않으므로, 조회는 잠금 안에서 항목 목록의 얕은 복사본만 만들고 정렬과 필터는
+    잠금 밖에서 합니다. 템플릿 파일 요약도 잠금 밖에서 하므로 템플릿 잠금을 잡은 채
+    put()하는 저장과 교착되지 않습니다.
+    """
+
+    INDEX_DIR = ".index"
+    FILENAME = "manifest.jsonl"
+    FORMAT_VERSION = 1
+
+    # 로그 줄 수가 (항목 수 * 배수 + 여유분)을 넘으면 압축
+    COMPACT_FACTOR = 2
+    COMPACT_SLACK = 100
+
+    def __init__(self, templates_dir: Path,
+                 summarize: Callable[[Path], Optional[Dict[str, Any]]],
+                 layout: Optional[TemplateLayout] = None):
+        """매니페스트 초기화
+
+        Args:
+            templates_dir: 템플릿 디렉토리
+            summarize: 템플릿 파일 경로를 받아 요약을 반환하는 함수 (유효하지 않으면 None)
+            layout: 템플릿 파일 배치 (None이면 디렉토리에 기록된 배치)
+        """
+        self.templates_dir = Path(templates_dir)
+        self.layout = layout or TemplateLayout(self.templates_dir)
+        self.path = self.templates_dir / self.INDEX_DIR / self.FILENAME
+        self._summarize = summarize
+
+        # template_id -> {"mtime_ns": int, "size": int, "summary": dict | None}
+        # 스레드 잠금 -> 디렉토리 색인 잠금 순서로만 잡음
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # 카테고리/태그 보조 색인 (_entries와 함께 _apply()에서만 갱신)
+        self._filters = TemplateFilterIndex()
+        self._offset = 0
+        self._file_id: Optional[tuple] = None
+        self._log_lines = 0
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._snapshot() if entry["summary"] is not None)
+
+    def _snapshot(self) -> List[Dict[str, Any]]:
+        """로그의 새 레코드를 반영한 뒤 현재 항목 목록 (항목은 읽기 전용으로 다룸)"""
+        with self._lock:
+            self._read()
+            return list(self._entries.values())
+
+    def summaries(self, refresh: bool = True) -> List[Dict[str, Any]]:
+        """유효한 템플릿 요약 목록 (호출자가 수정해도 되는 복사본)
+
+        Args:
+            refresh: True면 먼저 디렉토리와 비교해 변경분을 반영
+        """
+        return list(self.items(refresh).values())
+
+    def items(self, refresh: bool = True) -> Dict[str, Dict[str, Any]]:
+        """템플릿 ID -> 요약 매핑 (호출자가 수정해도 되는 복사본)"""
+        if refresh:
+            self.refresh()
+        with self._lock:
+            self._read()
+            entries = list(self._entries.items())
+        return {
+            template_id: {**entry["summary"], "tags": list(entry["summary"].get("tags", []))}
+            for template_id, entry in entries
+            if entry["summary"] is not None
+        }
+
+    def select(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+               key: Optional[Callable[[Dict[str, Any]], Any]] = None, reverse: bool = False,
+               limit: Optional[int] = None, after: Any = None,
+               category: Optional[str] = None, tags: Optional[List[str]] = None,
+               tag_match: str = "any") -> Tuple[List[Dict[str, Any]], int]:
+        """조건에 맞는 요약 중 정렬 순서상 앞의 limit개 (디렉토리 검증 없이 매니페스트 기준)
+
+        카테고리/태그 필터는 보조 색인의 집합 연산으로 후보를 좁히고, 전체를 정렬하지
+        않고 힙으로 상위 limit개만 고르며, 고른 요약만 복사합니다.
+
+        Args:
+            predicate: 포함할 요약 추가 조건 (None이면 전체)
+            key: 정렬 키 함수
+            reverse: 내림차순 여부
+            limit: 최대 개수 (None이면 전체 정렬)
+            after: 이 정렬 키 다음 항목부터 (키셋 페이지네이션)
+            category: 카테고리 필터 ("전체" 또는 None이면 필터 없음)
+            tags: 태그 필터
+            tag_match: "any"(태그 하나라도 일치) 또는 "all"(모두 일치)
+
+        Returns:
+            (요약 목록, after와 무관하게 조건에 맞는 전체 수)
+
+        Raises:
+            ValueError: 지원하지 않는 tag_match
+        """
+        with self._lock:
+            self._read()
+            template_ids = self._filters.select(category, tags, tag_match)
+            if template_ids is None:
+                summaries = [entry["summary"] for entry in self._entries.values()]
+            else:
+                summaries = [self._entries[template_id]["summary"] for template_id in template_ids]
+
+        matched = [
+            summary for summary in summaries
+            if summary is not None and (predicate is None or predicate(summary))
+        ]
+        total = len(matched)
+
+        if after is not None:
+            matched = [s for s in matched if (key(s) < after if reverse else key(s) > after)]
+
+        if limit is None:
+            selected = sorted(matched, key=key, reverse=reverse)
+        elif reverse:
+            selected = heapq.nlargest(limit, matched, key=key)
+        else:
+            selected = heapq.nsmallest(limit, matched, key=key)
+
+        return [{**summary, "tags": list(summary.get("tags", []))} for summary in selected], total
+
+    def recent_ids(self, limit: int) -> List[str]:
+        """파일 수정 시각이 최신인 템플릿 ID limit개 (디렉토리 검증 없이 매니페스트 기준)"""
+        with self._lock:
+            self._read()
+            recent = [
+                (entry["mtime_ns"] or 0, template_id)
+                for template_id, entry in self._entries.items()
+                if entry["summary"] is not None
+            ]
+        return [template_id for _, template_id in heapq.nlargest(limit, recent)]
+
+    def tag_counts(self, category: Optional[str] = None) -> Dict[str, int]:
+        """태그별 템플릿 수 (디렉토리 검증 없이 매니페스트 기준, 많은 순)"""
+        with self._lock:
+            self._read()
+            return self._filters.tag_counts(category)
+
+    def get(self, template_id: str) -> Optional[Dict[str, Any]]:
+        """단일 템플릿 요약 (디렉토리 검증 없이 매니페스트 기준)"""
+        with self._lock:
+            self._read()
+            entry = self._entries.get(template_id)
+        if not entry or entry["summary"] is None:
+            return None
+        return {**entry["summary"], "tags": list(entry["summary"].get("tags", []))}
+
+    def put(self, template_id: str, summary: Dict[str, Any], file_path: Path):
+        """저장된 템플릿의 요약 기록
+
+        Args:
+            template_id: 템플릿 ID (파일명 기준)
+            summary: `PromptTemplate.get_summary()` 결과
+            file_path: 방금 기록한 템플릿 파일 경로
+        """
+        try:
+            stat = file_path.stat()
+            self._commit([self._put_record(template_id, stat, summary)])
+        except OSError as e:
+            # 매니페스트 실패는 다음 refresh()에서 복구됨
+            print(f"매니페스트 업데이트 실패 ({template_id}): {e}")
+
+    def put_many(self, entries: List[tuple]):
+        """여러 템플릿의 요약을 한 번의 로그 기록으로 반영 (일괄 가져오기용)
+
+        Args:
+            entries: (template_id, summary, file_path) 목록
+        """
+        if not entries:
+            return
+        try:
+            records = [
+                self._put_record(template_id, file_path.stat(), summary)
+                for template_id, summary, file_path in entries
+            ]
+            self._commit(records)
+        except OSError as e:
+            print(f"매니페스트 일괄 업데이트 실패: {e}")
+
+    def remove(self, template_id: str):
+        """삭제된 템플릿 기록"""
+        try:
+            with self._lock:
+                self._read()
+                if template_id in self._entries:
+                    self._commit([{"op": "del", "id": template_id}])
+        except OSError as e:
+            print(f"매니페스트 업데이트 실패 ({template_id}): {e}")
+
+    def refresh(self, template_ids: Optional[Iterable[str]] = None) -> Set[str]:
+        """디렉토리와 매니페스트를 비교해 어긋난 항목만 다시 요약
+
+        Args:
+            template_ids: 바뀐 것으로 알려진 템플릿만 다시 요약 (None이면 디렉토리 전체 스캔)
+
+        Returns:
+            추가/변경/삭제가 감지된 템플릿 ID 집합
+        """
+        # 요약(파일 읽기)은 잠금 밖에서 하고, 그 사이 다른 스레드가 바꾼 항목은
+        # 기록할 때 건너뜀 (_commit_locked 참고)
+        with self._lock:
+            self._read()
+            known_entries = dict(self._entries)
+
+        records = []
+        changed: Set[str] = set()
+
+        if template_ids is not None:
+            # 파일 감시기가 알려준 템플릿은 stat이 같아도 다시 요약
+            for template_id in template_ids:
+                path = self.layout.resolve(template_id)
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    if template_id in known_entries:
+                        changed.add(template_id)
+                        records.append({"op": "del", "id": template_id})
+                    continue
+                changed.add(template_id)
+                records.append(self._summarize_record(template_id, path, stat))
+        else:
+            seen: Set[str] = set()
+
+            for dir_entry in self.layout.scan():
+                template_id = dir_entry.name[:-len(".json")]
+                seen.add(template_id)
+
+                stat = dir_entry.stat()
+                known = known_entries.get(template_id)
+                if (known and known["mtime_ns"] == stat.st_mtime_ns
+                        and known["size"] == stat.st_size):
+                    continue
+
+                changed.add(template_id)
+                records.append(self._summarize_record(template_id, Path(dir_entry.path), stat))
+
+            for template_id in set(known_entries) - seen:
+                changed.add(template_id)
+                records.append({"op": "del", "id": template_id})
+
+        if records:
+            try:
+                self._commit(records, known_entries)
+            except OSError as e:
+                print(f"매니페스트 업데이트 실패: {e}")
+
+        return changed
+
+    def _summarize_record(self, template_id: str, path: Path, stat: os.stat_result) -> Dict[str, Any]:
+        """템플릿 파일을 요약해 put 레코드 생성 (유효하지 않은 파일은 요약이 None)"""
+        try:
+            summary = self._summarize(path)
+        except Exception as e:
+            print(f"템플릿 요약 실패 ({path.name}): {e}")
+            summary = None
+        return self._put_record(template_id, stat, summary)
+
+    def rebuild(self) -> Set[str]:
+        """매니페스트를 처음부터 다시 생성"""
+        with self._lock, index_lock(self.templates_dir):
+            self._clear_entries()
+            self._file_id = None
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+        changed = self.refresh()
+        self.compact()
+        return changed
+
+    def compact(self):
+        """현재 항목만 남기도록 로그 파일 재작성 (원자적 교체)"""
+        with self._lock, index_lock(self.templates_dir):
+            # 다른 프로세스가 추가한 레코드까지 반영한 뒤 압축
+            self._read()
+            self._rewrite()
+
+    def _rewrite(self):
+        """로그 파일 재작성 (색인 잠금은 호출자가 관리)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = [json.dumps({"op": "header", "version": self.FORMAT_VERSION})]
+        lines.extend(
+            self._dumps({"op": "put", "id": template_id, **entry})
+            for template_id, entry in self._entries.items()
+        )
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.path)
+
+        stat = self.path.stat()
+        self._file_id = (stat.st_dev, stat.st_ino)
+        self._offset = len(payload)
+        self._log_lines = len(lines)
+
+    def _read(self):
+        """매니페스트 파일에서 아직 읽지 않은 부분만 반영"""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._clear_entries()
+            self._file_id = None
+            return
+
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id or stat.st_size < self._offset:
+            # 다른 프로세스가 압축했거나 파일이 교체됨 - 전체 재로드
+            self._clear_entries()
+        self._file_id = file_id
+
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+
+        # 마지막 줄이 아직 기록 중이면 다음 읽기로 미룸
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self._apply(line)
+        self._offset += end
+
+    def _clear_entries(self):
+        """메모리 항목과 보조 색인을 비우고 로그를 처음부터 다시 읽도록 함"""
+        self._entries = {}
+        self._filters.clear()
+        self._offset = 0
+        self._log_lines = 0
+
+    def _apply(self, line: bytes):
+        """로그 한 줄 적용 (손상된 줄은 무시)"""
+        try:
+            record = json.loads(line)
+            op = record.get("op")
+            template_id = record.get("id")
+        except (ValueError, AttributeError):
+            return
+
+        self._log_lines += 1
+        if op == "put" and template_id:
+            summary = record.get("summary")
+            self._entries[template_id] = {
+                "mtime_ns": record.get("mtime_ns"),
+                "size": record.get("size"),
+                "summary": summary,
+            }
+            if summary is not None:
+                self._filters.put(template_id, summary.get("category"), summary.get("tags", ()))
+            else:
+                self._filters.remove(template_id)
+        elif op == "del":
+            self._entries.pop(template_id, None)
+            self._filters.remove(template_id)
+
+    def _commit(self, records: List[Dict[str, Any]],
+                expected: Optional[Dict[str, Dict[str, Any]]] = None):
+        """레코드를 메모리에 반영하고 로그에 추가 (스레드 잠금과 디렉토리 색인 잠금 사용)"""
+        with self._lock, index_lock(self.templates_dir):
+            self._commit_locked(records, expected)
+
+    def _commit_locked(self, records: List[Dict[str, Any]],
+                       expected: Optional[Dict[str, Dict[str, Any]]] = None):
+        """잠금 안에서 기록
+
+        Args:
+            records: put/del 레코드
+            expected: 레코드를 만들 때 본 항목 (지정하면 그 뒤 다른 기록이 바꾼 항목의
+                레코드는 더 오래된 정보이므로 버림)
+        """
+        # 다른 프로세스의 기록을 먼저 반영해 압축 시 유실되지 않도록 함
+        self._read()
+        if expected is not None:
+            records = [
+                record for record in records
+                if _same_file(self._entries.get(record["id"]), expected.get(record["id"]))
+            ]
+            if not records:
+                return
+        for record in records:
+            self._apply(self._dumps(record).encode("utf-8"))
+
+        if self._log_lines > len(self._entries) * self.COMPACT_FACTOR + self.COMPACT_SLACK:
+            self._rewrite()
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = "".join(self._dumps(record) + "\n" for record in records).encode("utf-8")
+        with open(self.path, "ab") as f:
+            start = f.tell()
+            f.write(payload)
+            f.flush()
+            end = os.fstat(f.fileno()).st_size
+
+        # 그 사이 다른 기록이 없었을 때만 읽기 위치를 앞당김.
+        # 그렇지 않으면 다음 _read()에서 다시 적용되지만 put/del은 멱등이므로 무해함
+        if start == self._offset and end == start + len(payload):
+            self._offset = end
+        else:
+            self._log_lines -= len(records)
+        if self._file_id is None:
+            stat = self.path.stat()
+            self._file_id = (stat.st_dev, stat.st_ino)
+
+    @staticmethod
+    def _put_record(template_id: str, stat: os.stat_result,
+                    summary: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "op": "put",
+            "id": template_id,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "summary": summary,
+        }
+
+    @staticmethod
+    def _dumps(record: Dict[str, Any]) -> str:
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
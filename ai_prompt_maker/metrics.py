@@ -0,0 +1,303 @@
+"""
+Service Metrics
+
+서비스 작업별 지연 시간 히스토그램, 캐시 적중/실패, 읽고 쓴 바이트 수 집계
+
+히스토그램은 고정 버킷(10µs ~ 10s, 1-2.5-5 단위)에 개수만 더하므로 관측 한 번이
+잠금 한 번과 이진 탐색 한 번으로 끝납니다. p50/p95/p99는 버킷 안에서 선형 보간한
+추정값입니다. 집계 결과는 get_service_stats()용 dict나 Prometheus 텍스트 형식으로
+내보내고, 파일로 쓰거나 로컬 HTTP 엔드포인트로 수집할 수 있습니다.
+"""
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Union
+
+from .file_lock import atomic_write
+
+
+# 서비스가 계측하는 작업 (관측 전에도 0으로 내보냄)
+OPERATIONS = ("load", "save", "list", "search", "delete", "generate", "config", "formats")
+
+# 지연 시간 버킷 상한(초)
+DEFAULT_BUCKETS = tuple(
+    round(base * 10.0 ** exponent, 7) for exponent in range(-5, 1) for base in (1.0, 2.5, 5.0)
+) + (10.0,)
+
+# 내보내는 백분위수
+QUANTILES = (0.5, 0.95, 0.99)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (잠금은 호출자가 관리)"""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        # 마지막 칸은 가장 큰 상한을 넘는 값 (+Inf)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """백분위수 추정값(초, 관측이 없으면 0)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count or seen + bucket_count < rank:
+                seen += bucket_count
+                continue
+            lower = self.bounds[index - 1] if index else 0.0
+            upper = self.bounds[index] if index < len(self.bounds) else self.max
+            estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+            return min(estimate, self.max)
+        return self.max
+
+
+class OperationMetrics:
+    """작업 하나의 지표 (잠금은 ServiceMetrics가 관리)"""
+
+    __slots__ = ("latency", "errors", "cache_hits", "cache_misses", "bytes_read", "bytes_written")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.latency = LatencyHistogram(bounds)
+        self.errors = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.cache_hits + self.cache_misses
+        latency = self.latency
+        return {
+            "count": latency.count,
+            "errors": self.errors,
+            "total_ms": latency.total * 1000,
+            "mean_ms": latency.total * 1000 / latency.count if latency.count else 0.0,
+            "max_ms": latency.max * 1000,
+            **{f"p{round(q * 100)}_ms": latency.quantile(q) * 1000 for q in QUANTILES},
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+        }
+
+
+class _Timer:
+    """ServiceMetrics.time()이 돌려주는 측정기 (예외가 나면 오류로도 셈)"""
+
+    __slots__ = ("_metrics", "_operation", "_start")
+
+    def __init__(self, metrics: "ServiceMetrics", operation: str):
+        self._metrics = metrics
+        self._operation = operation
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._metrics.observe(self._operation, time.perf_counter() - self._start, exc_type is not None)
+        return False
+
+
+class ServiceMetrics:
+    """작업별 지표 모음 (여러 스레드가 함께 기록해도 누락 없음)
+
+    Args:
+        prefix: Prometheus 지표 이름 접두사
+        buckets: 지연 시간 버킷 상한(초)
+    """
+
+    def __init__(self, prefix: str = "prompt_maker", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._operations: Dict[str, OperationMetrics] = {
+            operation: OperationMetrics(self.buckets) for operation in OPERATIONS
+        }
+
+    def _operation(self, operation: str) -> OperationMetrics:
+        """작업 지표 (처음 보는 작업이면 추가, _lock 안에서 호출)"""
+        metrics = self._operations.get(operation)
+        if metrics is None:
+            metrics = self._operations[operation] = OperationMetrics(self.buckets)
+        return metrics
+
+    def observe(self, operation: str, seconds: float, error: bool = False):
+        """작업 지연 시간 기록"""
+        with self._lock:
+            metrics = self._operation(operation)
+            metrics.latency.observe(seconds)
+            if error:
+                metrics.errors += 1
+
+    def time(self, operation: str) -> _Timer:
+        """with 블록의 실행 시간을 기록하는 측정기"""
+        return _Timer(self, operation)
+
+    def hit(self, operation: str, amount: int = 1):
+        """캐시 적중 기록"""
+        with self._lock:
+            self._operation(operation).cache_hits += amount
+
+    def miss(self, operation: str, amount: int = 1):
+        """캐시 실패 기록 (원본을 다시 읽음)"""
+        with self._lock:
+            self._operation(operation).cache_misses += amount
+
+    def add_bytes(self, operation: str, read: int = 0, written: int = 0):
+        """읽고 쓴 바이트 수 기록"""
+        with self._lock:
+            metrics = self._operation(operation)
+            metrics.bytes_read += read
+            metrics.bytes_written += written
+
+    def reset(self):
+        """모든 지표를 0으로"""
+        with self._lock:
+            for operation in list(self._operations):
+                self._operations[operation] = OperationMetrics(self.buckets)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """작업 -> {"count", "errors", "p50_ms", "p95_ms", "p99_ms", "cache_hits", ...}"""
+        with self._lock:
+            return {operation: metrics.to_dict() for operation, metrics in self._operations.items()}
+
+    def to_prometheus(self, counters: Optional[Mapping[str, float]] = None) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)
+
+        Args:
+            counters: 함께 내보낼 서비스 카운터 {이름: 값} ({prefix}_{이름}_total로 출력)
+        """
+        prefix = self.prefix
+        with self._lock:
+            rows = [(operation, _copy(metrics)) for operation, metrics in self._operations.items()]
+
+        lines = [
+            f"# HELP {prefix}_operation_duration_seconds Service operation latency.",
+            f"# TYPE {prefix}_operation_duration_seconds histogram",
+        ]
+        for operation, metrics in rows:
+            latency = metrics.latency
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, latency.counts):
+                cumulative += bucket_count
+                lines.append(f'{prefix}_operation_duration_seconds_bucket'
+                             f'{{operation="{operation}",le="{_format(bound)}"}} {cumulative}')
+            lines.append(f'{prefix}_operation_duration_seconds_bucket'
+                         f'{{operation="{operation}",le="+Inf"}} {latency.count}')
+            lines.append(f'{prefix}_operation_duration_seconds_sum{{operation="{operation}"}} '
+                         f'{_format(latency.total)}')
+            lines.append(f'{prefix}_operation_duration_seconds_count{{operation="{operation}"}} {latency.count}')
+
+        lines.append(f"# HELP {prefix}_operation_duration_quantile_seconds "
+                     f"Estimated latency quantiles since service start.")
+        lines.append(f"# TYPE {prefix}_operation_duration_quantile_seconds gauge")
+        for operation, metrics in rows:
+            for q in QUANTILES:
+                lines.append(f'{prefix}_operation_duration_quantile_seconds'
+                             f'{{operation="{operation}",quantile="{q:g}"}} '
+                             f'{_format(metrics.latency.quantile(q))}')
+
+        for name, attribute, help_text in (
+                ("operation_errors", "errors", "Operations that raised an exception."),
+                ("cache_hits", "cache_hits", "Lookups served from memory."),
+                ("cache_misses", "cache_misses", "Lookups that had to read the source."),
+                ("bytes_read", "bytes_read", "Bytes read from template, config and format files."),
+                ("bytes_written", "bytes_written", "Bytes written to template and journal files.")):
+            lines.append(f"# HELP {prefix}_{name}_total {help_text}")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for operation, metrics in rows:
+                lines.append(f'{prefix}_{name}_total{{operation="{operation}"}} {getattr(metrics, attribute)}')
+
+        for name, value in (counters or {}).items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {_format(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Union[str, Path], counters: Optional[Mapping[str, float]] = None):
+        """Prometheus 텍스트를 파일로 원자적으로 저장 (node_exporter textfile 수집기용)"""
+        atomic_write(path, self.to_prometheus(counters).encode("utf-8"))
+
+
+def _copy(metrics: OperationMetrics) -> OperationMetrics:
+    """잠금 밖에서 출력하기 위한 지표 복사본 (_lock 안에서 호출)"""
+    copied = OperationMetrics(metrics.latency.bounds)
+    for attribute in ("errors", "cache_hits", "cache_misses", "bytes_read", "bytes_written"):
+        setattr(copied, attribute, getattr(metrics, attribute))
+    latency = copied.latency
+    latency.counts = list(metrics.latency.counts)
+    latency.count = metrics.latency.count
+    latency.total = metrics.latency.total
+    latency.max = metrics.latency.max
+    return copied
+
+
+def _format(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def timed(operation: str) -> Callable:
+    """서비스 메서드 실행 시간을 self._metrics에 기록하는 데코레이터"""
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self._metrics.time(operation):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_metrics_server(render: Callable[[], str], port: int = 0,
+                         host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Prometheus 수집용 HTTP 엔드포인트를 백그라운드 스레드로 시작
+
+    Args:
+        render: 요청마다 호출해 응답 본문(Prometheus 텍스트)을 만드는 함수
+        port: 포트 (0이면 빈 포트, 실제 포트는 server.server_address[1])
+        host: 바인드 주소 (기본값은 로컬 전용)
+
+    Returns:
+        실행 중인 서버 (shutdown()과 server_close()로 종료)
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # 수집 요청마다 stderr에 기록하지 않음
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="prompt-maker-metrics", daemon=True)
+    thread.start()
+    return server
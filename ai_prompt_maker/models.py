@@ -3,14 +3,17 @@ AI Prompt Maker 데이터 모델
 
 프롬프트 템플릿, 컴포넌트, 버전 관리를 위한 데이터 구조
 """
+from collections.abc import MutableSequence
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 import json
 import re
 import uuid
 from datetime import datetime
 from enum import Enum
 
+from .tracing import traced
+
 try:
     import jsonschema
     JSONSCHEMA_AVAILABLE = True
@@ -19,6 +22,41 @@ except ImportError:
     print("Warning: jsonschema not installed. JSON validation will be skipped.")
 
 
+# 스키마 객체 id -> (스키마, 검증기). 스키마 검사와 검증기 생성은 스키마마다 한 번만 수행
+_compiled_validators: Dict[int, tuple] = {}
+
+
+def compiled_validator(schema: Dict[str, Any]):
+    """스키마를 한 번만 검사해 만든 jsonschema 검증기 (스키마 객체별 캐시)
+
+    Raises:
+        jsonschema.SchemaError: 스키마 자체가 유효하지 않은 경우
+    """
+    cached = _compiled_validators.get(id(schema))
+    if cached is None or cached[0] is not schema:
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        cached = _compiled_validators[id(schema)] = (schema, validator_class(schema))
+    return cached[1]
+
+
+def schema_error(schema: Dict[str, Any], instance: Any):
+    """jsonschema.validate()와 같은 기준으로 고른 검증 오류 (없으면 None)"""
+    return jsonschema.exceptions.best_match(compiled_validator(schema).iter_errors(instance))
+
+
+# 잠재적으로 위험한 입력 패턴 (defense in depth, 한 번만 컴파일)
+_DANGEROUS_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE | re.DOTALL), pattern_name)
+    for pattern, pattern_name in (
+        (r'<script[^>]*>.*?</script>', 'Script tags'),
+        (r'javascript:', 'JavaScript protocol'),
+        (r'on\w+\s*=', 'Event handlers'),
+        (r'<iframe[^>]*>', 'Iframe tags'),
+    )
+]
+
+
 class PromptCategory(Enum):
     """프롬프트 카테고리"""
     PLANNING = "기획"
@@ -79,15 +117,8 @@ class PromptComponent:
             )
 
         # Check for potentially dangerous patterns (defense in depth)
-        dangerous_patterns = [
-            (r'<script[^>]*>.*?</script>', 'Script tags'),
-            (r'javascript:', 'JavaScript protocol'),
-            (r'on\w+\s*=', 'Event handlers'),
-            (r'<iframe[^>]*>', 'Iframe tags'),
-        ]
-
-        for pattern, pattern_name in dangerous_patterns:
-            if re.search(pattern, value, re.IGNORECASE | re.DOTALL):
+        for pattern, pattern_name in _DANGEROUS_PATTERNS:
+            if pattern.search(value):
                 raise ValueError(f"{field_name}: Potentially malicious content detected ({pattern_name})")
 
         return value
@@ -191,8 +222,23 @@ class PromptComponent:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'PromptComponent':
-        """딕셔너리에서 생성"""
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> 'PromptComponent':
+        """딕셔너리에서 생성
+
+        Args:
+            data: 컴포넌트 딕셔너리
+            trusted: True면 정리/검증을 생략 (서비스가 검증 후 서명한 파일 전용)
+        """
+        if trusted:
+            component = cls.__new__(cls)
+            component.role = list(data.get("role", []))
+            component.goal = data.get("goal", "")
+            component.context = list(data.get("context", []))
+            component.document = data.get("document", "")
+            component.output = data.get("output", "")
+            component.rule = list(data.get("rule", []))
+            return component
+
         return cls(
             role=data.get("role", []),
             goal=data.get("goal", ""),
@@ -259,19 +305,163 @@ class PromptVersion:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'PromptVersion':
-        """딕셔너리에서 생성"""
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> 'PromptVersion':
+        """딕셔너리에서 생성 (trusted는 PromptComponent.from_dict 참고)"""
         created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now()
 
         return cls(
             version=data.get("version", 1),
             created_at=created_at,
-            components=PromptComponent.from_dict(data.get("components", {})),
+            components=PromptComponent.from_dict(data.get("components", {}), trusted),
             generated_prompt=data.get("generated_prompt", ""),
             description=data.get("description", "")
         )
 
 
+def summarize_components(components: PromptComponent) -> Dict[str, Any]:
+    """버전 히스토리 표시용 컴포넌트 요약"""
+    return {
+        'role_count': len(components.role),
+        'has_goal': bool(components.goal),
+        'context_count': len(components.context),
+        'has_output': bool(components.output),
+        'rule_count': len(components.rule)
+    }
+
+
+def describe_version(version: PromptVersion) -> Dict[str, Any]:
+    """버전 본문 없이 알 수 있는 버전 정보 (헤더 인덱스 형식)"""
+    return {
+        "version": version.version,
+        "created_at": version.created_at.isoformat(),
+        "description": version.description,
+        "components_summary": summarize_components(version.components)
+    }
+
+
+class LazyVersionList(MutableSequence):
+    """필요할 때만 PromptVersion을 생성하는 지연 버전 목록
+
+    헤더의 버전 인덱스(버전 번호, 생성 시각, 설명, 컴포넌트 요약)만으로 길이, 버전 번호
+    조회, 히스토리 표시를 처리하고, 특정 버전에 접근할 때만 해당 버전 본문을 파싱,
+    검증해 PromptVersion으로 만듭니다.
+    """
+
+    def __init__(self, index: List[Dict[str, Any]],
+                 loader: Callable[[Dict[str, Any]], Dict[str, Any]],
+                 validate: bool = True, trusted: bool = False):
+        """지연 버전 목록 초기화
+
+        Args:
+            index: 위치별 버전 인덱스 항목
+            loader: 버전 인덱스 항목을 받아 버전 원본 딕셔너리를 반환하는 함수
+            validate: 본문을 만들 때 JSON 스키마 검증 여부
+            trusted: 서비스가 서명한 파일이면 True (스키마 검증과 컴포넌트 정리를 모두 생략)
+        """
+        self._index = [dict(entry) for entry in index]
+        self._loader = loader
+        self._validate = validate and not trusted
+        self._trusted = trusted
+        self._items: List[Optional[PromptVersion]] = [None] * len(self._index)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+
+        position = self._normalize(position)
+        item = self._items[position]
+        if item is None:
+            data = self._loader(self._index[position])
+            if self._validate:
+                validate_version_data(data)
+            item = PromptVersion.from_dict(data, self._trusted)
+            self._items[position] = item
+        return item
+
+    def __setitem__(self, position, value: PromptVersion):
+        if isinstance(position, slice):
+            raise TypeError("LazyVersionList does not support slice assignment")
+        position = self._normalize(position)
+        self._items[position] = value
+
+    def __delitem__(self, position):
+        if isinstance(position, slice):
+            raise TypeError("LazyVersionList does not support slice deletion")
+        position = self._normalize(position)
+        del self._items[position]
+        del self._index[position]
+
+    def insert(self, position: int, value: PromptVersion):
+        self._items.insert(position, value)
+        self._index.insert(position, {})
+
+    def _normalize(self, position: int) -> int:
+        if position < 0:
+            position += len(self._items)
+        if not 0 <= position < len(self._items):
+            raise IndexError("version position out of range")
+        return position
+
+    def is_materialized(self, position: int) -> bool:
+        """해당 위치의 버전 본문이 이미 생성되었는지 여부"""
+        return self._items[self._normalize(position)] is not None
+
+    def version_info(self, position: int) -> Dict[str, Any]:
+        """본문을 파싱하지 않고 버전 정보 반환"""
+        position = self._normalize(position)
+        item = self._items[position]
+        if item is not None:
+            return describe_version(item)
+        entry = self._index[position]
+        return {key: entry[key] for key in ("version", "created_at", "description", "components_summary")}
+
+    def version_numbers(self) -> List[int]:
+        """위치별 버전 번호"""
+        return [
+            item.version if item is not None else entry["version"]
+            for item, entry in zip(self._items, self._index)
+        ]
+
+    def raw(self, position: int) -> Dict[str, Any]:
+        """직렬화용 버전 딕셔너리 (생성되지 않은 버전은 원본을 그대로 사용)"""
+        position = self._normalize(position)
+        item = self._items[position]
+        return item.to_dict() if item is not None else self._loader(self._index[position])
+
+    def estimated_size(self) -> int:
+        """생성되지 않은 버전 원본의 추정 메모리 (바이트)"""
+        return sum(
+            256 + 2 * entry.get("length", 0)
+            for item, entry in zip(self._items, self._index)
+            if item is None
+        )
+
+
+def validate_version_data(data: Dict[str, Any]):
+    """단일 버전 딕셔너리를 템플릿 스키마의 버전 항목 규칙으로 검증
+
+    Raises:
+        PromptValidationError: 스키마 검증 실패
+    """
+    if not JSONSCHEMA_AVAILABLE:
+        return
+
+    e = schema_error(PromptTemplate.JSON_SCHEMA["properties"]["versions"]["items"], data)
+    if e is not None:
+        error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
+        raise PromptValidationError(f"JSON schema validation failed at versions -> {error_path}: {e.message}")
+
+
+def _version_numbers(versions) -> List[int]:
+    """버전 번호 목록 (지연 목록은 본문을 만들지 않음)"""
+    if isinstance(versions, LazyVersionList):
+        return versions.version_numbers()
+    return [version.version for version in versions]
+
+
 @dataclass
 class PromptTemplate:
     """프롬프트 템플릿 (with JSON schema validation)"""
@@ -398,24 +588,39 @@ class PromptTemplate:
 
         return new_version_number
 
+    def _version_position(self, version_number: int) -> Optional[int]:
+        """버전 번호의 목록 내 위치"""
+        try:
+            return _version_numbers(self.versions).index(version_number)
+        except ValueError:
+            return None
+
     def get_current_version(self) -> Optional[PromptVersion]:
         """현재 버전 반환"""
         if not self.versions:
             return None
 
-        for version in self.versions:
-            if version.version == self.current_version:
-                return version
+        position = self._version_position(self.current_version)
+        if position is not None:
+            return self.versions[position]
 
         # 현재 버전을 찾지 못한 경우 최신 버전 반환
         return self.versions[-1]
 
     def get_version(self, version_number: int) -> Optional[PromptVersion]:
         """특정 버전 반환"""
-        for version in self.versions:
-            if version.version == version_number:
-                return version
-        return None
+        position = self._version_position(version_number)
+        return self.versions[position] if position is not None else None
+
+    def get_version_infos(self) -> List[Dict[str, Any]]:
+        """버전 본문을 만들지 않고 버전별 정보 반환
+
+        Returns:
+            [{"version", "created_at"(ISO 문자열), "description", "components_summary"}, ...]
+        """
+        if isinstance(self.versions, LazyVersionList):
+            return [self.versions.version_info(i) for i in range(len(self.versions))]
+        return [describe_version(version) for version in self.versions]
 
     def update_current_version(self, components: PromptComponent, description: str = "") -> bool:
         """현재 버전 업데이트"""
@@ -438,17 +643,17 @@ class PromptTemplate:
         if len(self.versions) <= 1:
             return False
 
-        for i, version in enumerate(self.versions):
-            if version.version == version_number:
-                del self.versions[i]
+        position = self._version_position(version_number)
+        if position is None:
+            return False
 
-                # 삭제된 버전이 현재 버전이면 최신 버전으로 변경
-                if self.current_version == version_number:
-                    self.current_version = self.versions[-1].version
+        del self.versions[position]
 
-                return True
+        # 삭제된 버전이 현재 버전이면 최신 버전으로 변경
+        if self.current_version == version_number:
+            self.current_version = _version_numbers(self.versions)[-1]
 
-        return False
+        return True
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -457,15 +662,21 @@ class PromptTemplate:
             "name": self.name,
             "category": self.category.value,
             "current_version": self.current_version,
-            "versions": [version.to_dict() for version in self.versions],
+            "versions": self._version_dicts(),
             "tags": self.tags,
             "metadata": self.metadata
         }
 
+    def _version_dicts(self) -> List[Dict[str, Any]]:
+        """직렬화용 버전 목록 (지연 목록의 미생성 버전은 원본 그대로)"""
+        if isinstance(self.versions, LazyVersionList):
+            return [self.versions.raw(i) for i in range(len(self.versions))]
+        return [version.to_dict() for version in self.versions]
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'PromptTemplate':
-        """딕셔너리에서 생성"""
-        versions = [PromptVersion.from_dict(v_data) for v_data in data.get("versions", [])]
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> 'PromptTemplate':
+        """딕셔너리에서 생성 (trusted는 PromptComponent.from_dict 참고)"""
+        versions = [PromptVersion.from_dict(v_data, trusted) for v_data in data.get("versions", [])]
 
         return cls(
             template_id=data.get("template_id", str(uuid.uuid4())),
@@ -482,6 +693,7 @@ class PromptTemplate:
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
 
     @classmethod
+    @traced("PromptTemplate.from_json")
     def from_json(cls, json_str: str) -> 'PromptTemplate':
         """JSON 문자열에서 생성 (with validation)
 
@@ -511,13 +723,14 @@ class PromptTemplate:
         # Validate against schema if jsonschema is available
         if JSONSCHEMA_AVAILABLE:
             try:
-                jsonschema.validate(instance=data, schema=cls.JSON_SCHEMA)
-            except jsonschema.ValidationError as e:
-                # Extract useful error information
-                error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
-                raise PromptValidationError(
-                    f"JSON schema validation failed at {error_path}: {e.message}"
-                )
+                # 스키마 검사와 검증기 생성은 한 번만 (compiled_validator 캐시)
+                e = schema_error(cls.JSON_SCHEMA, data)
+                if e is not None:
+                    # Extract useful error information
+                    error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
+                    raise PromptValidationError(
+                        f"JSON schema validation failed at {error_path}: {e.message}"
+                    )
             except jsonschema.SchemaError as e:
                 # Schema itself is invalid (shouldn't happen in production)
                 raise PromptValidationError(f"Invalid JSON schema: {e}")
@@ -526,12 +739,15 @@ class PromptTemplate:
         return cls.from_dict(data)
 
     def get_summary(self) -> Dict[str, Any]:
-        """템플릿 요약 정보"""
-        current_version = self.get_current_version()
+        """템플릿 요약 정보 (버전 본문을 만들지 않음)"""
+        infos = self.get_version_infos()
+
+        position = self._version_position(self.current_version)
+        current_info = infos[position if position is not None else -1] if infos else None
 
-        # datetime 객체를 ISO 형식 문자열로 변환
-        created_at = self.versions[0].created_at if self.versions else None
-        updated_at = current_version.created_at if current_version else None
+        # 생성/수정 시각은 ISO 형식 문자열
+        created_at = infos[0]["created_at"] if infos else None
+        updated_at = current_info["created_at"] if current_info else None
 
         return {
             "template_id": self.template_id,
@@ -539,10 +755,10 @@ class PromptTemplate:
             "category": self.category.value,
             "version_count": len(self.versions),
             "current_version": self.current_version,
-            "created_at": created_at.isoformat() if created_at else None,
-            "updated_at": updated_at.isoformat() if updated_at else None,
+            "created_at": created_at,
+            "updated_at": updated_at,
             "tags": self.tags,
-            "has_components": not current_version.components.is_empty() if current_version else False
+            "has_components": any(current_info["components_summary"].values()) if current_info else False
         }
 
     @staticmethod
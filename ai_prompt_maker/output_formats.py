@@ -0,0 +1,158 @@
+"""
+Output Format Registry
+
+출력 형식 파일(data/output_formats.json)을 프로세스당 한 번 읽어 모든 세션이
+함께 쓰는 읽기 전용 레지스트리
+
+카테고리별 형식 목록, format_id 조회, 형식 keywords의 역색인을 로드 시점에 미리
+만들어 두므로 화면 재실행마다 파일을 다시 파싱하거나 형식 전체를 훑지 않습니다.
+조회 때는 파일 서명(수정 시간/크기)만 확인하고 바뀐 경우에만 다시 읽어 레지스트리를
+통째로 교체합니다. 값은 config_snapshot의 FrozenDict/FrozenList라서 세션이
+변경할 수 없습니다.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .config_snapshot import FrozenDict, FrozenList, freeze
+
+
+DEFAULT_OUTPUT_FORMATS_PATH = "data/output_formats.json"
+
+# 파일이 없거나 읽을 수 없을 때 쓰는 기본 형식
+DEFAULT_OUTPUT_FORMATS = {
+    "categories": {
+        "basic_format": {
+            "name": "기본 출력 형식",
+            "description": "일반적으로 사용되는 기본적인 문서 형태"
+        }
+    },
+    "formats": {
+        "basic_report": {
+            "format_id": "basic_report",
+            "name": "보고서",
+            "category": "basic_format",
+            "description": "기본 보고서 형식",
+            "template": "보고서 형식으로 작성해주세요.",
+            "keywords": ["보고서"]
+        }
+    }
+}
+
+# 파일 서명 (수정 시간 ns, 크기, inode), 파일이 없으면 None
+FileSignature = Optional[Tuple[int, int, int]]
+
+
+def _normalize_keyword(keyword: str) -> str:
+    return keyword.strip().lower()
+
+
+class OutputFormatRegistry:
+    """미리 색인한 읽기 전용 출력 형식 모음
+
+    Attributes:
+        raw: 형식 파일 전체 {"categories": ..., "formats": ...}
+        categories: 카테고리 ID -> 카테고리 정보
+        formats: format_id -> 형식 정보
+        signature: 읽은 파일의 서명 (기본 형식이면 None 또는 손상된 파일의 서명)
+    """
+
+    def __init__(self, data: Dict[str, Any], signature: FileSignature = None):
+        self.raw: FrozenDict = freeze(data)
+        self.categories: FrozenDict = self.raw.get("categories", FrozenDict())
+        self.formats: FrozenDict = self.raw.get("formats", FrozenDict())
+        self.signature = signature
+
+        by_category: Dict[str, Dict[str, Any]] = {category_id: {} for category_id in self.categories}
+        keyword_index: Dict[str, list] = {}
+        for format_id, format_data in self.formats.items():
+            by_category.setdefault(format_data.get("category"), {})[format_id] = format_data
+            for keyword in format_data.get("keywords", ()):
+                format_ids = keyword_index.setdefault(_normalize_keyword(keyword), [])
+                if format_id not in format_ids:
+                    format_ids.append(format_id)
+
+        self._by_category = FrozenDict((key, FrozenDict(value)) for key, value in by_category.items())
+        self._keyword_index = FrozenDict((key, FrozenList(value)) for key, value in keyword_index.items())
+
+    def __len__(self) -> int:
+        return len(self.formats)
+
+    def __contains__(self, format_id: str) -> bool:
+        return format_id in self.formats
+
+    def get(self, format_id: str) -> Optional[FrozenDict]:
+        """format_id로 형식 조회 (없으면 None)"""
+        return self.formats.get(format_id)
+
+    def formats_in(self, category: str) -> FrozenDict:
+        """카테고리에 속한 형식 (format_id -> 형식 정보, 파일 순서 유지)"""
+        return self._by_category.get(category, FrozenDict())
+
+    def formats_with_keyword(self, keyword: str) -> FrozenList:
+        """keywords에 keyword가 있는 형식 ID 목록 (대소문자/앞뒤 공백 무시)"""
+        return self._keyword_index.get(_normalize_keyword(keyword), FrozenList())
+
+    @property
+    def keywords(self) -> FrozenDict:
+        """정규화한 키워드 -> 형식 ID 목록 역색인"""
+        return self._keyword_index
+
+
+def _file_signature(path: Path) -> FileSignature:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _load_registry(path: Path, signature: FileSignature) -> OutputFormatRegistry:
+    if signature is None:
+        return OutputFormatRegistry(DEFAULT_OUTPUT_FORMATS)
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return OutputFormatRegistry(data, signature)
+
+    except Exception as e:
+        print(f"출력 형식 로드 실패: {e}")
+        # 손상된 파일은 서명을 기록해 두어 파일이 바뀔 때까지 다시 파싱하지 않음
+        return OutputFormatRegistry(DEFAULT_OUTPUT_FORMATS, signature)
+
+
+_registries: Dict[str, OutputFormatRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_output_format_registry(path: Union[str, Path] = DEFAULT_OUTPUT_FORMATS_PATH) -> OutputFormatRegistry:
+    """프로세스 공유 출력 형식 레지스트리
+
+    호출마다 파일 서명만 확인하고, 파일이 바뀐 경우에만 다시 읽어 교체합니다.
+    이전 레지스트리를 들고 있던 쪽은 계속 이전 내용을 일관되게 봅니다.
+
+    Args:
+        path: 출력 형식 파일 경로 (상대 경로는 현재 작업 디렉토리 기준)
+    """
+    path = Path(os.path.abspath(path))
+    key = str(path)
+    signature = _file_signature(path)
+
+    registry = _registries.get(key)
+    if registry is not None and registry.signature == signature:
+        return registry
+
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None or registry.signature != signature:
+            registry = _registries[key] = _load_registry(path, signature)
+        return registry
+
+
+def clear_output_format_registries():
+    """공유 레지스트리를 모두 비우기 (다음 조회 때 다시 읽음)"""
+    with _registries_lock:
+        _registries.clear()
@@ -0,0 +1,67 @@
+"""
+Pagination
+
+템플릿 목록의 정렬 기준과 키셋(keyset) 커서
+
+커서는 마지막으로 돌려준 항목의 (정렬 값, template_id)를 담은 불투명 문자열이며,
+다음 페이지는 이 키 "다음" 항목부터 시작합니다. 오프셋 방식과 달리 페이지 사이에
+템플릿이 추가/삭제되어도 항목이 중복되거나 빠지지 않습니다.
+"""
+import base64
+import json
+from typing import Any, Dict, Optional, Tuple
+
+
+# 정렬 기준 -> (요약 필드, 내림차순 여부)
+SORT_ORDERS: Dict[str, Tuple[str, bool]] = {
+    "updated_at": ("updated_at", True),
+    "created_at": ("created_at", True),
+    "name": ("name", False),
+}
+
+DEFAULT_SORT = "updated_at"
+
+
+def check_sort(sort: str) -> Tuple[str, bool]:
+    """정렬 기준 검증 후 (필드, 내림차순 여부) 반환
+
+    Raises:
+        ValueError: 지원하지 않는 정렬 기준
+    """
+    try:
+        return SORT_ORDERS[sort]
+    except KeyError:
+        raise ValueError(f"Unsupported sort: {sort} (expected one of {tuple(SORT_ORDERS)})")
+
+
+def sort_key(summary: Dict[str, Any], field: str) -> Tuple[str, str]:
+    """요약의 정렬 키 (값이 없으면 빈 문자열, 같은 값은 template_id로 구분)"""
+    return (summary.get(field) or "", summary["template_id"])
+
+
+def encode_cursor(sort: str, key: Tuple[str, str]) -> str:
+    """마지막 항목의 정렬 키를 불투명 커서 문자열로 변환"""
+    raw = json.dumps([sort, key[0], key[1]], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], sort: str) -> Optional[Tuple[str, str]]:
+    """커서 문자열을 정렬 키로 변환 (None이면 첫 페이지)
+
+    Raises:
+        ValueError: 손상된 커서 또는 다른 정렬 기준으로 만든 커서
+    """
+    if cursor is None:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, template_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+    if cursor_sort != sort:
+        raise ValueError(f"Cursor was created for sort '{cursor_sort}', not '{sort}'")
+    if not isinstance(value, str) or not isinstance(template_id, str):
+        raise ValueError("Invalid cursor: malformed key")
+    return value, template_id
@@ -5,6 +5,7 @@ Prompt Generator
 """
 from typing import Dict, List
 from .models import PromptComponent, OutputFormat
+from .tracing import traced
 
 
 class PromptGenerator:
@@ -13,6 +14,7 @@ class PromptGenerator:
     def __init__(self, output_format: OutputFormat = OutputFormat.XML):
         self.output_format = output_format
 
+    @traced("PromptGenerator.generate_prompt")
     def generate_prompt(self, components: PromptComponent, output_format: OutputFormat = None) -> str:
         """컴포넌트로부터 프롬프트 생성
 
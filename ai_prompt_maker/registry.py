@@ -0,0 +1,131 @@
+"""
+Shared Service Registry
+
+프로세스 안에서 PromptMakerService 인스턴스를 생성 인자별로 하나만 만들어 공유하는 레지스트리
+
+Streamlit은 위젯을 조작할 때마다 스크립트를 다시 실행하므로 매번 서비스를 새로
+만들면 설정 확인과 템플릿 캐시 예열(파일 stat/정렬, 최대 50개 파싱)을 반복합니다.
+get_shared_service()는 같은 인자에 대해 같은 인스턴스를 돌려주므로 캐시, 매니페스트,
+검색 색인을 모든 세션이 함께 씁니다. 다른 프로세스가 바꾼 파일은 서비스의 파일
+감시기가 반영합니다.
+
+    python -m ai_prompt_maker.registry --reruns 20
+"""
+import argparse
+import inspect
+import os
+import statistics
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .service import PromptMakerService
+
+
+# 경로 인자는 작업 디렉토리와 무관하게 같은 파일을 가리키면 같은 키로 취급
+_PATH_ARGUMENTS = ("config_path", "templates_dir", "db_path")
+_SERVICE_SIGNATURE = inspect.signature(PromptMakerService)
+
+_services: Dict[Tuple, PromptMakerService] = {}
+_registry_lock = threading.Lock()
+
+
+def _registry_key(service_kwargs: Dict[str, Any]) -> Tuple:
+    """생성 인자를 기본값까지 채워 정규화한 레지스트리 키
+
+    Raises:
+        TypeError: PromptMakerService가 받지 않는 인자
+    """
+    bound = _SERVICE_SIGNATURE.bind(**service_kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    for name in _PATH_ARGUMENTS:
+        if arguments.get(name) is not None:
+            arguments[name] = os.path.abspath(arguments[name])
+    return tuple(sorted(arguments.items()))
+
+
+def get_shared_service(**service_kwargs) -> PromptMakerService:
+    """같은 생성 인자의 공유 서비스 (처음 요청할 때 한 번만 생성)
+
+    여러 스레드가 동시에 처음 요청해도 인스턴스는 하나만 만들어집니다.
+
+    Args:
+        **service_kwargs: PromptMakerService 생성 인자
+
+    Returns:
+        프로세스 안에서 공유되는 서비스
+    """
+    key = _registry_key(service_kwargs)
+    service = _services.get(key)
+    if service is not None:
+        return service
+
+    with _registry_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = PromptMakerService(**service_kwargs)
+        return service
+
+
+def clear_shared_services():
+    """공유 서비스를 모두 정리하고 레지스트리 비우기 (다음 요청 때 새로 생성)"""
+    with _registry_lock:
+        services = list(_services.values())
+        _services.clear()
+    for service in services:
+        service.cleanup_service()
+
+
+def measure_rerun_latency(reruns: int = 20, **service_kwargs) -> Dict[str, float]:
+    """화면 재실행 한 번에 드는 서비스 준비 시간 비교
+
+    재실행마다 서비스를 얻은 뒤 설정과 첫 페이지 목록을 조회하는 과정을
+    새 인스턴스 생성 방식과 공유 인스턴스 방식으로 각각 측정합니다.
+
+    Args:
+        reruns: 재실행 횟수
+        **service_kwargs: PromptMakerService 생성 인자
+
+    Returns:
+        {"new_instance_ms": 중앙값, "shared_instance_ms": 중앙값, "speedup": 배수}
+    """
+    def rerun(get_service) -> float:
+        start = time.perf_counter()
+        service = get_service()
+        service.get_config()
+        service.list_templates(limit=20)
+        return (time.perf_counter() - start) * 1000
+
+    new_instance = [rerun(lambda: PromptMakerService(**service_kwargs)) for _ in range(max(1, reruns))]
+
+    # 첫 요청의 생성 비용은 프로세스당 한 번이므로 측정에서 제외
+    get_shared_service(**service_kwargs)
+    shared_instance = [rerun(lambda: get_shared_service(**service_kwargs)) for _ in range(max(1, reruns))]
+
+    new_ms = statistics.median(new_instance)
+    shared_ms = statistics.median(shared_instance)
+    return {
+        "new_instance_ms": new_ms,
+        "shared_instance_ms": shared_ms,
+        "speedup": new_ms / shared_ms if shared_ms else float("inf"),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    """명령행 진입점 (재실행 지연 측정)"""
+    parser = argparse.ArgumentParser(description="서비스 재실행 지연 측정 (새 인스턴스 vs 공유 인스턴스)")
+    parser.add_argument("--config", default="data/config.json")
+    parser.add_argument("--templates-dir", default="ai_prompt_maker/templates")
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    result = measure_rerun_latency(args.reruns, config_path=args.config, templates_dir=args.templates_dir)
+    print(f"재실행 {args.reruns}회 중앙값")
+    print(f"  새 인스턴스:  {result['new_instance_ms']:>10.2f} ms")
+    print(f"  공유 인스턴스: {result['shared_instance_ms']:>10.2f} ms")
+    print(f"  개선:        {result['speedup']:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
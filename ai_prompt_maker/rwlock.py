@@ -0,0 +1,56 @@
+"""
+Read/Write Lock
+
+여러 스레드가 읽기는 동시에, 쓰기는 혼자 하도록 하는 프로세스 내 잠금
+(프로세스 사이의 잠금은 file_lock 모듈 사용)
+"""
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """읽기 공유/쓰기 배타 잠금
+
+    쓰기를 기다리는 스레드가 있으면 새 읽기는 쓰기가 끝날 때까지 기다리므로
+    읽기가 계속 들어와도 쓰기가 굶지 않습니다. 재진입은 지원하지 않습니다.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """읽기 잠금 (다른 읽기와 동시에 진입)"""
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """쓰기 잠금 (혼자 진입)"""
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
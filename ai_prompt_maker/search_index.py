@@ -0,0 +1,244 @@
+"""
+Template Search Index
+
+템플릿 검색을 위한 증분 역색인 (한글은 문자 바이그램, 그 외는 단어 단위 토큰화)
+"""
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from .models import PromptTemplate
+from .rwlock import ReadWriteLock
+
+
+# 한글 음절, 자모, 호환 자모
+_HANGUL = "가-힣ᄀ-ᇿ㄰-㆏"
+_TOKEN_RE = re.compile(f"([{_HANGUL}]+)|([^\\W{_HANGUL}]+)")
+
+# 색인 단위: 0은 템플릿 헤더(이름, 태그), 1 이상은 해당 버전(프롬프트, 설명)
+HEADER_UNIT = 0
+
+
+def tokenize(text: str) -> List[str]:
+    """검색용 토큰화
+
+    한글 연속 구간은 문자 바이그램(1글자 구간은 그 글자)으로, 그 외 단어 문자는
+    공백/구두점/한글을 경계로 한 단어로 나눕니다. 입력은 소문자로 변환됩니다.
+
+    Args:
+        text: 토큰화할 텍스트
+
+    Returns:
+        토큰 목록 (중복 포함)
+    """
+    tokens = []
+    for match in _TOKEN_RE.finditer(text.lower()):
+        hangul, word = match.groups()
+        if hangul:
+            if len(hangul) == 1:
+                tokens.append(hangul)
+            else:
+                tokens.extend(hangul[i:i + 2] for i in range(len(hangul) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _query_terms(query: str) -> List[Tuple[str, bool]]:
+    """검색어를 (토큰, 정확 일치 여부) 목록으로 변환
+
+    검색어 양 끝의 단어나 1글자 한글은 문서 안에서 더 긴 토큰의 일부일 수 있으므로
+    어휘 사전에서 부분 일치로 찾아야 합니다. 나머지 토큰은 정확히 일치합니다.
+    """
+    terms = []
+    for match in _TOKEN_RE.finditer(query):
+        hangul, word = match.groups()
+        interior = match.start() > 0 and match.end() < len(query)
+        if hangul and len(hangul) > 1:
+            terms.extend((hangul[i:i + 2], True) for i in range(len(hangul) - 1))
+        else:
+            terms.append((hangul or word, interior))
+    return terms
+
+
+def _tokens(template: PromptTemplate) -> Dict[str, Set[int]]:
+    """템플릿의 토큰 -> 색인 단위 집합"""
+    units: Dict[int, List[str]] = {
+        HEADER_UNIT: [template.name, *template.tags]
+    }
+    for version in template.versions:
+        units.setdefault(version.version, []).extend(
+            [version.generated_prompt, version.description]
+        )
+
+    tokens: Dict[str, Set[int]] = {}
+    for unit, texts in units.items():
+        for text in texts:
+            for token in tokenize(text):
+                tokens.setdefault(token, set()).add(unit)
+    return tokens
+
+
+class TemplateSearchIndex:
+    """템플릿 역색인
+
+    토큰 -> 템플릿 ID -> 색인 단위(헤더 또는 버전 번호) 형태의 포스팅을 유지합니다.
+    `candidates()`는 검색어를 부분 문자열로 포함할 수 있는 템플릿의 상위 집합을
+    반환하며, 최종 일치 여부는 호출자가 원문으로 확인합니다.
+
+    여러 스레드에서 함께 쓸 수 있습니다. 검색끼리는 서로 막지 않고, 색인 변경은
+    토큰화를 잠금 밖에서 마친 뒤 포스팅 교체만 쓰기 잠금 안에서 합니다.
+    전체 구축(begin_build ~ finish_build) 중에 들어온 변경은 모아 두었다가 구축이
+    끝날 때 적용하므로 구축 도중 저장/삭제된 템플릿도 빠지지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = ReadWriteLock()
+        self._postings: Dict[str, Dict[str, Set[int]]] = {}
+        self._doc_terms: Dict[str, Set[str]] = {}
+        self._current: Dict[str, int] = {}
+        self.is_built = False
+
+        # 구축 중 들어온 변경 (template_id -> 템플릿, None이면 삭제)
+        self._pending: Optional[Dict[str, Optional[PromptTemplate]]] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, template_id: str) -> bool:
+        return template_id in self._doc_terms
+
+    @property
+    def is_building(self) -> bool:
+        return self._pending is not None
+
+    def clear(self):
+        """색인 초기화"""
+        with self._lock.write():
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._current.clear()
+            self._pending = None
+            self.is_built = False
+
+    def begin_build(self):
+        """전체 구축 시작 (이후 update()/remove() 변경은 finish_build()에서 다시 적용)"""
+        with self._lock.write():
+            self._pending = {}
+
+    def finish_build(self):
+        """구축 중 들어온 변경을 적용하고 구축 완료 표시"""
+        with self._lock.write():
+            # 잠금 안에서 적용해야 직후의 update()보다 오래된 내용이 덮어쓰지 않음
+            for template_id, template in (self._pending or {}).items():
+                self._remove(template_id)
+                if template is not None:
+                    self._insert(template_id, _tokens(template), template.current_version)
+            self._pending = None
+            self.is_built = True
+
+    def update(self, template_id: str, template: PromptTemplate):
+        """저장된 템플릿 반영 (색인이 아직 없으면 무시, 구축 중이면 끝날 때 반영)"""
+        if not self.is_built and self._pending is None:
+            return
+        tokens = _tokens(template)
+        with self._lock.write():
+            if self._pending is not None:
+                self._pending[template_id] = template
+            elif self.is_built:
+                self._remove(template_id)
+                self._insert(template_id, tokens, template.current_version)
+
+    def add(self, template_id: str, template: PromptTemplate):
+        """템플릿 색인 (기존 항목은 교체)
+
+        Args:
+            template_id: 색인 키 (템플릿 파일명 기준 ID)
+            template: 색인할 템플릿
+        """
+        tokens = _tokens(template)
+        with self._lock.write():
+            self._remove(template_id)
+            self._insert(template_id, tokens, template.current_version)
+
+    def _insert(self, template_id: str, tokens: Dict[str, Set[int]], current_version: int):
+        """토큰별 색인 단위를 포스팅에 추가 (쓰기 잠금은 호출자가 관리)"""
+        for token, units in tokens.items():
+            self._postings.setdefault(token, {})[template_id] = units
+        self._doc_terms[template_id] = set(tokens)
+        self._current[template_id] = current_version
+
+    def remove(self, template_id: str):
+        """템플릿을 색인에서 제거"""
+        with self._lock.write():
+            if self._pending is not None:
+                self._pending[template_id] = None
+            self._remove(template_id)
+
+    def _remove(self, template_id: str):
+        """색인에서 제거 (쓰기 잠금은 호출자가 관리)"""
+        terms = self._doc_terms.pop(template_id, None)
+        self._current.pop(template_id, None)
+        if not terms:
+            return
+
+        for token in terms:
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(template_id, None)
+            if not posting:
+                del self._postings[token]
+
+    def candidates(self, query: str, current_versions_only: bool = True) -> Optional[Set[str]]:
+        """검색어를 포함할 수 있는 템플릿 ID 집합
+
+        Args:
+            query: 소문자로 정리된 검색어
+            current_versions_only: True면 헤더와 현재 버전만 대상으로 함
+
+        Returns:
+            후보 템플릿 ID 집합, 검색어에 토큰이 없으면 None (전체 검사 필요)
+        """
+        terms = _query_terms(query)
+        if not terms:
+            return None
+
+        with self._lock.read():
+            # 토큰이 적게 등장하는 것부터 교집합 (정확 일치 우선)
+            matched: Optional[Dict[str, Set[int]]] = None
+            for token, exact in sorted(terms, key=lambda term: not term[1]):
+                units = self._lookup(token, exact)
+                if matched is None:
+                    matched = units
+                else:
+                    matched = {
+                        template_id: matched[template_id] & units[template_id]
+                        for template_id in matched.keys() & units.keys()
+                        if matched[template_id] & units[template_id]
+                    }
+                if not matched:
+                    return set()
+
+            if not current_versions_only:
+                return set(matched)
+
+            return {
+                template_id
+                for template_id, units in matched.items()
+                if HEADER_UNIT in units or self._current.get(template_id) in units
+            }
+
+    def _lookup(self, token: str, exact: bool) -> Dict[str, Set[int]]:
+        """토큰 포스팅 조회 (부분 일치는 어휘 사전 스캔, 읽기 잠금은 호출자가 관리)"""
+        if exact:
+            return {
+                template_id: set(units)
+                for template_id, units in self._postings.get(token, {}).items()
+            }
+
+        result: Dict[str, Set[int]] = {}
+        for term, posting in self._postings.items():
+            if token in term:
+                for template_id, units in posting.items():
+                    result.setdefault(template_id, set()).update(units)
+        return result
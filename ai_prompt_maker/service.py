@@ -6,49 +6,185 @@ Prompt Maker Service
 import json
 import os
 import re
+import threading
+import time
+import uuid
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Set, Union, BinaryIO, Callable
 from datetime import datetime
-import shutil
 
 from .models import PromptTemplate, PromptComponent, PromptVersion, PromptCategory, OutputFormat
 from .models import TemplateNotFoundError, PromptValidationError
 from .prompt_generator import PromptGenerator
+from .sqlite_store import SQLiteTemplateStore
+from .manifest import TemplateManifest
+from .search_index import TemplateSearchIndex
+from .cache import TemplateCache
+from .journal import TemplateJournal, JournalCompactor, make_record
+from .file_lock import template_lock
+from .backup_store import BackupStore
+from .watcher import FileWatcher
+from .layout import TemplateLayout, LAYOUTS
+from .config_snapshot import ConfigSnapshot, FALLBACK_CONFIG
+from .output_formats import OutputFormatRegistry, get_output_format_registry, DEFAULT_OUTPUT_FORMATS_PATH
+from .format_recommender import FormatRecommender
+from .filter_index import check_tag_match
+from .metrics import ServiceMetrics, timed, start_metrics_server
+from .tracing import traced
+from . import template_io, bulk_import, bulk_export, pagination
 
 
 class PromptMakerService:
     """프롬프트 메이커 서비스"""
 
+    STORAGE_BACKENDS = ("json", "sqlite")
+
     def __init__(self,
                  config_path: str = "data/config.json",
-                 templates_dir: str = "ai_prompt_maker/templates"):
+                 templates_dir: str = "ai_prompt_maker/templates",
+                 storage_backend: str = "json",
+                 db_path: Optional[str] = None,
+                 cache_max_entries: int = 256,
+                 cache_max_bytes: int = 32 * 1024 * 1024,
+                 cache_policy: str = "lru",
+                 version_storage: str = "full",
+                 journal_compact_threshold: int = 32,
+                 fsync: bool = False,
+                 backup_keep_generations: Optional[int] = 10,
+                 backup_max_age_days: Optional[float] = None,
+                 compression: str = "none",
+                 watch_files: bool = True,
+                 watch_interval: float = 1.0,
+                 layout: Optional[str] = None,
+                 config_reload_interval: float = 1.0):
         """서비스 초기화
 
         Args:
             config_path: 설정 파일 경로
-            templates_dir: 템플릿 저장 디렉토리
+            templates_dir: 템플릿 저장 디렉토리 (백업 파일도 이 아래에 저장)
+            storage_backend: 저장소 백엔드 ("json": 템플릿별 JSON 파일, "sqlite": 단일 DB)
+            db_path: SQLite DB 경로 (기본값: templates_dir/templates.sqlite3)
+            cache_max_entries: 템플릿 캐시 최대 항목 수
+            cache_max_bytes: 템플릿 캐시 최대 추정 메모리 (바이트)
+            cache_policy: 템플릿 캐시 교체 정책 ("lru" 또는 "lfu")
+            version_storage: JSON 파일의 버전 저장 방식
+                ("full": 모든 버전 전체 저장, "delta": 이전 버전은 다음 버전 대비 델타로 저장)
+            journal_compact_threshold: 템플릿 저널이 이 개수만큼 쌓이면 백그라운드에서
+                스냅샷으로 합침 (0이면 compact_journals() 호출 시에만 합침)
+            fsync: 템플릿/저널 파일을 쓸 때마다 디스크에 동기화할지 여부
+            backup_keep_generations: 삭제 백업을 템플릿별로 보관할 최대 세대 수 (None이면 제한 없음)
+            backup_max_age_days: 삭제 백업 보관 기간(일), prune_backups() 시 적용 (None이면 제한 없음)
+            compression: JSON 파일 압축 방식 ("none" 또는 "gzip", 읽을 때는 자동 감지)
+            watch_files: 템플릿/설정 파일 변경을 감시해 바뀐 항목의 캐시만 무효화할지 여부
+            watch_interval: inotify를 쓸 수 없을 때 디렉토리를 다시 스캔하는 최소 간격(초)
+            layout: 새 템플릿 파일 배치 ("flat": 디렉토리 하나, "sharded": ID 해시 기준
+                256개 하위 디렉토리, None이면 디렉토리에 기록된 배치 또는 flat).
+                기존 파일은 migrate_layout()으로 옮깁니다.
+            config_reload_interval: watch_files=False일 때 설정 파일 수정 시간을 다시
+                확인하는 최소 간격(초, 0이면 조회마다 확인)
         """
+        if storage_backend not in self.STORAGE_BACKENDS:
+            raise ValueError(f"Unknown storage backend: {storage_backend}")
+        if version_storage not in template_io.VERSION_STORAGE_MODES:
+            raise ValueError(f"Unknown version storage mode: {version_storage}")
+        if compression not in template_io.COMPRESSION_MODES:
+            raise ValueError(f"Unknown compression mode: {compression}")
+
         self.config_path = Path(config_path)
         self.templates_dir = Path(templates_dir)
         self.templates_dir.mkdir(parents=True, exist_ok=True)
 
+        # 저장소 백엔드 (None이면 JSON 디렉토리 사용)
+        self.storage_backend = storage_backend
+        self.version_storage = version_storage
+        self.compression = compression
+        self._store: Optional[SQLiteTemplateStore] = None
+        if storage_backend == "sqlite":
+            self._store = SQLiteTemplateStore(db_path or str(self.templates_dir / "templates.sqlite3"))
+
+        # 템플릿 파일 배치 (파일 위치는 두 배치를 모두 확인하므로 변환 중에도 안전)
+        self._layout = TemplateLayout(self.templates_dir, layout)
+
+        # 템플릿 요약 매니페스트 (JSON 디렉토리 백엔드 전용)
+        self._manifest: Optional[TemplateManifest] = None
+        if self._store is None:
+            self._layout.ensure_directories()
+            self._manifest = TemplateManifest(
+                self.templates_dir, self._summarize_template_file, self._layout
+            )
+
+        # 서비스가 쓴 파일 서명 키 (서명이 맞는 파일은 로드 시 검증 생략, JSON 디렉토리 백엔드 전용)
+        self._signing_key: Optional[bytes] = None
+        if self._store is None:
+            self._signing_key = template_io.load_signing_key(self.templates_dir)
+
+        # 버전 변경 저널 (JSON 디렉토리 백엔드 전용)
+        # 스냅샷과 저널은 템플릿별 파일 잠금(file_lock.template_lock)으로 보호
+        self.fsync = fsync
+        self._journal: Optional[TemplateJournal] = None
+        self._journal_counts: Dict[str, int] = {}
+        self.journal_compact_threshold = journal_compact_threshold
+        if self._store is None:
+            self._journal = TemplateJournal(self.templates_dir, fsync=fsync)
+            self._journal_compactor = JournalCompactor(self._fold_journal)
+
+        # 파일 변경 감시 (다른 프로세스나 배포가 바꾼 템플릿/설정 파일의 캐시만 무효화)
+        # 감시기가 있으면 매니페스트는 첫 조회에만 디렉토리 전체를 확인
+        self._watcher: Optional[FileWatcher] = None
+        self._manifest_scanned = False
+        if watch_files:
+            self._watcher = FileWatcher(poll_interval=watch_interval)
+            self._watcher.watch(self.config_path.parent, [".json"])
+            if self._store is None:
+                self._watch_template_directories()
+                self._watcher.watch(self._journal.journal_dir, [".jsonl"])
+
+        # 삭제 백업 저장소 (내용 해시 기반 압축 블롭, 두 백엔드 공용)
+        self._backups = BackupStore(
+            self.templates_dir / "backup",
+            keep_generations=backup_keep_generations,
+            max_age_days=backup_max_age_days,
+            fsync=fsync
+        )
+
+        # 검색 역색인 (첫 검색 시 구축, 이후 저장/삭제 시 증분 갱신)
+        self._search_index = TemplateSearchIndex()
+        self._search_build_lock = threading.Lock()
+
         # 프롬프트 생성기 초기화
         self.generator = PromptGenerator()
 
-        # 설정 캐시
-        self._config_cache: Optional[Dict] = None
-        self._config_last_modified: Optional[float] = None
-
-        # 템플릿 캐시
-        self._templates_cache: Dict[str, PromptTemplate] = {}
+        # 설정 스냅샷 (읽기 전용, 바뀌면 새 스냅샷으로 참조를 통째로 교체)
+        self._config_cache: Optional[ConfigSnapshot] = None
+        self._config_lock = threading.Lock()
+        self.config_reload_interval = config_reload_interval
+        self._config_checked_at = 0.0
+
+        # 출력 형식 추천기 (설정 스냅샷이나 형식 레지스트리가 바뀌면 새로 만듦)
+        self._format_recommender: Optional[FormatRecommender] = None
+
+        # 템플릿 캐시 (항목 수/메모리 제한)
+        self._templates_cache = TemplateCache(
+            max_entries=cache_max_entries,
+            max_bytes=cache_max_bytes,
+            policy=cache_policy
+        )
         self._cache_valid = False
 
-        # 통계
+        # 작업별 지연 시간/캐시 적중/입출력 바이트 지표
+        self._metrics = ServiceMetrics()
+        self._metrics_server = None
+        self._format_registry_seen: Optional[OutputFormatRegistry] = None
+
+        # 통계 (카운터 증가는 _count()로 잠금 안에서, templates_loaded는 캐시 적중 포함 로드 수)
+        self._stats_lock = threading.Lock()
         self.stats = {
             "templates_created": 0,
             "templates_loaded": 0,
             "templates_updated": 0,
             "templates_deleted": 0,
+            "journal_records": 0,
+            "journal_bytes_written": 0,
             "prompts_generated": 0,
             "last_operation": None,
             "service_started": datetime.now()
@@ -110,6 +246,22 @@ class PromptMakerService:
         except (ValueError, OSError) as e:
             raise ValueError(f"Invalid template path: {e}")
 
+    def _template_path(self, safe_id: str) -> Path:
+        """템플릿 파일 경로 (현재 배치 또는 변환 전 배치에서 찾은 위치, 없으면 새로 만들 위치)
+
+        Raises:
+            ValueError: 경로가 템플릿 디렉토리를 벗어나는 경우
+        """
+        template_path = self._layout.resolve(safe_id)
+        self._validate_template_path(template_path)
+        return template_path
+
+    def _watch_template_directories(self):
+        """템플릿 파일이 있을 수 있는 디렉토리 감시 (샤딩 배치면 샤드 디렉토리 포함)"""
+        directories = self._layout.directories() if self._layout.name == "sharded" else [self.templates_dir]
+        for directory in directories:
+            self._watcher.watch(directory, [".json"])
+
     def _ensure_config_exists(self):
         """설정 파일 존재 확인 및 생성"""
         if not self.config_path.exists():
@@ -130,179 +282,141 @@ class PromptMakerService:
                 json.dump(default_config, f, ensure_ascii=False, indent=2)
 
     def get_config(self, force_reload: bool = False) -> Dict:
-        """설정 파일 로드"""
-        try:
-            # 파일 변경 시간 확인
-            current_mtime = self.config_path.stat().st_mtime if self.config_path.exists() else 0
+        """설정 파일 로드 (읽기 전용 dict, 변경하려면 복사해서 사용)"""
+        return self.get_config_snapshot(force_reload).raw
 
-            # 캐시 유효성 검사
-            if (not force_reload and
-                self._config_cache and
-                self._config_last_modified and
-                current_mtime <= self._config_last_modified):
-                return self._config_cache
+    @timed("config")
+    def get_config_snapshot(self, force_reload: bool = False) -> ConfigSnapshot:
+        """현재 설정 스냅샷
 
-            # 설정 파일 로드
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+        감시기가 있으면 감시기가 알린 경우에만, 없으면 config_reload_interval마다
+        한 번만 설정 파일을 stat하고 나머지 조회는 파일 시스템에 접근하지 않습니다.
 
-            # 캐시 업데이트
-            self._config_cache = config
-            self._config_last_modified = current_mtime
+        Args:
+            force_reload: 변경 여부와 무관하게 지금 다시 읽기
+        """
+        if self._watcher is not None:
+            # 설정 파일이 바뀌면 감시기가 스냅샷을 비움
+            self._sync_file_changes()
+
+        # 다른 스레드가 교체할 수 있으므로 한 번만 읽어 사용
+        snapshot = self._config_cache
+        if not force_reload and snapshot is not None and not self._config_needs_check():
+            self._metrics.hit("config")
+            return snapshot
+
+        with self._config_lock:
+            current = self._config_cache
+            if not force_reload and current is not None and (
+                    current is not snapshot or not self._config_needs_check()):
+                # 기다리는 동안 다른 스레드가 새로 읽거나 확인함
+                self._metrics.hit("config")
+                return current
+            return self._reload_config(current, force_reload)
+
+    def _config_needs_check(self) -> bool:
+        """감시기 없이 쓸 때 설정 파일 수정 시간을 확인할 때가 되었는지"""
+        if self._watcher is not None:
+            return False
+        return time.monotonic() - self._config_checked_at >= self.config_reload_interval
 
-            return config
+    def _reload_config(self, current: Optional[ConfigSnapshot], force_reload: bool) -> ConfigSnapshot:
+        """설정 파일이 바뀌었으면 새 스냅샷을 만들어 교체 (_config_lock 안에서 호출)"""
+        self._config_checked_at = time.monotonic()
+        try:
+            mtime = self.config_path.stat().st_mtime
+            if not force_reload and current is not None and current.mtime is not None and mtime <= current.mtime:
+                self._metrics.hit("config")
+                return current
 
-        except Exception as e:
-            # 설정 로드 실패 시 기본 설정 반환
-            return {
-                "keywords": {
-                    "role": ["게임 기획자"],
-                    "goal": ["기능 분석"],
-                    "context": ["신규 기능 개발"],
-                    "output": ["보고서"],
-                    "rule": ["상세 분석 필수"]
-                },
-                "categories": ["전체"]
-            }
+            self._metrics.miss("config")
+            data = self.config_path.read_bytes()
+            self._metrics.add_bytes("config", read=len(data))
+            snapshot = ConfigSnapshot.compile(json.loads(data.decode('utf-8')), mtime)
+
+        except Exception:
+            # 설정 로드 실패 시 기본 설정 사용 (파일이 고쳐지면 다음 확인 때 다시 읽음)
+            snapshot = ConfigSnapshot.compile(FALLBACK_CONFIG)
+
+        self._config_cache = snapshot
+        return snapshot
 
     def get_keywords(self) -> Dict[str, List[str]]:
         """키워드 목록 반환"""
-        config = self.get_config()
-        return config.get("keywords", {})
+        return self.get_config_snapshot().keywords
 
     def get_domain_config(self, domain: str) -> Dict[str, Any]:
         """특정 도메인 설정 반환
 
+        레거시 구조(도메인 없음)는 스냅샷을 만들 때 game_dev 도메인으로 변환되어 있습니다.
+
         Args:
             domain: 도메인 ID (예: "game_dev", "uiux")
 
         Returns:
-            도메인 설정 딕셔너리
+            도메인 설정 딕셔너리 (없는 도메인이면 game_dev 설정, 읽기 전용)
         """
-        config = self.get_config()
-
-        # 새 도메인 구조 확인
-        if 'domains' in config:
-            domains = config.get('domains', {})
-            if domain in domains:
-                return domains[domain]
-            # 기본값으로 game_dev 반환
-            return domains.get('game_dev', {})
-
-        # 레거시 구조 (도메인 없음) - 자동 마이그레이션
-        return self._migrate_legacy_to_domain(config, 'game_dev')
-
-    def _migrate_legacy_to_domain(self, legacy_config: Dict, domain: str = 'game_dev') -> Dict[str, Any]:
-        """레거시 config를 도메인 구조로 변환
-
-        Args:
-            legacy_config: 기존 config 구조
-            domain: 변환할 도메인명
-
-        Returns:
-            도메인 형식의 설정
-        """
-        return {
-            'name': '게임 개발',
-            'description': '게임 기획, 개발, QA 관련 프롬프트',
-            'icon': '🎮',
-            'enabled': True,
-            'keywords': legacy_config.get('keywords', {}),
-            'goal_expansions': legacy_config.get('goal_expansions', {}),
-            'context_expansions': legacy_config.get('context_expansions', {}),
-            'rule_expansions': legacy_config.get('rule_expansions', {})
-        }
+        return self.get_config_snapshot().domain(domain)
 
     def list_domains(self) -> List[Dict[str, str]]:
         """활성화된 도메인 목록 반환
 
         Returns:
-            도메인 정보 리스트 [{'id': 'game_dev', 'name': '게임 개발', ...}, ...]
-        """
-        config = self.get_config()
-
-        # 새 도메인 구조
-        if 'domains' in config:
-            domains = config.get('domains', {})
-            return [
-                {
-                    'id': domain_id,
-                    'name': domain_data.get('name', domain_id),
-                    'description': domain_data.get('description', ''),
-                    'icon': domain_data.get('icon', '📁')
-                }
-                for domain_id, domain_data in domains.items()
-                if domain_data.get('enabled', True)
-            ]
-
-        # 레거시 구조 - 게임 개발만 반환
-        return [
-            {
-                'id': 'game_dev',
-                'name': '게임 개발',
-                'description': '게임 기획, 개발, QA 관련 프롬프트',
-                'icon': '🎮'
-            }
-        ]
+            도메인 정보 리스트 [{'id': 'game_dev', 'name': '게임 개발', ...}, ...] (읽기 전용)
+        """
+        return self.get_config_snapshot().domain_list
 
     def get_categories(self) -> List[str]:
         """카테고리 목록 반환"""
-        config = self.get_config()
-        return config.get("categories", ["전체"])
+        return self.get_config_snapshot().categories
 
     def load_output_formats(self) -> Dict[str, Any]:
-        """출력 형식 파일 로드"""
-        try:
-            output_formats_path = Path("data/output_formats.json")
-
-            if not output_formats_path.exists():
-                # 기본 포맷 반환
-                return {
-                    "categories": {
-                        "basic_format": {
-                            "name": "기본 출력 형식",
-                            "description": "일반적으로 사용되는 기본적인 문서 형태"
-                        }
-                    },
-                    "formats": {
-                        "basic_report": {
-                            "format_id": "basic_report",
-                            "name": "보고서",
-                            "category": "basic_format",
-                            "description": "기본 보고서 형식",
-                            "template": "보고서 형식으로 작성해주세요.",
-                            "keywords": ["보고서"]
-                        }
-                    }
-                }
-
-            with open(output_formats_path, 'r', encoding='utf-8') as f:
-                formats_data = json.load(f)
-
-            return formats_data
+        """출력 형식 파일 로드 (읽기 전용 dict, 프로세스 공유 레지스트리의 원본)"""
+        return self.get_output_format_registry().raw
 
-        except Exception as e:
-            print(f"출력 형식 로드 실패: {e}")
-            # 에러 발생 시 기본 포맷 반환
-            return {
-                "categories": {
-                    "basic_format": {
-                        "name": "기본 출력 형식",
-                        "description": "일반적으로 사용되는 기본적인 문서 형태"
-                    }
-                },
-                "formats": {
-                    "basic_report": {
-                        "format_id": "basic_report",
-                        "name": "보고서",
-                        "category": "basic_format",
-                        "description": "기본 보고서 형식",
-                        "template": "보고서 형식으로 작성해주세요.",
-                        "keywords": ["보고서"]
-                    }
-                }
-            }
+    def get_output_format_registry(self) -> OutputFormatRegistry:
+        """출력 형식 레지스트리 (카테고리별 목록, format_id 조회, 키워드 색인 포함)
+
+        파일은 바뀐 경우에만 다시 읽고, 읽을 수 없으면 기본 형식을 사용합니다.
+        """
+        with self._metrics.time("formats"):
+            registry = get_output_format_registry(DEFAULT_OUTPUT_FORMATS_PATH)
+        if registry is self._format_registry_seen:
+            self._metrics.hit("formats")
+        else:
+            # 처음 보거나 파일이 바뀌어 다시 읽은 레지스트리
+            self._format_registry_seen = registry
+            self._metrics.miss("formats")
+            if registry.signature is not None:
+                self._metrics.add_bytes("formats", read=registry.signature[1])
+        return registry
+
+    def get_format_recommender(self) -> FormatRecommender:
+        """현재 설정과 출력 형식으로 만든 추천기 (둘 중 하나가 바뀐 경우에만 다시 만듦)"""
+        config = self.get_config_snapshot()
+        registry = self.get_output_format_registry()
+        recommender = self._format_recommender
+        if recommender is None or recommender.config is not config or recommender.registry is not registry:
+            recommender = self._format_recommender = FormatRecommender(registry, config)
+        return recommender
+
+    def recommend_output_formats(self, goal: Optional[str] = None, context: Optional[List[str]] = None,
+                                 rule: Optional[List[str]] = None, domain: str = "game_dev",
+                                 top_k: int = 3) -> List[Dict[str, Any]]:
+        """선택한 목표/컨텍스트/규칙(과 설정 파일의 확장 문장)에 맞는 출력 형식 추천
+
+        Returns:
+            점수 내림차순 [{"format_id", "name", "category", "score", "matched_keywords"}, ...]
+        """
+        return self.get_format_recommender().recommend(goal, context or (), rule or (), domain, top_k)
+
+    def recommend_output_formats_batch(self, component_sets: List[Any], domain: str = "game_dev",
+                                       top_k: int = 3) -> List[List[Dict[str, Any]]]:
+        """여러 구성 요소 묶음({"goal", "context", "rule"} 또는 PromptComponent)을 한 번에 추천"""
+        return self.get_format_recommender().recommend_batch(component_sets, domain, top_k)
 
+    @traced("PromptMakerService.generate_prompt")
+    @timed("generate")
     def generate_prompt(self, components: PromptComponent, output_format: OutputFormat = None) -> str:
         """프롬프트 생성
 
@@ -320,7 +434,7 @@ class PromptMakerService:
             prompt = self.generator.generate_prompt(components, output_format)
 
             # 통계 업데이트
-            self.stats["prompts_generated"] += 1
+            self._count("prompts_generated")
             self.stats["last_operation"] = "프롬프트 생성"
 
             return prompt
@@ -349,7 +463,7 @@ class PromptMakerService:
             template.update_current_version(components, description)
 
             # 통계 업데이트
-            self.stats["templates_created"] += 1
+            self._count("templates_created")
             self.stats["last_operation"] = f"템플릿 생성: {name}"
 
             return template
@@ -357,12 +471,18 @@ class PromptMakerService:
         except Exception as e:
             raise PromptValidationError(f"템플릿 생성 실패: {e}")
 
-    def save_template(self, template: PromptTemplate, overwrite: bool = True) -> bool:
+    @traced("PromptMakerService.save_template")
+    @timed("save")
+    def save_template(self, template: PromptTemplate, overwrite: bool = True,
+                      change: Optional[Dict[str, Any]] = None) -> bool:
         """템플릿 저장
 
         Args:
             template: 저장할 템플릿
             overwrite: 기존 파일 덮어쓰기 허용 여부
+            change: 템플릿에 적용한 버전 변경 (선택). 지정하면 파일 전체를 다시 쓰지 않고
+                저널에 기록합니다. {"op": "set_current" | "add_version" | "delete_version"
+                | "update_version", "version": 버전 번호, "base": 기준 버전(add_version)}
 
         Returns:
             저장 성공 여부
@@ -374,28 +494,45 @@ class PromptMakerService:
         try:
             # Sanitize template ID to prevent path traversal
             safe_id = self._sanitize_template_id(template.template_id)
-            template_path = self.templates_dir / f"{safe_id}.json"
 
-            # Additional path validation
-            self._validate_template_path(template_path)
+            if self._store is not None:
+                existed = self._store.exists(safe_id)
 
-            # 덮어쓰기 확인
-            if not overwrite and template_path.exists():
-                raise PromptValidationError(f"템플릿이 이미 존재합니다: {template.name}")
+                # 덮어쓰기 확인
+                if not overwrite and existed:
+                    raise PromptValidationError(f"템플릿이 이미 존재합니다: {template.name}")
 
-            # JSON 파일로 저장
-            with open(template_path, 'w', encoding='utf-8') as f:
-                f.write(template.to_json())
+                self._store.save(template)
+            else:
+                # 다른 프로세스와 동시에 쓰지 않도록 템플릿 잠금 안에서 확인과 기록
+                # (배치 변환 중에도 기존 파일은 지금 있는 위치에 덮어씀)
+                with template_lock(self.templates_dir, safe_id):
+                    template_path = self._template_path(safe_id)
+                    existed = template_path.exists()
+
+                    # 덮어쓰기 확인
+                    if not overwrite and existed:
+                        raise PromptValidationError(f"템플릿이 이미 존재합니다: {template.name}")
+
+                    # 버전 변경은 저널에 추가하고, 그 외에는 헤더 우선 JSON 스냅샷으로 저장
+                    journaled = (change is not None and existed
+                                 and self._append_journal(safe_id, template_path, template, change))
+                    if not journaled:
+                        written = self._write_snapshot(safe_id, template_path, template)
+                        self._metrics.add_bytes("save", written=written)
+
+                    self._manifest.put(safe_id, template.get_summary(), template_path)
+                self._search_index.update(safe_id, template)
 
             # 캐시 업데이트
             self._templates_cache[template.template_id] = template
             self._cache_valid = True
 
             # 통계 업데이트
-            if template_path.exists():
-                self.stats["templates_updated"] += 1
+            if existed:
+                self._count("templates_updated")
             else:
-                self.stats["templates_created"] += 1
+                self._count("templates_created")
 
             self.stats["last_operation"] = f"템플릿 저장: {template.name}"
 
@@ -407,6 +544,21 @@ class PromptMakerService:
         except Exception as e:
             raise PromptValidationError(f"템플릿 저장 실패: {e}")
 
+    def edit_lock(self, template_id: str):
+        """템플릿 로드-수정-저장 전체를 감싸는 배타 잠금
+
+        캐시의 템플릿은 모든 세션이 함께 쓰므로 수정하는 쪽은 이 잠금 안에서 로드한
+        템플릿의 복사본을 고쳐 save_template()으로 저장합니다. 캐시는 저장에 성공한
+        뒤에만 복사본으로 교체되고, 같은 템플릿을 고치는 다른 세션/프로세스는 앞의
+        저장이 끝난 뒤에 로드하므로 변경을 덮어쓰지 않습니다.
+
+        Raises:
+            ValueError: 잘못된 template ID
+        """
+        return template_lock(self.templates_dir, self._sanitize_template_id(template_id))
+
+    @traced("PromptMakerService.load_template")
+    @timed("load")
     def load_template(self, template_id: str) -> Optional[PromptTemplate]:
         """템플릿 로드
 
@@ -423,30 +575,37 @@ class PromptMakerService:
             # Sanitize template ID to prevent path traversal
             safe_id = self._sanitize_template_id(template_id)
 
-            # 캐시 확인 (sanitized ID 사용)
-            if safe_id in self._templates_cache:
-                self.stats["templates_loaded"] += 1
-                return self._templates_cache[safe_id]
-
-            # 파일에서 로드
-            template_path = self.templates_dir / f"{safe_id}.json"
-
-            # Additional path validation
-            self._validate_template_path(template_path)
+            # 다른 프로세스가 바꾼 파일은 캐시에서 제거
+            self._sync_file_changes()
 
-            if not template_path.exists():
-                return None
+            # 캐시 확인 (sanitized ID 사용)
+            cached = self._templates_cache.get(safe_id)
+            if cached is not None:
+                self._metrics.hit("load")
+                self._count("templates_loaded")
+                return cached
+
+            self._metrics.miss("load")
+
+            if self._store is not None:
+                template = self._store.load(safe_id)
+                if template is None:
+                    return None
+            else:
+                # 파일에서 로드
+                template_path = self._template_path(safe_id)
 
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_data = f.read()
+                if not template_path.exists():
+                    return None
 
-            template = PromptTemplate.from_json(template_data)
+                # 헤더만 검증하고 버전 본문은 접근할 때 생성
+                template = self._read_template_file(safe_id, template_path)
 
             # 캐시에 저장
             self._templates_cache[safe_id] = template
 
             # 통계 업데이트
-            self.stats["templates_loaded"] += 1
+            self._count("templates_loaded")
             self.stats["last_operation"] = f"템플릿 로드: {template.name}"
 
             return template
@@ -460,36 +619,89 @@ class PromptMakerService:
             return None
 
     def list_templates(self, category: Optional[str] = None,
-                      tags: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-        """템플릿 목록 조회"""
+                      tags: Optional[List[str]] = None, sort: str = pagination.DEFAULT_SORT,
+                      limit: Optional[int] = None, cursor: Optional[str] = None,
+                      tag_match: str = "any") -> List[Dict[str, Any]]:
+        """템플릿 목록 조회
+
+        Args:
+            category: 카테고리 필터 ("전체" 또는 None이면 필터 없음)
+            tags: 태그 필터
+            sort: 정렬 기준 ("updated_at", "created_at" 최신순 / "name" 이름순)
+            limit: 최대 개수 (None이면 전체)
+            cursor: list_templates_page()가 돌려준 다음 페이지 커서
+            tag_match: "any"(태그 하나라도 일치하면 포함) 또는 "all"(모두 일치해야 포함)
+        """
         try:
-            templates = []
+            return self.list_templates_page(category, tags, sort, limit, cursor, tag_match)["templates"]
+        except Exception as e:
+            print(f"템플릿 목록 조회 실패: {e}")
+            return []
 
-            # 모든 템플릿 파일 스캔
-            for template_file in self.templates_dir.glob("*.json"):
-                template_id = template_file.stem
-                template = self.load_template(template_id)
+    @traced("PromptMakerService.list_templates_page")
+    @timed("list")
+    def list_templates_page(self, category: Optional[str] = None,
+                            tags: Optional[List[str]] = None, sort: str = pagination.DEFAULT_SORT,
+                            limit: Optional[int] = 50, cursor: Optional[str] = None,
+                            tag_match: str = "any") -> Dict[str, Any]:
+        """템플릿 목록 한 페이지 조회 (키셋 커서 방식)
 
-                if template:
-                    # 카테고리 필터
-                    if category and category != "전체" and template.category.value != category:
-                        continue
+        전체 목록을 정렬하지 않고 정렬 순서상 다음 limit개만 고릅니다
+        (JSON 백엔드는 카테고리/태그 보조 색인과 힙 선택, sqlite 백엔드는 정렬 키 색인 사용).
+
+        Args:
+            category: 카테고리 필터 ("전체" 또는 None이면 필터 없음)
+            tags: 태그 필터
+            sort: 정렬 기준 ("updated_at", "created_at" 최신순 / "name" 이름순)
+            limit: 페이지 크기 (None이면 남은 전체)
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+            tag_match: "any"(태그 하나라도 일치하면 포함) 또는 "all"(모두 일치해야 포함)
+
+        Returns:
+            {"templates": [...], "next_cursor": str 또는 None (마지막 페이지), "total": int}
 
-                    # 태그 필터
-                    if tags and not any(tag in template.tags for tag in tags):
-                        continue
+        Raises:
+            ValueError: 지원하지 않는 정렬 기준/태그 일치 방식, 잘못된 limit 또는 커서
+        """
+        field, descending = pagination.check_sort(sort)
+        check_tag_match(tag_match)
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        after = pagination.decode_cursor(cursor, sort)
+        # 다음 페이지가 있는지 알기 위해 하나 더 조회
+        fetch = limit + 1 if limit is not None else None
+
+        if self._store is not None:
+            templates = self._store.list_summaries(category, tags, sort, fetch, after, tag_match)
+            total = self._store.count_summaries(category, tags, tag_match)
+        else:
+            self._refresh_manifest()
+            templates, total = self._manifest.select(
+                key=lambda summary: pagination.sort_key(summary, field),
+                reverse=descending, limit=fetch, after=after,
+                category=category, tags=tags, tag_match=tag_match
+            )
 
-                    templates.append(template.get_summary())
+        next_cursor = None
+        if limit is not None and len(templates) > limit:
+            templates = templates[:limit]
+            next_cursor = pagination.encode_cursor(sort, pagination.sort_key(templates[-1], field))
 
-            # 업데이트 시간으로 정렬 (최신순) - ISO 형식 문자열 정렬
-            templates.sort(key=lambda x: x.get("updated_at") or "", reverse=True)
+        return {"templates": templates, "next_cursor": next_cursor, "total": total}
 
-            return templates
+    def get_tag_counts(self, category: Optional[str] = None) -> Dict[str, int]:
+        """태그별 템플릿 수 (태그 클라우드용, 많은 순)
 
-        except Exception as e:
-            print(f"템플릿 목록 조회 실패: {e}")
-            return []
+        Args:
+            category: 이 카테고리의 템플릿만 셈 ("전체" 또는 None이면 전체)
+        """
+        if self._store is not None:
+            return self._store.tag_counts(category)
+        self._refresh_manifest()
+        return self._manifest.tag_counts(category)
 
+    @traced("PromptMakerService.delete_template")
+    @timed("delete")
     def delete_template(self, template_id: str) -> bool:
         """템플릿 삭제
 
@@ -505,36 +717,39 @@ class PromptMakerService:
         try:
             # Sanitize template ID to prevent path traversal
             safe_id = self._sanitize_template_id(template_id)
-            template_path = self.templates_dir / f"{safe_id}.json"
 
-            # Additional path validation
-            self._validate_template_path(template_path)
+            if self._store is not None:
+                return self._delete_from_store(safe_id)
 
-            if not template_path.exists():
-                return False
-
-            # 백업 (선택적)
-            backup_dir = self.templates_dir / "backup"
-            backup_dir.mkdir(exist_ok=True)
+            with template_lock(self.templates_dir, safe_id):
+                template_path = self._template_path(safe_id)
+                if not template_path.exists():
+                    return False
 
-            # Use sanitized ID for backup filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_path = backup_dir / f"{safe_id}_{timestamp}.json"
+                # 저널 변경도 백업에 포함되도록 먼저 스냅샷으로 합침
+                self._fold_journal(safe_id)
 
-            # Validate backup path as well
-            self._validate_template_path(backup_path)
-
-            # Atomic copy and delete
-            shutil.copy2(template_path, backup_path)
+                # 백업 (같은 내용은 블롭 하나만 저장, 저장마다 바뀌는 스냅샷 ID와 서명은 제외)
+                summary = self._manifest.get(safe_id)
+                data = template_path.read_bytes()
+                self._metrics.add_bytes("delete", read=len(data))
+                self._backups.add(
+                    safe_id, template_io.canonical_bytes(data), summary["name"] if summary else None
+                )
 
-            # 원본 파일 삭제
-            template_path.unlink()
+                # 원본 파일 삭제
+                template_path.unlink()
+                self._journal.discard(safe_id)
+                self._journal_counts.pop(safe_id, None)
+                self._acknowledge_template_files(safe_id)
+            self._manifest.remove(safe_id)
+            self._search_index.remove(safe_id)
 
             # 캐시에서 제거 (sanitized ID 사용)
             self._templates_cache.pop(safe_id, None)
 
             # 통계 업데이트
-            self.stats["templates_deleted"] += 1
+            self._count("templates_deleted")
             self.stats["last_operation"] = f"템플릿 삭제: {safe_id}"
 
             return True
@@ -547,6 +762,77 @@ class PromptMakerService:
             print(f"템플릿 삭제 실패 ({template_id}): {e}")
             return False
 
+    def _delete_from_store(self, safe_id: str) -> bool:
+        """저장소 백엔드에서 템플릿 삭제 (JSON 백업 생성 후 삭제)"""
+        template = self._store.load(safe_id)
+        if template is None:
+            return False
+
+        # 백업 (JSON 백엔드와 같은 백업 저장소)
+        self._backups.add(safe_id, template.to_json().encode("utf-8"), template.name)
+
+        self._store.delete(safe_id)
+
+        # 캐시에서 제거
+        self._templates_cache.pop(safe_id, None)
+
+        # 통계 업데이트
+        self._count("templates_deleted")
+        self.stats["last_operation"] = f"템플릿 삭제: {safe_id}"
+
+        return True
+
+    def list_backups(self, template_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """삭제 백업 세대 목록 (최신 삭제가 먼저)
+
+        Args:
+            template_id: 특정 템플릿만 조회 (None이면 전체)
+
+        Returns:
+            [{"template_id", "generation", "hash", "size", "name", "deleted_at"}, ...]
+        """
+        if template_id is not None:
+            template_id = self._sanitize_template_id(template_id)
+        return self._backups.list_generations(template_id)
+
+    def restore_template(self, template_id: str, generation: Optional[int] = None,
+                         overwrite: bool = False) -> Optional[PromptTemplate]:
+        """삭제 백업에서 템플릿 복원
+
+        Args:
+            template_id: 복원할 템플릿 ID
+            generation: 백업 세대 번호 (None이면 최신 세대)
+            overwrite: 같은 ID의 템플릿이 있으면 덮어쓸지 여부
+
+        Returns:
+            복원된 템플릿 또는 None (백업이 없는 경우)
+
+        Raises:
+            ValueError: 잘못된 template ID
+            PromptValidationError: 백업이 손상되었거나 저장 실패
+        """
+        safe_id = self._sanitize_template_id(template_id)
+
+        try:
+            data = self._backups.get(safe_id, generation)
+            if data is None:
+                return None
+            template = template_io.loads_template(data, self._signing_key)
+        except Exception as e:
+            raise PromptValidationError(f"백업 복원 실패 ({template_id}): {e}")
+
+        self.save_template(template, overwrite=overwrite)
+        self.stats["last_operation"] = f"템플릿 복원: {template.name}"
+        return template
+
+    def prune_backups(self) -> Dict[str, int]:
+        """백업 보관 정책 적용 및 참조 없는 블롭 정리 (이전 방식 백업 파일도 가져옴)
+
+        Returns:
+            {"imported", "generations_removed", "blobs_removed", "bytes_freed"}
+        """
+        return self._backups.prune()
+
     def copy_template(self, template_id: str, new_name: str,
                      new_category: Optional[str] = None) -> Optional[PromptTemplate]:
         """템플릿 복사"""
@@ -579,8 +865,18 @@ class PromptMakerService:
         except Exception as e:
             raise PromptValidationError(f"템플릿 복사 실패: {e}")
 
-    def search_templates(self, query: str) -> List[Dict[str, Any]]:
-        """템플릿 검색"""
+    @traced("PromptMakerService.search_templates")
+    @timed("search")
+    def search_templates(self, query: str, current_versions_only: bool = True) -> List[Dict[str, Any]]:
+        """템플릿 검색
+
+        이름, 태그, 버전 설명, 생성된 프롬프트에서 대소문자 구분 없이 부분 문자열로 검색합니다.
+        역색인으로 후보를 좁힌 뒤 후보만 원문과 비교합니다.
+
+        Args:
+            query: 검색어
+            current_versions_only: True면 현재 버전만, False면 모든 버전의 설명/프롬프트 검색
+        """
         if not query.strip():
             return self.list_templates()
 
@@ -588,50 +884,226 @@ class PromptMakerService:
         matching_templates = []
 
         try:
-            all_templates = self.list_templates()
+            if self._store is not None:
+                return self._store.search(query, current_versions_only)
 
-            for template_summary in all_templates:
-                # 이름에서 검색
-                if query in template_summary["name"].lower():
-                    matching_templates.append(template_summary)
-                    continue
+            summaries = self._template_summaries()
+            self._ensure_search_index()
+
+            candidates = self._search_index.candidates(query, current_versions_only)
+            if candidates is None:
+                # 토큰이 없는 검색어 (구두점 등) - 전체 검사
+                candidates = summaries.keys()
 
-                # 태그에서 검색
-                if any(query in tag.lower() for tag in template_summary.get("tags", [])):
+            for template_id in candidates:
+                template_summary = summaries.get(template_id)
+                if template_summary and self._template_matches(
+                        template_id, template_summary, query, current_versions_only):
                     matching_templates.append(template_summary)
-                    continue
 
-                # 실제 템플릿 로드해서 내용 검색
-                template = self.load_template(template_summary["template_id"])
-                if template:
-                    current_version = template.get_current_version()
-                    if current_version:
-                        # 프롬프트 내용에서 검색
-                        prompt_text = current_version.generated_prompt.lower()
-                        if query in prompt_text:
-                            matching_templates.append(template_summary)
+            matching_templates.sort(key=lambda x: x.get("updated_at") or "", reverse=True)
 
         except Exception as e:
             print(f"템플릿 검색 실패: {e}")
 
         return matching_templates
 
+    def _template_matches(self, template_id: str, template_summary: Dict[str, Any],
+                          query: str, current_versions_only: bool) -> bool:
+        """검색어가 템플릿 원문에 포함되는지 확인"""
+        # 이름에서 검색
+        if query in template_summary["name"].lower():
+            return True
+
+        # 태그에서 검색
+        if any(query in tag.lower() for tag in template_summary.get("tags", [])):
+            return True
+
+        # 실제 템플릿 로드해서 내용 검색
+        template = self.load_template(template_id)
+        if not template:
+            return False
+
+        if current_versions_only:
+            versions = [template.get_current_version()]
+        else:
+            versions = template.versions
+
+        return any(
+            version and (query in version.generated_prompt.lower()
+                         or query in version.description.lower())
+            for version in versions
+        )
+
+    def _ensure_search_index(self):
+        """검색 역색인이 없으면 전체 템플릿으로 구축 (한 스레드만 구축, 나머지는 대기)"""
+        if self._search_index.is_built:
+            return
+
+        with self._search_build_lock:
+            if self._search_index.is_built:
+                return
+
+            # 구축 시작 후 목록을 읽어야 그 사이 저장된 템플릿이 빠지지 않음
+            self._search_index.begin_build()
+            try:
+                for template_id in self._manifest.items(refresh=False):
+                    template = self.load_template(template_id)
+                    if template:
+                        self._search_index.add(template_id, template)
+            finally:
+                self._search_index.finish_build()
+
+    def _template_summaries(self) -> Dict[str, Dict[str, Any]]:
+        """매니페스트 요약 조회 (외부에서 삭제된 템플릿은 캐시와 색인에서 제거)"""
+        self._refresh_manifest()
+        return self._manifest.items(refresh=False)
+
+    def _refresh_manifest(self):
+        """매니페스트를 디렉토리와 맞추고 외부에서 삭제된 템플릿을 캐시와 색인에서 제거
+
+        감시기가 있으면 디렉토리 전체 확인은 첫 호출에만 하고, 이후에는 감시기가
+        알린 파일만 다시 요약합니다.
+        """
+        self._sync_file_changes(force=True)
+        if self._manifest_scanned:
+            return
+
+        for template_id in self._manifest.refresh():
+            if self._manifest.get(template_id) is None:
+                self._templates_cache.pop(template_id, None)
+                self._search_index.remove(template_id)
+        self._manifest_scanned = self._watcher is not None
+
+    @property
+    def file_generation(self) -> int:
+        """감시 중인 템플릿/설정 파일이 바뀔 때마다 증가하는 세대 번호
+
+        파일 내용에서 파생된 다른 캐시는 이 값을 키로 삼아 무효화할 수 있습니다
+        (watch_files=False면 항상 0).
+        """
+        if self._watcher is None:
+            return 0
+        self._sync_file_changes()
+        return self._watcher.generation
+
+    def _sync_file_changes(self, force: bool = False):
+        """감시기가 알린 변경 파일에 해당하는 캐시/색인 항목만 무효화
+
+        Args:
+            force: 폴링 방식에서도 간격과 무관하게 지금 스캔
+        """
+        if self._watcher is None:
+            return
+        changed = self._watcher.poll(force)
+        if not changed:
+            return
+
+        template_ids: Set[str] = set()
+        for path in changed:
+            if path == self.config_path:
+                self._config_cache = None
+            elif self._store is not None:
+                continue
+            elif path.parent == self._journal.journal_dir:
+                template_ids.add(path.stem)
+            elif self._layout.template_id_of(path) is not None:
+                template_ids.add(self._layout.template_id_of(path))
+
+        if template_ids:
+            self._invalidate_templates(template_ids)
+
+    def _invalidate_templates(self, template_ids: Set[str]):
+        """바뀐 템플릿의 캐시 항목을 버리고 매니페스트/검색 색인 행만 다시 만듦"""
+        for template_id in template_ids:
+            self._templates_cache.pop(template_id, None)
+            self._journal_counts.pop(template_id, None)
+
+        if self._manifest_scanned:
+            self._manifest.refresh(template_ids)
+
+        if self._search_index.is_built or self._search_index.is_building:
+            for template_id in template_ids:
+                try:
+                    template = self._load_uncached(template_id)
+                except Exception as e:
+                    print(f"검색 색인 갱신 실패 ({template_id}): {e}")
+                    template = None
+                if template is None:
+                    self._search_index.remove(template_id)
+                else:
+                    self._search_index.update(template_id, template)
+
+    def _count(self, name: str, amount: int = 1):
+        """통계 카운터 증가 (여러 스레드가 같은 서비스를 써도 누락 없음)"""
+        with self._stats_lock:
+            self.stats[name] += amount
+
     def get_service_stats(self) -> Dict[str, Any]:
         """서비스 통계 반환"""
         try:
-            total_templates = len(list(self.templates_dir.glob("*.json")))
+            if self._store is not None:
+                total_templates = self._store.count()
+            else:
+                # 디렉토리를 다시 훑지 않고 매니페스트 항목 수 사용 (감시기가 변경분만 반영)
+                self._refresh_manifest()
+                total_templates = len(self._manifest)
+
+            with self._stats_lock:
+                stats = dict(self.stats)
 
             return {
-                **self.stats,
+                **stats,
                 "total_templates": total_templates,
+                "storage_backend": self.storage_backend,
                 "templates_directory": str(self.templates_dir),
+                "template_layout": self._layout.name,
                 "config_path": str(self.config_path),
                 "cache_size": len(self._templates_cache),
-                "cache_valid": self._cache_valid
+                "cache": self._templates_cache.get_stats(),
+                "cache_valid": self._cache_valid,
+                "operations": self._metrics.snapshot()
             }
         except Exception:
             return self.stats
 
+    def _stat_counters(self) -> Dict[str, int]:
+        """stats 중 숫자 카운터만"""
+        with self._stats_lock:
+            return {
+                name: value for name, value in self.stats.items()
+                if isinstance(value, int) and not isinstance(value, bool)
+            }
+
+    def get_metrics_text(self) -> str:
+        """작업 지표와 서비스 카운터를 Prometheus 텍스트 형식으로 반환"""
+        return self._metrics.to_prometheus(self._stat_counters())
+
+    def write_metrics(self, path: Union[str, Path]):
+        """Prometheus 텍스트를 파일로 원자적으로 저장 (node_exporter textfile 수집기 등)"""
+        self._metrics.write_prometheus(path, self._stat_counters())
+
+    def start_metrics_server(self, port: int = 0, host: str = "127.0.0.1"):
+        """Prometheus가 수집할 로컬 HTTP 엔드포인트(/metrics) 시작 (이미 실행 중이면 그대로 반환)
+
+        Args:
+            port: 포트 (0이면 빈 포트, 실제 포트는 server.server_address[1])
+            host: 바인드 주소 (기본값은 로컬 전용)
+
+        Returns:
+            실행 중인 서버
+        """
+        if self._metrics_server is None:
+            self._metrics_server = start_metrics_server(self.get_metrics_text, port, host)
+        return self._metrics_server
+
+    def stop_metrics_server(self):
+        """지표 엔드포인트 종료"""
+        server, self._metrics_server = self._metrics_server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
     def export_template(self, template_id: str, export_format: str = "json") -> Optional[str]:
         """템플릿 내보내기"""
         try:
@@ -650,6 +1122,78 @@ class PromptMakerService:
         except Exception:
             return None
 
+    def export_templates(self, destination: Union[str, Path, BinaryIO], export_format: str = "jsonl",
+                         category: Optional[str] = None, tags: Optional[List[str]] = None,
+                         updated_after: Union[datetime, str, None] = None,
+                         updated_before: Union[datetime, str, None] = None,
+                         member_format: str = "json", include_all_versions: bool = False,
+                         progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """템플릿 전체 또는 필터로 고른 일부를 하나의 파일로 스트리밍 내보내기
+
+        템플릿을 하나씩 로드해 바로 기록하고 캐시에 넣지 않으므로 메모리 사용량은
+        템플릿 수와 무관합니다. jsonl 결과는 import_templates로 다시 가져올 수 있습니다.
+
+        Args:
+            destination: 출력 파일 경로 또는 바이너리 스트림
+            export_format: "jsonl", "zip", "text" 중 하나
+            category: 카테고리 필터
+            tags: 태그 필터 (하나라도 일치)
+            updated_after: 이 시각 이후에 수정된 템플릿만 (datetime 또는 ISO 문자열)
+            updated_before: 이 시각 이전에 수정된 템플릿만 (datetime 또는 ISO 문자열)
+            member_format: zip 항목 형식 ("json" 또는 "markdown")
+            include_all_versions: text 형식에서 모든 버전 포함 여부
+            progress: 템플릿 하나를 처리할 때마다 (처리 수, 전체 수)로 호출되는 콜백
+
+        Returns:
+            {"total": int, "exported": int, "bytes": int,
+             "failed": [{"template_id", "error"}, ...]}
+
+        Raises:
+            ValueError: 지원하지 않는 형식
+        """
+        summaries = bulk_export.filter_by_date(
+            self.list_templates(category, tags), updated_after, updated_before
+        )
+        total = len(summaries)
+        failed: List[Dict[str, Any]] = []
+
+        with bulk_export.TemplateExportWriter(
+            destination, export_format, member_format, include_all_versions
+        ) as writer:
+            for done, summary in enumerate(summaries, 1):
+                template_id = summary["template_id"]
+                try:
+                    template = self._load_uncached(template_id)
+                    if template is None:
+                        raise TemplateNotFoundError(f"Template not found: {template_id}")
+                    writer.write(template)
+                except Exception as e:
+                    failed.append({"template_id": template_id, "error": str(e)})
+
+                if progress is not None:
+                    progress(done, total)
+
+        self.stats["last_operation"] = f"템플릿 일괄 내보내기: {writer.count}개"
+        return {"total": total, "exported": writer.count, "bytes": writer.bytes_written, "failed": failed}
+
+    def _load_uncached(self, template_id: str) -> Optional[PromptTemplate]:
+        """캐시를 채우지 않고 템플릿 로드 (캐시에 있으면 그대로 사용)
+
+        Raises:
+            ValueError: 잘못된 template ID
+        """
+        safe_id = self._sanitize_template_id(template_id)
+        cached = self._templates_cache.get(safe_id)
+        if cached is not None:
+            return cached
+        if self._store is not None:
+            return self._store.load(safe_id)
+
+        template_path = self._template_path(safe_id)
+        if not template_path.exists():
+            return None
+        return self._read_template_file(safe_id, template_path)
+
     def import_template_from_json(self, json_data: str) -> Optional[PromptTemplate]:
         """JSON에서 템플릿 가져오기"""
         try:
@@ -659,18 +1203,323 @@ class PromptMakerService:
         except Exception as e:
             raise PromptValidationError(f"템플릿 가져오기 실패: {e}")
 
+    def import_templates(self, source: Union[str, Path, BinaryIO], overwrite: bool = False,
+                         workers: Optional[int] = None, batch_size: int = 500) -> Dict[str, Any]:
+        """JSONL 또는 ZIP 아카이브에서 템플릿 일괄 가져오기
+
+        레코드를 batch_size개씩 스트리밍으로 읽어 작업자 프로세스에서 전체 검증하고,
+        묶음 단위로 저장한 뒤 매니페스트는 마지막에 한 번만 갱신합니다.
+
+        Args:
+            source: 파일 경로 또는 바이너리 스트림 (형식 자동 감지)
+            overwrite: 같은 ID의 기존 템플릿을 덮어쓸지 여부 (False면 duplicate로 보고)
+            workers: 검증 작업자 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 검증,
+                레코드가 bulk_import.PARALLEL_MIN_RECORDS개보다 적으면 작업자를 만들지 않음)
+            batch_size: 한 번에 읽고 검증하고 저장할 레코드 수
+
+        Returns:
+            {"accepted": int, "rejected": int, "duplicate": int,
+             "records": [{"source", "status", "template_id", "error"}, ...]}
+        """
+        records: List[Dict[str, Any]] = []
+        seen: Set[str] = set()
+        manifest_entries: List[tuple] = []
+
+        batches = bulk_import.validate_batches(bulk_import.iter_records(source), batch_size, workers)
+        for batch in batches:
+            accepted = []
+            for where, status, payload in batch:
+                record = {"source": where, "status": status, "template_id": None, "error": None}
+                records.append(record)
+                if status != bulk_import.ACCEPTED:
+                    record["error"] = payload
+                    continue
+
+                try:
+                    template_id = record["template_id"] = self._sanitize_template_id(payload.get("template_id"))
+                except ValueError as e:
+                    record["status"], record["error"] = bulk_import.REJECTED, str(e)
+                    continue
+
+                existed = self._template_exists(template_id)
+                if template_id in seen or (existed and not overwrite):
+                    record["status"] = bulk_import.DUPLICATE
+                    continue
+                seen.add(template_id)
+                # 작업자 프로세스에서 검증을 마쳤으므로 다시 검증하지 않음
+                accepted.append((record, PromptTemplate.from_dict(payload, trusted=True), existed))
+
+            manifest_entries.extend(self._write_import_batch(accepted))
+
+        if self._manifest is not None:
+            self._manifest.put_many(manifest_entries)
+
+        report: Dict[str, Any] = {
+            status: sum(1 for record in records if record["status"] == status)
+            for status in (bulk_import.ACCEPTED, bulk_import.REJECTED, bulk_import.DUPLICATE)
+        }
+        report["records"] = records
+        self.stats["last_operation"] = f"템플릿 일괄 가져오기: {report[bulk_import.ACCEPTED]}개"
+        return report
+
+    def _template_exists(self, safe_id: str) -> bool:
+        if self._store is not None:
+            return self._store.exists(safe_id)
+        return self._layout.resolve(safe_id).exists()
+
+    def _write_import_batch(self, accepted: List[tuple]) -> List[tuple]:
+        """검증된 가져오기 묶음 저장 (실패한 레코드는 rejected로 표시)
+
+        Returns:
+            매니페스트에 기록할 (template_id, summary, file_path) 목록
+        """
+        if not accepted:
+            return []
+
+        written = []
+        if self._store is not None:
+            try:
+                self._store.save_many([template for _, template, _ in accepted])
+                written = [(record, template, None, existed) for record, template, existed in accepted]
+            except Exception as e:
+                for record, _, _ in accepted:
+                    record["status"] = bulk_import.REJECTED
+                    record["error"] = str(e)
+        else:
+            for record, template, existed in accepted:
+                try:
+                    safe_id = template.template_id
+                    with template_lock(self.templates_dir, safe_id):
+                        template_path = self._template_path(safe_id)
+                        self._write_snapshot(safe_id, template_path, template)
+                    written.append((record, template, template_path, existed))
+                except Exception as e:
+                    record["status"] = bulk_import.REJECTED
+                    record["error"] = str(e)
+
+        manifest_entries = []
+        for _, template, template_path, existed in written:
+            template_id = template.template_id
+            self._templates_cache.pop(template_id, None)
+            self._search_index.update(template_id, template)
+            if template_path is not None:
+                manifest_entries.append((template_id, template.get_summary(), template_path))
+            self._count("templates_updated" if existed else "templates_created")
+
+        return manifest_entries
+
+    def _summarize_template_file(self, template_path: Path) -> Optional[Dict[str, Any]]:
+        """매니페스트 재생성용 템플릿 파일 요약
+
+        변경이 감지된 파일만 호출됩니다. 헤더 우선 파일은 첫 줄만 읽고, 캐시나 검색
+        색인에 있는 템플릿일 때만 전체를 다시 읽어 갱신합니다.
+
+        Returns:
+            템플릿 요약 또는 None (유효하지 않은 파일)
+        """
+        try:
+            safe_id = self._sanitize_template_id(template_path.stem)
+        except ValueError:
+            return None
+
+        try:
+            if (safe_id not in self._templates_cache
+                    and not (self._search_index.is_built or self._search_index.is_building)
+                    and not self._journal.exists(safe_id)):
+                header = template_io.read_header(template_path)
+                if header is not None:
+                    return template_io.summary_from_header(header)
+
+            template = self._read_template_file(safe_id, template_path)
+        except Exception as e:
+            print(f"템플릿 요약 실패 ({template_path.name}): {e}")
+            self._templates_cache.pop(safe_id, None)
+            self._search_index.remove(safe_id)
+            return None
+
+        if safe_id in self._templates_cache:
+            self._templates_cache[safe_id] = template
+        self._search_index.update(safe_id, template)
+
+        return template.get_summary()
+
+    def compact_templates(self, version_storage: Optional[str] = None,
+                          compression: Optional[str] = None) -> Dict[str, Any]:
+        """기존 템플릿 파일을 버전 저장/압축 방식에 맞게 일괄 변환 (JSON 디렉토리 백엔드 전용)
+
+        Args:
+            version_storage: 변환할 저장 방식 (None이면 서비스 설정 사용)
+            compression: 변환할 압축 방식 (None이면 서비스 설정 사용)
+
+        Returns:
+            변환 결과 (template_io.compact_directory 참고)
+        """
+        if self._store is not None:
+            raise PromptValidationError("SQLite 백엔드는 파일 변환을 지원하지 않습니다")
+
+        result = template_io.compact_directory(
+            str(self.templates_dir), version_storage or self.version_storage, fsync=self.fsync,
+            compression=compression or self.compression, signing_key=self._signing_key,
+            layout=self._layout
+        )
+
+        # 파일 내용이 바뀌었으므로 캐시를 비우고 매니페스트를 다시 확인
+        self._templates_cache.clear()
+        self._manifest.refresh()
+        self.stats["last_operation"] = f"템플릿 파일 변환: {result['converted']}개"
+
+        return result
+
+    def migrate_layout(self, layout: str) -> Dict[str, int]:
+        """템플릿 파일을 다른 배치로 옮김 (JSON 디렉토리 백엔드 전용)
+
+        템플릿별 잠금을 잡고 한 파일씩 옮기므로 같은 디렉토리를 쓰는 다른 서비스가
+        동작 중이어도 됩니다. 변환한 배치는 디렉토리에 기록되어 layout을 지정하지 않은
+        서비스가 이후 따릅니다.
+
+        Args:
+            layout: 변환할 배치 ("flat" 또는 "sharded")
+
+        Returns:
+            변환 결과 (layout.TemplateLayout.migrate 참고)
+
+        Raises:
+            ValueError: 지원하지 않는 배치
+        """
+        if self._store is not None:
+            raise PromptValidationError("SQLite 백엔드는 파일 배치 변환을 지원하지 않습니다")
+
+        result = self._layout.migrate(layout, fsync=self.fsync, on_move=self._acknowledge_template_files)
+        if self._watcher is not None:
+            self._watch_template_directories()
+
+        # 옮긴 파일은 mtime과 크기가 그대로이므로 다시 요약하지 않음
+        self._manifest.refresh()
+        self.stats["last_operation"] = f"템플릿 배치 변환: {layout} ({result['moved']}개)"
+
+        return result
+
+    @traced("PromptMakerService.read_template_file")
+    def _read_template_file(self, safe_id: str, template_path: Path) -> PromptTemplate:
+        """템플릿 스냅샷 파일을 읽고 저널 재생 (템플릿 공유 잠금 사용)"""
+        with template_lock(self.templates_dir, safe_id, shared=True):
+            if not template_path.exists():
+                # 잠금을 기다리는 동안 배치 변환으로 옮겨졌을 수 있음
+                template_path = self._template_path(safe_id)
+            template, applied, size = self._journal.load(safe_id, template_path, self._signing_key)
+            self._journal_counts[safe_id] = applied
+        self._metrics.add_bytes("load", read=size)
+        return template
+
+    def _write_snapshot(self, safe_id: str, template_path: Path, template: PromptTemplate) -> int:
+        """템플릿 전체를 새 스냅샷으로 저장하고 이전 저널 삭제 (잠금은 호출자가 관리)
+
+        Returns:
+            기록한 바이트 수
+        """
+        written = template_io.write_template(
+            template_path, template, self.version_storage,
+            snapshot_id=uuid.uuid4().hex, fsync=self.fsync, compression=self.compression,
+            signing_key=self._signing_key
+        )
+        # 새 스냅샷 ID로 이전 저널은 이미 무효이므로 삭제 실패해도 안전
+        self._journal.discard(safe_id)
+        self._journal_counts.pop(safe_id, None)
+        self._acknowledge_template_files(safe_id)
+        return written
+
+    def _acknowledge_template_files(self, safe_id: str):
+        """이 서비스가 쓴 템플릿/저널 파일을 감시기에 알림 (잠금은 호출자가 관리)"""
+        if self._watcher is not None:
+            # 배치 변환 중 옮겨진 파일도 있으므로 두 배치의 위치를 모두 알림
+            for layout_name in LAYOUTS:
+                self._watcher.acknowledge(self._layout.path_for(safe_id, layout_name))
+            self._watcher.acknowledge(self._journal.path_for(safe_id))
+
+    def _append_journal(self, safe_id: str, template_path: Path, template: PromptTemplate,
+                        change: Dict[str, Any]) -> bool:
+        """버전 변경을 저널에 추가 (잠금은 호출자가 관리)
+
+        Returns:
+            저널 기록 여부 (False면 호출자가 스냅샷 전체를 저장)
+        """
+        try:
+            header = template_io.read_header(template_path)
+        except Exception:
+            header = None
+
+        # 이전 형식 스냅샷은 저널을 연결할 수 없으므로 전체 저장으로 전환
+        snapshot_id = header.get("snapshot_id") if header else None
+        if snapshot_id is None:
+            return False
+
+        try:
+            previous = None
+            if change.get("op") == "update_version":
+                previous = self._read_template_file(safe_id, template_path)
+            record = make_record(template, change, previous)
+        except Exception as e:
+            print(f"저널 기록 생성 실패 ({safe_id}): {e}")
+            return False
+
+        written = self._journal.append(safe_id, snapshot_id, record)
+        self._acknowledge_template_files(safe_id)
+        self._count("journal_records")
+        self._count("journal_bytes_written", written)
+        self._metrics.add_bytes("save", written=written)
+
+        count = self._journal_counts.get(safe_id, 0) + 1
+        self._journal_counts[safe_id] = count
+        if self.journal_compact_threshold and count >= self.journal_compact_threshold:
+            self._journal_compactor.schedule(safe_id)
+
+        return True
+
+    def _fold_journal(self, safe_id: str):
+        """템플릿 저널을 스냅샷으로 합침"""
+        with template_lock(self.templates_dir, safe_id):
+            if not self._journal.exists(safe_id):
+                return
+
+            template_path = self._template_path(safe_id)
+            if not template_path.exists():
+                self._journal.discard(safe_id)
+                return
+
+            template = self._read_template_file(safe_id, template_path)
+            self._write_snapshot(safe_id, template_path, template)
+
+    def compact_journals(self) -> int:
+        """모든 템플릿 저널을 스냅샷으로 합침 (JSON 디렉토리 백엔드 전용)
+
+        Returns:
+            합친 템플릿 수
+        """
+        if self._journal is None:
+            return 0
+
+        # 진행 중인 백그라운드 작업을 먼저 마침
+        self._journal_compactor.flush()
+
+        template_ids = self._journal.template_ids()
+        for template_id in template_ids:
+            self._fold_journal(template_id)
+
+        return len(template_ids)
+
     def _load_templates_cache(self):
         """템플릿 캐시 로드"""
         try:
-            # 최대 50개의 최신 템플릿만 캐시
-            template_files = sorted(
-                self.templates_dir.glob("*.json"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )[:50]
-
-            for template_file in template_files:
-                template_id = template_file.stem
+            # 최대 50개의 최신 템플릿만 미리 캐시 (캐시 한도가 더 작으면 그만큼)
+            warm_count = min(50, self._templates_cache.max_entries)
+            if self._store is not None:
+                template_ids = self._store.recent_ids(warm_count)
+            else:
+                # 파일마다 stat하지 않고 매니페스트에 기록된 수정 시각으로 선택
+                self._refresh_manifest()
+                template_ids = self._manifest.recent_ids(warm_count)
+
+            for template_id in template_ids:
                 self.load_template(template_id)
 
             self._cache_valid = True
@@ -683,7 +1532,9 @@ class PromptMakerService:
         """서비스 정리"""
         try:
             # 통계 저장 등 정리 작업
+            self.stop_metrics_server()
             self._templates_cache.clear()
+            self._search_index.clear()
             self._config_cache = None
             self._cache_valid = False
         except Exception:
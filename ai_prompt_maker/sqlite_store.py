@@ -0,0 +1,421 @@
+"""
+SQLite Template Store
+
+템플릿, 버전, 태그, 요약 정보를 하나의 로컬 SQLite 데이터베이스에 저장하는 저장소 백엔드
+"""
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from .models import PromptTemplate, PromptValidationError
+from . import journal, template_io
+from .pagination import DEFAULT_SORT, check_sort
+from .filter_index import check_tag_match
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    template_id     TEXT PRIMARY KEY,
+    name            TEXT NOT NULL,
+    category        TEXT NOT NULL,
+    current_version INTEGER NOT NULL,
+    version_count   INTEGER NOT NULL,
+    created_at      TEXT,
+    updated_at      TEXT,
+    has_components  INTEGER NOT NULL DEFAULT 0,
+    metadata        TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS versions (
+    template_id      TEXT NOT NULL REFERENCES templates(template_id) ON DELETE CASCADE,
+    position         INTEGER NOT NULL,
+    version          INTEGER NOT NULL,
+    created_at       TEXT,
+    components       TEXT NOT NULL,
+    generated_prompt TEXT NOT NULL DEFAULT '',
+    description      TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (template_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS tags (
+    template_id TEXT NOT NULL REFERENCES templates(template_id) ON DELETE CASCADE,
+    position    INTEGER NOT NULL,
+    tag         TEXT NOT NULL,
+    PRIMARY KEY (template_id, position)
+);
+
+CREATE INDEX IF NOT EXISTS idx_templates_category ON templates(category);
+CREATE INDEX IF NOT EXISTS idx_templates_updated_at ON templates(updated_at DESC);
+-- 목록 페이지네이션용 (pagination.sort_key와 같은 정렬 키)
+CREATE INDEX IF NOT EXISTS idx_templates_updated_key ON templates(COALESCE(updated_at, ''), template_id);
+CREATE INDEX IF NOT EXISTS idx_templates_created_key ON templates(COALESCE(created_at, ''), template_id);
+CREATE INDEX IF NOT EXISTS idx_templates_name_key ON templates(COALESCE(name, ''), template_id);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
+CREATE INDEX IF NOT EXISTS idx_versions_lookup ON versions(template_id, version);
+"""
+
+
+class SQLiteTemplateStore:
+    """SQLite 기반 템플릿 저장소
+
+    `PromptMakerService`의 JSON 디렉토리 저장 방식과 동일한 의미로
+    저장/로드/목록/삭제/검색을 제공합니다. 목록 조회는 요약 컬럼만 읽으므로
+    템플릿 본문을 파싱하지 않습니다.
+    """
+
+    def __init__(self, db_path: str):
+        """저장소 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+
+        # Python str.lower()와 동일한 대소문자 처리를 위해 함수 등록
+        self._conn.create_function("pm_lower", 1, _lower, deterministic=True)
+
+        with self._lock:
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def exists(self, template_id: str) -> bool:
+        """템플릿 존재 여부 확인"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM templates WHERE template_id = ?", (template_id,)
+            ).fetchone()
+        return row is not None
+
+    def count(self) -> int:
+        """저장된 템플릿 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM templates").fetchone()[0]
+
+    def save(self, template: PromptTemplate):
+        """템플릿 저장 (기존 템플릿은 교체)
+
+        Args:
+            template: 저장할 템플릿
+        """
+        data = template.to_dict()
+        summary = template.get_summary()
+
+        with self._lock:
+            try:
+                with self._conn:
+                    self._write_template(data, summary)
+            except sqlite3.Error as e:
+                raise PromptValidationError(f"SQLite 저장 실패: {e}")
+
+    def save_many(self, templates: List[PromptTemplate]):
+        """여러 템플릿을 하나의 트랜잭션으로 저장"""
+        rows = [(template.to_dict(), template.get_summary()) for template in templates]
+
+        with self._lock:
+            try:
+                with self._conn:
+                    for data, summary in rows:
+                        self._write_template(data, summary)
+            except sqlite3.Error as e:
+                raise PromptValidationError(f"SQLite 저장 실패: {e}")
+
+    def _write_template(self, data: Dict[str, Any], summary: Dict[str, Any]):
+        """템플릿 행 기록 (잠금과 트랜잭션은 호출자가 관리)"""
+        template_id = data["template_id"]
+
+        self._conn.execute("DELETE FROM templates WHERE template_id = ?", (template_id,))
+        self._conn.execute(
+            "INSERT INTO templates (template_id, name, category, current_version, version_count,"
+            " created_at, updated_at, has_components, metadata)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                template_id,
+                data["name"],
+                data["category"],
+                data["current_version"],
+                summary["version_count"],
+                summary["created_at"],
+                summary["updated_at"],
+                int(bool(summary["has_components"])),
+                json.dumps(data.get("metadata", {}), ensure_ascii=False),
+            )
+        )
+        self._conn.executemany(
+            "INSERT INTO versions (template_id, position, version, created_at, components,"
+            " generated_prompt, description) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    template_id,
+                    position,
+                    version["version"],
+                    version["created_at"],
+                    json.dumps(version["components"], ensure_ascii=False),
+                    version["generated_prompt"],
+                    version["description"],
+                )
+                for position, version in enumerate(data["versions"])
+            ]
+        )
+        self._conn.executemany(
+            "INSERT INTO tags (template_id, position, tag) VALUES (?, ?, ?)",
+            [(template_id, position, tag) for position, tag in enumerate(data["tags"])]
+        )
+
+    def load(self, template_id: str) -> Optional[PromptTemplate]:
+        """템플릿 로드
+
+        Args:
+            template_id: 로드할 템플릿 ID
+
+        Returns:
+            템플릿 객체 또는 None (존재하지 않는 경우)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM templates WHERE template_id = ?", (template_id,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            version_rows = self._conn.execute(
+                "SELECT * FROM versions WHERE template_id = ? ORDER BY position",
+                (template_id,)
+            ).fetchall()
+            tags = self._tags_for([template_id]).get(template_id, [])
+
+        return PromptTemplate.from_dict({
+            "template_id": row["template_id"],
+            "name": row["name"],
+            "category": row["category"],
+            "current_version": row["current_version"],
+            "versions": [
+                {
+                    "version": v["version"],
+                    "created_at": v["created_at"],
+                    "components": json.loads(v["components"]),
+                    "generated_prompt": v["generated_prompt"],
+                    "description": v["description"],
+                }
+                for v in version_rows
+            ],
+            "tags": tags,
+            "metadata": json.loads(row["metadata"]),
+        })
+
+    def delete(self, template_id: str) -> bool:
+        """템플릿 삭제
+
+        Returns:
+            삭제 여부 (존재하지 않으면 False)
+        """
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM templates WHERE template_id = ?", (template_id,)
+                )
+        return cursor.rowcount > 0
+
+    def list_summaries(self, category: Optional[str] = None,
+                       tags: Optional[List[str]] = None, sort: str = DEFAULT_SORT,
+                       limit: Optional[int] = None,
+                       after: Optional[Tuple[str, str]] = None,
+                       tag_match: str = "any") -> List[Dict[str, Any]]:
+        """템플릿 요약 목록 (기본값: 최신 업데이트 순)
+
+        Args:
+            category: 카테고리 필터 ("전체" 또는 None이면 필터 없음)
+            tags: 태그 필터
+            sort: 정렬 기준 (pagination.SORT_ORDERS)
+            limit: 최대 개수 (None이면 전체)
+            after: 이 (정렬 값, template_id) 키 다음 항목부터 (키셋 페이지네이션)
+            tag_match: "any"(태그 하나라도 일치하면 포함) 또는 "all"(모두 일치해야 포함)
+        """
+        field, descending = check_sort(sort)
+        clauses, params = self._summary_filters(category, tags, tag_match)
+
+        # 정렬 값이 없는 행은 빈 문자열로 취급 (pagination.sort_key와 같은 순서)
+        column = f"COALESCE(t.{field}, '')"
+        if after is not None:
+            clauses.append(f"({column}, t.template_id) {'<' if descending else '>'} (?, ?)")
+            params.extend(after)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        direction = "DESC" if descending else "ASC"
+        sql = f"SELECT t.* FROM templates t {where} ORDER BY {column} {direction}, t.template_id {direction}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._query_summaries(sql, params)
+
+    def count_summaries(self, category: Optional[str] = None,
+                        tags: Optional[List[str]] = None, tag_match: str = "any") -> int:
+        """필터에 맞는 템플릿 수"""
+        clauses, params = self._summary_filters(category, tags, tag_match)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM templates t {where}", params).fetchone()[0]
+
+    def tag_counts(self, category: Optional[str] = None) -> Dict[str, int]:
+        """태그별 템플릿 수 (많은 순)"""
+        sql = "SELECT g.tag, COUNT(DISTINCT g.template_id) AS n FROM tags g"
+        params: List[Any] = []
+        if category and category != "전체":
+            sql += " JOIN templates t ON t.template_id = g.template_id WHERE t.category = ?"
+            params.append(category)
+        sql += " GROUP BY g.tag ORDER BY n DESC, g.tag"
+        with self._lock:
+            return {row[0]: row[1] for row in self._conn.execute(sql, params)}
+
+    @staticmethod
+    def _summary_filters(category: Optional[str], tags: Optional[List[str]],
+                         tag_match: str = "any") -> Tuple[List[str], List[Any]]:
+        """카테고리/태그 필터 WHERE 절 조각과 매개변수"""
+        check_tag_match(tag_match)
+        clauses = []
+        params: List[Any] = []
+
+        if category and category != "전체":
+            clauses.append("t.category = ?")
+            params.append(category)
+
+        if tags:
+            tags = list(dict.fromkeys(tags))
+            placeholders = ", ".join("?" for _ in tags)
+            subquery = f"SELECT template_id FROM tags WHERE tag IN ({placeholders})"
+            if tag_match == "all":
+                subquery += " GROUP BY template_id HAVING COUNT(DISTINCT tag) = ?"
+            clauses.append(f"t.template_id IN ({subquery})")
+            params.extend(tags)
+            if tag_match == "all":
+                params.append(len(tags))
+
+        return clauses, params
+
+    def search(self, query: str, current_versions_only: bool = True) -> List[Dict[str, Any]]:
+        """이름, 태그, 버전 설명/프롬프트에서 부분 문자열 검색
+
+        Args:
+            query: 검색어 (소문자 비교)
+            current_versions_only: True면 현재 버전만, False면 모든 버전 검색
+        """
+        query = query.lower().strip()
+        if not query:
+            return self.list_summaries()
+
+        sql = (
+            "SELECT t.* FROM templates t"
+            " WHERE instr(pm_lower(t.name), ?) > 0"
+            " OR EXISTS (SELECT 1 FROM tags g WHERE g.template_id = t.template_id"
+            "            AND instr(pm_lower(g.tag), ?) > 0)"
+            " OR EXISTS (SELECT 1 FROM versions v WHERE v.template_id = t.template_id"
+            "            AND (? = 0 OR v.version = t.current_version)"
+            "            AND (instr(pm_lower(v.generated_prompt), ?) > 0"
+            "                 OR instr(pm_lower(v.description), ?) > 0))"
+            " ORDER BY t.updated_at DESC"
+        )
+        return self._query_summaries(
+            sql, [query, query, int(current_versions_only), query, query]
+        )
+
+    def recent_ids(self, limit: int) -> List[str]:
+        """최근 업데이트된 템플릿 ID 목록"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT template_id FROM templates ORDER BY updated_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [row["template_id"] for row in rows]
+
+    def _query_summaries(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        """요약 행 조회 후 get_summary() 형식으로 변환"""
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            tags = self._tags_for([row["template_id"] for row in rows])
+
+        return [
+            {
+                "template_id": row["template_id"],
+                "name": row["name"],
+                "category": row["category"],
+                "version_count": row["version_count"],
+                "current_version": row["current_version"],
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+                "tags": tags.get(row["template_id"], []),
+                "has_components": bool(row["has_components"]),
+            }
+            for row in rows
+        ]
+
+    def _tags_for(self, template_ids: List[str]) -> Dict[str, List[str]]:
+        """템플릿별 태그 목록 (잠금은 호출자가 관리)"""
+        result: Dict[str, List[str]] = {}
+        # SQLite 변수 개수 제한을 피하기 위해 나눠서 조회
+        for start in range(0, len(template_ids), 500):
+            chunk = template_ids[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self._conn.execute(
+                f"SELECT template_id, tag FROM tags WHERE template_id IN ({placeholders})"
+                " ORDER BY template_id, position",
+                chunk
+            ).fetchall()
+            for row in rows:
+                result.setdefault(row["template_id"], []).append(row["tag"])
+        return result
+
+
+def _lower(value: Optional[str]) -> Optional[str]:
+    """SQLite용 소문자 변환 함수"""
+    return value.lower() if value is not None else None
+
+
+def migrate_json_directory(templates_dir: str, store: SQLiteTemplateStore,
+                           overwrite: bool = False) -> Dict[str, Any]:
+    """JSON 템플릿 디렉토리를 SQLite 저장소로 일괄 이전 (저널에 기록된 변경 포함)
+
+    Args:
+        templates_dir: 기존 JSON 템플릿 디렉토리
+        store: 대상 SQLite 저장소
+        overwrite: 이미 존재하는 템플릿 덮어쓰기 여부
+
+    Returns:
+        이전 결과 {"migrated": int, "skipped": int, "failed": [(파일명, 오류)]}
+    """
+    result: Dict[str, Any] = {"migrated": 0, "skipped": 0, "failed": []}
+    batch: List[PromptTemplate] = []
+
+    for template_file in template_io.template_files(templates_dir):
+        try:
+            template = journal.read_template(Path(templates_dir), template_file)
+        except Exception as e:
+            result["failed"].append((template_file.name, str(e)))
+            continue
+
+        if not overwrite and store.exists(template.template_id):
+            result["skipped"] += 1
+            continue
+
+        batch.append(template)
+        if len(batch) >= 200:
+            store.save_many(batch)
+            result["migrated"] += len(batch)
+            batch = []
+
+    if batch:
+        store.save_many(batch)
+        result["migrated"] += len(batch)
+
+    return result
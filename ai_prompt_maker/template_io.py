@@ -0,0 +1,783 @@
+"""
+Template File I/O
+
+헤더 우선(header-first) 템플릿 파일 형식 읽기/쓰기
+
+파일 전체는 여전히 유효한 JSON이지만, 첫 줄에 템플릿 메타데이터와 버전 인덱스를
+담고 이후 한 줄에 버전 하나씩 기록합니다.
+
+    {"layout": "header-first", ..., "version_index": [...], "versions":[
+    {버전 1}
+    ,{버전 2}
+    ]}
+
+따라서 첫 줄만 읽으면 요약과 버전 히스토리를 얻을 수 있고, 버전 본문은 접근할 때
+해당 줄만 파싱/검증합니다. 이전의 들여쓰기 JSON 파일도 그대로 읽을 수 있습니다.
+
+델타 저장 방식("delta")에서는 마지막 버전만 전체를 저장하고, 이전 버전은 바로 다음
+버전 대비 바뀐 섹션(필드)만 저장합니다. 긴 텍스트 섹션은 줄 단위 복사/삽입 연산으로
+기록합니다.
+
+압축 저장("gzip")을 선택하면 같은 형식을 gzip으로 감싸 저장하며, 읽을 때는 gzip
+매직 바이트로 자동 감지합니다. 헤더는 압축 스트림의 첫 줄만 풀어 읽습니다.
+
+서비스가 저장한 파일은 디렉토리별 비밀 키(.index/signing.key)로 만든 HMAC 서명을
+헤더에 기록합니다. 서명이 맞는 파일은 저장 시 이미 검증한 내용이므로 스키마 검증과
+컴포넌트 정리를 생략하고, 서명이 없거나 맞지 않는 파일(가져오기, 직접 수정한 파일)은
+항상 전체 검증합니다.
+
+    python -m ai_prompt_maker.template_io compact ai_prompt_maker/templates
+    python -m ai_prompt_maker.template_io compact --compression gzip ai_prompt_maker/templates
+    python -m ai_prompt_maker.template_io bench ai_prompt_maker/templates
+    python -m ai_prompt_maker.template_io layout sharded ai_prompt_maker/templates
+"""
+import argparse
+import copy
+import difflib
+import gzip
+import hashlib
+import hmac
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .file_lock import atomic_write, template_lock
+from .layout import LAYOUTS, TemplateLayout
+from .models import (
+    PromptTemplate, PromptCategory, PromptComponent, PromptValidationError, LazyVersionList,
+    JSONSCHEMA_AVAILABLE, schema_error
+)
+from .tracing import traced
+
+
+LAYOUT = "header-first"
+LAYOUT_VERSION = 1
+VERSION_STORAGE_MODES = ("full", "delta")
+COMPRESSION_MODES = ("none", "gzip")
+
+_PREFIX = b'{"layout":'
+_VERSIONS_OPEN = b',"versions":['
+_VERSIONS_CLOSE = b']}\n'
+_MAX_HEADER_SIZE = 1_000_000  # 1MB
+_GZIP_MAGIC = b"\x1f\x8b"
+_GZIP_LEVEL = 6
+_SIGNATURE_KEY = b'"signature":"'
+_SIGNATURE_PLACEHOLDER = b"0" * 64  # HMAC-SHA256 hex 길이
+SIGNING_KEY_PATH = Path(".index") / "signing.key"
+_DELTA_MIN_TEXT = 256  # 이보다 짧은 텍스트 섹션은 줄 단위 델타 대신 값 전체 저장
+
+# 버전 목록을 제외한 템플릿 스키마 (헤더 검증용)
+_HEADER_SCHEMA = {
+    **PromptTemplate.JSON_SCHEMA,
+    "required": [key for key in PromptTemplate.JSON_SCHEMA["required"] if key != "versions"],
+    "properties": {
+        key: value for key, value in PromptTemplate.JSON_SCHEMA["properties"].items()
+        if key != "versions"
+    },
+}
+
+
+def _compact(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _flatten_version(version: Dict[str, Any]) -> Dict[str, Any]:
+    """버전 딕셔너리를 섹션 단위 평면 딕셔너리로 변환 ("components.goal" 등)"""
+    flat = {key: value for key, value in version.items() if key not in ("version", "components")}
+    for key, value in version.get("components", {}).items():
+        flat[f"components.{key}"] = value
+    return flat
+
+
+def _unflatten_version(number: int, flat: Dict[str, Any]) -> Dict[str, Any]:
+    version: Dict[str, Any] = {"version": number, "components": {}}
+    for key, value in flat.items():
+        if key.startswith("components."):
+            version["components"][key[len("components."):]] = value
+        else:
+            version[key] = value
+    return version
+
+
+def _text_ops(base: str, text: str) -> List[Any]:
+    """base 대비 text의 줄 단위 연산 ([시작, 끝] = base 줄 복사, 문자열 = 삽입)"""
+    base_lines = base.splitlines(keepends=True)
+    lines = text.splitlines(keepends=True)
+
+    ops: List[Any] = []
+    matcher = difflib.SequenceMatcher(None, base_lines, lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append("".join(lines[j1:j2]))
+    return ops
+
+
+def _apply_text_ops(base: str, ops: List[Any]) -> str:
+    base_lines = base.splitlines(keepends=True)
+    parts: List[str] = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            start, end = op
+            parts.extend(base_lines[start:end])
+    return "".join(parts)
+
+
+def encode_delta(version: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
+    """base(다음 버전) 대비 바뀐 섹션만 담은 델타 레코드 생성
+
+    Args:
+        version: 저장할 버전 딕셔너리
+        base: 기준이 되는 다음 버전 딕셔너리
+
+    Returns:
+        {"version": n, "delta": {"base": m, "fields": {...}, "removed": [...]}}
+    """
+    flat, base_flat = _flatten_version(version), _flatten_version(base)
+
+    fields: Dict[str, Any] = {}
+    for key, value in flat.items():
+        base_value = base_flat.get(key)
+        if key in base_flat and value == base_value:
+            continue
+
+        if isinstance(value, str) and isinstance(base_value, str) and len(value) >= _DELTA_MIN_TEXT:
+            ops = _text_ops(base_value, value)
+            if len(_compact(ops)) < len(_compact(value)):
+                fields[key] = {"ops": ops}
+                continue
+
+        fields[key] = value
+
+    delta: Dict[str, Any] = {"base": base["version"], "fields": fields}
+    removed = [key for key in base_flat if key not in flat]
+    if removed:
+        delta["removed"] = removed
+
+    return {"version": version["version"], "delta": delta}
+
+
+def apply_delta(record: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
+    """델타 레코드를 기준 버전에 적용해 전체 버전 딕셔너리 복원"""
+    delta = record["delta"]
+    flat = _flatten_version(base)
+
+    for key in delta.get("removed", []):
+        flat.pop(key, None)
+
+    for key, value in delta.get("fields", {}).items():
+        if isinstance(value, dict):
+            value = _apply_text_ops(flat.get(key, ""), value["ops"])
+        flat[key] = value
+
+    return _unflatten_version(record["version"], flat)
+
+
+def dumps_template(template: PromptTemplate, version_storage: str = "full",
+                   snapshot_id: Optional[str] = None, signing_key: Optional[bytes] = None) -> bytes:
+    """템플릿을 헤더 우선 형식의 바이트로 직렬화
+
+    Args:
+        template: 직렬화할 템플릿
+        version_storage: "full" (모든 버전 전체 저장) 또는 "delta" (마지막 버전만 전체 저장)
+        snapshot_id: 저널 레코드와 연결할 스냅샷 ID (선택)
+        signing_key: 지정하면 파일 전체의 HMAC 서명을 헤더에 기록 (신뢰 경로용)
+
+    Returns:
+        UTF-8 JSON 바이트
+    """
+    if version_storage not in VERSION_STORAGE_MODES:
+        raise ValueError(f"Unknown version storage mode: {version_storage}")
+
+    data = template.to_dict()
+    infos = template.get_version_infos()
+    versions = data["versions"]
+
+    # 버전 본문 줄과 본문 영역 내 위치 계산 (첫 줄 다음부터 0)
+    lines: List[bytes] = []
+    index: List[Dict[str, Any]] = []
+    offset = 0
+    for position, (version, info) in enumerate(zip(versions, infos)):
+        if version_storage == "delta" and position + 1 < len(versions):
+            version = encode_delta(version, versions[position + 1])
+
+        separator = b"," if position else b""
+        line = _compact(version)
+        index.append({**info, "offset": offset + len(separator), "length": len(line)})
+        lines.append(separator + line + b"\n")
+        offset += len(separator) + len(line) + 1
+
+    header = {
+        "layout": LAYOUT,
+        "layout_version": LAYOUT_VERSION,
+    }
+    if signing_key is not None:
+        # 서명 위치를 고정하기 위해 레이아웃 필드 바로 다음에 자리표시자로 기록
+        header["signature"] = _SIGNATURE_PLACEHOLDER.decode("ascii")
+    header.update({
+        "template_id": data["template_id"],
+        "name": data["name"],
+        "category": data["category"],
+        "current_version": data["current_version"],
+        "tags": data["tags"],
+        "metadata": data["metadata"],
+        "version_storage": version_storage,
+        "version_index": index,
+    })
+    if snapshot_id is not None:
+        header["snapshot_id"] = snapshot_id
+
+    result = _compact(header)[:-1] + _VERSIONS_OPEN + b"\n" + b"".join(lines) + _VERSIONS_CLOSE
+    if signing_key is None:
+        return result
+
+    # 자리표시자 상태의 전체 바이트에 서명한 뒤 자리표시자를 서명으로 교체
+    signature = hmac.new(signing_key, result, hashlib.sha256).hexdigest().encode("ascii")
+    return result.replace(_SIGNATURE_KEY + _SIGNATURE_PLACEHOLDER, _SIGNATURE_KEY + signature, 1)
+
+
+def verify_signature(data: bytes, signing_key: Optional[bytes]) -> bool:
+    """압축을 푼 헤더 우선 파일이 이 키로 서명되었는지 확인"""
+    if signing_key is None:
+        return False
+
+    # 서명은 항상 레이아웃 필드 바로 다음에 있음
+    prefix_end = data.find(b",", data.find(b'"layout_version":')) + 1
+    if prefix_end <= 0 or not data.startswith(_SIGNATURE_KEY, prefix_end):
+        return False
+
+    start = prefix_end + len(_SIGNATURE_KEY)
+    signature = data[start:start + len(_SIGNATURE_PLACEHOLDER)]
+    unsigned = data[:start] + _SIGNATURE_PLACEHOLDER + data[start + len(signature):]
+    expected = hmac.new(signing_key, unsigned, hashlib.sha256).hexdigest().encode("ascii")
+    return hmac.compare_digest(signature, expected)
+
+
+def load_signing_key(templates_dir: Union[str, Path], create: bool = True) -> Optional[bytes]:
+    """디렉토리의 서명 키 (없으면 생성, 여러 프로세스가 동시에 호출해도 같은 키)
+
+    Args:
+        templates_dir: 템플릿 디렉토리
+        create: False이면 키가 없을 때 만들지 않고 None 반환 (읽기 전용 사용처)
+    """
+    path = Path(templates_dir) / SIGNING_KEY_PATH
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        if not create:
+            return None
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    key = os.urandom(32)
+    try:
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # 다른 프로세스가 먼저 만든 키 사용 (기록이 끝날 때까지 잠시 대기)
+        for _ in range(100):
+            key = path.read_bytes()
+            if len(key) == 32:
+                return key
+            time.sleep(0.01)
+        return key
+
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def compress(data: bytes, compression: str = "none") -> bytes:
+    """직렬화된 템플릿을 저장 형식으로 압축"""
+    if compression not in COMPRESSION_MODES:
+        raise ValueError(f"Unknown compression mode: {compression}")
+    if compression == "gzip":
+        # mtime=0으로 같은 내용이 항상 같은 바이트가 되도록 함
+        return gzip.compress(data, _GZIP_LEVEL, mtime=0)
+    return data
+
+
+def decompress(data: bytes) -> bytes:
+    """압축된 템플릿이면 풀고, 아니면 그대로 반환"""
+    if data.startswith(_GZIP_MAGIC):
+        try:
+            return gzip.decompress(data)
+        except (OSError, EOFError) as e:
+            raise ValueError(f"Invalid compressed template: {e}")
+    return data
+
+
+def detect_compression(data: bytes) -> str:
+    """파일 내용의 압축 방식"""
+    return "gzip" if data.startswith(_GZIP_MAGIC) else "none"
+
+
+def _split_header(data: bytes) -> Optional[tuple]:
+    """헤더 우선 형식이면 (헤더 딕셔너리, 본문 시작 위치) 반환, 아니면 None"""
+    if not data.startswith(_PREFIX):
+        return None
+
+    end = data.find(b"\n")
+    if end < 0:
+        return None
+
+    line = data[:end]
+    if not line.endswith(_VERSIONS_OPEN):
+        return None
+
+    try:
+        header = json.loads(line[:-len(_VERSIONS_OPEN)] + b"}")
+    except ValueError as e:
+        raise ValueError(f"Invalid template header: {e}")
+
+    if not isinstance(header, dict) or header.get("layout") != LAYOUT:
+        return None
+
+    return header, end + 1
+
+
+def canonical_bytes(data: bytes) -> bytes:
+    """저장할 때마다 바뀌는 필드를 뺀 템플릿 파일 내용 (내용 비교/백업 해시용)
+
+    스냅샷을 쓸 때마다 새로 정해지는 snapshot_id와 이를 포함한 서명을 헤더에서 빼고
+    압축을 풉니다. 결과는 서명 없는 헤더 우선 파일이므로 그대로 로드할 수 있습니다.
+    이전 형식 파일은 압축만 풉니다.
+    """
+    data = decompress(data)
+    split = _split_header(data)
+    if split is None:
+        return data
+
+    header, body_start = split
+    header.pop("signature", None)
+    header.pop("snapshot_id", None)
+    return _compact(header)[:-1] + _VERSIONS_OPEN + b"\n" + data[body_start:]
+
+
+def validate_header(header: Dict[str, Any], trusted: bool = False):
+    """헤더 필드와 버전 인덱스 검증
+
+    Args:
+        header: 헤더 딕셔너리
+        trusted: 서명이 확인된 파일이면 True (스키마 검증 생략, 인덱스 구조만 확인)
+
+    Raises:
+        PromptValidationError: 검증 실패
+    """
+    if JSONSCHEMA_AVAILABLE and not trusted:
+        e = schema_error(_HEADER_SCHEMA, header)
+        if e is not None:
+            error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
+            raise PromptValidationError(f"Template header validation failed at {error_path}: {e.message}")
+
+    index = header.get("version_index")
+    if not isinstance(index, list) or not 1 <= len(index) <= 100:
+        raise PromptValidationError("Template header has an invalid version index")
+
+    for entry in index:
+        if not isinstance(entry, dict) or not all(
+            isinstance(entry.get(key), int) and entry[key] >= 0
+            for key in ("version", "offset", "length")
+        ) or not isinstance(entry.get("created_at"), str):
+            raise PromptValidationError("Template header has an invalid version index entry")
+        entry.setdefault("description", "")
+        entry.setdefault("components_summary", {})
+
+
+def loads_template(data: bytes, signing_key: Optional[bytes] = None) -> PromptTemplate:
+    """바이트에서 템플릿 생성 (헤더 우선 형식은 버전을 지연 생성)
+
+    Args:
+        data: 템플릿 파일 내용 (압축 여부 자동 감지)
+        signing_key: 지정하면 이 키로 서명된 파일은 검증을 생략
+
+    Returns:
+        PromptTemplate 객체
+
+    Raises:
+        ValueError: JSON이 유효하지 않은 경우
+        PromptValidationError: 검증 실패
+    """
+    return _loads(data, signing_key)[0]
+
+
+@traced("template_io.loads")
+def _loads(data: bytes, signing_key: Optional[bytes] = None) -> Tuple[PromptTemplate, Optional[Dict[str, Any]]]:
+    """템플릿과 헤더(이전 형식이면 None) 반환"""
+    data = decompress(data)
+    split = _split_header(data)
+    if split is None:
+        return PromptTemplate.from_json(data.decode("utf-8")), None
+
+    header, body_start = split
+    trusted = verify_signature(data, signing_key)
+    validate_header(header, trusted)
+    body = memoryview(data)[body_start:]
+
+    index = header["version_index"]
+    # 버전 번호가 중복된 파일도 있으므로 위치(본문 오프셋)로 버전을 찾음
+    positions = {entry["offset"]: position for position, entry in enumerate(index)}
+    # 델타 복원 중 만든 버전 (같은 체인을 다시 따라가지 않도록 위치별로 보관)
+    resolved: Dict[int, Dict[str, Any]] = {}
+
+    def read_record(position: int) -> Dict[str, Any]:
+        entry = index[position]
+        start = entry["offset"]
+        try:
+            record = json.loads(bytes(body[start:start + entry["length"]]))
+        except ValueError as e:
+            raise PromptValidationError(f"Invalid data for version {entry['version']}: {e}")
+        if not isinstance(record, dict) or record.get("version") != entry["version"]:
+            raise PromptValidationError(f"Invalid data for version {entry['version']}")
+        return record
+
+    def load_version(entry: Dict[str, Any]) -> Dict[str, Any]:
+        position = positions[entry["offset"]]
+
+        # 전체 저장된 버전(또는 이미 복원한 버전)까지 다음 위치로 델타 체인을 따라감
+        chain: List[Dict[str, Any]] = []
+        while position not in resolved:
+            record = read_record(position)
+            delta = record.get("delta")
+            if delta is None:
+                resolved[position] = record
+                break
+
+            position += 1
+            if (not isinstance(delta, dict) or position >= len(index)
+                    or delta.get("base") != index[position]["version"]):
+                raise PromptValidationError(f"Invalid delta base for version {record['version']}")
+            chain.append(record)
+
+        version = resolved[position]
+        for record in reversed(chain):
+            position -= 1
+            try:
+                version = apply_delta(record, version)
+            except (TypeError, ValueError, KeyError, AttributeError) as e:
+                raise PromptValidationError(f"Invalid delta for version {record['version']}: {e}")
+            resolved[position] = version
+
+        return copy.deepcopy(version)
+
+    template = PromptTemplate(
+        template_id=header["template_id"],
+        name=header["name"],
+        category=PromptCategory(header["category"]),
+        current_version=header["current_version"],
+        versions=LazyVersionList(index, load_version, trusted=trusted),
+        tags=header["tags"],
+        metadata=header.get("metadata", {})
+    )
+    return template, header
+
+
+def read_template(path: Path, signing_key: Optional[bytes] = None) -> PromptTemplate:
+    """템플릿 파일 로드 (형식 자동 감지)"""
+    return loads_template(Path(path).read_bytes(), signing_key)
+
+
+def read_template_with_header(path: Path, signing_key: Optional[bytes] = None
+                              ) -> Tuple[PromptTemplate, Optional[Dict[str, Any]]]:
+    """템플릿 파일과 헤더 로드 (이전 형식 파일의 헤더는 None)"""
+    return loads_template_with_header(Path(path).read_bytes(), signing_key)
+
+
+def loads_template_with_header(data: bytes, signing_key: Optional[bytes] = None
+                               ) -> Tuple[PromptTemplate, Optional[Dict[str, Any]]]:
+    """읽어 둔 템플릿 파일 바이트에서 템플릿과 헤더 로드 (이전 형식 파일의 헤더는 None)"""
+    return _loads(data, signing_key)
+
+
+def write_template(path: Path, template: PromptTemplate, version_storage: str = "full",
+                   snapshot_id: Optional[str] = None, fsync: bool = False,
+                   compression: str = "none", signing_key: Optional[bytes] = None) -> int:
+    """템플릿을 헤더 우선 형식으로 원자적으로 저장 (잠금은 호출자가 관리)
+
+    Returns:
+        기록한 바이트 수
+    """
+    data = compress(dumps_template(template, version_storage, snapshot_id, signing_key), compression)
+    atomic_write(path, data, fsync=fsync)
+    return len(data)
+
+
+def read_header(path: Path) -> Optional[Dict[str, Any]]:
+    """첫 줄만 읽어 검증된 헤더 반환
+
+    Returns:
+        헤더 딕셔너리 또는 None (이전 형식 파일)
+
+    Raises:
+        ValueError, PromptValidationError: 손상된 헤더
+    """
+    with open(path, "rb") as f:
+        if f.read(len(_GZIP_MAGIC)) == _GZIP_MAGIC:
+            f.seek(0)
+            # 압축 파일은 첫 줄까지만 풀어서 읽음
+            with gzip.GzipFile(fileobj=f) as gz:
+                line = gz.readline(_MAX_HEADER_SIZE)
+        else:
+            f.seek(0)
+            line = f.readline(_MAX_HEADER_SIZE)
+
+    split = _split_header(line)
+    if split is None:
+        return None
+
+    header = split[0]
+    validate_header(header)
+    return header
+
+
+def summary_from_header(header: Dict[str, Any]) -> Dict[str, Any]:
+    """헤더로부터 get_summary()와 같은 형식의 요약 생성"""
+    index = header["version_index"]
+    current = next(
+        (entry for entry in index if entry["version"] == header["current_version"]), index[-1]
+    )
+
+    return {
+        "template_id": header["template_id"],
+        "name": header["name"],
+        "category": header["category"],
+        "version_count": len(index),
+        "current_version": header["current_version"],
+        "created_at": index[0]["created_at"],
+        "updated_at": current["created_at"],
+        "tags": header["tags"],
+        "has_components": any(current.get("components_summary", {}).values()),
+    }
+
+
+def template_files(templates_dir: str, layout: Optional[TemplateLayout] = None) -> List[Path]:
+    """디렉토리의 템플릿 파일 경로 (파일명 순, 두 배치 모두 포함)"""
+    layout = layout or TemplateLayout(Path(templates_dir))
+    return sorted((Path(entry.path) for entry in layout.scan()), key=lambda path: path.name)
+
+
+def compact_directory(templates_dir: str, version_storage: str = "delta",
+                      fsync: bool = False, compression: str = "none",
+                      signing_key: Optional[bytes] = None,
+                      layout: Optional[TemplateLayout] = None) -> Dict[str, Any]:
+    """디렉토리의 템플릿 파일을 지정한 버전 저장 방식과 압축 방식으로 변환
+
+    이전 형식 파일도 변환 대상이며, 템플릿 잠금을 잡고 모든 버전을 검증한 뒤
+    임시 파일에 쓰고 교체합니다.
+
+    Args:
+        templates_dir: 템플릿 디렉토리
+        version_storage: 변환할 저장 방식 ("full" 또는 "delta")
+        fsync: 파일을 디스크에 동기화할지 여부
+        compression: 변환할 압축 방식 ("none" 또는 "gzip")
+        signing_key: 변환한 파일에 서명할 키 (기존 서명 파일은 검증 생략)
+        layout: 템플릿 파일 배치 (None이면 디렉토리에 기록된 배치)
+
+    Returns:
+        {"converted": int, "skipped": int, "failed": [(파일명, 오류)],
+         "bytes_before": int, "bytes_after": int}
+    """
+    if version_storage not in VERSION_STORAGE_MODES:
+        raise ValueError(f"Unknown version storage mode: {version_storage}")
+    if compression not in COMPRESSION_MODES:
+        raise ValueError(f"Unknown compression mode: {compression}")
+
+    result: Dict[str, Any] = {
+        "converted": 0, "skipped": 0, "failed": [], "bytes_before": 0, "bytes_after": 0
+    }
+
+    for template_file in template_files(templates_dir, layout):
+        try:
+            with template_lock(templates_dir, template_file.stem):
+                data = template_file.read_bytes()
+                split = _split_header(decompress(data))
+                if (split is not None and detect_compression(data) == compression
+                        and split[0].get("version_storage", "full") == version_storage):
+                    result["skipped"] += 1
+                    result["bytes_before"] += len(data)
+                    result["bytes_after"] += len(data)
+                    continue
+
+                template, header = _loads(data, signing_key)
+                # 손상된 버전을 새 파일로 옮기지 않도록 모든 버전 검증
+                for _ in template.versions:
+                    pass
+                # 내용이 같으므로 저널이 계속 적용되도록 스냅샷 ID 유지
+                snapshot_id = header.get("snapshot_id") if header else None
+                converted = compress(
+                    dumps_template(template, version_storage, snapshot_id, signing_key), compression
+                )
+                atomic_write(template_file, converted, fsync=fsync)
+        except Exception as e:
+            result["failed"].append((template_file.name, str(e)))
+            continue
+
+        result["converted"] += 1
+        result["bytes_before"] += len(data)
+        result["bytes_after"] += len(converted)
+
+    return result
+
+
+# 벤치마크 비교 대상: (이름, 버전 저장 방식, 압축 방식), 버전 저장 방식 None은 들여쓰기 JSON
+BENCHMARK_FORMATS = (
+    ("legacy-json", None, "none"),
+    ("header-first", "full", "none"),
+    ("header-first+gzip", "full", "gzip"),
+    ("delta", "delta", "none"),
+    ("delta+gzip", "delta", "gzip"),
+)
+
+
+def synthetic_templates(config_path: str, count: int, versions: int = 5,
+                        seed: int = 0) -> List[PromptTemplate]:
+    """설정 파일의 확장 문구로 벤치마크용 템플릿 생성
+
+    Args:
+        config_path: 도메인 설정 파일 (data/config.json)
+        count: 템플릿 수
+        versions: 템플릿당 버전 수
+        seed: 난수 시드
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    rng = random.Random(seed)
+    domains = list(config.get("domains", {}).values()) or [config]
+    limit = PromptComponent.MAX_ITEM_LENGTH
+
+    def pick(domain: Dict[str, Any], key: str, k: int) -> List[str]:
+        texts = list(domain.get(key, {}).values())
+        return [text[:limit] for text in rng.sample(texts, min(k, len(texts)))]
+
+    templates = []
+    for n in range(count):
+        domain = domains[n % len(domains)]
+        roles = domain.get("keywords", {}).get("role", [])
+        template = PromptTemplate(
+            name=f"벤치마크 {n}", category=PromptCategory.PROGRAMMING, tags=["benchmark"]
+        )
+        for v in range(versions):
+            component = PromptComponent(
+                role=rng.sample(roles, min(2, len(roles))),
+                goal=(pick(domain, "goal_expansions", 1) or [""])[0][:PromptComponent.MAX_GOAL_LENGTH],
+                context=pick(domain, "context_expansions", 2),
+                document="\n".join(pick(domain, "goal_expansions", 4)),
+                rule=pick(domain, "rule_expansions", 3),
+            )
+            if v == 0:
+                template.update_current_version(component, "v1")
+            else:
+                template.add_version(component, f"v{v + 1}")
+        templates.append(template)
+
+    return templates
+
+
+def benchmark_formats(templates: List[PromptTemplate], repeat: int = 3) -> List[Dict[str, Any]]:
+    """저장 형식별 디스크 크기와 로드 시간 비교
+
+    형식마다 임시 디렉토리에 모든 템플릿을 쓰고, 파일 읽기 + 파싱 + 현재 버전 생성까지의
+    전체 시간을 repeat번 측정해 중앙값을 기록합니다.
+
+    Returns:
+        [{"format": str, "bytes": int, "load_seconds": float, "ratio": float}, ...]
+        (ratio는 legacy-json 대비 크기 비율)
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, version_storage, compression in BENCHMARK_FORMATS:
+            directory = Path(tmp) / name
+            directory.mkdir()
+            paths = []
+            for template in templates:
+                if version_storage is None:
+                    data = template.to_json().encode("utf-8")
+                else:
+                    data = compress(dumps_template(template, version_storage), compression)
+                path = directory / f"{template.template_id}.json"
+                path.write_bytes(data)
+                paths.append(path)
+
+            timings = []
+            for _ in range(max(1, repeat)):
+                start = time.perf_counter()
+                for path in paths:
+                    read_template(path).get_current_version()
+                timings.append(time.perf_counter() - start)
+
+            results.append({
+                "format": name,
+                "bytes": sum(path.stat().st_size for path in paths),
+                "load_seconds": statistics.median(timings),
+            })
+
+    baseline = results[0]["bytes"] or 1
+    for result in results:
+        result["ratio"] = result["bytes"] / baseline
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="템플릿 파일 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compact = subparsers.add_parser("compact", help="템플릿 파일의 버전 저장 방식 변환")
+    compact.add_argument("templates_dir", nargs="?", default="ai_prompt_maker/templates")
+    compact.add_argument("--mode", choices=VERSION_STORAGE_MODES, default="delta")
+    compact.add_argument("--compression", choices=COMPRESSION_MODES, default="none")
+
+    bench = subparsers.add_parser("bench", help="저장 형식별 디스크 크기와 로드 시간 비교")
+    bench.add_argument("templates_dir", nargs="?", default="ai_prompt_maker/templates")
+    bench.add_argument("--synthetic", type=int, default=0,
+                       help="디렉토리 대신 설정 파일 확장 문구로 만든 템플릿 N개 사용")
+    bench.add_argument("--config", default="data/config.json")
+    bench.add_argument("--repeat", type=int, default=3)
+
+    layout = subparsers.add_parser("layout", help="템플릿 파일 배치 변환 (flat <-> sharded)")
+    layout.add_argument("target", choices=LAYOUTS)
+    layout.add_argument("templates_dir", nargs="?", default="ai_prompt_maker/templates")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "layout":
+        result = TemplateLayout(Path(args.templates_dir)).migrate(args.target)
+        print(f"이동: {result['moved']}개, 건너뜀: {result['skipped']}개, 충돌: {result['conflicts']}개")
+        return
+
+    if args.command == "bench":
+        if args.synthetic:
+            templates = synthetic_templates(args.config, args.synthetic)
+        else:
+            templates = [read_template(path) for path in template_files(args.templates_dir)]
+        if not templates:
+            print("벤치마크할 템플릿이 없습니다 (--synthetic N 사용)")
+            return
+
+        print(f"템플릿 {len(templates)}개, 반복 {args.repeat}회")
+        print(f"{'형식':<20}{'크기(bytes)':>14}{'비율':>8}{'로드(ms)':>12}")
+        for result in benchmark_formats(templates, args.repeat):
+            print(f"{result['format']:<20}{result['bytes']:>14,}{result['ratio']:>8.2f}"
+                  f"{result['load_seconds'] * 1000:>12.1f}")
+        return
+
+    result = compact_directory(
+        args.templates_dir, args.mode, compression=args.compression,
+        signing_key=load_signing_key(args.templates_dir)
+    )
+
+    print(f"변환: {result['converted']}개, 건너뜀: {result['skipped']}개, 실패: {len(result['failed'])}개")
+    print(f"크기: {result['bytes_before']:,} -> {result['bytes_after']:,} bytes")
+    for name, error in result["failed"]:
+        print(f"  {name}: {error}")
+
+
+if __name__ == "__main__":
+    main()
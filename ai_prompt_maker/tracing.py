@@ -0,0 +1,505 @@
+"""
+Tracing
+
+요청(Streamlit 재실행) 단위로 묶이는 중첩 스팬 추적
+
+    with tracing.trace("rerun-42"):
+        with tracing.span("DataHandler.list_templates", category="기획"):
+            ...
+
+스팬은 끝날 때 싱크(sink)로 보냅니다. 싱크는 메모리 링 버퍼, JSONL 파일,
+OpenTelemetry OTLP/JSON 내보내기 중에서 골라 set_sink()로 설정하며, 싱크가 없으면
+span()은 미리 만든 빈 스팬을 돌려주고 traced() 데코레이터는 원래 함수를 바로 호출하므로
+전역 변수 확인 한 번 외에는 비용이 없습니다. 현재 스팬과 요청 ID는 contextvars에
+두므로 스레드와 asyncio 작업마다 따로 추적됩니다.
+
+환경 변수 PROMPT_MAKER_TRACE로도 싱크를 켤 수 있습니다 (configure_from_env()):
+"memory[:용량]", "jsonl:<경로>", "otlp:<수집기 URL>", "otlp-file:<경로>"
+"""
+import json
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+TRACE_ENV = "PROMPT_MAKER_TRACE"
+
+# 현재 싱크 (None이면 추적 꺼짐)
+_sink: Optional["SpanSink"] = None
+
+# 스팬 오류로 기록하지 않는 예외 (제어 흐름용, ignore_errors()로 추가)
+_ignored_errors: Tuple[type, ...] = ()
+
+# 현재 스팬, 현재 (trace_id, request_id)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("prompt_maker_span", default=None)
+_current_trace: ContextVar[Optional[Tuple[str, str]]] = ContextVar("prompt_maker_trace", default=None)
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+class Span:
+    """끝난(또는 진행 중인) 스팬 하나
+
+    Attributes:
+        name: 스팬 이름 (예: "PromptMakerService.load_template")
+        trace_id: 32자리 16진수 추적 ID (요청 하나의 스팬이 공유)
+        span_id: 16자리 16진수 스팬 ID
+        parent_id: 부모 스팬 ID (최상위면 None)
+        request_id: 요청/재실행 ID (trace()에 준 값, 없으면 trace_id)
+        start_ns, end_ns: 시작/종료 시각 (Unix epoch ns)
+        attributes: 스팬 속성
+        error: 예외로 끝났으면 "예외 클래스: 메시지"
+    """
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "request_id",
+                 "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], request_id: str,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_span_id()
+        self.parent_id = parent_id
+        self.request_id = request_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "request_id": self.request_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """추적이 꺼져 있을 때 span()이 돌려주는 빈 스팬"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _SpanScope:
+    """with 블록 동안 스팬을 현재 스팬으로 두고 끝나면 싱크로 보냄"""
+
+    __slots__ = ("_name", "_attributes", "_span", "_token")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self._name = name
+        self._attributes = attributes
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id, request_id, parent_id = parent.trace_id, parent.request_id, parent.span_id
+        else:
+            trace_id, request_id = _current_trace.get() or _new_trace()
+            parent_id = None
+        self._span = Span(self._name, trace_id, parent_id, request_id, self._attributes)
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        span = self._span
+        span.end_ns = time.time_ns()
+        if exc_type is not None and not issubclass(exc_type, _ignored_errors):
+            span.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        _export(span)
+        return False
+
+
+def _new_trace(request_id: Optional[str] = None) -> Tuple[str, str]:
+    trace_id = uuid.uuid4().hex
+    return trace_id, request_id or trace_id
+
+
+def _export(span: Span):
+    """싱크로 스팬 전달 (싱크 오류는 추적 대상 작업에 영향을 주지 않음)"""
+    sink = _sink
+    if sink is None:
+        return
+    try:
+        sink.export(span)
+    except Exception as e:
+        print(f"스팬 내보내기 실패 ({span.name}): {e}")
+
+
+def span(name: str, **attributes: Any) -> Union[_SpanScope, _NoopSpan]:
+    """중첩 스팬 (with 블록, 추적이 꺼져 있으면 아무것도 하지 않음)
+
+    Args:
+        name: 스팬 이름
+        **attributes: 스팬 속성
+    """
+    if _sink is None:
+        return _NOOP_SPAN
+    return _SpanScope(name, attributes)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """함수 실행을 스팬으로 감싸는 데코레이터 (추적이 꺼져 있으면 원래 함수를 바로 호출)
+
+    Args:
+        name: 스팬 이름 (기본값: 함수의 __qualname__)
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _sink is None:
+                return func(*args, **kwargs)
+            with _SpanScope(span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class trace:
+    """요청(재실행) 하나의 스팬을 같은 trace_id와 request_id로 묶는 범위
+
+    Args:
+        request_id: 요청/재실행 ID (None이면 새 trace_id 사용)
+    """
+
+    __slots__ = ("request_id", "trace_id", "_token")
+
+    def __init__(self, request_id: Optional[str] = None):
+        self.trace_id, self.request_id = _new_trace(request_id)
+
+    def __enter__(self) -> "trace":
+        self._token = _current_trace.set((self.trace_id, self.request_id))
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _current_trace.reset(self._token)
+        return False
+
+
+def current_span() -> Optional[Span]:
+    """현재 스팬 (추적이 꺼져 있거나 스팬 밖이면 None)"""
+    return _current_span.get()
+
+
+def current_request_id() -> Optional[str]:
+    """현재 요청 ID (trace() 또는 스팬 밖이면 None)"""
+    parent = _current_span.get()
+    if parent is not None:
+        return parent.request_id
+    current = _current_trace.get()
+    return current[1] if current else None
+
+
+def ignore_errors(*exception_types: type):
+    """스팬을 오류로 기록하지 않을 예외 종류 추가
+
+    Streamlit의 st.rerun()/st.stop()처럼 예외로 실행 흐름을 바꾸는 경우에 씁니다.
+    """
+    global _ignored_errors
+    _ignored_errors = tuple(dict.fromkeys(_ignored_errors + exception_types))
+
+
+def enabled() -> bool:
+    return _sink is not None
+
+
+def get_sink() -> Optional["SpanSink"]:
+    return _sink
+
+
+def set_sink(sink: Optional["SpanSink"]) -> Optional["SpanSink"]:
+    """스팬 싱크 설정 (None이면 추적 끔)
+
+    Returns:
+        이전 싱크 (닫지 않고 돌려주므로 호출자가 flush()/close())
+    """
+    global _sink
+    previous, _sink = _sink, sink
+    return previous
+
+
+class SpanSink:
+    """스팬 싱크 인터페이스 (export()는 여러 스레드에서 호출될 수 있음)"""
+
+    def export(self, span: Span):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+class RingBufferSink(SpanSink):
+    """최근 스팬 capacity개를 메모리에 보관 (화면 표시/테스트용)"""
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self._spans: deque = deque(maxlen=capacity)
+
+    def export(self, span: Span):
+        # deque.append는 원자적이므로 잠금 불필요
+        self._spans.append(span)
+
+    def spans(self, request_id: Optional[str] = None) -> List[Span]:
+        """보관 중인 스팬 (끝난 순서, request_id를 주면 그 요청만)"""
+        spans = list(self._spans)
+        if request_id is None:
+            return spans
+        return [span for span in spans if span.request_id == request_id]
+
+    def clear(self):
+        self._spans.clear()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+
+class JsonlFileSink(SpanSink):
+    """스팬마다 JSON 한 줄을 파일 끝에 추가"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def to_otlp(spans: List[Span], service_name: str = "ai-prompt-maker") -> Dict[str, Any]:
+    """스팬 목록을 OTLP/JSON ExportTraceServiceRequest로 변환"""
+    otlp_spans = []
+    for span in spans:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns if span.end_ns is not None else span.start_ns),
+            "attributes": _otlp_attributes({**span.attributes, "request.id": span.request_id}),
+            # STATUS_CODE_ERROR = 2, STATUS_CODE_UNSET = 0
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 0},
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        otlp_spans.append(otlp_span)
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+            "scopeSpans": [{"scope": {"name": "ai_prompt_maker"}, "spans": otlp_spans}],
+        }]
+    }
+
+
+class OTLPJsonSink(SpanSink):
+    """OpenTelemetry OTLP/JSON으로 스팬 내보내기
+
+    스팬을 batch_size개씩 모아 OTLP/HTTP 수집기(endpoint, 예: http://localhost:4318/v1/traces)로
+    POST하거나, path에 요청 하나를 한 줄로 추가합니다 (Collector file 수신기 형식).
+
+    묶음은 크기가 제한된 큐에 넣고 백그라운드 데몬 스레드가 보내므로, 스팬을 끝내는
+    스레드(템플릿 잠금을 잡고 있을 수도 있음)는 네트워크나 파일 입출력을 기다리지
+    않습니다. 큐가 가득 차면 묶음을 버리고 dropped에 센 스팬 수를 더합니다.
+    보내기 실패는 출력만 하고 해당 묶음은 버립니다.
+
+    Args:
+        endpoint: OTLP/HTTP traces URL
+        path: OTLP/JSON 줄을 추가할 파일 (endpoint가 없을 때)
+        service_name: resource의 service.name
+        batch_size: 이만큼 모이면 내보냄 (나머지는 flush()/close() 때)
+        timeout: HTTP 요청 제한 시간(초)
+        max_queued_batches: 보내기를 기다릴 수 있는 최대 묶음 수
+    """
+
+    def __init__(self, endpoint: Optional[str] = None, path: Optional[Union[str, Path]] = None,
+                 service_name: str = "ai-prompt-maker", batch_size: int = 64, timeout: float = 5.0,
+                 max_queued_batches: int = 16):
+        if endpoint is None and path is None:
+            raise ValueError("endpoint or path is required")
+        self.endpoint = endpoint
+        self.path = Path(path) if path is not None else None
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._pending: List[Span] = []
+        # 보낼 묶음 (None은 내보내기 스레드 종료 신호)
+        self._queue: "queue.Queue[Optional[List[Span]]]" = queue.Queue(maxsize=max_queued_batches)
+        self._thread = threading.Thread(target=self._run, name="prompt-maker-otlp", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span):
+        with self._lock:
+            self._pending.append(span)
+            if len(self._pending) < self.batch_size:
+                return
+            batch, self._pending = self._pending, []
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            with self._lock:
+                self.dropped += len(batch)
+
+    def flush(self):
+        """모은 스팬을 큐에 넣고 큐의 묶음을 모두 보낼 때까지 대기"""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if self._thread.is_alive():
+            if batch:
+                self._queue.put(batch)
+            self._queue.join()
+        elif batch:
+            self._send(batch)
+
+    def close(self):
+        """남은 스팬을 보내고 내보내기 스레드 종료"""
+        self.flush()
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                self._send(batch)
+            finally:
+                self._queue.task_done()
+
+    def _send(self, batch: List[Span]):
+        payload = json.dumps(to_otlp(batch, self.service_name), ensure_ascii=False, default=str)
+        try:
+            if self.endpoint is not None:
+                request = urllib.request.Request(
+                    self.endpoint, data=payload.encode("utf-8"),
+                    headers={"Content-Type": "application/json"}, method="POST"
+                )
+                with urllib.request.urlopen(request, timeout=self.timeout):
+                    pass
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(payload + "\n")
+        except Exception as e:
+            print(f"OTLP 스팬 내보내기 실패 ({len(batch)}개): {e}")
+
+
+def sink_from_spec(spec: str) -> Optional[SpanSink]:
+    """설정 문자열로 싱크 생성 ("memory[:용량]", "jsonl:<경로>", "otlp:<URL>", "otlp-file:<경로>")
+
+    Raises:
+        ValueError: 알 수 없는 싱크 종류
+    """
+    spec = spec.strip()
+    if not spec or spec.lower() in ("0", "off", "none"):
+        return None
+    kind, _, target = spec.partition(":")
+    kind = kind.lower()
+    if kind == "memory":
+        return RingBufferSink(int(target) if target else 1024)
+    if kind == "jsonl" and target:
+        return JsonlFileSink(target)
+    if kind == "otlp" and target:
+        return OTLPJsonSink(endpoint=target)
+    if kind == "otlp-file" and target:
+        return OTLPJsonSink(path=target)
+    raise ValueError(f"Unknown trace sink: {spec}")
+
+
+_configure_lock = threading.Lock()
+
+
+def configure_from_env() -> Optional[SpanSink]:
+    """PROMPT_MAKER_TRACE 환경 변수로 싱크 설정 (이미 싱크가 있으면 그대로 사용)
+
+    Returns:
+        현재 싱크 (환경 변수가 없거나 잘못되었으면 None)
+    """
+    with _configure_lock:
+        if _sink is not None:
+            return _sink
+        spec = os.environ.get(TRACE_ENV)
+        if not spec:
+            return None
+        try:
+            set_sink(sink_from_spec(spec))
+        except ValueError as e:
+            print(f"추적 설정 무시: {e}")
+        return _sink
@@ -0,0 +1,365 @@
+"""
+File Watcher
+
+템플릿 디렉토리와 설정 디렉토리의 파일 변경을 감지하는 감시기
+
+- inotify (Linux): 커널이 알려준 파일만 stat으로 확인하므로 호출 비용이 파일 수와 무관
+- 폴링 (그 외 환경): poll_interval마다 디렉토리당 한 번 scandir하고 stat 결과를
+  이전 스냅샷과 비교
+
+감시기는 변경된 파일 경로만 돌려주며, 무엇을 무효화할지는 호출자가 정합니다.
+변경이 감지될 때마다 generation이 1씩 증가하므로 다른 캐시는 이 값을 키로
+사용할 수 있습니다.
+"""
+import ctypes
+import ctypes.util
+import os
+import struct
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+# 파일 상태 서명 (mtime_ns, size, inode) - 원자적 교체는 inode가 바뀜
+Signature = Tuple[int, int, int]
+
+
+def _signature(path: Path) -> Optional[Signature]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _Inotify:
+    """프로세스 공용 inotify 인스턴스
+
+    사용자당 inotify 인스턴스 수가 제한되어 있으므로(기본 128개) 감시기마다 만들지
+    않고 하나를 공유하며, 이벤트는 디렉토리를 구독한 감시기에 나눠 줍니다.
+    구독은 약한 참조라 감시기가 사라지면 다음 drain()에서 감시가 해제됩니다.
+    """
+
+    _shared: Optional["_Inotify"] = None
+    _unavailable = False
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> Optional["_Inotify"]:
+        """공용 인스턴스 (inotify를 쓸 수 없는 환경이면 None)"""
+        with cls._shared_lock:
+            if cls._shared is None and not cls._unavailable:
+                try:
+                    cls._shared = cls()
+                except (OSError, AttributeError):
+                    cls._unavailable = True
+            return cls._shared
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self._libc = libc
+        self._fd = fd
+        self._lock = threading.Lock()
+        # wd -> {감시기: 감시기가 등록한 디렉토리 경로}
+        self._watches: Dict[int, "weakref.WeakKeyDictionary[FileWatcher, Path]"] = {}
+
+    def add(self, directory: Path, watcher: "FileWatcher") -> int:
+        """디렉토리 감시 추가 (같은 디렉토리는 같은 wd를 공유)
+
+        Raises:
+            OSError: 디렉토리가 없거나 감시 한도를 넘은 경우
+        """
+        with self._lock:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), _WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), str(directory))
+            self._watches.setdefault(wd, weakref.WeakKeyDictionary())[watcher] = directory
+            return wd
+
+    def remove(self, wd: int, watcher: "FileWatcher"):
+        """감시기의 구독 해제 (마지막 구독이면 커널 감시도 해제)"""
+        with self._lock:
+            subscribers = self._watches.get(wd)
+            if subscribers is None:
+                return
+            subscribers.pop(watcher, None)
+            if not subscribers:
+                self._release(wd)
+
+    def drain(self):
+        """대기 중인 이벤트를 모두 읽어 구독 감시기에 전달"""
+        with self._lock:
+            while True:
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    break
+                self._dispatch(data)
+
+            # 감시기가 모두 사라진 디렉토리는 감시 해제
+            for wd in [wd for wd, subscribers in self._watches.items() if not subscribers]:
+                self._release(wd)
+
+    def _dispatch(self, data: bytes):
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            start = offset + _EVENT_HEADER.size
+            name = os.fsdecode(data[start:start + length].rstrip(b"\0"))
+            offset = start + length
+
+            if mask & _IN_Q_OVERFLOW:
+                # 이벤트가 유실됨 - 모든 감시기가 전체 스캔
+                for subscribers in self._watches.values():
+                    for watcher in list(subscribers.keys()):
+                        watcher._on_overflow()
+                continue
+
+            subscribers = self._watches.get(wd)
+            if subscribers is None:
+                continue
+
+            if mask & _IN_IGNORED:
+                # 디렉토리가 삭제/이동되어 커널이 감시를 해제함
+                del self._watches[wd]
+                for watcher, directory in list(subscribers.items()):
+                    watcher._on_lost(directory)
+            elif name:
+                for watcher, directory in list(subscribers.items()):
+                    watcher._on_event(directory, name)
+
+    def _release(self, wd: int):
+        self._watches.pop(wd, None)
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+
+class FileWatcher:
+    """디렉토리별 파일 변경 감시기 (스레드 안전)
+
+    watch()로 등록한 디렉토리에서 지정한 확장자의 파일이 추가/수정/삭제되면
+    poll()이 해당 경로를 돌려줍니다. 이 프로세스가 직접 쓴 파일은 acknowledge()로
+    알려 주면 변경으로 보고하지 않습니다.
+    """
+
+    BACKENDS = ("auto", "inotify", "poll")
+
+    def __init__(self, poll_interval: float = 1.0, backend: str = "auto"):
+        """감시기 초기화
+
+        Args:
+            poll_interval: 폴링 방식에서 디렉토리를 다시 스캔하는 최소 간격(초)
+            backend: "auto" (inotify 우선), "inotify", "poll"
+
+        Raises:
+            ValueError: 지원하지 않는 backend
+            OSError: backend="inotify"인데 inotify를 쓸 수 없는 경우
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown watcher backend: {backend}")
+
+        self.poll_interval = poll_interval
+        self.generation = 0
+
+        self._inotify = _Inotify.shared() if backend != "poll" else None
+        if backend == "inotify" and self._inotify is None:
+            raise OSError("inotify is not available on this platform")
+        self.backend = "inotify" if self._inotify is not None else "poll"
+
+        self._lock = threading.Lock()
+        self._suffixes: Dict[Path, Tuple[str, ...]] = {}
+        # 디렉토리 -> 파일 이름 -> 서명
+        self._snapshot: Dict[Path, Dict[str, Signature]] = {}
+        # inotify가 알려준, 아직 확인하지 않은 파일
+        self._pending: Set[Path] = set()
+        # 전체 스캔이 필요한 디렉토리 (새 감시, 이벤트 유실, 디렉토리 교체)
+        self._rescan: Set[Path] = set()
+        # 아직 없어서 inotify 감시를 걸지 못한 디렉토리
+        self._missing: Set[Path] = set()
+        self._acknowledged: Dict[Path, Optional[Signature]] = {}
+        self._wds: Dict[Path, int] = {}
+        self._last_poll = time.monotonic()
+
+    def watch(self, directory: Path, suffixes: Iterable[str]):
+        """디렉토리 감시 추가 (현재 상태를 기준 스냅샷으로 삼음)
+
+        Args:
+            directory: 감시할 디렉토리 (하위 디렉토리는 포함하지 않음)
+            suffixes: 감시할 파일 확장자 (예: [".json"])
+        """
+        directory = Path(directory)
+        with self._lock:
+            merged = set(self._suffixes.get(directory, ())) | set(suffixes)
+            self._suffixes[directory] = tuple(sorted(merged))
+
+        # 감시를 먼저 건 뒤 스캔해야 그 사이의 변경을 놓치지 않음
+        if self._inotify is not None:
+            self._add_watch(directory)
+
+        with self._lock:
+            self._scan(directory)
+
+    def poll(self, force: bool = False) -> Set[Path]:
+        """마지막 호출 이후 바뀐 파일 경로
+
+        Args:
+            force: 폴링 방식에서 poll_interval이 지나지 않았어도 스캔
+
+        Returns:
+            추가/수정/삭제된 파일 경로 집합 (watch()에 넘긴 디렉토리 기준 경로)
+        """
+        if self._inotify is not None:
+            # 감시기 잠금 밖에서 읽어야 drain()과 잠금 순서가 엇갈리지 않음
+            self._inotify.drain()
+            with self._lock:
+                missing = list(self._missing)
+            for directory in missing:
+                if directory.is_dir():
+                    self._add_watch(directory)
+        else:
+            now = time.monotonic()
+            if not force and now - self._last_poll < self.poll_interval:
+                return set()
+            self._last_poll = now
+
+        with self._lock:
+            changed: Set[Path] = set()
+            if self._inotify is None:
+                for directory in self._suffixes:
+                    changed |= self._scan(directory)
+            else:
+                rescan, self._rescan = self._rescan, set()
+                pending, self._pending = self._pending, set()
+                for directory in rescan:
+                    changed |= self._scan(directory)
+                for path in pending:
+                    if path.parent not in rescan and self._check(path):
+                        changed.add(path)
+
+            if changed:
+                self.generation += 1
+            return changed
+
+    def acknowledge(self, path: Path):
+        """이 프로세스가 쓴(또는 지운) 파일의 현재 상태를 기준으로 기록
+
+        같은 파일에 대해 이어서 도착하는 이벤트나 폴링 결과는 변경으로 보고하지
+        않습니다. 다른 프로세스와 겹치지 않도록 파일 잠금 안에서 호출해야 합니다.
+        """
+        path = Path(path)
+        with self._lock:
+            names = self._snapshot.get(path.parent)
+            if names is None or not path.name.endswith(self._suffixes[path.parent]):
+                return
+            signature = _signature(path)
+            self._store(names, path.name, signature)
+            if self._inotify is not None:
+                self._acknowledged[path] = signature
+
+    def close(self):
+        """inotify 구독 해제"""
+        if self._inotify is not None:
+            for wd in list(self._wds.values()):
+                self._inotify.remove(wd, self)
+            self._wds.clear()
+
+    def _add_watch(self, directory: Path):
+        try:
+            self._wds[directory] = self._inotify.add(directory, self)
+        except OSError:
+            with self._lock:
+                self._missing.add(directory)
+            return
+        with self._lock:
+            self._missing.discard(directory)
+            self._rescan.add(directory)
+
+    def _scan(self, directory: Path) -> Set[Path]:
+        """디렉토리 전체를 스냅샷과 비교 (잠금은 호출자가 관리)"""
+        suffixes = self._suffixes[directory]
+        previous = self._snapshot.get(directory, {})
+        current: Dict[str, Signature] = {}
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffixes) and entry.is_file():
+                        stat = entry.stat()
+                        current[entry.name] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except FileNotFoundError:
+            pass
+
+        self._snapshot[directory] = current
+        changed = {
+            directory / name
+            for name in previous.keys() | current.keys()
+            if previous.get(name) != current.get(name)
+        }
+        for path in changed:
+            self._acknowledged.pop(path, None)
+        return changed
+
+    def _check(self, path: Path) -> bool:
+        """inotify가 알려준 파일 하나 확인 (잠금은 호출자가 관리)"""
+        signature = _signature(path)
+        if path in self._acknowledged:
+            if self._acknowledged[path] == signature:
+                return False
+            del self._acknowledged[path]
+
+        # 커널 이벤트가 있었으므로 서명이 같아도 (같은 시각 안의 제자리 수정) 변경으로 봄
+        names = self._snapshot.setdefault(path.parent, {})
+        self._store(names, path.name, signature)
+        return True
+
+    @staticmethod
+    def _store(names: Dict[str, Signature], name: str, signature: Optional[Signature]):
+        if signature is None:
+            names.pop(name, None)
+        else:
+            names[name] = signature
+
+    # _Inotify.drain()에서 호출 (공용 인스턴스 잠금 안)
+
+    def _on_event(self, directory: Path, name: str):
+        with self._lock:
+            suffixes = self._suffixes.get(directory)
+            if suffixes and name.endswith(suffixes):
+                self._pending.add(directory / name)
+
+    def _on_overflow(self):
+        with self._lock:
+            self._rescan |= set(self._suffixes)
+
+    def _on_lost(self, directory: Path):
+        with self._lock:
+            self._wds.pop(directory, None)
+            self._missing.add(directory)
+            self._rescan.add(directory)
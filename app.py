@@ -5,6 +5,7 @@ AI Prompt Maker - Standalone Application
 게임 개발을 위한 AI 프롬프트 생성 도구
 """
 import streamlit as st
+from streamlit.runtime.scriptrunner import RerunException, StopException
 from typing import Dict, Any, List, Optional
 import time
 import uuid
@@ -21,7 +22,8 @@ except ImportError:
 from components.template_manager import render_template_manager
 from components.prompt_editor import render_prompt_editor
 from components.prompt_guide import render_prompt_guide
-from ai_prompt_maker.service import PromptMakerService
+from ai_prompt_maker.registry import get_shared_service
+from ai_prompt_maker import tracing
 from ai_prompt_maker.models import PromptTemplate, PromptComponent, PromptCategory, PromptValidationError, OutputFormat
 from utils.template_storage import TemplateStorageManager
 
@@ -319,13 +321,13 @@ def render_prompt_generator(domain: str = "game_dev"):
     Args:
         domain: 도메인 ID (game_dev, uiux 등)
     """
-    service = PromptMakerService()
+    # 재실행마다 새로 만들지 않고 프로세스 공유 서비스 사용 (캐시 예열은 한 번만)
+    service = get_shared_service()
 
     # 세션 상태 초기화
     session_key = f"{domain}_prompt_maker"
     session_key_category = f"{domain}_output_category"
     session_key_format = f"{domain}_output_format"
-    session_key_formats_data = f"{domain}_output_formats_data"
 
     if f"{session_key}_last_generated_prompt" not in st.session_state:
         st.session_state[f"{session_key}_last_generated_prompt"] = None
@@ -337,8 +339,6 @@ def render_prompt_generator(domain: str = "game_dev"):
         st.session_state[session_key_category] = ""
     if session_key_format not in st.session_state:
         st.session_state[session_key_format] = None
-    if session_key_formats_data not in st.session_state:
-        st.session_state[session_key_formats_data] = None
 
     st.subheader("🎯 프롬프트 생성")
 
@@ -356,16 +356,14 @@ def render_prompt_generator(domain: str = "game_dev"):
         context_expansions = {}
         rule_expansions = {}
 
-    # 출력 형식 데이터 로드 (session state에 캐싱) - 나중에 사용
+    # 출력 형식 레지스트리 (프로세스 공유, 세션마다 복사하지 않음) - 나중에 사용
     try:
-        if st.session_state[session_key_formats_data] is None:
-            st.session_state[session_key_formats_data] = service.load_output_formats()
-
-        formats_data = st.session_state[session_key_formats_data]
-        categories = formats_data.get('categories', {})
-        formats = formats_data.get('formats', {})
+        format_registry = service.get_output_format_registry()
+        categories = format_registry.categories
+        formats = format_registry.formats
     except Exception as e:
         st.error(f"출력 형식 로드 실패: {e}")
+        format_registry = None
         categories = {}
         formats = {}
 
@@ -437,6 +435,29 @@ def render_prompt_generator(domain: str = "game_dev"):
         st.markdown("### 📊 출력 형식 설정")
         st.markdown("프롬프트 생성 시 사용할 출력 형식을 선택하세요")
 
+        # 추천 형식 (적용한 목표/컨텍스트/규칙 기준, 누르면 카테고리와 형식을 함께 선택)
+        if format_registry is not None and selected_goal:
+            recommendations = service.recommend_output_formats(
+                selected_goal, selected_contexts, selected_rules, domain=domain
+            )
+            if recommendations:
+                st.markdown("**💡 추천 형식**")
+                recommendation_cols = st.columns(len(recommendations))
+                for col, recommendation in zip(recommendation_cols, recommendations):
+                    with col:
+                        if st.button(
+                            recommendation['name'],
+                            key=f"{domain}_recommend_{recommendation['format_id']}",
+                            help="일치 키워드: " + (", ".join(recommendation['matched_keywords']) or "-"),
+                            use_container_width=True
+                        ):
+                            st.session_state[session_key_category] = recommendation['category']
+                            st.session_state[session_key_format] = recommendation['format_id']
+                            # 선택 위젯이 새 index로 다시 만들어지도록 위젯 상태 제거
+                            st.session_state.pop(f"{domain}_category_select_widget", None)
+                            st.session_state.pop(f"{domain}_format_select_widget", None)
+                            st.rerun()
+
         # STEP 1: 카테고리 선택
         category_options = {cat_id: cat_data['name']
                           for cat_id, cat_data in categories.items()}
@@ -465,10 +486,8 @@ def render_prompt_generator(domain: str = "game_dev"):
 
         # STEP 2: 세부 형식 선택 (카테고리 선택 시에만 표시)
         if selected_category and selected_category != "":
-            # 해당 카테고리의 포맷 필터링
-            category_formats = {fmt_id: fmt_data
-                               for fmt_id, fmt_data in formats.items()
-                               if fmt_data.get('category') == selected_category}
+            # 해당 카테고리의 포맷 (레지스트리에 미리 분류됨)
+            category_formats = format_registry.formats_in(selected_category) if format_registry else {}
 
             if category_formats:
                 format_options = {fmt_id: fmt_data['name']
@@ -662,6 +681,18 @@ def render_prompt_generator(domain: str = "game_dev"):
 
 def main():
     """메인 함수"""
+    # 추적 설정 (PROMPT_MAKER_TRACE 환경 변수가 없으면 꺼짐)
+    tracing.configure_from_env()
+    # st.rerun()/st.stop()은 예외로 실행을 끝내는 정상 흐름이므로 오류 스팬으로 기록하지 않음
+    tracing.ignore_errors(RerunException, StopException)
+
+    # 재실행마다 새 요청 ID로 이번 실행의 스팬을 묶음
+    with tracing.trace(), tracing.span("app.rerun"):
+        render_app()
+
+
+def render_app():
+    """앱 화면 렌더링"""
     # 페이지 설정
     st.set_page_config(
         page_title="🤖 AI Prompt Maker",
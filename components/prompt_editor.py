@@ -72,7 +72,8 @@ def render_template_selector(data_handler: DataHandler) -> Optional[Dict[str, An
             st.write(f"**현재 버전:** {selected_template['current_version']}")
 
         with col2:
-            st.write(f"**총 버전:** {len(selected_template['versions'])}개")
+            version_count = selected_template.get('version_count', len(selected_template.get('versions', [])))
+            st.write(f"**총 버전:** {version_count}개")
             if selected_template.get('tags'):
                 st.write(f"**태그:** {', '.join(selected_template['tags'])}")
 
@@ -180,12 +181,8 @@ def render_main_editor(template: Dict[str, Any], data_handler: DataHandler):
     template_id = template['template_id']
     selected_version = st.session_state.get('editor_selected_version', template['current_version'])
 
-    # 선택된 버전의 데이터 가져오기
-    version_data = None
-    for version in template['versions']:
-        if version['version'] == selected_version:
-            version_data = version
-            break
+    # 선택된 버전의 데이터만 가져오기
+    version_data = data_handler.get_version(template_id, selected_version)
 
     if not version_data:
         st.error("선택된 버전을 찾을 수 없습니다.")
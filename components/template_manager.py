@@ -4,14 +4,20 @@ Template Manager Component
 저장된 프롬프트 템플릿을 관리하는 컴포넌트
 """
 import streamlit as st
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 import uuid
 
 from utils.data_handler import DataHandler
 from utils.template_storage import TemplateStorageManager
+from ai_prompt_maker.tracing import traced
 
 
+# 파일 시스템 템플릿 목록 한 페이지의 카드 수
+TEMPLATE_PAGE_SIZE = 20
+
+
+@traced("render_template_manager")
 def render_template_manager():
     """템플릿 관리자 메인 렌더링"""
     st.header("📚 Prompt Template")
@@ -56,7 +62,7 @@ def render_template_manager():
             render_template_list(data_handler)
 
         # 템플릿이 하나도 없는 경우
-        if not localstorage_templates and (not data_handler or not data_handler.list_templates(None)):
+        if not localstorage_templates and (not data_handler or not data_handler.list_templates_page(None, limit=1)["total"]):
             st.info("💡 저장된 템플릿이 없습니다. 프롬프트를 생성한 후 '템플릿으로 저장' 버튼을 클릭하여 저장하세요.")
 
     except Exception as e:
@@ -303,6 +309,7 @@ def render_localstorage_delete_confirmation(template: Any):
             st.rerun()
 
 
+@traced("render_template_list")
 def render_template_list(data_handler: DataHandler):
     """템플릿 목록 렌더링"""
 
@@ -314,10 +321,22 @@ def render_template_list(data_handler: DataHandler):
         # 템플릿 목록 조회
         category = None if category_filter == "전체" else category_filter
 
+        # 필터가 바뀌면 첫 페이지부터 다시 조회
+        if st.session_state.get('template_page_filter') != (category, search_term):
+            st.session_state.template_page_filter = (category, search_term)
+            st.session_state.template_page_cursors = []
+
+        cursors = st.session_state.get('template_page_cursors', [])
+        next_cursor = None
+
         if search_term:
             templates = data_handler.search_templates(search_term)
+            total = len(templates)
         else:
-            templates = data_handler.list_templates(category)
+            page = data_handler.list_templates_page(
+                category, limit=TEMPLATE_PAGE_SIZE, cursor=cursors[-1] if cursors else None
+            )
+            templates, total, next_cursor = page["templates"], page["total"], page["next_cursor"]
 
         if not templates:
             if search_term:
@@ -327,17 +346,40 @@ def render_template_list(data_handler: DataHandler):
             return
 
         # 템플릿 개수 표시
-        st.info(f"총 {len(templates)}개의 템플릿이 있습니다.")
+        st.info(f"총 {total}개의 템플릿이 있습니다.")
         st.divider()
 
         # 템플릿 카드 렌더링
         for template in templates:
             render_template_card(template, data_handler)
 
+        # 페이지 이동
+        if cursors or next_cursor:
+            render_template_page_navigation(cursors, next_cursor)
+
     except Exception as e:
         st.error(f"템플릿 목록 로딩 실패: {e}")
 
 
+def render_template_page_navigation(cursors: List[str], next_cursor: Optional[str]):
+    """템플릿 목록 페이지 이동 버튼 (지나온 페이지의 커서를 세션에 쌓아 둠)"""
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col1:
+        if cursors and st.button("◀ 이전", key="template_page_prev"):
+            st.session_state.template_page_cursors = cursors[:-1]
+            st.rerun()
+
+    with col2:
+        st.caption(f"{len(cursors) + 1} 페이지")
+
+    with col3:
+        if next_cursor and st.button("다음 ▶", key="template_page_next"):
+            st.session_state.template_page_cursors = cursors + [next_cursor]
+            st.rerun()
+
+
 def render_template_card(template: Dict[str, Any], data_handler: DataHandler):
     """개별 템플릿 카드 렌더링"""
 
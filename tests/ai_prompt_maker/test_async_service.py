@@ -0,0 +1,177 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+비동기 서비스 테스트
+
+ai_prompt_maker.async_service.AsyncPromptMakerService를 테스트합니다.
+- 저장/로드/목록/검색/삭제가 동기 서비스와 같은 결과와 파일을 만드는지
+- 같은 ID의 동시 로드 합치기와 취소 처리
+- 파일 I/O 중에도 이벤트 루프가 막히지 않는지
+- 일괄 가져오기/내보내기와 진행 상황 콜백
+"""
+
+import asyncio
+import io
+import threading
+import time
+
+import pytest
+
+from ai_prompt_maker import AsyncPromptMakerService
+from ai_prompt_maker.service import PromptMakerService
+
+
+@pytest.fixture
+def service_kwargs(config_file, test_templates_dir):
+    return {"config_path": str(config_file), "templates_dir": str(test_templates_dir), "watch_interval": 0}
+
+
+class TestAsyncPromptMakerService:
+    """AsyncPromptMakerService 통합 테스트"""
+
+    @pytest.mark.integration
+    def test_should_match_sync_service(self, service_kwargs, test_templates_dir, make_template):
+        """비동기 API로 저장한 템플릿은 동기 서비스에서도 같게 보여야 한다"""
+        async def scenario():
+            async with await AsyncPromptMakerService.create(**service_kwargs) as service:
+                for n in range(3):
+                    assert await service.save_template(make_template(f"t{n}", f"목표 {n}"))
+                assert await service.delete_template("t2")
+                loaded = await service.load_template("t1")
+                listed = await service.list_templates()
+                page = await service.list_templates_page(limit=1)
+                found = await service.search_templates("목표 0")
+                return loaded, listed, page, found
+
+        # When
+        loaded, listed, page, found = asyncio.run(scenario())
+
+        # Then
+        sync_service = PromptMakerService(**service_kwargs)
+        assert loaded.get_current_version().components.goal == "목표 1"
+        assert [t["template_id"] for t in listed] == [t["template_id"] for t in sync_service.list_templates()]
+        assert page["total"] == 2 and len(page["templates"]) == 1
+        assert [t["template_id"] for t in found] == ["t0"]
+        assert sync_service.load_template("t2") is None
+        assert (test_templates_dir / "t0.json").exists()
+
+    @pytest.mark.integration
+    def test_should_apply_sync_validation_rules(self, service_kwargs, make_template):
+        """잘못된 ID는 동기 서비스와 같은 방식으로 거부해야 한다"""
+        async def scenario():
+            async with AsyncPromptMakerService(**service_kwargs) as service:
+                assert await service.load_template("../../etc/passwd") is None
+                assert await service.delete_template("../outside") is False
+                with pytest.raises(ValueError):
+                    await service.save_template(make_template("../evil"))
+
+        asyncio.run(scenario())
+
+    @pytest.mark.integration
+    def test_should_coalesce_concurrent_loads(self, service_kwargs, monkeypatch, make_template):
+        """같은 ID를 동시에 로드하면 한 번만 읽고, 한 호출이 취소되어도 나머지는 결과를 받아야 한다"""
+        # Given
+        sync_service = PromptMakerService(**service_kwargs)
+        sync_service.save_template(make_template("shared"))
+        calls = []
+        original = sync_service.load_template
+
+        def slow_load(template_id):
+            calls.append(template_id)
+            time.sleep(0.05)
+            return original(template_id)
+
+        monkeypatch.setattr(sync_service, "load_template", slow_load)
+
+        async def scenario():
+            async with AsyncPromptMakerService(sync_service) as service:
+                tasks = [asyncio.ensure_future(service.load_template("shared")) for _ in range(10)]
+                other = asyncio.ensure_future(service.load_template("missing"))
+                await asyncio.sleep(0)
+                tasks[0].cancel()
+                results = await asyncio.gather(*tasks[1:], other)
+                again = await service.load_template("shared")
+                return tasks[0], results, again
+
+        # When
+        cancelled, results, again = asyncio.run(scenario())
+
+        # Then
+        assert cancelled.cancelled()
+        assert all(result is results[0] for result in results[:9])
+        assert results[0].template_id == "shared" and results[9] is None
+        assert calls == ["shared", "missing", "shared"]
+        assert again is results[0]
+
+    @pytest.mark.integration
+    def test_should_not_block_event_loop(self, service_kwargs, monkeypatch):
+        """파일 I/O가 느려도 이벤트 루프의 다른 작업은 계속 실행되어야 한다"""
+        # Given
+        sync_service = PromptMakerService(**service_kwargs)
+        started = threading.Event()
+
+        def slow_list(*args):
+            started.set()
+            time.sleep(0.2)
+            return []
+
+        monkeypatch.setattr(sync_service, "list_templates", slow_list)
+
+        async def scenario():
+            async with AsyncPromptMakerService(sync_service, max_workers=1) as service:
+                listing = asyncio.ensure_future(service.list_templates())
+                ticks = 0
+                while not listing.done():
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+                return ticks
+
+        # When
+        ticks = asyncio.run(scenario())
+
+        # Then
+        assert started.is_set()
+        assert ticks >= 5
+
+    @pytest.mark.integration
+    def test_should_import_and_export_with_progress(self, service_kwargs, make_template):
+        """일괄 가져오기/내보내기 결과는 동기 서비스와 같고 진행 상황은 루프 스레드에서 받아야 한다"""
+        async def scenario():
+            async with AsyncPromptMakerService(**service_kwargs) as service:
+                for n in range(3):
+                    await service.save_template(make_template(f"t{n}"))
+                buffer = io.BytesIO()
+                progress = []
+                loop_thread = threading.get_ident()
+                exported = await service.export_templates(
+                    buffer, progress=lambda done, total: progress.append((done, total, threading.get_ident()))
+                )
+                for n in range(3):
+                    await service.delete_template(f"t{n}")
+                buffer.seek(0)
+                imported = await service.import_templates(buffer, workers=1)
+                return exported, progress, loop_thread, imported, await service.list_templates()
+
+        # When
+        exported, progress, loop_thread, imported, listed = asyncio.run(scenario())
+
+        # Then
+        assert exported["exported"] == 3
+        assert progress and progress[-1][:2] == (3, 3)
+        assert {thread for _, _, thread in progress} == {loop_thread}
+        assert imported["accepted"] == 3
+        assert {t["template_id"] for t in listed} == {"t0", "t1", "t2"}
+
+    @pytest.mark.unit
+    def test_should_reject_use_after_close(self, service_kwargs):
+        """닫은 뒤의 호출과 잘못된 스레드 수는 거부해야 한다"""
+        async def scenario():
+            service = AsyncPromptMakerService(**service_kwargs)
+            await service.close()
+            await service.close()
+            with pytest.raises(RuntimeError):
+                await service.list_templates()
+
+        asyncio.run(scenario())
+        with pytest.raises(ValueError):
+            AsyncPromptMakerService(max_workers=0, **service_kwargs)
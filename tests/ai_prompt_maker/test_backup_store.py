@@ -0,0 +1,175 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+삭제 백업 저장소 테스트
+
+ai_prompt_maker.backup_store 모듈과 서비스 백업/복원 연동을 테스트합니다.
+- 내용 해시 기반 중복 제거와 압축
+- 세대 수/보관 기간 정책과 정리 작업
+- 이전 방식 타임스탬프 백업 파일 가져오기
+- restore_template 세대 복원, 복원 후 재삭제 중복 제거
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from ai_prompt_maker.backup_store import BackupStore
+from ai_prompt_maker.models import PromptComponent, PromptValidationError
+from ai_prompt_maker.service import PromptMakerService
+
+
+def _blobs(store):
+    return list((store.root / BackupStore.OBJECTS_DIR).glob("*/*.gz"))
+
+
+class TestBackupStore:
+    """BackupStore 단위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_deduplicate_identical_content(self, temp_dir):
+        """같은 내용을 다시 백업하면 블롭과 세대가 늘지 않아야 한다"""
+        # Given
+        store = BackupStore(temp_dir / "backup")
+        data = b'{"name": "a"}' * 100
+
+        # When
+        first = store.add("t1", data)
+        second = store.add("t1", data)
+        store.add("t2", data)
+
+        # Then
+        assert first == second == 1
+        assert len(_blobs(store)) == 1
+        assert store.get("t1") == data
+        assert store.stats()["stored_bytes"] < len(data)
+
+    @pytest.mark.unit
+    def test_should_keep_generations_and_restore_by_number(self, temp_dir):
+        """세대별 내용을 보관하고 번호로 조회할 수 있어야 한다"""
+        # Given
+        store = BackupStore(temp_dir / "backup")
+
+        # When
+        for n in range(3):
+            store.add("t1", f"내용 {n}".encode("utf-8"), name="이름")
+
+        # Then
+        assert [e["generation"] for e in store.list_generations("t1")] == [3, 2, 1]
+        assert store.get("t1", 1) == "내용 0".encode("utf-8")
+        assert store.get("t1") == "내용 2".encode("utf-8")
+        assert store.get("t1", 99) is None
+        assert store.get("missing") is None
+
+    @pytest.mark.unit
+    def test_should_enforce_generation_limit_on_add(self, temp_dir):
+        """세대 수 제한을 넘으면 오래된 세대와 블롭을 지워야 한다"""
+        # Given
+        store = BackupStore(temp_dir / "backup", keep_generations=2)
+
+        # When
+        for n in range(4):
+            store.add("t1", f"내용 {n}".encode("utf-8"))
+
+        # Then
+        assert [e["generation"] for e in store.list_generations("t1")] == [4, 3]
+        assert len(_blobs(store)) == 2
+
+    @pytest.mark.unit
+    def test_should_prune_by_age_and_keep_shared_blobs(self, temp_dir):
+        """기간이 지난 세대는 정리하되 다른 세대가 참조하는 블롭은 남겨야 한다"""
+        # Given
+        store = BackupStore(temp_dir / "backup", keep_generations=None, max_age_days=30)
+        store.add("old", b"shared")
+        store.add("old", b"only-old")
+        store.add("new", b"shared")
+
+        # When
+        result = store.prune(now=datetime.now() + timedelta(days=31))
+        store.add("new", b"fresh")
+        later = store.prune(now=datetime.now() + timedelta(days=1))
+
+        # Then
+        assert result["generations_removed"] == 3
+        assert result["blobs_removed"] == 2
+        assert later["generations_removed"] == 0
+        assert store.get("new") == b"fresh"
+        assert store.get("old") is None
+
+    @pytest.mark.unit
+    def test_should_import_legacy_backup_files(self, temp_dir):
+        """이전 방식 타임스탬프 백업 파일을 세대로 옮겨야 한다"""
+        # Given
+        root = temp_dir / "backup"
+        root.mkdir()
+        (root / "my_id_20240101_120000.json").write_bytes(b"first")
+        (root / "my_id_20240201_120000.json").write_bytes(b"second")
+        store = BackupStore(root, keep_generations=None)
+
+        # When
+        result = store.prune()
+
+        # Then
+        assert result["imported"] == 2
+        assert list(root.glob("*_*.json")) == []
+        assert store.get("my_id") == b"second"
+        assert store.list_generations("my_id")[-1]["deleted_at"] == "2024-01-01T12:00:00"
+
+
+class TestServiceBackups:
+    """서비스 삭제 백업과 복원 테스트"""
+
+    @pytest.mark.integration
+    def test_should_restore_deleted_template(self, service, sample_template):
+        """삭제한 템플릿을 최신 세대에서 복원해야 한다"""
+        # Given
+        service.save_template(sample_template)
+        service.delete_template(sample_template.template_id)
+
+        # When
+        restored = service.restore_template(sample_template.template_id)
+
+        # Then
+        assert restored.to_dict() == sample_template.to_dict()
+        assert service.load_template(sample_template.template_id) is not None
+        assert sample_template.template_id in {t["template_id"] for t in service.list_templates()}
+
+    @pytest.mark.integration
+    def test_should_deduplicate_redelete_after_restore(self, config_file, test_templates_dir, sample_template):
+        """복원 후 다시 삭제하거나 압축 방식이 달라도 내용이 같으면 블롭과 세대가 하나여야 한다"""
+        for compression in ("none", "gzip"):
+            # Given
+            service = PromptMakerService(config_path=str(config_file), templates_dir=str(test_templates_dir),
+                                         compression=compression)
+            service.save_template(sample_template)
+            service.delete_template(sample_template.template_id)
+
+            # When
+            service.restore_template(sample_template.template_id)
+            service.delete_template(sample_template.template_id)
+
+            # Then
+            assert [b["generation"] for b in service.list_backups(sample_template.template_id)] == [1]
+            assert len(_blobs(service._backups)) == 1
+            restored = service.restore_template(sample_template.template_id)
+            assert restored.to_dict() == sample_template.to_dict()
+            service.delete_template(sample_template.template_id)
+
+    @pytest.mark.integration
+    def test_should_restore_specific_generation(self, service, sample_template):
+        """세대 번호를 지정하면 해당 시점의 내용을 복원해야 한다"""
+        # Given
+        service.save_template(sample_template)
+        service.delete_template(sample_template.template_id)
+        service.restore_template(sample_template.template_id)
+        template = service.load_template(sample_template.template_id)
+        template.add_version(PromptComponent(goal="두 번째"), "v2")
+        service.save_template(template)
+        service.delete_template(sample_template.template_id)
+
+        # When / Then
+        assert len(service.restore_template(sample_template.template_id, 1).versions) == 1
+        with pytest.raises(PromptValidationError):
+            service.restore_template(sample_template.template_id, 2)
+        assert len(service.restore_template(sample_template.template_id, 2, overwrite=True).versions) == 2
+        assert service.restore_template("missing_id") is None
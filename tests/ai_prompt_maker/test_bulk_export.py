@@ -0,0 +1,167 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+일괄 내보내기 테스트
+
+ai_prompt_maker.bulk_export 모듈과 PromptMakerService.export_templates를 테스트합니다.
+- JSONL/ZIP(JSON, Markdown)/텍스트 형식 스트리밍 기록
+- 카테고리/태그/수정 시각 필터
+- 진행 상황 콜백과 캐시 미사용
+"""
+
+import io
+import json
+import zipfile
+from datetime import datetime
+
+import pytest
+
+from ai_prompt_maker import bulk_export
+from ai_prompt_maker.models import PromptTemplate, PromptCategory
+
+
+class _WriteOnly(io.RawIOBase):
+    """탐색할 수 없는 출력 스트림 (소켓/파이프 흉내)"""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+@pytest.fixture
+def populated_service(service, make_template):
+    for template_id, category, tags in (
+        ("code_a", PromptCategory.PROGRAMMING, ["python"]),
+        ("code_b", PromptCategory.PROGRAMMING, ["rust"]),
+        ("plan_a", PromptCategory.PLANNING, ["python"]),
+    ):
+        service.save_template(make_template(
+            template_id, category=category, tags=tags, name=f"이름 {template_id}", role=["개발자"]
+        ))
+    service._templates_cache.clear()
+    return service
+
+
+class TestTemplateExportWriter:
+    """작성기 단위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_reject_unknown_format_before_opening_file(self, temp_dir):
+        """지원하지 않는 형식이면 파일을 만들기 전에 실패해야 한다"""
+        path = temp_dir / "out.bin"
+
+        with pytest.raises(ValueError):
+            bulk_export.TemplateExportWriter(path, "xml")
+        with pytest.raises(ValueError):
+            bulk_export.TemplateExportWriter(path, "zip", member_format="pdf")
+        assert not path.exists()
+
+    @pytest.mark.unit
+    def test_should_write_zip_to_unseekable_stream(self, make_template):
+        """탐색할 수 없는 스트림에도 ZIP을 기록하고 스트림은 닫지 않아야 한다"""
+        # Given
+        stream = _WriteOnly()
+
+        # When
+        with bulk_export.TemplateExportWriter(stream, "zip", member_format="markdown") as writer:
+            writer.write(make_template("md_a", goal="마크다운 목표", role=["개발자"]))
+
+        # Then
+        assert not stream.closed
+        with zipfile.ZipFile(io.BytesIO(bytes(stream.data))) as archive:
+            markdown = archive.read("md_a.md").decode("utf-8")
+        assert "# 마크다운 목표" in markdown
+        assert "- 개발자" in markdown
+        assert writer.count == 1
+
+
+class TestServiceExport:
+    """PromptMakerService.export_templates 통합 테스트"""
+
+    @pytest.mark.integration
+    def test_should_round_trip_jsonl_through_import(self, populated_service):
+        """JSONL로 내보낸 결과를 다시 가져오면 같은 템플릿이어야 한다"""
+        # Given
+        buffer = io.BytesIO()
+
+        # When
+        report = populated_service.export_templates(buffer)
+
+        # Then
+        assert (report["total"], report["exported"], report["failed"]) == (3, 3, [])
+        assert report["bytes"] == len(buffer.getvalue())
+        lines = buffer.getvalue().decode("utf-8").splitlines()
+        exported = {json.loads(line)["template_id"]: json.loads(line) for line in lines}
+        assert exported["code_a"] == populated_service.load_template("code_a").to_dict()
+
+        buffer.seek(0)
+        again = populated_service.import_templates(buffer, overwrite=True, workers=1)
+        assert again["accepted"] == 3
+
+    @pytest.mark.integration
+    def test_should_filter_and_report_progress(self, populated_service, temp_dir):
+        """카테고리/태그/수정 시각 필터를 적용하고 진행 상황을 알려야 한다"""
+        # Given
+        path = temp_dir / "python.zip"
+        calls = []
+
+        # When
+        report = populated_service.export_templates(
+            path, "zip", category="프로그램", tags=["python"],
+            progress=lambda done, total: calls.append((done, total))
+        )
+        future = populated_service.export_templates(
+            io.BytesIO(), updated_after=datetime(2999, 1, 1)
+        )
+        past = populated_service.export_templates(
+            io.BytesIO(), updated_before="2000-01-01T00:00:00"
+        )
+
+        # Then
+        assert report["exported"] == 1
+        assert calls == [(1, 1)]
+        with zipfile.ZipFile(path) as archive:
+            assert archive.namelist() == ["code_a.json"]
+            assert PromptTemplate.from_json(archive.read("code_a.json").decode("utf-8")).name == "이름 code_a"
+        assert future["total"] == past["total"] == 0
+
+    @pytest.mark.integration
+    def test_should_concatenate_text_without_filling_cache(self, populated_service):
+        """텍스트 형식은 템플릿을 이어 붙이고 캐시를 채우지 않아야 한다"""
+        # Given
+        buffer = io.BytesIO()
+
+        # When
+        report = populated_service.export_templates(buffer, "text", include_all_versions=True)
+
+        # Then
+        text = buffer.getvalue().decode("utf-8")
+        assert report["exported"] == 3
+        assert all(f"템플릿 이름: 이름 {tid}" in text for tid in ("code_a", "code_b", "plan_a"))
+        assert len(populated_service._templates_cache) == 0
+
+    @pytest.mark.integration
+    def test_should_report_unreadable_templates(self, populated_service, monkeypatch):
+        """읽을 수 없는 템플릿은 건너뛰고 실패 목록에 보고해야 한다"""
+        # Given
+        original = populated_service._read_template_file
+
+        def read(safe_id, path):
+            if safe_id == "code_b":
+                raise ValueError("손상된 파일")
+            return original(safe_id, path)
+
+        monkeypatch.setattr(populated_service, "_read_template_file", read)
+
+        # When
+        report = populated_service.export_templates(io.BytesIO(), category="프로그램")
+
+        # Then
+        assert (report["total"], report["exported"]) == (2, 1)
+        assert report["failed"] == [{"template_id": "code_b", "error": "손상된 파일"}]
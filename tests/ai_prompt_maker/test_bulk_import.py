@@ -0,0 +1,223 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+일괄 가져오기 테스트
+
+ai_prompt_maker.bulk_import 모듈과 PromptMakerService.import_templates를 테스트합니다.
+- JSONL/ZIP 형식 자동 감지와 스트리밍 읽기
+- 레코드별 accepted/rejected/duplicate 보고
+- 작업자 프로세스 병렬 검증 (spawn, 작은 입력은 현재 프로세스)
+- 매니페스트 일괄 갱신과 sqlite 백엔드 저장
+"""
+
+import io
+import json
+import zipfile
+
+import pytest
+
+from ai_prompt_maker import bulk_import, template_io
+from ai_prompt_maker.models import PromptComponent
+from ai_prompt_maker.service import PromptMakerService
+
+
+def _jsonl(*lines):
+    return "\n".join(lines).encode("utf-8") + b"\n"
+
+
+def _line(template):
+    return json.dumps(template.to_dict(), ensure_ascii=False)
+
+
+class _Unseekable(io.RawIOBase):
+    """탐색할 수 없는 스트림 (소켓/파이프 흉내)"""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._data.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class TestBulkImportReader:
+    """레코드 읽기/검증 단위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_reject_oversized_line_and_continue(self, make_template):
+        """너무 긴 줄은 거부하고 다음 줄부터 계속 읽어야 한다"""
+        # Given
+        data = b"x" * (bulk_import.MAX_RECORD_SIZE + 10) + b"\n" + _jsonl(_line(make_template("after")))
+
+        # When
+        records = list(bulk_import.iter_records(io.BytesIO(data)))
+
+        # Then
+        assert [(where, error is None) for where, _, error in records] == [("line 1", False), ("line 2", True)]
+
+    @pytest.mark.unit
+    def test_should_validate_header_first_and_gzip_records(self, make_template):
+        """헤더 우선 형식과 gzip 압축 레코드도 전체 검증해야 한다"""
+        # Given
+        template = make_template("packed")
+        template.add_version(PromptComponent(goal="두 번째"), "v2")
+        packed = template_io.compress(template_io.dumps_template(template, "delta"), "gzip")
+
+        # When
+        status, payload = bulk_import.parse_record(packed)
+        bad_status, error = bulk_import.parse_record(b'{"template_id": "x"}')
+
+        # Then
+        assert status == bulk_import.ACCEPTED
+        assert payload == template.to_dict()
+        assert bad_status == bulk_import.REJECTED
+        assert error
+
+
+class TestServiceImport:
+    """PromptMakerService.import_templates 통합 테스트"""
+
+    @pytest.mark.integration
+    def test_should_report_each_record(self, service, make_template):
+        """레코드마다 accepted/rejected/duplicate를 보고해야 한다"""
+        # Given
+        service.save_template(make_template("existing"))
+        data = _jsonl(
+            _line(make_template("new_one")),
+            "{not json",
+            _line(make_template("new_one", "다시")),
+            _line(make_template("existing")),
+            json.dumps({**make_template("bad_id").to_dict(), "template_id": "../escape"}),
+        )
+
+        # When
+        report = service.import_templates(io.BytesIO(data), workers=1)
+
+        # Then
+        statuses = [record["status"] for record in report["records"]]
+        assert statuses == ["accepted", "rejected", "duplicate", "duplicate", "rejected"]
+        assert (report["accepted"], report["rejected"], report["duplicate"]) == (1, 2, 2)
+        assert report["records"][1]["error"]
+        assert service.load_template("new_one").get_current_version().components.goal == "목표"
+        assert {t["template_id"] for t in service.list_templates()} == {"existing", "new_one"}
+
+    @pytest.mark.integration
+    def test_should_overwrite_existing_when_requested(self, service, make_template):
+        """overwrite=True면 기존 템플릿을 덮어쓰고 캐시를 비워야 한다"""
+        # Given
+        service.save_template(make_template("existing"))
+        service.load_template("existing")
+
+        # When
+        report = service.import_templates(
+            io.BytesIO(_jsonl(_line(make_template("existing", "덮어씀")))), overwrite=True, workers=1
+        )
+
+        # Then
+        assert report["accepted"] == 1
+        assert service.load_template("existing").get_current_version().components.goal == "덮어씀"
+
+    @pytest.mark.integration
+    def test_should_import_zip_from_unseekable_stream(self, service, make_template):
+        """탐색할 수 없는 스트림의 ZIP 아카이브(템플릿 파일 + JSONL)를 가져와야 한다"""
+        # Given
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("a.json", template_io.compress(template_io.dumps_template(make_template("zip_a")), "gzip"))
+            archive.writestr("dir/more.jsonl", _jsonl(_line(make_template("zip_b")), _line(make_template("zip_c"))))
+            archive.writestr("readme.txt", "무시")
+
+        # When
+        report = service.import_templates(io.BufferedReader(_Unseekable(buffer.getvalue())), workers=1)
+
+        # Then
+        assert report["accepted"] == 3
+        assert [r["source"] for r in report["records"]] == ["a.json", "dir/more.jsonl: line 1", "dir/more.jsonl: line 2"]
+        assert service.load_template("zip_c") is not None
+
+    @pytest.mark.integration
+    def test_should_update_manifest_once(self, service, monkeypatch, make_template):
+        """여러 묶음을 가져와도 매니페스트는 한 번만 기록해야 한다"""
+        # Given
+        service.list_templates()
+        commits = []
+        original = service._manifest._commit
+        monkeypatch.setattr(service._manifest, "_commit", lambda *a, **k: (commits.append(1), original(*a, **k))[1])
+        data = _jsonl(*(_line(make_template(f"t{n}")) for n in range(7)))
+
+        # When
+        report = service.import_templates(io.BytesIO(data), workers=1, batch_size=3)
+
+        # Then
+        assert report["accepted"] == 7
+        assert len(commits) == 1
+        fresh = PromptMakerService(config_path=str(service.config_path), templates_dir=str(service.templates_dir))
+        assert len(fresh.list_templates()) == 7
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_should_validate_in_worker_processes(self, service, temp_dir, monkeypatch, make_template):
+        """작업자 프로세스로 검증해도 결과 순서와 내용이 같아야 한다"""
+        # Given
+        monkeypatch.setattr(bulk_import, "PARALLEL_MIN_RECORDS", 16)
+        path = temp_dir / "import.jsonl"
+        path.write_bytes(_jsonl(*(_line(make_template(f"p{n}", f"목표 {n}")) for n in range(40)), "[]"))
+
+        # When
+        report = service.import_templates(str(path), workers=2, batch_size=16)
+
+        # Then
+        assert (report["accepted"], report["rejected"]) == (40, 1)
+        assert [r["template_id"] for r in report["records"][:40]] == [f"p{n}" for n in range(40)]
+        assert service.load_template("p39").get_current_version().components.goal == "목표 39"
+
+    @pytest.mark.unit
+    def test_should_start_spawn_workers_only_past_threshold(self, monkeypatch, make_template):
+        """읽은 레코드가 기준보다 적으면 작업자를 만들지 않고, 넘으면 spawn 작업자를 써야 한다"""
+        # Given
+        created = []
+
+        class _RecordingPool:
+            def __init__(self, max_workers, mp_context):
+                created.append((max_workers, mp_context.get_start_method()))
+
+            def map(self, func, items, chunksize=1):
+                return map(func, items)
+
+            def shutdown(self):
+                pass
+
+        monkeypatch.setattr(bulk_import, "ProcessPoolExecutor", _RecordingPool)
+
+        lines = [(f"line {n}", _line(make_template(f"t{n}")).encode("utf-8"), None) for n in range(10)]
+
+        # When
+        small = list(bulk_import.validate_batches(iter(lines), batch_size=4, workers=4))
+        large = list(bulk_import.validate_batches(iter(lines), batch_size=4, workers=4, parallel_threshold=8))
+
+        # Then
+        assert [len(batch) for batch in small] == [len(batch) for batch in large] == [4, 4, 2]
+        assert small == large
+        assert created == [(4, "spawn")]
+
+    @pytest.mark.integration
+    def test_should_import_into_sqlite_backend(self, config_file, test_templates_dir, make_template):
+        """sqlite 백엔드에서는 묶음 단위로 저장해야 한다"""
+        # Given
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir), storage_backend="sqlite"
+        )
+        service.save_template(make_template("existing"))
+        data = _jsonl(_line(make_template("s1")), _line(make_template("s2")), _line(make_template("existing")))
+
+        # When
+        report = service.import_templates(io.BytesIO(data), workers=1)
+
+        # Then
+        assert (report["accepted"], report["duplicate"]) == (2, 1)
+        assert list(test_templates_dir.glob("*.json")) == []
+        assert {t["template_id"] for t in service.list_templates()} == {"existing", "s1", "s2"}
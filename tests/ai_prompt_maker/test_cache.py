@@ -0,0 +1,137 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+템플릿 캐시 테스트
+
+ai_prompt_maker.cache 모듈의 TemplateCache와 교체 정책을 테스트합니다.
+- 항목 수 / 바이트 한도
+- LRU, LFU 교체 순서
+- 적중/실패/교체 통계와 서비스 연동
+"""
+
+import pytest
+
+from ai_prompt_maker.cache import TemplateCache, estimate_template_size
+from ai_prompt_maker.models import PromptTemplate, PromptComponent, PromptCategory
+from ai_prompt_maker.service import PromptMakerService
+
+
+class TestTemplateCacheLimits:
+    """캐시 한도 테스트"""
+
+    @pytest.mark.unit
+    def test_should_evict_least_recently_used_entry(self):
+        """LRU 정책은 가장 오래 사용되지 않은 항목을 내보내야 한다"""
+        # Given
+        cache = TemplateCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        # When
+        cache.put("c", 3)
+
+        # Then
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.evictions == 1
+
+    @pytest.mark.unit
+    def test_should_evict_least_frequently_used_entry(self):
+        """LFU 정책은 사용 빈도가 가장 낮은 항목을 내보내야 한다"""
+        # Given
+        cache = TemplateCache(max_entries=2, policy="lfu")
+        cache.put("a", 1)
+        cache.put("b", 2)
+        for _ in range(3):
+            cache.get("a")
+        cache.get("b")
+
+        # When
+        cache.put("c", 3)
+        cache.put("d", 4)
+
+        # Then
+        assert "a" in cache
+        assert "d" in cache
+        assert len(cache) == 2
+
+    @pytest.mark.unit
+    def test_should_respect_byte_limit(self):
+        """추정 바이트 한도를 넘으면 항목을 내보내야 한다"""
+        # Given
+        cache = TemplateCache(max_entries=100, max_bytes=100)
+
+        # When
+        cache.put("a", "x", size=60)
+        cache.put("b", "y", size=60)
+        cache.put("huge", "z", size=1000)
+
+        # Then
+        assert list(cache.keys()) == ["b"]
+        assert cache.total_bytes == 60
+
+    @pytest.mark.unit
+    def test_should_reject_unknown_policy(self):
+        """알 수 없는 정책은 거부해야 한다"""
+        with pytest.raises(ValueError):
+            TemplateCache(policy="random")
+
+    @pytest.mark.unit
+    def test_should_estimate_larger_size_for_larger_documents(self):
+        """문서가 큰 템플릿일수록 추정 크기가 커야 한다"""
+        # Given
+        small = PromptTemplate(name="작은", category=PromptCategory.QA)
+        large = PromptTemplate(name="큰", category=PromptCategory.QA)
+        large.update_current_version(PromptComponent(goal="분석", document="가" * 5000))
+
+        # Then
+        assert estimate_template_size(large) > estimate_template_size(small) + 10_000
+
+
+class TestTemplateCacheStats:
+    """캐시 통계 테스트"""
+
+    @pytest.mark.unit
+    def test_should_count_hits_and_misses(self):
+        """조회 적중/실패를 집계해야 한다"""
+        # Given
+        cache = TemplateCache()
+        cache.put("a", 1)
+
+        # When
+        cache.get("a")
+        cache.get("missing")
+        with pytest.raises(KeyError):
+            cache["missing"]
+
+        # Then
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-3)
+
+    @pytest.mark.unit
+    def test_should_report_cache_stats_in_service(self, config_file, test_templates_dir):
+        """서비스 통계에 캐시 적중/실패/교체가 나타나야 한다"""
+        # Given
+        service = PromptMakerService(
+            config_path=str(config_file),
+            templates_dir=str(test_templates_dir),
+            cache_max_entries=2
+        )
+        templates = [PromptTemplate(name=f"템플릿 {i}", category=PromptCategory.QA) for i in range(3)]
+        for template in templates:
+            service.save_template(template)
+
+        # When
+        service.load_template(templates[2].template_id)
+        service.cleanup_service()
+        service.load_template(templates[0].template_id)
+
+        # Then
+        cache_stats = service.get_service_stats()["cache"]
+        assert cache_stats["entries"] <= 2
+        assert cache_stats["evictions"] >= 1
+        assert cache_stats["hits"] >= 1
+        assert cache_stats["misses"] >= 1
@@ -0,0 +1,234 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+동시 사용 테스트
+
+여러 스레드가 하나의 PromptMakerService를 함께 쓸 때의 안전성을 테스트합니다.
+- 읽기/쓰기 잠금의 읽기 공유와 쓰기 배타
+- 템플릿 캐시와 검색 색인의 동시 변경
+- 로드/저장/삭제/검색 혼합 부하에서 예외, 통계 누락, 목록/색인 불일치가 없는지
+"""
+
+import random
+import sys
+import threading
+import time
+
+import pytest
+
+from ai_prompt_maker.cache import TemplateCache
+from ai_prompt_maker.rwlock import ReadWriteLock
+from ai_prompt_maker.search_index import TemplateSearchIndex
+from ai_prompt_maker.service import PromptMakerService
+
+
+def _run_threads(target, count):
+    """스레드 count개로 target(index)를 동시에 실행하고 발생한 예외 목록 반환"""
+    errors = []
+    barrier = threading.Barrier(count)
+
+    def runner(index):
+        try:
+            barrier.wait()
+            target(index)
+        except Exception as e:  # pragma: no cover - 실패 시 내용 확인용
+            errors.append(e)
+
+    threads = [threading.Thread(target=runner, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+    return errors
+
+
+class TestReadWriteLock:
+    """ReadWriteLock 단위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_let_readers_share_and_writers_exclude(self):
+        """읽기는 동시에 들어가고 쓰기는 읽기가 모두 나간 뒤 혼자 들어가야 한다"""
+        # Given
+        lock = ReadWriteLock()
+        inside = []
+        both_reading = threading.Barrier(2, timeout=5)
+
+        def reader(_):
+            with lock.read():
+                inside.append("r")
+                # 두 읽기가 동시에 잠금 안에 있어야 통과
+                both_reading.wait()
+
+        # When
+        errors = _run_threads(reader, 2)
+
+        # Then
+        assert errors == [] and inside == ["r", "r"]
+
+        log = []
+        with lock.read():
+            writer = threading.Thread(target=lambda: (lock.write().__enter__(), log.append("w")))
+            writer.start()
+            time.sleep(0.05)
+            log.append("r-done")
+        writer.join(timeout=5)
+        assert log == ["r-done", "w"]
+
+
+class TestConcurrentStructures:
+    """캐시와 검색 색인 동시 변경 테스트"""
+
+    @pytest.mark.unit
+    def test_should_keep_cache_accounting_consistent(self):
+        """여러 스레드가 넣고 빼도 항목 수/바이트 합계가 맞고 한도를 넘지 않아야 한다"""
+        # Given
+        cache = TemplateCache(max_entries=16, max_bytes=10_000)
+
+        def worker(index):
+            rng = random.Random(index)
+            for _ in range(2000):
+                key = rng.randrange(40)
+                action = rng.random()
+                if action < 0.5:
+                    cache.put(key, object(), size=rng.randrange(100, 900))
+                elif action < 0.8:
+                    cache.get(key)
+                else:
+                    cache.pop(key, None)
+
+        # When
+        errors = _run_threads(worker, 8)
+
+        # Then
+        assert errors == []
+        assert len(cache) <= 16
+        assert cache.total_bytes == sum(cache._sizes.values()) <= 10_000
+        stats = cache.get_stats()
+        assert stats["entries"] == len(cache)
+
+    @pytest.mark.unit
+    def test_should_apply_changes_made_during_build(self, make_template):
+        """색인 구축 중에 저장/삭제된 템플릿도 구축이 끝나면 반영되어야 한다"""
+        # Given
+        index = TemplateSearchIndex()
+        index.update("ignored", make_template("ignored", "무시"))
+        index.begin_build()
+        index.add("old", make_template("old", "오래된 내용"))
+        index.add("gone", make_template("gone", "사라질 내용"))
+
+        # When
+        index.update("old", make_template("old", "새 내용"))
+        index.update("new", make_template("new", "추가된 내용"))
+        index.remove("gone")
+        index.finish_build()
+
+        # Then
+        assert index.is_built and not index.is_building
+        assert index.candidates("새 내용") == {"old"}
+        assert index.candidates("추가된") == {"new"}
+        assert index.candidates("오래된") == set()
+        assert "gone" not in index and "ignored" not in index
+
+
+@pytest.fixture
+def frequent_switches():
+    """스레드 전환을 자주 일으켜 경쟁 상태가 드러나게 함"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.usefixtures("frequent_switches")
+class TestServiceStress:
+    """공유 서비스 혼합 부하 테스트"""
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_should_survive_mixed_traffic(self, config_file, test_templates_dir, make_template):
+        """로드/저장/삭제/검색/목록을 동시에 섞어도 예외와 통계 누락 없이 일관되어야 한다"""
+        # Given
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir),
+            cache_max_entries=8, watch_interval=0
+        )
+        for n in range(20):
+            service.save_template(make_template(f"t{n}", f"초기 {n}"))
+        service.search_templates("초기")
+        before = dict(service.stats)
+        counts = {"save": 0, "delete": 0, "load": 0}
+        counts_lock = threading.Lock()
+
+        def worker(index):
+            rng = random.Random(index)
+            local = {"save": 0, "delete": 0, "load": 0}
+            for step in range(150):
+                template_id = f"t{rng.randrange(30)}"
+                action = rng.random()
+                if action < 0.35:
+                    service.save_template(make_template(template_id, f"스레드{index} 단계{step}"))
+                    local["save"] += 1
+                elif action < 0.45:
+                    if service.delete_template(template_id):
+                        local["delete"] += 1
+                elif action < 0.75:
+                    service.load_template(template_id)
+                    local["load"] += 1
+                elif action < 0.9:
+                    service.search_templates(f"스레드{rng.randrange(8)}")
+                else:
+                    service.list_templates_page(limit=5)
+            with counts_lock:
+                for key, value in local.items():
+                    counts[key] += value
+
+        # When
+        errors = _run_threads(worker, 8)
+
+        # Then
+        assert errors == []
+        stats = service.get_service_stats()
+        saved = (stats["templates_created"] + stats["templates_updated"]
+                 - before["templates_created"] - before["templates_updated"])
+        assert saved == counts["save"]
+        assert stats["templates_deleted"] - before["templates_deleted"] == counts["delete"]
+
+        on_disk = {path.stem for path in test_templates_dir.glob("t*.json")}
+        assert {t["template_id"] for t in service.list_templates()} == on_disk
+        assert stats["total_templates"] == len(on_disk)
+
+        fresh = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir), watch_files=False
+        )
+        for query in ("스레드3", "초기", "단계1"):
+            expected = {t["template_id"] for t in fresh.search_templates(query)}
+            assert {t["template_id"] for t in service.search_templates(query)} == expected
+        for template_id in on_disk:
+            goal = fresh.load_template(template_id).get_current_version().components.goal
+            assert service.load_template(template_id).get_current_version().components.goal == goal
+
+    @pytest.mark.integration
+    def test_should_index_templates_saved_while_building(self, config_file, test_templates_dir, make_template):
+        """첫 검색이 색인을 만드는 동안 저장된 템플릿도 검색되어야 한다"""
+        # Given
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir), watch_interval=0
+        )
+        for n in range(40):
+            service.save_template(make_template(f"t{n}", "기존"))
+        service._templates_cache.clear()
+
+        def worker(index):
+            if index == 0:
+                service.search_templates("기존")
+            else:
+                for n in range(10):
+                    service.save_template(make_template(f"w{index}-{n}", "동시 저장"))
+
+        # When
+        errors = _run_threads(worker, 4)
+
+        # Then
+        assert errors == []
+        found = {t["template_id"] for t in service.search_templates("동시 저장")}
+        assert found == {f"w{index}-{n}" for index in range(1, 4) for n in range(10)}
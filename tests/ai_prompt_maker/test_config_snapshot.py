@@ -0,0 +1,174 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+설정 스냅샷 테스트
+
+ai_prompt_maker.config_snapshot 모듈과 서비스 설정 조회를 테스트합니다.
+- 도메인/레거시 구조의 미리 계산된 조회 값
+- 읽기 전용 dict/list (비교는 일반 dict/list와 동일, 변경은 TypeError)
+- 감시기 없이 쓸 때 수정 시간 확인 간격 제한과 원자적 교체
+"""
+
+import copy
+import json
+import os
+
+import pytest
+
+from ai_prompt_maker.config_snapshot import ConfigSnapshot, FrozenDict, FrozenList, freeze
+from ai_prompt_maker.service import PromptMakerService
+
+
+DOMAIN_CONFIG = {
+    "domains": {
+        "game_dev": {
+            "name": "게임 개발", "icon": "🎮", "enabled": True,
+            "keywords": {"goal": ["기능 분석"]},
+            "goal_expansions": {"기능 분석": "기능을 상세히 분석"}
+        },
+        "uiux": {"name": "UI/UX", "enabled": True, "keywords": {}},
+        "off": {"name": "꺼짐", "enabled": False}
+    },
+    "categories": ["기획", "전체"]
+}
+
+
+def _write_config(path, config, mtime=None):
+    path.write_text(json.dumps(config, ensure_ascii=False), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+class TestConfigSnapshot:
+    """ConfigSnapshot 단위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_precompute_domain_lookups(self):
+        """도메인 설정, 확장 맵, 활성 도메인 목록, 카테고리를 미리 계산해야 한다"""
+        # Given/When
+        snapshot = ConfigSnapshot.compile(DOMAIN_CONFIG, mtime=1.0)
+
+        # Then
+        assert [d["id"] for d in snapshot.domain_list] == ["game_dev", "uiux"]
+        assert snapshot.domain_list[1]["icon"] == "📁"
+        assert snapshot.domain("uiux")["name"] == "UI/UX"
+        assert snapshot.domain("nonexistent") is snapshot.domain("game_dev")
+        assert snapshot.expansions("game_dev", "goal_expansions") == {"기능 분석": "기능을 상세히 분석"}
+        assert snapshot.expansions("uiux", "rule_expansions") == {}
+        assert snapshot.categories == ["기획", "전체"] and "기획" in snapshot.category_set
+        assert snapshot.keywords == {}
+
+    @pytest.mark.unit
+    def test_should_migrate_legacy_config_once(self):
+        """레거시 구조는 스냅샷을 만들 때 game_dev 도메인 하나로 변환해야 한다"""
+        # Given
+        legacy = {"keywords": {"role": ["기획자"]}, "rule_expansions": {"a": "b"}}
+
+        # When
+        snapshot = ConfigSnapshot.compile(legacy)
+
+        # Then
+        domain = snapshot.domain("game_dev")
+        assert domain["keywords"] is snapshot.keywords
+        assert domain["rule_expansions"] == {"a": "b"} and domain["goal_expansions"] == {}
+        assert snapshot.domain_list == [
+            {"id": "game_dev", "name": "게임 개발", "description": "게임 기획, 개발, QA 관련 프롬프트", "icon": "🎮"}
+        ]
+        assert snapshot.categories == ["전체"]
+
+    @pytest.mark.unit
+    def test_should_reject_mutation_but_allow_copies(self):
+        """스냅샷 값은 변경할 수 없고 복사본은 자유롭게 바꿀 수 있어야 한다"""
+        # Given
+        frozen = freeze({"keywords": {"role": ["기획자"]}})
+
+        # When/Then
+        assert isinstance(frozen, dict) and isinstance(frozen["keywords"]["role"], list)
+        with pytest.raises(TypeError):
+            frozen["new"] = 1
+        with pytest.raises(TypeError):
+            frozen["keywords"].update(goal=[])
+        with pytest.raises(TypeError):
+            frozen["keywords"]["role"].append("QA")
+
+        mutable = frozen.copy()
+        mutable["new"] = 1
+        deep = copy.deepcopy(frozen)
+        assert type(deep) is FrozenDict and type(deep["keywords"]["role"]) is FrozenList
+        assert json.loads(json.dumps(frozen)) == {"keywords": {"role": ["기획자"]}}
+
+
+class TestServiceConfigReload:
+    """서비스 설정 조회/재로드 테스트"""
+
+    @pytest.mark.unit
+    def test_should_not_stat_within_reload_interval(self, config_file, test_templates_dir, monkeypatch):
+        """확인 간격 안에서는 설정 파일을 stat하지 않고 같은 스냅샷을 돌려줘야 한다"""
+        # Given
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir),
+            watch_files=False, config_reload_interval=3600
+        )
+        snapshot = service.get_config_snapshot()
+        _write_config(config_file, DOMAIN_CONFIG, mtime=snapshot.mtime + 10)
+
+        # When
+        stats = []
+        original_stat = type(config_file).stat
+
+        def counting_stat(self, *args, **kwargs):
+            if self == config_file:
+                stats.append(self)
+            return original_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(config_file), "stat", counting_stat)
+        for _ in range(100):
+            service.get_config()
+            service.get_domain_config("uiux")
+            service.list_domains()
+            service.get_categories()
+
+        # Then
+        assert stats == []
+        assert service.get_config_snapshot() is snapshot
+        assert service.get_config_snapshot(force_reload=True).categories == ["기획", "전체"]
+
+    @pytest.mark.unit
+    def test_should_swap_snapshot_after_interval(self, config_file, test_templates_dir):
+        """간격이 지나면 바뀐 파일만 다시 읽어 새 스냅샷으로 교체해야 한다"""
+        # Given
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir),
+            watch_files=False, config_reload_interval=0
+        )
+        old = service.get_config_snapshot()
+        old_domains = service.list_domains()
+
+        # When
+        assert service.get_config_snapshot() is old  # 수정 시간이 같으면 재사용
+        _write_config(config_file, DOMAIN_CONFIG, mtime=old.mtime + 10)
+        new = service.get_config_snapshot()
+
+        # Then
+        assert new is not old
+        assert [d["id"] for d in service.list_domains()] == ["game_dev", "uiux"]
+        assert old_domains == old.domain_list  # 이전 스냅샷은 그대로
+        assert service.get_domain_config("game_dev")["keywords"] == {"goal": ["기능 분석"]}
+
+    @pytest.mark.unit
+    def test_should_fall_back_and_recover_from_broken_file(self, config_file, test_templates_dir):
+        """읽을 수 없는 설정은 기본 설정으로 대신하고 파일이 고쳐지면 다시 읽어야 한다"""
+        # Given
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir),
+            watch_files=False, config_reload_interval=0
+        )
+        config_file.write_text("{ broken", encoding="utf-8")
+
+        # When
+        fallback = service.get_config(force_reload=True)
+        _write_config(config_file, DOMAIN_CONFIG)
+
+        # Then
+        assert fallback["categories"] == ["전체"]
+        assert service.get_categories() == ["기획", "전체"]
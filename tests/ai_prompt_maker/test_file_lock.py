@@ -0,0 +1,215 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+파일 잠금과 원자적 쓰기 테스트
+
+ai_prompt_maker.file_lock 모듈과 여러 프로세스의 동시 저장을 테스트합니다.
+- 임시 파일 + 교체 방식의 원자적 쓰기
+- 프로세스 사이의 배타/공유 잠금, 제한 시간
+- 여러 워커 프로세스가 같은 디렉토리에 저장/로드할 때 손상된 파일이 없는지
+"""
+
+import json
+import multiprocessing
+import time
+
+import pytest
+
+from ai_prompt_maker import file_lock, template_io
+from ai_prompt_maker.models import PromptTemplate, PromptComponent, PromptCategory
+from ai_prompt_maker.service import PromptMakerService
+
+
+WORKERS = 4
+ROUNDS = 25
+SHARED_IDS = ["shared_a", "shared_b"]
+
+
+def _hold_lock(lock_dir, ready, release):
+    """다른 프로세스에서 배타 잠금을 잡고 신호를 기다림"""
+    with file_lock.template_lock(lock_dir, "held"):
+        ready.set()
+        release.wait(10)
+
+
+def _hammer(config_path, templates_dir, worker, errors):
+    """공유 템플릿을 번갈아 저장하고 로드"""
+    try:
+        service = PromptMakerService(
+            config_path=config_path, templates_dir=templates_dir, journal_compact_threshold=4
+        )
+        for i in range(ROUNDS):
+            for template_id in SHARED_IDS:
+                template = service.load_template(template_id)
+                if template is None:
+                    template = PromptTemplate(
+                        template_id=template_id, name=template_id, category=PromptCategory.PROGRAMMING
+                    )
+                    template.update_current_version(PromptComponent(goal="초기"), "v1")
+                    service.save_template(template)
+                    continue
+
+                if i % 3 == 0:
+                    # 저널 경로 (버전 추가)
+                    template.add_version(
+                        PromptComponent(goal=f"워커 {worker} 라운드 {i}", document="내용\n" * 200),
+                        f"w{worker}-{i}"
+                    )
+                    service.save_template(template, change={
+                        "op": "add_version", "version": template.versions[-1].version,
+                        "base": template.current_version,
+                    })
+                else:
+                    # 스냅샷 전체 재작성 경로
+                    template.update_current_version(
+                        PromptComponent(goal=f"워커 {worker} 라운드 {i}", document="내용\n" * 200),
+                        f"w{worker}-{i}"
+                    )
+                    service.save_template(template)
+
+            # 다른 워커가 쓰는 중에도 새 서비스가 읽을 수 있어야 함
+            service._templates_cache.clear()
+        service.cleanup_service()
+    except Exception as e:
+        errors.put(f"worker {worker}: {type(e).__name__}: {e}")
+
+
+class TestAtomicWrite:
+    """원자적 쓰기 테스트"""
+
+    @pytest.mark.unit
+    def test_should_replace_file_without_leaving_temp_files(self, temp_dir):
+        """교체 후 임시 파일이 남지 않아야 한다"""
+        # Given
+        path = temp_dir / "a.json"
+        path.write_text("old", encoding="utf-8")
+
+        # When
+        file_lock.atomic_write(path, b'{"new": true}', fsync=True)
+
+        # Then
+        assert json.loads(path.read_text(encoding="utf-8")) == {"new": True}
+        assert [p.name for p in temp_dir.iterdir()] == ["a.json"]
+
+    @pytest.mark.unit
+    def test_should_keep_original_when_write_fails(self, temp_dir, monkeypatch):
+        """교체 전에 실패하면 원본과 디렉토리가 그대로여야 한다"""
+        # Given
+        path = temp_dir / "a.json"
+        path.write_text("old", encoding="utf-8")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(file_lock.os, "replace", fail_replace)
+
+        # When / Then
+        with pytest.raises(OSError):
+            file_lock.atomic_write(path, b"new")
+        assert path.read_text(encoding="utf-8") == "old"
+        assert [p.name for p in temp_dir.iterdir()] == ["a.json"]
+
+
+class TestFileLock:
+    """파일 잠금 테스트"""
+
+    @pytest.mark.unit
+    def test_should_be_reentrant_within_thread(self, temp_dir):
+        """같은 스레드는 배타 잠금 안에서 배타/공유 잠금을 다시 잡을 수 있어야 한다"""
+        with file_lock.template_lock(temp_dir, "t1"):
+            with file_lock.template_lock(temp_dir, "t1"):
+                with file_lock.template_lock(temp_dir, "t1", shared=True):
+                    pass
+
+        assert (temp_dir / file_lock.LOCK_DIR / "t1.lock").exists()
+
+    @pytest.mark.unit
+    def test_should_reject_upgrade_from_shared(self, temp_dir):
+        """공유 잠금을 가진 채 배타 잠금을 요청하면 오류여야 한다"""
+        with file_lock.template_lock(temp_dir, "t1", shared=True):
+            with pytest.raises(RuntimeError):
+                file_lock.template_lock(temp_dir, "t1").acquire()
+
+    @pytest.mark.integration
+    def test_should_time_out_while_other_process_holds_lock(self, temp_dir):
+        """다른 프로세스가 잠금을 가진 동안에는 제한 시간 후 실패해야 한다"""
+        # Given
+        ready = multiprocessing.Event()
+        release = multiprocessing.Event()
+        holder = multiprocessing.Process(target=_hold_lock, args=(str(temp_dir), ready, release))
+        holder.start()
+
+        try:
+            assert ready.wait(10)
+
+            # When / Then
+            start = time.monotonic()
+            with pytest.raises(file_lock.LockTimeoutError):
+                file_lock.template_lock(temp_dir, "held", timeout=0.2).acquire()
+            assert time.monotonic() - start >= 0.2
+
+            # 다른 템플릿 잠금은 영향 없음
+            with file_lock.template_lock(temp_dir, "other", timeout=1):
+                pass
+        finally:
+            release.set()
+            holder.join(10)
+
+        # 해제 후에는 획득 가능
+        with file_lock.template_lock(temp_dir, "held", timeout=5):
+            pass
+
+
+class TestConcurrentWorkers:
+    """여러 워커 프로세스의 동시 저장/로드 테스트"""
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    def test_should_never_leave_corrupt_files(self, config_file, test_templates_dir):
+        """동시 저장/로드 중 오류가 없고 모든 파일이 온전해야 한다"""
+        # Given
+        errors = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(
+                target=_hammer, args=(str(config_file), str(test_templates_dir), n, errors)
+            )
+            for n in range(WORKERS)
+        ]
+
+        # When
+        for worker in workers:
+            worker.start()
+
+        # 워커가 쓰는 동안 잠금 없이 읽어도 반쯤 쓰인 파일을 보지 않아야 함
+        reads = 0
+        while any(worker.is_alive() for worker in workers):
+            for template_id in SHARED_IDS:
+                path = test_templates_dir / f"{template_id}.json"
+                if path.exists():
+                    template_io.read_template(path)
+                    reads += 1
+
+        for worker in workers:
+            worker.join(60)
+
+        # Then
+        failures = []
+        while not errors.empty():
+            failures.append(errors.get())
+        assert failures == []
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert reads > 0
+
+        leftovers = [p.name for p in test_templates_dir.glob("*.tmp")]
+        assert leftovers == []
+
+        reader = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir)
+        )
+        for template_id in SHARED_IDS:
+            template = reader.load_template(template_id)
+            assert template is not None
+            assert template.get_current_version() is not None
+        listed = {t["template_id"] for t in reader.list_templates()}
+        assert listed == set(SHARED_IDS)
+        reader.cleanup_service()
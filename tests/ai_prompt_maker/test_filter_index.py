@@ -0,0 +1,173 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+카테고리/태그 보조 색인 테스트
+
+ai_prompt_maker.filter_index 모듈과 목록 필터 연동을 테스트합니다.
+- 카테고리/태그 집합 연산 (태그 OR/AND), 교체/삭제 시 행 갱신
+- 태그별 개수 (태그 클라우드)
+- JSON/sqlite 백엔드 필터 결과 일치, 세션 템플릿 필터
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ai_prompt_maker.filter_index import TemplateFilterIndex
+from ai_prompt_maker.models import PromptCategory
+from ai_prompt_maker.service import PromptMakerService
+
+
+TEMPLATES = [
+    ("a", PromptCategory.PROGRAMMING, ["python", "api"]),
+    ("b", PromptCategory.PROGRAMMING, ["python"]),
+    ("c", PromptCategory.PLANNING, ["api", "문서"]),
+    ("d", PromptCategory.PLANNING, []),
+]
+
+
+def _populate(service, make_template):
+    for template_id, category, tags in TEMPLATES:
+        service.save_template(make_template(template_id, category=category, tags=tags))
+
+
+def _ids(templates):
+    return sorted(t["template_id"] for t in templates)
+
+
+@pytest.fixture
+def sqlite_service(config_file, test_templates_dir):
+    return PromptMakerService(
+        config_path=str(config_file), templates_dir=str(test_templates_dir / "db"), storage_backend="sqlite"
+    )
+
+
+class TestTemplateFilterIndex:
+    """TemplateFilterIndex 단위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_select_by_category_and_tags(self):
+        """카테고리와 태그(OR/AND) 조합을 집합 연산으로 골라야 한다"""
+        # Given
+        index = TemplateFilterIndex()
+        for template_id, category, tags in TEMPLATES:
+            index.put(template_id, category.value, tags)
+
+        # When/Then
+        assert index.select() is None and index.select("전체") is None
+        assert index.select("기획") == {"c", "d"}
+        assert index.select(tags=["python", "api"]) == {"a", "b", "c"}
+        assert index.select(tags=["python", "api"], tag_match="all") == {"a"}
+        assert index.select("기획", tags=["api"]) == {"c"}
+        assert index.select("아트", tags=["api"]) == set()
+        assert index.select(tags=["없는 태그"], tag_match="all") == set()
+        with pytest.raises(ValueError):
+            index.select(tags=["api"], tag_match="some")
+
+    @pytest.mark.unit
+    def test_should_update_rows_on_replace_and_remove(self):
+        """교체하면 이전 카테고리/태그에서 빠지고 삭제하면 모든 집합에서 빠져야 한다"""
+        # Given
+        index = TemplateFilterIndex()
+        index.put("a", "프로그램", ["python", "api"])
+        index.put("b", "프로그램", ["python"])
+
+        # When
+        index.put("a", "기획", ["api", "api"])
+        index.remove("b")
+        index.remove("missing")
+
+        # Then
+        assert len(index) == 1 and "b" not in index
+        assert index.select("프로그램") == set()
+        assert index.select(tags=["python"]) == set()
+        assert index.tag_counts() == {"api": 1}
+        assert index.category_counts() == {"기획": 1}
+
+    @pytest.mark.unit
+    def test_should_count_tags_per_category(self):
+        """태그별 개수를 많은 순으로, 카테고리를 지정하면 그 안에서 세야 한다"""
+        index = TemplateFilterIndex()
+        for template_id, category, tags in TEMPLATES:
+            index.put(template_id, category.value, tags)
+
+        assert index.tag_counts() == {"api": 2, "python": 2, "문서": 1}
+        assert list(index.tag_counts()) == ["api", "python", "문서"]
+        assert index.tag_counts("프로그램") == {"python": 2, "api": 1}
+
+
+class TestServiceFilters:
+    """서비스 목록 필터 테스트"""
+
+    @pytest.mark.integration
+    def test_should_filter_listings_on_both_backends(self, service, sqlite_service, make_template):
+        """JSON과 sqlite 백엔드가 같은 필터 결과와 태그 개수를 돌려줘야 한다"""
+        # Given
+        _populate(service, make_template)
+        _populate(sqlite_service, make_template)
+
+        for backend in (service, sqlite_service):
+            # When/Then
+            assert _ids(backend.list_templates(tags=["python", "api"])) == ["a", "b", "c"]
+            assert _ids(backend.list_templates(tags=["python", "api"], tag_match="all")) == ["a"]
+            assert _ids(backend.list_templates(category="기획", tags=["api"])) == ["c"]
+            page = backend.list_templates_page(category="프로그램", tags=["api", "python"],
+                                               tag_match="all", limit=1)
+            assert page["total"] == 1 and _ids(page["templates"]) == ["a"]
+            assert backend.get_tag_counts() == {"api": 2, "python": 2, "문서": 1}
+            assert backend.get_tag_counts("기획") == {"api": 1, "문서": 1}
+            assert backend.list_templates(tags=["api"], tag_match="some") == []
+
+    @pytest.mark.integration
+    def test_should_follow_saves_deletes_and_external_edits(self, service, test_templates_dir, make_template):
+        """저장/삭제와 다른 프로세스의 변경이 필터 결과에 반영되어야 한다"""
+        # Given
+        _populate(service, make_template)
+        other = PromptMakerService(
+            config_path=str(service.config_path), templates_dir=str(test_templates_dir), watch_interval=0
+        )
+
+        # When
+        service.save_template(make_template("b", category=PromptCategory.QA, tags=["qa"]))
+        service.delete_template("c")
+        other.save_template(make_template("e", category=PromptCategory.PLANNING, tags=["api"]))
+
+        # Then
+        assert _ids(service.list_templates(tags=["python"])) == ["a"]
+        assert _ids(service.list_templates(category="QA")) == ["b"]
+        assert _ids(service.list_templates(tags=["api"])) == ["a", "e"]
+        assert service.get_tag_counts() == {"api": 2, "python": 1, "qa": 1}
+
+
+class TestSessionTemplateFilters:
+    """세션 템플릿(TemplateStorageManager) 필터 테스트"""
+
+    @pytest.mark.unit
+    def test_should_filter_session_templates_with_index(self, monkeypatch, test_templates_dir, make_template):
+        """세션 템플릿도 색인으로 필터하고 저장/삭제/목록 교체를 따라가야 한다"""
+        # Given
+        from utils import template_storage
+        from utils.template_storage import TemplateStorageManager
+
+        mock_st = Mock()
+        mock_st.session_state = {TemplateStorageManager.STORAGE_KEY: [
+            make_template(template_id, category=category, tags=tags) for template_id, category, tags in TEMPLATES
+        ]}
+        monkeypatch.setattr(template_storage, "st", mock_st)
+        monkeypatch.setattr(TemplateStorageManager, "TEMPLATE_DIR", test_templates_dir)
+
+        # When
+        filtered = TemplateStorageManager.filter_templates(tags=["api", "python"])
+        both = TemplateStorageManager.filter_templates(tags=["api", "python"], tag_match="all")
+        TemplateStorageManager.save_template("새 템플릿", PromptCategory.PLANNING, {"goal": "목표"}, "", tags=["api"])
+        TemplateStorageManager.delete_template("c")
+        after_changes = TemplateStorageManager.filter_templates("기획", ["api"])
+
+        # Then
+        assert [t.template_id for t in filtered] == ["a", "b", "c"]
+        assert [t.template_id for t in both] == ["a"]
+        assert [t.name for t in after_changes] == ["새 템플릿"]
+        assert TemplateStorageManager.get_tag_counts() == {"api": 2, "python": 2}
+
+        mock_st.session_state[TemplateStorageManager.STORAGE_KEY] = [make_template("z", tags=["api"])]
+        assert [t.template_id for t in TemplateStorageManager.filter_templates(tags=["api"])] == ["z"]
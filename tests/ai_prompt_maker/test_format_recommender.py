@@ -0,0 +1,155 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+출력 형식 추천 테스트
+
+ai_prompt_maker.format_recommender 모듈과 서비스 연동을 테스트합니다.
+- 목표/컨텍스트/규칙과 확장 문장 기반 순위, 일치 키워드
+- 묶음 추천과 단건 추천 결과 일치
+- 설정/형식이 바뀔 때만 추천기 재구축, 요청당 지연
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from ai_prompt_maker import output_formats
+from ai_prompt_maker.config_snapshot import ConfigSnapshot
+from ai_prompt_maker.format_recommender import FormatRecommender
+from ai_prompt_maker.models import PromptComponent
+from ai_prompt_maker.output_formats import OutputFormatRegistry
+from ai_prompt_maker.service import PromptMakerService
+
+
+FORMATS = {
+    "categories": {"table_format": {"name": "표"}, "report_format": {"name": "보고서"}},
+    "formats": {
+        "test_case_table": {"name": "테스트 케이스 표", "category": "table_format",
+                            "keywords": ["테스트", "검증", "QA"]},
+        "analysis_report": {"name": "분석 보고서", "category": "report_format",
+                            "keywords": ["분석", "현황", "데이터"]},
+        "kpi_dashboard": {"name": "KPI 대시보드", "category": "report_format",
+                          "keywords": ["KPI", "지표", "수치"]}
+    }
+}
+
+CONFIG = {
+    "domains": {
+        "game_dev": {
+            "name": "게임 개발",
+            "keywords": {"goal": ["기능 분석", "성능 최적화"], "context": ["밸런스 테스트"], "rule": ["데이터 기반 결론"]},
+            "goal_expansions": {"성능 최적화": "응답 지표와 수치를 측정하세요"},
+            "context_expansions": {},
+            "rule_expansions": {}
+        }
+    }
+}
+
+
+@pytest.fixture
+def recommender():
+    return FormatRecommender(OutputFormatRegistry(FORMATS), ConfigSnapshot.compile(CONFIG))
+
+
+class TestFormatRecommender:
+    """FormatRecommender 순위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_rank_formats_by_selected_keywords(self, recommender):
+        """선택 항목의 키워드와 일치하는 형식이 먼저 나와야 한다"""
+        # Given/When
+        analysis = recommender.recommend("기능 분석", rule=["데이터 기반 결론"])
+        testing = recommender.recommend("기능 분석", context=["밸런스 테스트"], top_k=1)
+
+        # Then
+        assert analysis[0]["format_id"] == "analysis_report"
+        assert analysis[0]["category"] == "report_format"
+        assert analysis[0]["matched_keywords"] == ["분석", "데이터"]
+        assert [r["format_id"] for r in testing] == ["analysis_report"]
+        assert all(a["score"] >= b["score"] for a, b in zip(analysis, analysis[1:]))
+
+    @pytest.mark.unit
+    def test_should_use_expansions_and_skip_unrelated(self, recommender):
+        """확장 문장의 단어도 점수에 반영하고 점수가 0인 형식은 빼야 한다"""
+        # Given/When
+        expanded = recommender.recommend("성능 최적화")
+        unrelated = recommender.recommend("관련 없는 목표")
+
+        # Then
+        assert [r["format_id"] for r in expanded] == ["kpi_dashboard"]
+        assert expanded[0]["matched_keywords"] == ["지표", "수치"]
+        assert unrelated == []
+
+    @pytest.mark.unit
+    def test_should_match_single_recommendations_in_batch(self, recommender):
+        """묶음 추천은 단건 추천을 각각 호출한 결과와 같아야 한다"""
+        # Given
+        component_sets = [
+            {"goal": "기능 분석", "context": ["밸런스 테스트"]},
+            PromptComponent(goal="성능 최적화", rule=["데이터 기반 결론"]),
+            {"goal": "직접 입력한 QA 검증 목표"},
+            {"goal": "직접 입력한 QA 검증 목표"},
+        ]
+
+        # When
+        batch = recommender.recommend_batch(component_sets, top_k=2)
+
+        # Then
+        assert batch == [
+            recommender.recommend("기능 분석", ["밸런스 테스트"], top_k=2),
+            recommender.recommend("성능 최적화", rule=["데이터 기반 결론"], top_k=2),
+            recommender.recommend("직접 입력한 QA 검증 목표", top_k=2),
+            recommender.recommend("직접 입력한 QA 검증 목표", top_k=2),
+        ]
+        assert batch[2][0]["format_id"] == "test_case_table"
+
+    @pytest.mark.slow
+    def test_should_recommend_well_under_a_millisecond(self, recommender):
+        """미리 계산한 키워드 선택은 요청당 1ms보다 훨씬 빨라야 한다"""
+        recommender.recommend("기능 분석", ["밸런스 테스트"], ["데이터 기반 결론"])
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            recommender.recommend("기능 분석", ["밸런스 테스트"], ["데이터 기반 결론"])
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        per_request_ms = elapsed_ms / 1000
+
+        assert per_request_ms < 0.5
+
+
+class TestServiceRecommendation:
+    """서비스 추천 연동 테스트"""
+
+    @pytest.mark.integration
+    def test_should_rebuild_only_when_config_or_formats_change(self, temp_dir, test_templates_dir, monkeypatch):
+        """설정이나 형식 파일이 바뀔 때만 추천기를 새로 만들어야 한다"""
+        # Given
+        monkeypatch.chdir(temp_dir)
+        output_formats.clear_output_format_registries()
+        (temp_dir / "data").mkdir()
+        formats_path = temp_dir / "data" / "output_formats.json"
+        formats_path.write_text(json.dumps(FORMATS, ensure_ascii=False), encoding="utf-8")
+        config_path = temp_dir / "data" / "config.json"
+        config_path.write_text(json.dumps(CONFIG, ensure_ascii=False), encoding="utf-8")
+        service = PromptMakerService(
+            config_path=str(config_path), templates_dir=str(test_templates_dir),
+            watch_files=False, config_reload_interval=0
+        )
+
+        # When
+        first = service.get_format_recommender()
+        same = service.get_format_recommender()
+        recommended = service.recommend_output_formats("기능 분석")
+        stat = formats_path.stat()
+        formats_path.write_text(json.dumps({"categories": {}, "formats": {}}), encoding="utf-8")
+        os.utime(formats_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        rebuilt = service.get_format_recommender()
+
+        # Then
+        assert same is first
+        assert recommended[0]["format_id"] == "analysis_report"
+        assert rebuilt is not first and len(rebuilt) == 0
+        assert service.recommend_output_formats_batch([{"goal": "기능 분석"}]) == [[]]
+        output_formats.clear_output_format_registries()
@@ -0,0 +1,282 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+템플릿 변경 저널 테스트
+
+ai_prompt_maker.journal 모듈과 서비스 저널 연동을 테스트합니다.
+- 레코드 생성/적용 (현재 버전 지정, 버전 추가/삭제/수정)
+- 스냅샷 위 저널 재생과 스냅샷 ID 검사
+- 백그라운드/수동 저널 합치기
+- 서비스 밖 읽기(SQLite 이전, 세션 저장소)의 저널 재생
+- DataHandler 버전 변경의 쓰기 양
+"""
+
+import pytest
+
+from unittest.mock import Mock
+
+from ai_prompt_maker import journal, template_io
+from ai_prompt_maker.models import PromptTemplate, PromptComponent, PromptCategory
+from ai_prompt_maker.service import PromptMakerService
+from ai_prompt_maker.sqlite_store import SQLiteTemplateStore, migrate_json_directory
+from utils.data_handler import DataHandler
+
+
+def _template():
+    """긴 문서를 가진 세 버전 템플릿"""
+    template = PromptTemplate(name="저널 테스트", category=PromptCategory.PROGRAMMING)
+    template.update_current_version(PromptComponent(goal="목표 1", document="문서 내용\n" * 500), "v1")
+    template.add_version(PromptComponent(goal="목표 2", document="문서 내용\n" * 500), "v2")
+    template.add_version(PromptComponent(goal="목표 3", document="문서 내용\n" * 500), "v3")
+    return template
+
+
+@pytest.fixture
+def journal_service(config_file, test_templates_dir):
+    """저널을 자동으로 합치지 않는 서비스"""
+    return PromptMakerService(
+        config_path=str(config_file), templates_dir=str(test_templates_dir),
+        journal_compact_threshold=0
+    )
+
+
+def _reload(service, template_id):
+    """같은 디렉토리를 새 서비스로 다시 읽기"""
+    reader = PromptMakerService(
+        config_path=str(service.config_path), templates_dir=str(service.templates_dir)
+    )
+    reader.cleanup_service()
+    return reader.load_template(template_id)
+
+
+class TestJournalRecords:
+    """레코드 생성/적용 테스트"""
+
+    @pytest.mark.unit
+    def test_should_replay_every_operation(self):
+        """네 가지 변경을 재생하면 같은 템플릿이 되어야 한다"""
+        # Given
+        original = _template()
+        edited = PromptTemplate.from_dict(original.to_dict())
+        records = []
+
+        # When
+        edited.current_version = 1
+        records.append(journal.make_record(edited, {"op": "set_current", "version": 1}))
+        number = edited.add_version(PromptComponent(goal="목표 4", document="문서 내용\n" * 500), "")
+        records.append(journal.make_record(edited, {"op": "add_version", "version": number, "base": 3}))
+        edited.delete_version(2)
+        records.append(journal.make_record(edited, {"op": "delete_version", "version": 2}))
+        previous = PromptTemplate.from_dict(edited.to_dict())
+        edited.get_version(1).description = "수정"
+        records.append(journal.make_record(edited, {"op": "update_version", "version": 1}, previous))
+
+        replayed = PromptTemplate.from_dict(original.to_dict())
+        for record in records:
+            journal.apply_record(replayed, record)
+
+        # Then
+        assert replayed.to_dict() == edited.to_dict()
+        assert "delta" in records[1] and "delta" in records[3]
+
+    @pytest.mark.unit
+    def test_should_reject_unknown_change(self):
+        """알 수 없는 변경은 거부해야 한다"""
+        with pytest.raises(ValueError):
+            journal.make_record(_template(), {"op": "rename", "version": 1})
+
+
+class TestServiceJournal:
+    """서비스 저널 기록과 재생 테스트"""
+
+    @pytest.mark.unit
+    def test_set_current_should_not_rewrite_snapshot(self, journal_service):
+        """현재 버전 변경은 스냅샷을 그대로 두고 작은 레코드만 추가해야 한다"""
+        # Given
+        template = _template()
+        journal_service.save_template(template)
+        path = journal_service.templates_dir / f"{template.template_id}.json"
+        snapshot = path.read_bytes()
+
+        # When
+        template.current_version = 1
+        journal_service.save_template(template, change={"op": "set_current", "version": 1})
+
+        # Then
+        assert path.read_bytes() == snapshot
+        assert journal_service.stats["journal_bytes_written"] < 200
+        assert _reload(journal_service, template.template_id).current_version == 1
+        assert journal_service.list_templates()[0]["current_version"] == 1
+
+    @pytest.mark.unit
+    def test_update_should_write_small_delta(self, journal_service):
+        """긴 문서가 있어도 버전 수정은 바뀐 섹션만 기록해야 한다"""
+        # Given
+        template = _template()
+        journal_service.save_template(template)
+
+        # When
+        handler = DataHandler(journal_service)
+        components = template.get_version(2).components.to_dict()
+        components["goal"] = "새 목표"
+        assert handler.update_template_version(template.template_id, 2, components, "수정")
+
+        # Then
+        assert journal_service.stats["journal_records"] == 1
+        assert journal_service.stats["journal_bytes_written"] < 1000
+        loaded = _reload(journal_service, template.template_id)
+        assert loaded.get_version(2).components.goal == "새 목표"
+        assert loaded.get_version(2).description == "수정"
+
+    @pytest.mark.unit
+    def test_should_ignore_journal_of_previous_snapshot(self, journal_service):
+        """새 스냅샷이 기록되면 이전 저널은 재생하지 않아야 한다"""
+        # Given
+        template = _template()
+        journal_service.save_template(template)
+        template.current_version = 1
+        journal_service.save_template(template, change={"op": "set_current", "version": 1})
+        journal_path = journal_service._journal.path_for(template.template_id)
+        stale = journal_path.read_bytes()
+
+        # When: 스냅샷 기록 후 저널 삭제 전에 중단된 상황
+        template.name = "새 이름"
+        journal_service.save_template(template)
+        journal_path.write_bytes(stale)
+        template_io.write_template(
+            journal_service.templates_dir / f"{template.template_id}.json",
+            PromptTemplate.from_dict({**template.to_dict(), "current_version": 2}),
+            snapshot_id="fresh"
+        )
+
+        # Then
+        assert _reload(journal_service, template.template_id).current_version == 2
+
+    @pytest.mark.unit
+    def test_should_skip_torn_journal_line(self, journal_service):
+        """중간에 끊긴 줄이 있어도 이후 레코드를 재생해야 한다"""
+        # Given
+        template = _template()
+        journal_service.save_template(template)
+        template.current_version = 1
+        journal_service.save_template(template, change={"op": "set_current", "version": 1})
+        with open(journal_service._journal.path_for(template.template_id), "ab") as f:
+            f.write(b'{"op":"set_cur')
+
+        # When
+        template.delete_version(3)
+        journal_service.save_template(template, change={"op": "delete_version", "version": 3})
+
+        # Then
+        loaded = _reload(journal_service, template.template_id)
+        assert loaded.current_version == 1
+        assert len(loaded.versions) == 2
+
+
+class TestJournalCompaction:
+    """저널 합치기 테스트"""
+
+    @pytest.mark.unit
+    def test_should_fold_in_background_after_threshold(self, config_file, test_templates_dir):
+        """저널이 한도만큼 쌓이면 백그라운드에서 스냅샷으로 합쳐야 한다"""
+        # Given
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir),
+            journal_compact_threshold=3
+        )
+        template = _template()
+        service.save_template(template)
+
+        # When
+        for number in (1, 2, 1):
+            template.current_version = number
+            service.save_template(template, change={"op": "set_current", "version": number})
+        service._journal_compactor.flush()
+
+        # Then
+        assert not service._journal.exists(template.template_id)
+        header = template_io.read_header(test_templates_dir / f"{template.template_id}.json")
+        assert header["current_version"] == 1
+
+    @pytest.mark.unit
+    def test_should_fold_all_journals_on_demand(self, journal_service):
+        """compact_journals()는 모든 저널을 합치고 내용을 보존해야 한다"""
+        # Given
+        template = _template()
+        journal_service.save_template(template)
+        number = template.add_version(PromptComponent(goal="목표 4"), "추가")
+        journal_service.save_template(template, change={"op": "add_version", "version": number, "base": 3})
+
+        # When
+        folded = journal_service.compact_journals()
+
+        # Then
+        assert folded == 1
+        assert journal_service._journal.template_ids() == []
+        assert _reload(journal_service, template.template_id).to_dict() == template.to_dict()
+
+    @pytest.mark.unit
+    def test_backup_should_include_journal_changes(self, journal_service):
+        """삭제 백업에는 저널 변경까지 반영되어야 한다"""
+        # Given
+        template = _template()
+        journal_service.save_template(template)
+        template.current_version = 1
+        journal_service.save_template(template, change={"op": "set_current", "version": 1})
+
+        # When
+        journal_service.delete_template(template.template_id)
+
+        # Then
+        backup = journal_service._backups.get(template.template_id)
+        assert template_io.loads_template(backup).current_version == 1
+        assert not journal_service._journal.exists(template.template_id)
+
+
+class TestJournalReaders:
+    """서비스 밖 읽기의 저널 재생 테스트"""
+
+    @pytest.fixture
+    def journaled(self, journal_service):
+        """스냅샷 저장 후 버전 추가를 저널에만 기록한 템플릿"""
+        template = _template()
+        journal_service.save_template(template)
+        template.add_version(PromptComponent(goal="목표 4"), "v4")
+        journal_service.save_template(template, change={"op": "add_version", "version": 4, "base": 3})
+        assert journal_service._journal.exists(template.template_id)
+        return template
+
+    @pytest.mark.integration
+    def test_migration_should_include_journaled_changes(self, journal_service, journaled, temp_dir):
+        """SQLite 이전은 저널에만 있는 버전 추가까지 옮겨야 한다"""
+        # Given
+        store = SQLiteTemplateStore(str(temp_dir / "migrated.sqlite3"))
+
+        # When
+        result = migrate_json_directory(str(journal_service.templates_dir), store)
+
+        # Then
+        assert result["migrated"] == 1
+        migrated = store.load(journaled.template_id)
+        assert len(migrated.versions) == 4
+        assert migrated.to_dict() == journaled.to_dict()
+
+    @pytest.mark.unit
+    def test_session_storage_should_include_journaled_changes(self, journal_service, journaled, monkeypatch):
+        """세션 저장소가 파일에서 읽은 템플릿에도 저널 변경이 반영되어야 한다"""
+        # Given
+        from utils import template_storage
+        from utils.template_storage import TemplateStorageManager
+
+        mock_st = Mock()
+        mock_st.session_state = {}
+        monkeypatch.setattr(template_storage, "st", mock_st)
+        monkeypatch.setattr(TemplateStorageManager, "TEMPLATE_DIR", journal_service.templates_dir)
+
+        # When
+        TemplateStorageManager._load_from_filesystem()
+
+        # Then
+        loaded, = mock_st.session_state[TemplateStorageManager.STORAGE_KEY]
+        assert loaded.get_version(4).components.goal == "목표 4"
+        assert loaded.to_dict() == journaled.to_dict()
@@ -0,0 +1,211 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+템플릿 파일 배치 테스트
+
+ai_prompt_maker.layout 모듈과 PromptMakerService 배치 연동을 테스트합니다.
+- ID 해시 기준 샤드 경로와 두 배치를 모두 확인하는 위치 찾기
+- 샤딩 배치에서 저장/로드/삭제/목록과 경로 조작 차단
+- 서비스 사용 중 flat <-> sharded 변환과 배치 기록
+- 세션 저장소(TemplateStorageManager)의 샤딩 배치 읽기/저장/삭제
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from ai_prompt_maker import template_io
+from ai_prompt_maker.layout import TemplateLayout, shard_of
+from ai_prompt_maker.models import PromptCategory
+from ai_prompt_maker.service import PromptMakerService
+
+
+def _service(config_file, templates_dir, **kwargs):
+    return PromptMakerService(
+        config_path=str(config_file), templates_dir=str(templates_dir), watch_interval=0, **kwargs
+    )
+
+
+class TestTemplateLayout:
+    """TemplateLayout 단위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_place_templates_by_id_hash(self, temp_dir):
+        """샤딩 배치는 ID 해시 앞 두 자리 디렉토리에 두고 경로에서 ID를 되찾아야 한다"""
+        # Given
+        layout = TemplateLayout(temp_dir, "sharded")
+
+        # When
+        path = layout.path_for("abc")
+
+        # Then
+        assert path == temp_dir / shard_of("abc") / "abc.json"
+        assert len(shard_of("abc")) == 2
+        assert layout.path_for("abc", "flat") == temp_dir / "abc.json"
+        assert layout.template_id_of(path) == "abc"
+        assert layout.template_id_of(temp_dir / "abc.json") == "abc"
+        assert layout.template_id_of(temp_dir / "zz" / "abc.json") is None
+        assert layout.template_id_of(temp_dir / ".abc.json.1.tmp") is None
+        with pytest.raises(ValueError):
+            TemplateLayout(temp_dir, "nested")
+
+    @pytest.mark.unit
+    def test_should_resolve_and_scan_both_layouts(self, temp_dir):
+        """다른 배치에 있는 파일도 찾고, 두 곳에 있으면 현재 배치 쪽만 나열해야 한다"""
+        # Given
+        layout = TemplateLayout(temp_dir, "sharded")
+        (temp_dir / "old.json").write_text("{}", encoding="utf-8")
+        for template_id in ("new", "both"):
+            layout.path_for(template_id).parent.mkdir(exist_ok=True)
+            layout.path_for(template_id).write_text("{}", encoding="utf-8")
+        (temp_dir / "both.json").write_text("{}", encoding="utf-8")
+        (temp_dir / "index.txt").write_text("x", encoding="utf-8")
+
+        # When
+        scanned = sorted(entry.path for entry in layout.scan())
+
+        # Then
+        assert layout.resolve("old") == temp_dir / "old.json"
+        assert layout.resolve("missing") == layout.path_for("missing")
+        assert scanned == sorted(str(p) for p in (
+            temp_dir / "old.json", layout.path_for("new"), layout.path_for("both")
+        ))
+        assert layout.resolve("both") == layout.path_for("both")
+
+
+class TestServiceLayout:
+    """PromptMakerService 배치 통합 테스트"""
+
+    @pytest.mark.integration
+    def test_should_store_templates_in_shards(self, config_file, test_templates_dir, make_template):
+        """샤딩 배치 서비스는 샤드 디렉토리에 저장하고 같은 API로 다뤄야 한다"""
+        # Given
+        service = _service(config_file, test_templates_dir, layout="sharded")
+
+        # When
+        for n in range(5):
+            service.save_template(make_template(f"t{n}"))
+        service.delete_template("t4")
+
+        # Then
+        assert (test_templates_dir / shard_of("t0") / "t0.json").exists()
+        assert not (test_templates_dir / "t0.json").exists()
+        assert not (test_templates_dir / shard_of("t4") / "t4.json").exists()
+        reopened = _service(config_file, test_templates_dir, layout="sharded")
+        assert reopened.load_template("t1").name == "t1"
+        assert {t["template_id"] for t in reopened.list_templates()} == {"t0", "t1", "t2", "t3"}
+        assert reopened.get_service_stats()["total_templates"] == 4
+        assert reopened.restore_template("t4").template_id == "t4"
+        assert (test_templates_dir / shard_of("t4") / "t4.json").exists()
+
+    @pytest.mark.integration
+    def test_should_reject_path_traversal(self, config_file, test_templates_dir, make_template):
+        """샤딩 배치에서도 디렉토리를 벗어나는 ID는 거부해야 한다"""
+        service = _service(config_file, test_templates_dir, layout="sharded")
+
+        assert service.load_template("../../etc/passwd") is None
+        assert service.delete_template("../outside") is False
+        with pytest.raises(ValueError):
+            service.save_template(make_template("../evil"))
+
+    @pytest.mark.integration
+    def test_should_migrate_while_other_service_keeps_working(self, config_file, test_templates_dir, make_template):
+        """변환 중에도 다른 서비스가 템플릿을 읽고 고칠 수 있고, 새 서비스는 기록된 배치를 따라야 한다"""
+        # Given
+        mine = _service(config_file, test_templates_dir)
+        other = _service(config_file, test_templates_dir)
+        for n in range(4):
+            mine.save_template(make_template(f"t{n}", f"원래 {n}"))
+        assert len(other.list_templates()) == 4
+
+        # When
+        result = mine.migrate_layout("sharded")
+        other.save_template(make_template("t1", "변환 후 수정"), overwrite=True)
+        other.save_template(make_template("t9"))
+
+        # Then
+        assert result == {"moved": 4, "skipped": 0, "conflicts": 0}
+        assert sorted(p.name for p in test_templates_dir.glob("*.json")) == ["t9.json"]
+        assert (test_templates_dir / shard_of("t1") / "t1.json").exists()
+        assert mine.load_template("t1").get_current_version().components.goal == "변환 후 수정"
+        assert {t["template_id"] for t in mine.list_templates()} == {"t0", "t1", "t2", "t3", "t9"}
+        assert _service(config_file, test_templates_dir)._layout.name == "sharded"
+
+    @pytest.mark.integration
+    def test_should_migrate_back_to_flat(self, config_file, test_templates_dir, make_template):
+        """flat으로 되돌리면 파일을 최상위로 옮기고 빈 샤드 디렉토리를 지워야 한다"""
+        # Given
+        service = _service(config_file, test_templates_dir, layout="sharded")
+        for n in range(3):
+            service.save_template(make_template(f"t{n}"))
+
+        # When
+        result = service.migrate_layout("flat")
+
+        # Then
+        assert result["moved"] == 3
+        assert sorted(p.name for p in test_templates_dir.glob("*.json")) == ["t0.json", "t1.json", "t2.json"]
+        assert not (test_templates_dir / shard_of("t0")).exists()
+        assert json.loads((test_templates_dir / ".index" / "layout.json").read_text())["layout"] == "flat"
+        assert service.load_template("t2").name == "t2"
+        with pytest.raises(ValueError):
+            service.migrate_layout("nested")
+
+    @pytest.mark.integration
+    def test_should_compact_sharded_directory(self, config_file, test_templates_dir, make_template):
+        """파일 변환 도구는 샤드 디렉토리의 템플릿도 처리해야 한다"""
+        # Given
+        service = _service(config_file, test_templates_dir, layout="sharded")
+        for n in range(3):
+            service.save_template(make_template(f"t{n}"))
+
+        # When
+        result = service.compact_templates(compression="gzip")
+
+        # Then
+        assert result["converted"] == 3
+        assert [p.name for p in template_io.template_files(str(test_templates_dir))] == [
+            "t0.json", "t1.json", "t2.json"
+        ]
+        assert service.load_template("t0").name == "t0"
+
+
+class TestSessionStorageLayout:
+    """세션 저장소 배치 연동 테스트"""
+
+    @pytest.mark.integration
+    def test_should_follow_sharded_layout(self, config_file, test_templates_dir, monkeypatch, make_template):
+        """세션 저장소는 샤드 파일을 읽고 서비스와 같은 위치와 형식으로 저장/삭제해야 한다"""
+        # Given
+        from utils import template_storage
+        from utils.template_storage import TemplateStorageManager
+
+        service = _service(config_file, test_templates_dir, layout="sharded")
+        service.save_template(make_template("t0"))
+        mock_st = Mock()
+        mock_st.session_state = {}
+        monkeypatch.setattr(template_storage, "st", mock_st)
+        monkeypatch.setattr(TemplateStorageManager, "TEMPLATE_DIR", test_templates_dir)
+        monkeypatch.setattr(TemplateStorageManager, "LAYOUT", "sharded")
+
+        # When
+        TemplateStorageManager._load_from_filesystem()
+        loaded = mock_st.session_state[TemplateStorageManager.STORAGE_KEY]
+        loaded[0].name = "수정됨"
+        TemplateStorageManager._save_to_filesystem(loaded[0])
+        TemplateStorageManager.save_template("새 템플릿", PromptCategory.PLANNING, {"goal": "목표"}, "")
+        new_id = mock_st.session_state[TemplateStorageManager.STORAGE_KEY][-1].template_id
+
+        # Then
+        assert [t.template_id for t in loaded[:1]] == ["t0"]
+        assert list(test_templates_dir.glob("*.json")) == []
+        new_path = test_templates_dir / shard_of(new_id) / f"{new_id}.json"
+        assert template_io.verify_signature(new_path.read_bytes(), service._signing_key)
+        assert template_io.read_header(new_path)["name"] == "새 템플릿"
+        assert service.load_template("t0").name == "수정됨"
+        assert service.load_template(new_id).name == "새 템플릿"
+
+        TemplateStorageManager.delete_template("t0")
+        assert not (test_templates_dir / shard_of("t0") / "t0.json").exists()
+        assert service.load_template("t0") is None
@@ -0,0 +1,208 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+템플릿 매니페스트 테스트
+
+ai_prompt_maker.manifest 모듈의 TemplateManifest와 서비스 연동을 테스트합니다.
+- 저장/삭제/가져오기 시 증분 업데이트
+- 목록 조회 시 템플릿 파싱 회피
+- mtime/크기 불일치 감지 후 재생성
+"""
+
+import json
+import os
+
+import pytest
+from unittest.mock import patch
+
+from ai_prompt_maker.layout import TemplateLayout
+from ai_prompt_maker.manifest import TemplateManifest
+from ai_prompt_maker.models import PromptTemplate, PromptCategory
+from ai_prompt_maker.service import PromptMakerService
+
+
+class TestManifestUpdates:
+    """서비스 작업에 따른 매니페스트 증분 업데이트 테스트"""
+
+    @pytest.mark.unit
+    def test_should_record_summary_on_save(self, service, sample_template):
+        """저장 시 매니페스트에 요약이 기록되어야 한다"""
+        # When
+        service.save_template(sample_template)
+
+        # Then
+        manifest_path = service.templates_dir / ".index" / "manifest.jsonl"
+        assert manifest_path.exists()
+        summary = service._manifest.get(sample_template.template_id)
+        assert summary == sample_template.get_summary()
+
+    @pytest.mark.unit
+    def test_should_remove_summary_on_delete(self, service, sample_template):
+        """삭제 시 매니페스트에서 제거되어야 한다"""
+        # Given
+        service.save_template(sample_template)
+
+        # When
+        service.delete_template(sample_template.template_id)
+
+        # Then
+        assert service._manifest.get(sample_template.template_id) is None
+        assert service.list_templates() == []
+
+    @pytest.mark.unit
+    def test_should_record_summary_on_import(self, service, sample_template):
+        """가져오기 시 매니페스트에 기록되어야 한다"""
+        # When
+        service.import_template_from_json(sample_template.to_json())
+
+        # Then
+        assert service._manifest.get(sample_template.template_id) is not None
+
+
+class TestManifestListing:
+    """매니페스트 기반 목록 조회 테스트"""
+
+    @pytest.mark.unit
+    def test_should_list_without_parsing_templates(self, service, sample_template):
+        """목록 조회는 템플릿 파일을 파싱하지 않아야 한다"""
+        # Given
+        service.save_template(sample_template)
+        fresh = PromptMakerService(
+            config_path=str(service.config_path),
+            templates_dir=str(service.templates_dir)
+        )
+
+        # When
+        with patch.object(PromptTemplate, "from_json") as from_json:
+            templates = fresh.list_templates()
+
+        # Then
+        from_json.assert_not_called()
+        assert [t["template_id"] for t in templates] == [sample_template.template_id]
+
+    @pytest.mark.unit
+    def test_should_return_independent_copies(self, service, sample_template):
+        """반환된 요약을 수정해도 매니페스트에 영향이 없어야 한다"""
+        # Given
+        service.save_template(sample_template)
+
+        # When
+        first = service.list_templates()
+        first[0]["source"] = "file"
+        first[0]["tags"].append("변경")
+
+        # Then
+        second = service.list_templates()
+        assert "source" not in second[0]
+        assert "변경" not in second[0]["tags"]
+
+    @pytest.mark.unit
+    def test_should_take_stats_and_warm_up_from_manifest(self, service):
+        """통계의 템플릿 수와 캐시 예열 대상은 디렉토리를 다시 훑지 않고 매니페스트에서 구해야 한다"""
+        # Given
+        templates = [PromptTemplate(name=f"템플릿 {i}", category=PromptCategory.QA) for i in range(3)]
+        for i, template in enumerate(templates):
+            service.save_template(template)
+            path = service.templates_dir / f"{template.template_id}.json"
+            os.utime(path, ns=(1_000_000_000 * (i + 1),) * 2)
+        fresh = PromptMakerService(
+            config_path=str(service.config_path),
+            templates_dir=str(service.templates_dir),
+            cache_max_entries=2,
+            watch_interval=0
+        )
+
+        # When
+        with patch.object(TemplateLayout, "scan", side_effect=AssertionError("scan")):
+            fresh._templates_cache.clear()
+            fresh._load_templates_cache()
+            stats = fresh.get_service_stats()
+
+        # Then
+        assert stats["total_templates"] == 3
+        assert set(fresh._templates_cache.keys()) == {t.template_id for t in templates[1:]}
+
+
+class TestManifestRebuild:
+    """디렉토리 변경 감지 및 재생성 테스트"""
+
+    @pytest.mark.unit
+    def test_should_detect_externally_modified_file(self, service, sample_template):
+        """외부에서 수정된 파일은 다시 요약해야 한다"""
+        # Given
+        service.save_template(sample_template)
+        path = service.templates_dir / f"{sample_template.template_id}.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["name"] = "외부에서 바뀐 이름"
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+        # When
+        templates = service.list_templates()
+
+        # Then
+        assert templates[0]["name"] == "외부에서 바뀐 이름"
+
+    @pytest.mark.unit
+    def test_should_detect_added_and_removed_files(self, service, sample_template):
+        """외부에서 추가/삭제된 파일을 반영해야 한다"""
+        # Given
+        service.save_template(sample_template)
+        other = PromptTemplate(name="외부 추가", category=PromptCategory.QA)
+        (service.templates_dir / f"{other.template_id}.json").write_text(other.to_json(), encoding="utf-8")
+
+        # When
+        names = {t["name"] for t in service.list_templates()}
+        os.remove(service.templates_dir / f"{sample_template.template_id}.json")
+        after_delete = [t["name"] for t in service.list_templates()]
+
+        # Then
+        assert names == {sample_template.name, "외부 추가"}
+        assert after_delete == ["외부 추가"]
+
+    @pytest.mark.unit
+    def test_should_skip_invalid_files_without_reparsing(self, service):
+        """유효하지 않은 파일은 목록에서 제외하고 변경 전까지 다시 파싱하지 않아야 한다"""
+        # Given
+        (service.templates_dir / "broken.json").write_text("{not json")
+        summarize_calls = []
+        manifest = TemplateManifest(
+            service.templates_dir,
+            lambda path: summarize_calls.append(path) or None
+        )
+
+        # When
+        manifest.refresh()
+        manifest.refresh()
+
+        # Then
+        assert manifest.summaries() == []
+        assert len(summarize_calls) == 1
+
+    @pytest.mark.unit
+    def test_should_rebuild_from_corrupted_manifest(self, service, sample_template):
+        """손상된 매니페스트는 무시하고 재생성해야 한다"""
+        # Given
+        service.save_template(sample_template)
+        service._manifest.path.write_text("garbage\n{\"op\": \"put\"}\n")
+
+        # When
+        manifest = TemplateManifest(service.templates_dir, service._summarize_template_file)
+        summaries = manifest.summaries()
+
+        # Then
+        assert [s["template_id"] for s in summaries] == [sample_template.template_id]
+
+    @pytest.mark.unit
+    def test_should_compact_log(self, service, sample_template):
+        """로그가 길어지면 현재 항목만 남도록 압축해야 한다"""
+        # Given
+        for _ in range(TemplateManifest.COMPACT_SLACK + 5):
+            service.save_template(sample_template)
+
+        # When
+        lines = service._manifest.path.read_text(encoding="utf-8").splitlines()
+
+        # Then
+        assert len(lines) < TemplateManifest.COMPACT_SLACK + 5
+        reloaded = TemplateManifest(service.templates_dir, service._summarize_template_file)
+        assert len(reloaded.summaries()) == 1
@@ -0,0 +1,169 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+서비스 지표 테스트
+
+ai_prompt_maker.metrics 모듈과 서비스 계측을 테스트합니다.
+- 지연 시간 히스토그램 백분위수 추정, 오류 집계
+- Prometheus 텍스트 형식 (누적 버킷, 카운터), 파일 저장과 HTTP 엔드포인트
+- 로드/설정/형식의 캐시 적중·실패, 읽고 쓴 바이트 수
+"""
+
+import urllib.request
+
+import pytest
+
+from ai_prompt_maker.metrics import LatencyHistogram, ServiceMetrics, DEFAULT_BUCKETS
+from ai_prompt_maker.models import PromptComponent
+
+
+def _sample(text, name):
+    """Prometheus 텍스트에서 이름(레이블 포함)이 같은 줄의 값"""
+    for line in text.splitlines():
+        if line.startswith(name + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{name} not found")
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 테스트"""
+
+    @pytest.mark.unit
+    def test_should_estimate_quantiles_within_bucket(self):
+        """백분위수는 값이 속한 버킷 범위 안에서 추정하고 최댓값을 넘지 않아야 한다"""
+        # Given
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.observe(0.0003)
+        for _ in range(10):
+            histogram.observe(0.02)
+
+        # When/Then
+        assert 0.00025 <= histogram.quantile(0.5) <= 0.0005
+        assert 0.01 <= histogram.quantile(0.95) <= 0.02
+        assert histogram.quantile(0.99) <= histogram.max == 0.02
+        assert LatencyHistogram().quantile(0.5) == 0.0
+
+    @pytest.mark.unit
+    def test_should_put_slow_observations_in_overflow_bucket(self):
+        """가장 큰 상한을 넘는 값은 +Inf 칸에 넣고 백분위수는 최댓값으로 제한해야 한다"""
+        histogram = LatencyHistogram()
+        histogram.observe(30.0)
+
+        assert histogram.counts[-1] == 1
+        assert DEFAULT_BUCKETS[-1] <= histogram.quantile(0.99) <= 30.0
+
+
+class TestServiceMetrics:
+    """ServiceMetrics 집계/출력 테스트"""
+
+    @pytest.mark.unit
+    def test_should_render_prometheus_text(self):
+        """누적 버킷, 합계/개수, 오류/캐시/바이트 카운터를 Prometheus 형식으로 출력해야 한다"""
+        # Given
+        metrics = ServiceMetrics()
+        with metrics.time("load"):
+            pass
+        with pytest.raises(RuntimeError):
+            with metrics.time("load"):
+                raise RuntimeError("실패")
+        metrics.observe("load", 0.004)
+        metrics.hit("load", 2)
+        metrics.miss("load")
+        metrics.add_bytes("save", written=128)
+
+        # When
+        text = metrics.to_prometheus({"templates_loaded": 3})
+        snapshot = metrics.snapshot()
+
+        # Then
+        assert "# TYPE prompt_maker_operation_duration_seconds histogram" in text
+        assert _sample(text, 'prompt_maker_operation_duration_seconds_bucket{operation="load",le="0.005"}') == 3
+        assert _sample(text, 'prompt_maker_operation_duration_seconds_bucket{operation="load",le="+Inf"}') == 3
+        assert _sample(text, 'prompt_maker_operation_duration_seconds_count{operation="search"}') == 0
+        assert _sample(text, 'prompt_maker_operation_errors_total{operation="load"}') == 1
+        assert _sample(text, 'prompt_maker_cache_hits_total{operation="load"}') == 2
+        assert _sample(text, 'prompt_maker_bytes_written_total{operation="save"}') == 128
+        assert _sample(text, "prompt_maker_templates_loaded_total") == 3
+        assert snapshot["load"]["hit_rate"] == pytest.approx(2 / 3)
+        assert set(snapshot["load"]) >= {"p50_ms", "p95_ms", "p99_ms"}
+
+
+class TestServiceInstrumentation:
+    """서비스 계측 테스트"""
+
+    @pytest.mark.integration
+    def test_should_count_cache_hits_and_file_bytes(self, service):
+        """캐시 적중과 실패를 따로 세고 실제 파일 크기만큼 읽고 쓴 바이트를 기록해야 한다"""
+        # Given
+        template = service.create_template("지표", "기획", PromptComponent(goal="목표"))
+        service.save_template(template)
+        size = service._template_path(template.template_id).stat().st_size
+
+        # When
+        service.load_template(template.template_id)
+        service._templates_cache.clear()
+        service.load_template(template.template_id)
+        service.load_template(template.template_id)
+        service.list_templates()
+        service.generate_prompt(PromptComponent(goal="목표"))
+        service.delete_template(template.template_id)
+        operations = service.get_service_stats()["operations"]
+
+        # Then
+        assert operations["load"]["cache_hits"] == 2
+        assert operations["load"]["cache_misses"] == 1
+        assert operations["load"]["bytes_read"] == size
+        assert operations["save"]["bytes_written"] == size
+        assert operations["delete"]["bytes_read"] == size
+        for name in ("load", "save", "list", "generate", "delete"):
+            assert operations[name]["count"] >= 1
+            assert 0 < operations[name]["p50_ms"] <= operations[name]["p99_ms"] <= operations[name]["max_ms"]
+
+    @pytest.mark.integration
+    def test_should_count_config_and_format_reloads(self, service):
+        """설정/형식은 다시 읽은 경우만 실패로 세고 나머지 조회는 적중으로 세야 한다"""
+        # Given
+        service.config_reload_interval = 3600
+        service.get_config(force_reload=True)
+        service.get_output_format_registry()
+
+        # When
+        for _ in range(5):
+            service.get_config()
+            service.get_output_format_registry()
+        operations = service.get_service_stats()["operations"]
+
+        # Then
+        assert operations["config"]["cache_misses"] >= 1
+        assert operations["config"]["cache_hits"] >= 5
+        config_size = service.config_path.stat().st_size
+        assert operations["config"]["bytes_read"] == config_size * operations["config"]["cache_misses"]
+        assert operations["formats"]["cache_misses"] == 1
+        assert operations["formats"]["cache_hits"] == 5
+
+    @pytest.mark.integration
+    def test_should_export_to_file_and_local_endpoint(self, service, temp_dir):
+        """Prometheus 텍스트를 파일로 쓰고 로컬 엔드포인트로 수집할 수 있어야 한다"""
+        # Given
+        service.generate_prompt(PromptComponent(goal="목표"))
+        path = temp_dir / "prompt_maker.prom"
+
+        # When
+        service.write_metrics(path)
+        server = service.start_metrics_server()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                scraped = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+        finally:
+            service.cleanup_service()
+
+        # Then
+        written = path.read_text(encoding="utf-8")
+        for text in (written, scraped):
+            assert _sample(text, 'prompt_maker_operation_duration_seconds_count{operation="generate"}') == 1
+            assert _sample(text, "prompt_maker_prompts_generated_total") == 1
+        assert content_type.startswith("text/plain")
+        assert service._metrics_server is None
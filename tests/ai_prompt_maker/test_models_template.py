@@ -13,6 +13,7 @@ import pytest
 import json
 from datetime import datetime
 
+from ai_prompt_maker import models
 from ai_prompt_maker.models import (
     PromptTemplate,
     PromptCategory,
@@ -210,6 +211,22 @@ class TestPromptTemplateSerialization:
         with pytest.raises(ValueError, match="Invalid JSON format"):
             PromptTemplate.from_json(invalid_json)
 
+    @pytest.mark.unit
+    def test_should_reuse_compiled_schema_validator(self, sample_template):
+        """스키마 검증기는 한 번만 만들고 검증은 매번 수행해야 한다"""
+        # Given
+        data = sample_template.to_dict()
+        data["name"] = "a" * 201
+
+        # When
+        first = models.compiled_validator(PromptTemplate.JSON_SCHEMA)
+        PromptTemplate.from_json(sample_template.to_json())
+
+        # Then
+        assert models.compiled_validator(PromptTemplate.JSON_SCHEMA) is first
+        with pytest.raises(PromptValidationError, match="at name"):
+            PromptTemplate.from_json(json.dumps(data))
+
 
 class TestPromptTemplateSummary:
     """PromptTemplate 요약 정보 테스트"""
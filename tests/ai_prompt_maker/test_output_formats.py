@@ -0,0 +1,124 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+출력 형식 레지스트리 테스트
+
+ai_prompt_maker.output_formats 모듈을 테스트합니다.
+- 카테고리별 형식 목록, format_id 조회, 키워드 역색인
+- 프로세스 공유 (같은 파일이면 같은 레지스트리, 바뀐 경우에만 다시 읽기)
+- 파일이 없거나 손상된 경우 기본 형식
+"""
+
+import json
+import os
+
+import pytest
+
+from ai_prompt_maker import output_formats
+from ai_prompt_maker.output_formats import OutputFormatRegistry, get_output_format_registry
+
+
+FORMATS = {
+    "categories": {
+        "table_format": {"name": "표 형식"},
+        "list_format": {"name": "목록 형식"},
+        "empty_format": {"name": "빈 형식"}
+    },
+    "formats": {
+        "test_case_table": {"name": "테스트 케이스 표", "category": "table_format", "keywords": ["테스트", "QA"]},
+        "checklist": {"name": "체크리스트", "category": "list_format", "keywords": ["qa ", "확인"]},
+        "comparison_table": {"name": "비교 표", "category": "table_format", "keywords": ["비교"]}
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_registries():
+    output_formats.clear_output_format_registries()
+    yield
+    output_formats.clear_output_format_registries()
+
+
+@pytest.fixture
+def formats_file(temp_dir):
+    path = temp_dir / "output_formats.json"
+    path.write_text(json.dumps(FORMATS, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+class TestOutputFormatRegistry:
+    """OutputFormatRegistry 색인 테스트"""
+
+    @pytest.mark.unit
+    def test_should_precompute_category_and_keyword_indexes(self):
+        """카테고리별 목록과 키워드 역색인을 미리 만들어야 한다"""
+        # Given/When
+        registry = OutputFormatRegistry(FORMATS)
+
+        # Then
+        assert list(registry.formats_in("table_format")) == ["test_case_table", "comparison_table"]
+        assert registry.formats_in("empty_format") == {}
+        assert registry.formats_in("unknown") == {}
+        assert registry.get("checklist")["name"] == "체크리스트"
+        assert registry.get("missing") is None
+        assert len(registry) == 3 and "checklist" in registry
+        assert registry.formats_with_keyword(" QA") == ["test_case_table", "checklist"]
+        assert registry.formats_with_keyword("없음") == []
+
+    @pytest.mark.unit
+    def test_should_be_read_only(self):
+        """세션이 공유 레지스트리 내용을 바꿀 수 없어야 한다"""
+        registry = OutputFormatRegistry(FORMATS)
+
+        with pytest.raises(TypeError):
+            registry.formats["new"] = {}
+        with pytest.raises(TypeError):
+            registry.get("checklist")["keywords"].append("새 키워드")
+
+
+class TestSharedRegistry:
+    """get_output_format_registry 공유/재로드 테스트"""
+
+    @pytest.mark.unit
+    def test_should_share_until_file_changes(self, formats_file, monkeypatch):
+        """파일이 바뀌지 않으면 다시 파싱하지 않고 같은 레지스트리를 돌려줘야 한다"""
+        # Given
+        loads = []
+        original_load = output_formats._load_registry
+        monkeypatch.setattr(output_formats, "_load_registry",
+                            lambda *args: loads.append(args) or original_load(*args))
+        first = get_output_format_registry(formats_file)
+
+        # When
+        monkeypatch.chdir(formats_file.parent)
+        same = [get_output_format_registry("output_formats.json") for _ in range(50)]
+        stat = formats_file.stat()
+        formats_file.write_text(json.dumps({"categories": {}, "formats": {}}), encoding="utf-8")
+        os.utime(formats_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        changed = get_output_format_registry(formats_file)
+
+        # Then
+        assert all(registry is first for registry in same)
+        assert len(loads) == 2
+        assert changed is not first and len(changed) == 0
+        assert len(first) == 3  # 이전 레지스트리는 그대로
+
+    @pytest.mark.unit
+    def test_should_fall_back_to_defaults(self, temp_dir, capsys):
+        """파일이 없거나 손상되면 기본 형식을 쓰고 고쳐지면 다시 읽어야 한다"""
+        # Given
+        path = temp_dir / "output_formats.json"
+
+        # When
+        missing = get_output_format_registry(path)
+        path.write_text("INVALID JSON {{{", encoding="utf-8")
+        broken = get_output_format_registry(path)
+        broken_again = get_output_format_registry(path)
+        path.write_text(json.dumps(FORMATS, ensure_ascii=False), encoding="utf-8")
+        fixed = get_output_format_registry(path)
+
+        # Then
+        assert list(missing.formats) == ["basic_report"]
+        assert list(broken.formats) == ["basic_report"] and broken_again is broken
+        assert capsys.readouterr().out.count("출력 형식 로드 실패") == 1
+        assert len(fixed) == 3
@@ -0,0 +1,145 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+템플릿 목록 페이지네이션 테스트
+
+ai_prompt_maker.pagination 모듈과 PromptMakerService.list_templates_page를 테스트합니다.
+- 키셋 커서로 전체 목록을 중복/누락 없이 순회
+- 정렬 기준별 순서와 같은 값의 template_id 정렬
+- JSON/sqlite 백엔드 결과 일치
+- 잘못된 커서/정렬 기준 오류
+"""
+
+from datetime import datetime
+
+import pytest
+
+from ai_prompt_maker import pagination
+from ai_prompt_maker.models import PromptCategory
+from ai_prompt_maker.service import PromptMakerService
+
+
+@pytest.fixture
+def dated_template(make_template):
+    def _dated_template(template_id, day, **kwargs):
+        template = make_template(template_id, **kwargs)
+        # 같은 날짜의 템플릿을 여러 개 만들어 정렬 값이 겹치게 함
+        template.versions[0].created_at = datetime(2024, 1, day)
+        return template
+    return _dated_template
+
+
+def _populate(service, dated_template):
+    for n in range(7):
+        service.save_template(dated_template(f"t{n}", day=1 + n // 3, name=f"이름 {6 - n}"))
+    service.save_template(dated_template("plan", day=9, category=PromptCategory.PLANNING))
+
+
+def _walk(service, **kwargs):
+    """커서를 따라 모든 페이지를 순회"""
+    pages, cursor = [], None
+    while True:
+        page = service.list_templates_page(cursor=cursor, **kwargs)
+        pages.append([t["template_id"] for t in page["templates"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages, page["total"]
+
+
+@pytest.fixture
+def sqlite_service(config_file, test_templates_dir):
+    return PromptMakerService(
+        config_path=str(config_file), templates_dir=str(test_templates_dir / "db"), storage_backend="sqlite"
+    )
+
+
+class TestCursor:
+    """커서 인코딩 단위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_round_trip_and_reject_bad_cursors(self):
+        """커서는 왕복 변환되고 손상/정렬 불일치 커서는 거부해야 한다"""
+        cursor = pagination.encode_cursor("name", ("이름", "t1"))
+
+        assert pagination.decode_cursor(cursor, "name") == ("이름", "t1")
+        assert pagination.decode_cursor(None, "name") is None
+        for bad in ("!!", "bm90IGpzb24", pagination.encode_cursor("name", ("a", "b"))[:-3]):
+            with pytest.raises(ValueError):
+                pagination.decode_cursor(bad, "name")
+        with pytest.raises(ValueError):
+            pagination.decode_cursor(cursor, "updated_at")
+        with pytest.raises(ValueError):
+            pagination.check_sort("size")
+
+
+class TestServicePagination:
+    """PromptMakerService 목록 페이지 통합 테스트"""
+
+    @pytest.mark.integration
+    def test_should_walk_all_pages_in_sort_order(self, service, dated_template):
+        """페이지를 이어 붙이면 전체 정렬 결과와 같아야 한다"""
+        # Given
+        _populate(service, dated_template)
+
+        for sort in pagination.SORT_ORDERS:
+            # When
+            pages, total = _walk(service, sort=sort, limit=3)
+            everything = [t["template_id"] for t in service.list_templates(sort=sort)]
+
+            # Then
+            assert [len(page) for page in pages] == [3, 3, 2]
+            assert sum(pages, []) == everything
+            assert total == 8
+
+        # 마지막 정렬 기준은 이름순 (ASCII 이름이 한글보다 앞)
+        assert everything == ["plan"] + [f"t{n}" for n in range(7)][::-1]
+        assert [t["template_id"] for t in service.list_templates(limit=4)] == ["plan", "t6", "t5", "t4"]
+
+    @pytest.mark.integration
+    def test_should_not_repeat_items_when_templates_change_between_pages(self, service, dated_template):
+        """페이지 사이에 템플릿이 추가/삭제되어도 이미 본 항목이 다시 나오지 않아야 한다"""
+        # Given
+        _populate(service, dated_template)
+        first = service.list_templates_page(limit=3)
+
+        # When
+        service.save_template(dated_template("newest", day=20))
+        service.delete_template("t4")
+        second = service.list_templates_page(limit=3, cursor=first["next_cursor"])
+
+        # Then
+        assert [t["template_id"] for t in first["templates"]] == ["plan", "t6", "t5"]
+        assert [t["template_id"] for t in second["templates"]] == ["t3", "t2", "t1"]
+
+    @pytest.mark.integration
+    def test_should_filter_pages_and_reject_invalid_arguments(self, service, dated_template):
+        """필터를 적용한 전체 수를 돌려주고 잘못된 인자는 거부해야 한다"""
+        # Given
+        _populate(service, dated_template)
+
+        # When
+        page = service.list_templates_page(category="기획", limit=5)
+
+        # Then
+        assert [t["template_id"] for t in page["templates"]] == ["plan"]
+        assert (page["total"], page["next_cursor"]) == (1, None)
+        with pytest.raises(ValueError):
+            service.list_templates_page(limit=0)
+        with pytest.raises(ValueError):
+            service.list_templates_page(cursor="garbage")
+        assert service.list_templates(cursor="garbage") == []
+
+    @pytest.mark.integration
+    def test_should_match_json_backend_on_sqlite(self, service, sqlite_service, dated_template):
+        """sqlite 백엔드도 같은 순서와 커서로 페이지를 돌려줘야 한다"""
+        # Given
+        _populate(service, dated_template)
+        _populate(sqlite_service, dated_template)
+
+        for sort in pagination.SORT_ORDERS:
+            # When
+            json_pages = _walk(service, sort=sort, limit=3)
+            sqlite_pages = _walk(sqlite_service, sort=sort, limit=3)
+
+            # Then
+            assert sqlite_pages == json_pages
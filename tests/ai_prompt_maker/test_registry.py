@@ -0,0 +1,172 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+공유 서비스 레지스트리 테스트
+
+ai_prompt_maker.registry 모듈을 테스트합니다.
+- 같은 생성 인자(경로 표기 무관)에 같은 인스턴스
+- 여러 스레드가 동시에 처음 요청해도 인스턴스 하나만 생성
+- DataHandler의 공유 서비스 사용
+- 공유 캐시 템플릿을 고치지 않는 버전 변경 (저장 실패, 동시 수정)
+- 재실행 지연 측정
+"""
+
+import os
+import threading
+import time
+
+from unittest.mock import patch
+
+import pytest
+
+from ai_prompt_maker import registry
+from ai_prompt_maker.models import PromptComponent, PromptValidationError
+from ai_prompt_maker.service import PromptMakerService
+from utils.data_handler import DataHandler
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    registry.clear_shared_services()
+    yield
+    registry.clear_shared_services()
+
+
+@pytest.fixture
+def service_kwargs(config_file, test_templates_dir):
+    return {"config_path": str(config_file), "templates_dir": str(test_templates_dir), "watch_interval": 0}
+
+
+class TestSharedServiceRegistry:
+    """get_shared_service 테스트"""
+
+    @pytest.mark.unit
+    def test_should_share_instance_per_arguments(self, service_kwargs, test_templates_dir, monkeypatch):
+        """같은 인자는 같은 인스턴스, 다른 인자는 다른 인스턴스를 돌려줘야 한다"""
+        # Given
+        shared = registry.get_shared_service(**service_kwargs)
+        monkeypatch.chdir(test_templates_dir)
+
+        # When
+        relative = registry.get_shared_service(**{**service_kwargs, "templates_dir": "."})
+        with_default = registry.get_shared_service(**service_kwargs, storage_backend="json")
+        other = registry.get_shared_service(**service_kwargs, cache_max_entries=8)
+
+        # Then
+        assert relative is shared
+        assert with_default is shared
+        assert other is not shared
+        with pytest.raises(TypeError):
+            registry.get_shared_service(unknown_option=True)
+
+    @pytest.mark.unit
+    def test_should_create_one_instance_under_concurrent_first_use(self, service_kwargs, monkeypatch):
+        """여러 스레드가 동시에 처음 요청해도 서비스는 한 번만 생성되어야 한다"""
+        # Given
+        created = []
+        original_init = PromptMakerService.__init__
+
+        def slow_init(self, *args, **kwargs):
+            created.append(self)
+            time.sleep(0.05)
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(PromptMakerService, "__init__", slow_init)
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.append(registry.get_shared_service(**service_kwargs))
+
+        # When
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        assert len(created) == 1
+        assert len(results) == 8 and all(result is created[0] for result in results)
+
+    @pytest.mark.unit
+    def test_should_recreate_after_clear(self, service_kwargs):
+        """레지스트리를 비우면 다음 요청에서 새 인스턴스를 만들어야 한다"""
+        first = registry.get_shared_service(**service_kwargs)
+
+        registry.clear_shared_services()
+
+        assert registry.get_shared_service(**service_kwargs) is not first
+
+    @pytest.mark.integration
+    def test_should_share_service_between_data_handlers(self, monkeypatch, config_file, test_templates_dir):
+        """DataHandler는 재생성되어도 같은 공유 서비스를 써야 한다"""
+        # Given
+        monkeypatch.chdir(test_templates_dir)
+        os.makedirs("data", exist_ok=True)
+        explicit = PromptMakerService(config_path=str(config_file), templates_dir=str(test_templates_dir))
+
+        # When
+        first, second = DataHandler(), DataHandler()
+
+        # Then
+        assert first.service is second.service
+        assert first.service is registry.get_shared_service()
+        assert DataHandler(service=explicit).service is explicit
+
+    @pytest.mark.unit
+    def test_failed_version_save_should_leave_cache_untouched(self, service_kwargs):
+        """버전 변경 저장에 실패하면 공유 캐시의 템플릿은 변경 전 그대로여야 한다"""
+        # Given
+        shared = registry.get_shared_service(**service_kwargs)
+        template = shared.create_template("공유", "기획", PromptComponent(goal="목표"))
+        shared.save_template(template)
+        cached = shared.load_template(template.template_id)
+        handler = DataHandler(shared)
+
+        # When
+        with patch.object(shared, "save_template", side_effect=PromptValidationError("디스크 가득 참")):
+            new_version = handler.create_new_version_from_existing(
+                template.template_id, 1, {"goal": "새 목표"}, "v2")
+            deleted = handler.delete_version(template.template_id, 1)
+
+        # Then
+        assert new_version is None and deleted is False
+        assert shared.load_template(template.template_id) is cached
+        assert len(cached.versions) == 1 and cached.current_version == 1
+
+    @pytest.mark.integration
+    def test_concurrent_version_edits_should_all_be_kept(self, service_kwargs):
+        """여러 세션이 같은 템플릿에 동시에 버전을 추가해도 모두 남아야 한다"""
+        # Given
+        shared = registry.get_shared_service(**service_kwargs)
+        template = shared.create_template("공유", "기획", PromptComponent(goal="목표"))
+        shared.save_template(template)
+        results = []
+
+        def add_version(index):
+            results.append(DataHandler(shared).create_new_version_from_existing(
+                template.template_id, 1, {"goal": f"목표 {index}"}, f"세션 {index}"))
+
+        # When
+        threads = [threading.Thread(target=add_version, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        assert sorted(results) == list(range(2, 10))
+        reopened = PromptMakerService(**service_kwargs)
+        loaded = reopened.load_template(template.template_id)
+        assert sorted(v.description for v in loaded.versions[1:]) == sorted(f"세션 {i}" for i in range(8))
+
+    @pytest.mark.slow
+    def test_should_measure_rerun_latency(self, service_kwargs):
+        """재실행 지연 측정은 두 방식의 중앙값과 개선 배수를 돌려줘야 한다"""
+        result = registry.measure_rerun_latency(reruns=3, **service_kwargs)
+
+        assert set(result) == {"new_instance_ms", "shared_instance_ms", "speedup"}
+        assert result["new_instance_ms"] > 0 and result["shared_instance_ms"] > 0
+        assert result["shared_instance_ms"] < result["new_instance_ms"]
@@ -0,0 +1,179 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+템플릿 검색 역색인 테스트
+
+ai_prompt_maker.search_index 모듈과 서비스 검색 연동을 테스트합니다.
+- 한글 바이그램 / 단어 토큰화
+- 후보 집합이 전체 스캔 결과를 포함하는지 확인
+- 저장/삭제 시 증분 갱신
+- 현재 버전 한정 검색
+"""
+
+import random
+
+import pytest
+from unittest.mock import patch
+
+from ai_prompt_maker.models import PromptTemplate, PromptComponent, PromptCategory
+from ai_prompt_maker.search_index import TemplateSearchIndex, tokenize
+
+
+def _template(name, goal, tags=None, description=""):
+    """테스트용 템플릿 생성 헬퍼"""
+    template = PromptTemplate(name=name, category=PromptCategory.QA, tags=tags or [])
+    template.update_current_version(PromptComponent(goal=goal), description)
+    return template
+
+
+class TestTokenize:
+    """토큰화 테스트"""
+
+    @pytest.mark.unit
+    def test_should_split_hangul_into_bigrams(self):
+        """한글은 문자 바이그램으로 나눠야 한다"""
+        assert tokenize("캐릭터") == ["캐릭", "릭터"]
+        assert tokenize("가") == ["가"]
+
+    @pytest.mark.unit
+    def test_should_split_other_text_into_lowercase_words(self):
+        """그 외 텍스트는 소문자 단어로 나눠야 한다"""
+        assert tokenize("Bug-Fix v2, QA!") == ["bug", "fix", "v2", "qa"]
+
+    @pytest.mark.unit
+    def test_should_separate_words_at_hangul_boundary(self):
+        """라틴 문자와 한글이 붙어 있으면 경계에서 나눠야 한다"""
+        assert tokenize("TestCase제작") == ["testcase", "제작"]
+
+
+class TestTemplateSearchIndex:
+    """TemplateSearchIndex 후보 계산 테스트"""
+
+    @pytest.mark.unit
+    def test_should_find_partial_words_at_query_edges(self):
+        """검색어 양 끝의 부분 단어도 후보로 찾아야 한다"""
+        # Given
+        index = TemplateSearchIndex()
+        index.add("a", _template("Character Analysis", "기능 분석"))
+        index.add("b", _template("Inventory", "기능 분석"))
+
+        # When/Then
+        assert index.candidates("racter ana") == {"a"}
+        assert index.candidates("ventor") == {"b"}
+
+    @pytest.mark.unit
+    def test_should_return_none_for_query_without_tokens(self):
+        """토큰이 없는 검색어는 None(전체 검사)을 반환해야 한다"""
+        assert TemplateSearchIndex().candidates("--") is None
+
+    @pytest.mark.unit
+    def test_should_remove_template_postings(self):
+        """제거한 템플릿은 후보에서 빠져야 한다"""
+        # Given
+        index = TemplateSearchIndex()
+        index.add("a", _template("캐릭터 분석", "기능 분석"))
+
+        # When
+        index.remove("a")
+
+        # Then
+        assert index.candidates("캐릭터") == set()
+        assert len(index) == 0
+
+    @pytest.mark.unit
+    def test_should_restrict_to_current_version(self):
+        """current_versions_only면 이전 버전 내용은 후보에서 제외해야 한다"""
+        # Given
+        template = _template("템플릿", "옛날 목표")
+        template.add_version(PromptComponent(goal="새로운 목표"), "")
+        index = TemplateSearchIndex()
+        index.add("a", template)
+
+        # When/Then
+        assert index.candidates("옛날") == set()
+        assert index.candidates("옛날", current_versions_only=False) == {"a"}
+
+    @pytest.mark.unit
+    def test_candidates_should_cover_brute_force_matches(self):
+        """후보 집합은 항상 전체 스캔 일치 집합을 포함해야 한다"""
+        # Given
+        rng = random.Random(7)
+        words = ["캐릭터", "시스템", "분석", "QA", "Test", "case", "버그", "레벨업", "v2"]
+        templates = {
+            f"t{i}": _template(" ".join(rng.sample(words, 3)), " ".join(rng.sample(words, 4)))
+            for i in range(30)
+        }
+        index = TemplateSearchIndex()
+        for template_id, template in templates.items():
+            index.add(template_id, template)
+
+        for _ in range(200):
+            text = " ".join(rng.sample(words, 2)).lower()
+            start = rng.randrange(len(text))
+            query = text[start:start + rng.randint(1, 6)].strip()
+            if not query:
+                continue
+
+            # When
+            candidates = index.candidates(query)
+
+            # Then
+            expected = {
+                template_id for template_id, template in templates.items()
+                if query in template.name.lower()
+                or query in template.get_current_version().generated_prompt.lower()
+            }
+            assert candidates is None or expected <= candidates, query
+
+
+class TestServiceSearchIndex:
+    """서비스 검색 역색인 연동 테스트"""
+
+    @pytest.mark.unit
+    def test_should_update_index_incrementally(self, service):
+        """저장/삭제 후 검색 결과가 바로 반영되어야 한다"""
+        # Given
+        first = _template("첫 번째", "기능 분석")
+        service.save_template(first)
+        assert service.search_templates("두 번째") == []
+
+        # When
+        second = _template("두 번째", "기능 분석")
+        service.save_template(second)
+        found = service.search_templates("두 번째")
+        service.delete_template(second.template_id)
+
+        # Then
+        assert [t["template_id"] for t in found] == [second.template_id]
+        assert service.search_templates("두 번째") == []
+
+    @pytest.mark.unit
+    def test_should_only_load_candidate_templates(self, service):
+        """검색 시 후보 템플릿만 원문을 확인해야 한다"""
+        # Given
+        for i in range(5):
+            service.save_template(_template(f"템플릿 {i}", f"목표 {i}"))
+        target = _template("다른 이름", "희귀한 검색어")
+        service.save_template(target)
+        service.search_templates("워밍업")
+
+        # When
+        with patch.object(service, "load_template", wraps=service.load_template) as load:
+            results = service.search_templates("희귀한")
+
+        # Then
+        assert [t["template_id"] for t in results] == [target.template_id]
+        assert load.call_count == 1
+
+    @pytest.mark.unit
+    def test_should_search_descriptions_and_all_versions(self, service):
+        """설명과 이전 버전 프롬프트도 검색할 수 있어야 한다"""
+        # Given
+        template = _template("템플릿", "옛날 목표", description="버전 설명")
+        template.add_version(PromptComponent(goal="새로운 목표"), "")
+        service.save_template(template)
+
+        # When/Then
+        assert service.search_templates("옛날") == []
+        assert len(service.search_templates("옛날", current_versions_only=False)) == 1
+        assert len(service.search_templates("버전 설명", current_versions_only=False)) == 1
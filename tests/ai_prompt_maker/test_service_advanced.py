@@ -221,7 +221,7 @@ class TestPromptMakerServiceCacheInvalidation:
 
         # Then - 캐시가 무효화되어 재로드됨
         # (실제로는 같은 내용이지만 다른 객체여야 함)
-        assert config1 is not config2 or service._config_last_modified is not None
+        assert config1 is not config2 or service._config_cache.mtime is not None
 
     @pytest.mark.unit
     def test_should_reload_templates_cache_after_cleanup(self, service, sample_template):
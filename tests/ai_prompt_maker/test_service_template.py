@@ -197,10 +197,9 @@ class TestPromptMakerServiceTemplateDelete:
         service.delete_template(sample_template.template_id)
 
         # Then
-        backup_dir = service.templates_dir / "backup"
-        assert backup_dir.exists()
-        backup_files = list(backup_dir.glob(f"{sample_template.template_id}_*.json"))
-        assert len(backup_files) > 0
+        backups = service.list_backups(sample_template.template_id)
+        assert len(backups) == 1
+        assert backups[0]["name"] == sample_template.name
 
     @pytest.mark.unit
     def test_should_return_false_for_nonexistent_template_deletion(self, service):
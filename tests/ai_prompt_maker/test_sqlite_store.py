@@ -0,0 +1,194 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+SQLite 저장소 백엔드 테스트
+
+ai_prompt_maker.sqlite_store 모듈과 PromptMakerService의 sqlite 백엔드를 테스트합니다.
+- 저장/로드/삭제
+- 목록 필터 및 정렬
+- 검색
+- JSON 디렉토리 이전
+"""
+
+import pytest
+
+from ai_prompt_maker.models import PromptTemplate, PromptCategory, PromptValidationError
+from ai_prompt_maker.service import PromptMakerService
+from ai_prompt_maker.sqlite_store import SQLiteTemplateStore, migrate_json_directory
+
+
+@pytest.fixture
+def sqlite_service(config_file, test_templates_dir):
+    """sqlite 백엔드를 사용하는 서비스 픽스처"""
+    return PromptMakerService(
+        config_path=str(config_file),
+        templates_dir=str(test_templates_dir),
+        storage_backend="sqlite"
+    )
+
+
+def _make_template(name, category=PromptCategory.PLANNING, tags=None):
+    """테스트용 템플릿 생성 헬퍼"""
+    return PromptTemplate(name=name, category=category, tags=tags or [])
+
+
+class TestSQLiteTemplateStore:
+    """SQLiteTemplateStore 기본 동작 테스트"""
+
+    @pytest.mark.unit
+    def test_should_round_trip_template(self, temp_dir, sample_template):
+        """저장한 템플릿을 동일하게 로드해야 한다"""
+        # Given
+        store = SQLiteTemplateStore(str(temp_dir / "t.sqlite3"))
+
+        # When
+        store.save(sample_template)
+        loaded = store.load(sample_template.template_id)
+
+        # Then
+        assert loaded.to_dict() == sample_template.to_dict()
+        assert store.count() == 1
+
+    @pytest.mark.unit
+    def test_should_replace_existing_template_on_save(self, temp_dir, sample_template, sample_component):
+        """같은 ID로 저장하면 버전과 태그가 교체되어야 한다"""
+        # Given
+        store = SQLiteTemplateStore(str(temp_dir / "t.sqlite3"))
+        store.save(sample_template)
+
+        # When
+        sample_template.add_version(sample_component, "v2")
+        sample_template.tags = ["새태그"]
+        store.save(sample_template)
+
+        # Then
+        loaded = store.load(sample_template.template_id)
+        assert len(loaded.versions) == 2
+        assert loaded.tags == ["새태그"]
+        assert store.list_summaries()[0]["version_count"] == 2
+
+    @pytest.mark.unit
+    def test_should_delete_template(self, temp_dir, sample_template):
+        """삭제 후에는 로드되지 않아야 한다"""
+        # Given
+        store = SQLiteTemplateStore(str(temp_dir / "t.sqlite3"))
+        store.save(sample_template)
+
+        # When/Then
+        assert store.delete(sample_template.template_id) is True
+        assert store.load(sample_template.template_id) is None
+        assert store.delete(sample_template.template_id) is False
+
+
+class TestSQLiteBackendService:
+    """PromptMakerService sqlite 백엔드 테스트"""
+
+    @pytest.mark.unit
+    def test_should_reject_unknown_backend(self, temp_dir):
+        """알 수 없는 백엔드는 거부해야 한다"""
+        with pytest.raises(ValueError):
+            PromptMakerService(
+                config_path=str(temp_dir / "config.json"),
+                templates_dir=str(temp_dir / "templates"),
+                storage_backend="redis"
+            )
+
+    @pytest.mark.unit
+    def test_should_not_write_json_files(self, sqlite_service, sample_template):
+        """sqlite 백엔드는 템플릿 JSON 파일을 만들지 않아야 한다"""
+        # When
+        sqlite_service.save_template(sample_template)
+
+        # Then
+        assert list(sqlite_service.templates_dir.glob("*.json")) == []
+        assert sqlite_service.get_service_stats()["total_templates"] == 1
+
+    @pytest.mark.unit
+    def test_should_respect_overwrite_flag(self, sqlite_service, sample_template):
+        """overwrite=False이면 기존 템플릿 저장을 거부해야 한다"""
+        # Given
+        sqlite_service.save_template(sample_template)
+
+        # When/Then
+        with pytest.raises(PromptValidationError):
+            sqlite_service.save_template(sample_template, overwrite=False)
+
+    @pytest.mark.unit
+    def test_should_load_after_cache_cleanup(self, sqlite_service, sample_template):
+        """캐시가 비어도 DB에서 템플릿을 로드해야 한다"""
+        # Given
+        sqlite_service.save_template(sample_template)
+        sqlite_service.cleanup_service()
+
+        # When
+        loaded = sqlite_service.load_template(sample_template.template_id)
+
+        # Then
+        assert loaded is not None
+        assert loaded.name == sample_template.name
+
+    @pytest.mark.unit
+    def test_should_filter_list_by_category_and_tags(self, sqlite_service):
+        """카테고리와 태그로 목록을 필터링해야 한다"""
+        # Given
+        sqlite_service.save_template(_make_template("기획 템플릿", PromptCategory.PLANNING, ["a"]))
+        sqlite_service.save_template(_make_template("QA 템플릿", PromptCategory.QA, ["b"]))
+
+        # When
+        by_category = sqlite_service.list_templates(category="QA")
+        by_tag = sqlite_service.list_templates(tags=["a"])
+
+        # Then
+        assert [t["name"] for t in by_category] == ["QA 템플릿"]
+        assert [t["name"] for t in by_tag] == ["기획 템플릿"]
+        assert len(sqlite_service.list_templates(category="전체")) == 2
+
+    @pytest.mark.unit
+    def test_should_search_name_tags_and_prompt(self, sqlite_service, sample_template):
+        """이름, 태그, 현재 버전 프롬프트에서 검색해야 한다"""
+        # Given
+        sqlite_service.save_template(sample_template)
+
+        # When/Then
+        assert len(sqlite_service.search_templates("캐릭터 시스템")) == 1
+        assert len(sqlite_service.search_templates("시스템 분석")) == 1
+        assert len(sqlite_service.search_templates("<ROLE>")) == 1
+        assert sqlite_service.search_templates("존재하지않는검색어") == []
+
+    @pytest.mark.unit
+    def test_should_backup_before_deletion(self, sqlite_service, sample_template):
+        """삭제 전에 JSON 백업을 남겨야 한다"""
+        # Given
+        sqlite_service.save_template(sample_template)
+
+        # When
+        result = sqlite_service.delete_template(sample_template.template_id)
+
+        # Then
+        assert result is True
+        assert len(sqlite_service.list_backups(sample_template.template_id)) == 1
+        assert sqlite_service.load_template(sample_template.template_id) is None
+        assert sqlite_service.delete_template(sample_template.template_id) is False
+
+
+class TestMigrateJsonDirectory:
+    """JSON 디렉토리 이전 테스트"""
+
+    @pytest.mark.unit
+    def test_should_migrate_json_templates(self, service, sample_template, temp_dir):
+        """JSON 템플릿을 SQLite로 이전해야 한다"""
+        # Given
+        service.save_template(sample_template)
+        service.save_template(_make_template("두 번째"))
+        (service.templates_dir / "broken.json").write_text("{not json")
+        store = SQLiteTemplateStore(str(temp_dir / "migrated.sqlite3"))
+
+        # When
+        result = migrate_json_directory(str(service.templates_dir), store)
+        second = migrate_json_directory(str(service.templates_dir), store)
+
+        # Then
+        assert result["migrated"] == 2
+        assert len(result["failed"]) == 1
+        assert second["skipped"] == 2
+        assert store.load(sample_template.template_id).to_dict() == sample_template.to_dict()
@@ -0,0 +1,331 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+헤더 우선 템플릿 파일 형식 테스트
+
+ai_prompt_maker.template_io 모듈과 지연 버전 목록을 테스트합니다.
+- 직렬화 왕복 및 일반 JSON 호환성
+- 헤더만 읽는 요약
+- 접근한 버전만 파싱/검증
+- 이전 형식 파일 읽기
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+from ai_prompt_maker import template_io
+from ai_prompt_maker.models import (
+    PromptTemplate, PromptComponent, PromptCategory, PromptValidationError, LazyVersionList
+)
+from ai_prompt_maker.service import PromptMakerService
+from utils.data_handler import DataHandler
+
+
+def _template(version_count=3):
+    """여러 버전을 가진 테스트용 템플릿 생성 헬퍼"""
+    template = PromptTemplate(name="헤더 테스트", category=PromptCategory.QA, tags=["qa"])
+    template.update_current_version(PromptComponent(goal="목표 1", role=["QA"]), "첫 버전")
+    for i in range(2, version_count + 1):
+        template.add_version(PromptComponent(goal=f"목표 {i}"), f"버전 {i}")
+    return template
+
+
+class TestTemplateFileLayout:
+    """헤더 우선 직렬화 테스트"""
+
+    @pytest.mark.unit
+    def test_should_round_trip_template(self):
+        """직렬화 후 다시 읽으면 같은 내용이어야 한다"""
+        # Given
+        template = _template()
+
+        # When
+        loaded = template_io.loads_template(template_io.dumps_template(template))
+
+        # Then
+        assert isinstance(loaded.versions, LazyVersionList)
+        assert loaded.to_dict() == template.to_dict()
+
+    @pytest.mark.unit
+    def test_should_remain_valid_template_json(self):
+        """헤더 우선 파일도 기존 from_json으로 읽을 수 있어야 한다"""
+        # Given
+        data = template_io.dumps_template(_template())
+
+        # When
+        loaded = PromptTemplate.from_json(data.decode("utf-8"))
+
+        # Then
+        assert len(loaded.versions) == 3
+        assert json.loads(data)["version_index"][0]["description"] == "첫 버전"
+
+    @pytest.mark.unit
+    def test_should_read_legacy_pretty_json(self, tmp_path):
+        """이전 들여쓰기 JSON 파일도 읽을 수 있어야 한다"""
+        # Given
+        template = _template()
+        path = tmp_path / "legacy.json"
+        path.write_text(template.to_json(), encoding="utf-8")
+
+        # When/Then
+        assert template_io.read_header(path) is None
+        assert template_io.read_template(path).to_dict() == template.to_dict()
+
+
+class TestLazyVersions:
+    """지연 버전 생성 테스트"""
+
+    @pytest.mark.unit
+    def test_should_materialize_only_accessed_version(self):
+        """현재 버전 조회는 현재 버전만 생성해야 한다"""
+        # Given
+        loaded = template_io.loads_template(template_io.dumps_template(_template(5)))
+
+        # When
+        current = loaded.get_current_version()
+        summary = loaded.get_summary()
+        infos = loaded.get_version_infos()
+
+        # Then
+        assert current.components.goal == "목표 5"
+        assert [loaded.versions.is_materialized(i) for i in range(5)] == [False] * 4 + [True]
+        assert summary["version_count"] == 5
+        assert [info["version"] for info in infos] == [1, 2, 3, 4, 5]
+
+    @pytest.mark.unit
+    def test_should_validate_version_on_access(self):
+        """손상된 버전은 접근할 때 검증 오류를 내야 한다"""
+        # Given
+        data = template_io.dumps_template(_template())
+        # 같은 길이로 바꿔 다른 버전의 위치는 유지
+        corrupted = data.replace('"goal":"목표 2"'.encode("utf-8"), b'"goal":1234567890')
+        loaded = template_io.loads_template(corrupted)
+
+        # When/Then
+        assert loaded.get_version(3).components.goal == "목표 3"
+        with pytest.raises(PromptValidationError):
+            loaded.get_version(2)
+
+    @pytest.mark.unit
+    def test_should_keep_mapping_after_deleting_version(self):
+        """버전 삭제 후에도 남은 버전이 올바른 본문을 가져야 한다"""
+        # Given
+        loaded = template_io.loads_template(template_io.dumps_template(_template(4)))
+
+        # When
+        assert loaded.delete_version(2)
+        loaded.add_version(PromptComponent(goal="목표 5"), "")
+
+        # Then
+        assert [v.components.goal for v in loaded.versions] == ["목표 1", "목표 3", "목표 4", "목표 5"]
+        reloaded = template_io.loads_template(template_io.dumps_template(loaded))
+        assert reloaded.get_version(3).components.goal == "목표 3"
+
+
+class TestHeaderSummary:
+    """헤더 기반 요약 테스트"""
+
+    @pytest.mark.unit
+    def test_should_summarize_from_header_only(self, tmp_path):
+        """헤더 요약은 get_summary()와 같아야 한다"""
+        # Given
+        template = _template()
+        template.current_version = 2
+        path = tmp_path / f"{template.template_id}.json"
+        template_io.write_template(path, template)
+
+        # When
+        header = template_io.read_header(path)
+
+        # Then
+        assert template_io.summary_from_header(header) == template.get_summary()
+
+    @pytest.mark.unit
+    def test_should_reject_invalid_header(self, tmp_path):
+        """스키마에 맞지 않는 헤더는 거부해야 한다"""
+        # Given
+        path = tmp_path / "bad.json"
+        data = template_io.dumps_template(_template())
+        path.write_bytes(data.replace('"category":"QA"'.encode("utf-8"), b'"category":"???"', 1))
+
+        # When/Then
+        with pytest.raises(PromptValidationError):
+            template_io.read_header(path)
+
+    @pytest.mark.unit
+    def test_service_should_list_without_parsing_versions(self, config_file, test_templates_dir):
+        """새 서비스의 목록 조회는 버전 본문을 읽지 않아야 한다"""
+        # Given
+        writer = PromptMakerService(config_path=str(config_file), templates_dir=str(test_templates_dir))
+        template = _template()
+        writer.save_template(template)
+        (test_templates_dir / ".index").mkdir(exist_ok=True)
+        for manifest_file in (test_templates_dir / ".index").iterdir():
+            manifest_file.unlink()
+
+        # When
+        reader = PromptMakerService(config_path=str(config_file), templates_dir=str(test_templates_dir))
+        reader._templates_cache.clear()
+        with patch.object(template_io, "read_template") as read_template:
+            summaries = reader.list_templates()
+
+        # Then
+        read_template.assert_not_called()
+        assert summaries == [template.get_summary()]
+
+    @pytest.mark.unit
+    def test_data_handler_should_read_history_and_single_version(self, service):
+        """버전 히스토리는 인덱스로, 편집 버전은 하나만 생성해야 한다"""
+        # Given
+        loaded = template_io.loads_template(template_io.dumps_template(_template(4)))
+        handler = DataHandler(service)
+        with patch.object(handler.service, "load_template", return_value=loaded):
+            # When
+            history = handler.get_version_history(loaded.template_id)
+            version = handler.get_version(loaded.template_id, 2)
+
+        # Then
+        assert [entry["version"] for entry in history] == [1, 2, 3, 4]
+        assert history[0]["components_summary"]["role_count"] == 1
+        assert version["components"]["goal"] == "목표 2"
+        assert [loaded.versions.is_materialized(i) for i in range(4)] == [False, True, False, False]
+
+
+class TestCompression:
+    """압축 저장 형식 테스트"""
+
+    @pytest.mark.unit
+    def test_should_auto_detect_gzip_file(self, tmp_path):
+        """gzip 파일도 형식 지정 없이 읽고 헤더만 풀어 읽어야 한다"""
+        # Given
+        template = _template()
+        path = tmp_path / "compressed.json"
+
+        # When
+        template_io.write_template(path, template, compression="gzip")
+
+        # Then
+        assert template_io.detect_compression(path.read_bytes()) == "gzip"
+        assert template_io.read_header(path)["name"] == "헤더 테스트"
+        assert template_io.read_template(path).to_dict() == template.to_dict()
+
+    @pytest.mark.unit
+    def test_service_should_write_compressed_and_read_plain(self, config_file, test_templates_dir):
+        """압축 설정 서비스는 gzip으로 저장하고 기존 일반 파일도 읽어야 한다"""
+        # Given
+        plain = PromptMakerService(config_path=str(config_file), templates_dir=str(test_templates_dir))
+        old = _template()
+        plain.save_template(old)
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir), compression="gzip"
+        )
+        new = _template(2)
+
+        # When
+        service.save_template(new)
+        service._templates_cache.clear()
+
+        # Then
+        assert (test_templates_dir / f"{new.template_id}.json").read_bytes()[:2] == b"\x1f\x8b"
+        assert service.load_template(old.template_id).to_dict() == old.to_dict()
+        assert service.load_template(new.template_id).to_dict() == new.to_dict()
+        assert len(service.list_templates()) == 2
+
+    @pytest.mark.unit
+    def test_should_convert_directory_compression(self, tmp_path):
+        """디렉토리 변환으로 압축을 켜고 끌 수 있어야 한다"""
+        # Given
+        template = _template()
+        path = tmp_path / f"{template.template_id}.json"
+        path.write_text(template.to_json(), encoding="utf-8")
+
+        # When
+        compressed = template_io.compact_directory(str(tmp_path), "full", compression="gzip")
+        again = template_io.compact_directory(str(tmp_path), "full", compression="gzip")
+        plain = template_io.compact_directory(str(tmp_path), "full", compression="none")
+
+        # Then
+        assert compressed["converted"] == 1
+        assert compressed["bytes_after"] < compressed["bytes_before"]
+        assert again["skipped"] == 1
+        assert plain["converted"] == 1
+        assert template_io.read_template(path).to_dict() == template.to_dict()
+
+    @pytest.mark.unit
+    def test_benchmark_should_compare_formats(self):
+        """벤치마크는 형식별 크기와 로드 시간을 보고해야 한다"""
+        # Given
+        templates = template_io.synthetic_templates("data/config.json", 3, versions=2)
+
+        # When
+        results = {r["format"]: r for r in template_io.benchmark_formats(templates, repeat=1)}
+
+        # Then
+        assert set(results) == {name for name, _, _ in template_io.BENCHMARK_FORMATS}
+        assert results["header-first+gzip"]["bytes"] < results["header-first"]["bytes"]
+        assert all(r["load_seconds"] > 0 for r in results.values())
+
+
+class TestSignedFastPath:
+    """서비스 서명 파일의 검증 생략 경로 테스트"""
+
+    @pytest.mark.unit
+    def test_should_skip_validation_for_signed_file(self, tmp_path):
+        """같은 키로 서명된 파일은 스키마 검증 없이 읽어야 한다"""
+        # Given
+        key = template_io.load_signing_key(tmp_path)
+        template = _template()
+        path = tmp_path / "signed.json"
+        template_io.write_template(path, template, "delta", signing_key=key, compression="gzip")
+
+        # When
+        with patch("ai_prompt_maker.models.schema_error") as models_check, \
+                patch.object(template_io, "schema_error") as header_check:
+            loaded = template_io.read_template(path, key)
+            versions = [version.components.goal for version in loaded.versions]
+
+        # Then
+        models_check.assert_not_called()
+        header_check.assert_not_called()
+        assert versions == ["목표 1", "목표 2", "목표 3"]
+        assert loaded.to_dict() == template.to_dict()
+        assert template_io.load_signing_key(tmp_path) == key
+
+    @pytest.mark.unit
+    def test_should_fully_validate_tampered_or_foreign_file(self, tmp_path):
+        """내용이 바뀌었거나 다른 키로 서명된 파일은 전체 검증해야 한다"""
+        # Given
+        key = template_io.load_signing_key(tmp_path)
+        path = tmp_path / "signed.json"
+        template_io.write_template(path, _template(), signing_key=key)
+        # 오프셋이 유지되도록 같은 길이의 위험 패턴으로 교체
+        path.write_bytes(path.read_bytes().replace("목표 2".encode("utf-8"), b"onload=1"))
+        other = tmp_path / "other.json"
+        template_io.write_template(other, _template(), signing_key=b"k" * 32)
+
+        # When
+        tampered = template_io.read_template(path, key)
+        with patch("ai_prompt_maker.models.schema_error", return_value=None) as check:
+            template_io.read_template(other, key).versions[0]
+
+        # Then
+        assert not template_io.verify_signature(path.read_bytes(), key)
+        with pytest.raises(ValueError, match="malicious"):
+            tampered.versions[1]
+        check.assert_called_once()
+
+    @pytest.mark.unit
+    def test_service_should_sign_files_but_validate_imports(self, service, sample_template):
+        """서비스 저장 파일은 서명되고, 가져오기는 항상 검증해야 한다"""
+        # Given
+        service.save_template(sample_template)
+        path = service.templates_dir / f"{sample_template.template_id}.json"
+        data = sample_template.to_dict()
+        data["versions"][0]["components"]["goal"] = "a" * 501
+
+        # When / Then
+        assert template_io.verify_signature(path.read_bytes(), service._signing_key)
+        with pytest.raises(PromptValidationError):
+            service.import_template_from_json(json.dumps(data))
@@ -0,0 +1,308 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+추적 스팬 테스트
+
+ai_prompt_maker.tracing 모듈과 계층별 스팬 연동을 테스트합니다.
+- 중첩 스팬의 부모/추적 ID, 요청 ID, 예외 기록
+- 추적이 꺼져 있을 때 빈 스팬과 원래 함수 직접 호출
+- 제어 흐름 예외(st.rerun() 등)를 오류로 기록하지 않음
+- 링 버퍼/JSONL/OTLP 싱크, OTLP 백그라운드 내보내기와 큐가 가득 찼을 때 버리기, 환경 변수 설정
+- DataHandler -> 서비스 -> 파일 파싱 스팬 계층
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from ai_prompt_maker import tracing
+from ai_prompt_maker.export_service import ExportService
+from ai_prompt_maker.models import PromptComponent
+from ai_prompt_maker.tracing import RingBufferSink, JsonlFileSink, OTLPJsonSink
+
+
+@pytest.fixture(autouse=True)
+def no_sink():
+    previous = tracing.set_sink(None)
+    yield
+    tracing.set_sink(previous)
+
+
+@pytest.fixture
+def ring():
+    sink = RingBufferSink()
+    tracing.set_sink(sink)
+    return sink
+
+
+class TestSpans:
+    """스팬 기록 테스트"""
+
+    @pytest.mark.unit
+    def test_should_do_nothing_when_disabled(self):
+        """싱크가 없으면 빈 스팬을 돌려주고 데코레이터는 원래 함수만 호출해야 한다"""
+        # Given
+        @tracing.traced("noop")
+        def add(a, b):
+            return a + b
+
+        # When
+        with tracing.trace("rerun-0"):
+            with tracing.span("outer", key="value") as span:
+                span.set_attribute("ignored", True)
+                result = add(1, 2)
+
+        # Then
+        assert result == 3
+        assert tracing.span("outer") is tracing.span("other")
+        assert tracing.current_span() is None
+        assert not tracing.enabled()
+
+    @pytest.mark.unit
+    def test_should_nest_spans_under_request(self, ring):
+        """중첩 스팬은 같은 추적/요청 ID와 부모 ID를 갖고 예외를 기록해야 한다"""
+        # Given
+        @tracing.traced()
+        def fail():
+            raise RuntimeError("실패")
+
+        # When
+        with tracing.trace("rerun-1"):
+            with tracing.span("outer", category="기획") as outer:
+                with tracing.span("inner"):
+                    assert tracing.current_request_id() == "rerun-1"
+                with pytest.raises(RuntimeError):
+                    fail()
+        with tracing.span("separate"):
+            pass
+
+        # Then
+        inner, failed, outer_span, separate = ring.spans()
+        assert outer_span is outer and outer.attributes == {"category": "기획"}
+        assert inner.parent_id == outer.span_id and failed.parent_id == outer.span_id
+        assert outer.parent_id is None
+        assert {inner.trace_id, failed.trace_id} == {outer.trace_id}
+        assert [span.name for span in ring.spans("rerun-1")] == ["inner", f"{fail.__qualname__}", "outer"]
+        assert failed.error == "RuntimeError: 실패"
+        assert separate.trace_id != outer.trace_id and separate.request_id == separate.trace_id
+        assert outer.end_ns >= inner.end_ns >= inner.start_ns >= outer.start_ns
+
+    @pytest.mark.unit
+    def test_should_not_record_ignored_exceptions_as_errors(self, ring, monkeypatch):
+        """ignore_errors()로 등록한 제어 흐름 예외는 스팬 오류로 기록하지 않아야 한다"""
+        # Given
+        class Rerun(Exception):
+            pass
+
+        class FastRerun(Rerun):
+            pass
+
+        monkeypatch.setattr(tracing, "_ignored_errors", ())
+        tracing.ignore_errors(Rerun)
+        tracing.ignore_errors(Rerun)
+
+        # When
+        for error in (FastRerun, ValueError):
+            with pytest.raises(error):
+                with tracing.span("app.rerun"):
+                    raise error("중단")
+
+        # Then
+        rerun, failed = ring.spans()
+        assert rerun.error is None
+        assert failed.error == "ValueError: 중단"
+        assert tracing._ignored_errors == (Rerun,)
+
+    @pytest.mark.unit
+    def test_should_keep_threads_separate_and_bound_ring(self):
+        """스레드마다 현재 스팬이 따로이고 링 버퍼는 최근 용량만큼만 보관해야 한다"""
+        # Given
+        ring = RingBufferSink(capacity=8)
+        tracing.set_sink(ring)
+
+        def work(index):
+            with tracing.trace(f"worker-{index}"), tracing.span("work"):
+                with tracing.span("step"):
+                    pass
+
+        # When
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        spans = ring.spans()
+        work(99)
+
+        # Then
+        for index in range(4):
+            step, parent = [span for span in spans if span.request_id == f"worker-{index}"]
+            assert (step.name, parent.name) == ("step", "work")
+            assert step.parent_id == parent.span_id and step.trace_id == parent.trace_id
+        assert len(ring) == 8
+        assert ring.spans() == spans[2:] + ring.spans("worker-99")
+
+
+class TestSinks:
+    """싱크 테스트"""
+
+    @pytest.mark.unit
+    def test_should_write_jsonl_and_otlp_files(self, temp_dir):
+        """JSONL 싱크는 스팬마다 한 줄, OTLP 파일 싱크는 묶음마다 OTLP/JSON 한 줄을 써야 한다"""
+        # Given
+        jsonl = JsonlFileSink(temp_dir / "spans.jsonl")
+        otlp = OTLPJsonSink(path=temp_dir / "otlp.jsonl", batch_size=2)
+
+        # When
+        for sink in (jsonl, otlp):
+            tracing.set_sink(sink)
+            with tracing.trace("rerun-2"), tracing.span("outer", count=3):
+                with tracing.span("inner", ratio=0.5, ok=True):
+                    pass
+            with tracing.span("last"):
+                pass
+            sink.close()
+
+        # Then
+        lines = [json.loads(line) for line in (temp_dir / "spans.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert [line["name"] for line in lines] == ["inner", "outer", "last"]
+        assert lines[0]["parent_id"] == lines[1]["span_id"] and lines[0]["request_id"] == "rerun-2"
+
+        batches = [json.loads(line) for line in (temp_dir / "otlp.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert len(batches) == 2
+        spans = [span for batch in batches
+                 for span in batch["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+        inner, outer, last = spans
+        assert len(inner["traceId"]) == 32 and len(inner["spanId"]) == 16
+        assert inner["parentSpanId"] == outer["spanId"] and "parentSpanId" not in outer
+        assert {"key": "request.id", "value": {"stringValue": "rerun-2"}} in inner["attributes"]
+        assert {"key": "ok", "value": {"boolValue": True}} in inner["attributes"]
+        assert {"key": "count", "value": {"intValue": "3"}} in outer["attributes"]
+        assert int(outer["endTimeUnixNano"]) >= int(inner["endTimeUnixNano"])
+        assert last["status"] == {"code": 0}
+
+    @pytest.mark.integration
+    def test_should_post_otlp_to_collector(self):
+        """OTLP 엔드포인트 싱크는 flush 때 수집기로 JSON을 POST해야 한다"""
+        # Given
+        received = []
+
+        class Collector(BaseHTTPRequestHandler):
+            def do_POST(self):
+                received.append((self.path, self.headers["Content-Type"],
+                                 json.loads(self.rfile.read(int(self.headers["Content-Length"])))))
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Collector)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            sink = tracing.sink_from_spec(f"otlp:http://127.0.0.1:{server.server_address[1]}/v1/traces")
+            tracing.set_sink(sink)
+
+            # When
+            with tracing.span("exported"):
+                pass
+            sink.flush()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # Then
+        path, content_type, payload = received[0]
+        assert path == "/v1/traces" and content_type == "application/json"
+        assert payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == "exported"
+
+    @pytest.mark.unit
+    def test_otlp_export_should_not_block_and_drop_when_full(self, temp_dir):
+        """OTLP 보내기는 백그라운드 스레드가 하고, 큐가 가득 차면 묶음을 버려야 한다"""
+        # Given
+        release = threading.Event()
+        sent = []
+        sink = OTLPJsonSink(path=temp_dir / "otlp.jsonl", batch_size=1, max_queued_batches=1)
+
+        def slow_send(batch):
+            release.wait(5)
+            sent.append(batch)
+
+        sink._send = slow_send
+        tracing.set_sink(sink)
+
+        # When
+        for index in range(5):
+            with tracing.span(f"span-{index}"):
+                pass
+        blocked_sent = len(sent)
+        release.set()
+        sink.close()
+
+        # Then
+        assert blocked_sent == 0
+        assert 1 <= len(sent) <= 2 and sink.dropped >= 3
+        assert len(sent) + sink.dropped == 5
+        assert not sink._thread.is_alive()
+
+    @pytest.mark.unit
+    def test_should_configure_from_environment(self, monkeypatch, temp_dir):
+        """환경 변수로 싱크를 고르고 잘못된 값은 무시해야 한다"""
+        monkeypatch.setenv(tracing.TRACE_ENV, "memory:16")
+        sink = tracing.configure_from_env()
+        assert isinstance(sink, RingBufferSink) and sink.capacity == 16
+        assert tracing.configure_from_env() is sink
+
+        tracing.set_sink(None)
+        monkeypatch.setenv(tracing.TRACE_ENV, "unknown:x")
+        assert tracing.configure_from_env() is None
+        assert isinstance(tracing.sink_from_spec(f"jsonl:{temp_dir / 'a.jsonl'}"), JsonlFileSink)
+        assert tracing.sink_from_spec("off") is None
+
+
+class TestLayerSpans:
+    """계층별 스팬 연동 테스트"""
+
+    @pytest.mark.integration
+    def test_should_trace_handler_service_and_parsing(self, ring, service, monkeypatch, temp_dir):
+        """DataHandler 호출 아래에 서비스, 세션 저장소, 파일 파싱, 생성기 스팬이 이어져야 한다"""
+        # Given
+        from utils import template_storage
+        from utils.data_handler import DataHandler
+
+        mock_st = Mock()
+        mock_st.session_state = {}
+        monkeypatch.setattr(template_storage, "st", mock_st)
+        template = service.create_template("추적", "기획", PromptComponent(goal="목표"))
+        service.save_template(template)
+        service._templates_cache.clear()
+        handler = DataHandler(service)
+        ring.clear()
+
+        # When
+        with tracing.trace("rerun-3"):
+            handler.list_templates("기획")
+            handler.load_template(template.template_id)
+            service.generate_prompt(PromptComponent(goal="목표"))
+            ExportService(fonts_dir=str(temp_dir)).export_to_markdown(
+                PromptComponent(goal="목표"), "traced", str(temp_dir))
+
+        # Then
+        spans = ring.spans("rerun-3")
+        by_id = {span.span_id: span for span in spans}
+
+        def parent_name(name):
+            span = next(s for s in spans if s.name == name)
+            return by_id[span.parent_id].name if span.parent_id else None
+
+        assert parent_name("PromptMakerService.list_templates_page") == "DataHandler.list_templates"
+        assert parent_name("TemplateStorageManager.filter_templates") == "DataHandler.list_templates"
+        assert parent_name("PromptMakerService.load_template") == "DataHandler.load_template"
+        assert parent_name("PromptMakerService.read_template_file") == "PromptMakerService.load_template"
+        assert parent_name("template_io.loads") == "PromptMakerService.read_template_file"
+        assert parent_name("PromptGenerator.generate_prompt") == "PromptMakerService.generate_prompt"
+        assert parent_name("ExportService.export_to_markdown") is None
+        assert len({span.trace_id for span in spans}) == 1
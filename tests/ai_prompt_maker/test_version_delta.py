@@ -0,0 +1,203 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+델타 버전 저장 테스트
+
+ai_prompt_maker.template_io 모듈의 델타 저장 방식을 테스트합니다.
+- 마지막 버전만 전체 저장, 이전 버전은 섹션 델타
+- get_version()의 투명한 복원
+- 기존 파일 일괄 변환 (compact)
+"""
+
+import json
+import random
+
+import pytest
+
+from ai_prompt_maker import template_io
+from ai_prompt_maker.models import PromptTemplate, PromptComponent, PromptCategory, PromptValidationError
+from ai_prompt_maker.service import PromptMakerService
+
+
+def _document(revision):
+    """수정 회차마다 한 줄씩 바뀌는 긴 문서"""
+    lines = [f"{i}. 캐릭터 성장 시스템 요구사항 설명 문장입니다." for i in range(80)]
+    lines[revision % 80] = f"{revision % 80}. 수정된 요구사항 (rev {revision})"
+    return "\n".join(lines)
+
+
+def _history_template(version_count=10):
+    """긴 문서를 조금씩 고친 버전이 쌓인 템플릿"""
+    template = PromptTemplate(name="델타 테스트", category=PromptCategory.PLANNING)
+    template.update_current_version(
+        PromptComponent(goal="시스템 분석", role=["게임 기획자"], document=_document(0)), "초안"
+    )
+    for revision in range(1, version_count):
+        template.add_version(
+            PromptComponent(goal="시스템 분석", role=["게임 기획자"], document=_document(revision)),
+            f"rev {revision}"
+        )
+    return template
+
+
+class TestDeltaEncoding:
+    """델타 직렬화 테스트"""
+
+    @pytest.mark.unit
+    def test_should_store_only_newest_version_in_full(self):
+        """마지막 버전만 전체로, 이전 버전은 델타로 저장해야 한다"""
+        # Given
+        template = _history_template(5)
+
+        # When
+        data = json.loads(template_io.dumps_template(template, "delta"))
+
+        # Then
+        assert data["version_storage"] == "delta"
+        assert "components" in data["versions"][-1]
+        assert all("delta" in record for record in data["versions"][:-1])
+        assert data["versions"][0]["delta"]["base"] == 2
+
+    @pytest.mark.unit
+    def test_should_reconstruct_every_version(self):
+        """모든 버전을 원래 내용으로 복원해야 한다"""
+        # Given
+        template = _history_template()
+
+        # When
+        loaded = template_io.loads_template(template_io.dumps_template(template, "delta"))
+
+        # Then
+        assert loaded.get_version(1).components.document == _document(0)
+        assert loaded.to_dict() == template.to_dict()
+
+    @pytest.mark.unit
+    def test_should_be_much_smaller_than_full_storage(self):
+        """비슷한 버전이 많으면 전체 저장보다 훨씬 작아야 한다"""
+        # Given
+        template = _history_template(30)
+
+        # When
+        full = template_io.dumps_template(template, "full")
+        delta = template_io.dumps_template(template, "delta")
+
+        # Then
+        assert len(delta) * 4 < len(full)
+
+    @pytest.mark.unit
+    def test_text_deltas_should_round_trip_random_edits(self):
+        """임의 줄 편집도 정확히 복원해야 한다"""
+        rng = random.Random(3)
+        alphabet = ["가나다", "abc", "\r\n", "\n", " ", " ", "라마"]
+
+        for _ in range(200):
+            base = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 200)))
+            lines = base.splitlines(keepends=True)
+            for _ in range(rng.randint(0, 5)):
+                lines.insert(rng.randint(0, len(lines)), rng.choice(alphabet) * rng.randint(1, 3))
+            text = "".join(lines) + ("x" * 300)
+
+            record = template_io.encode_delta(
+                {"version": 1, "components": {"document": text}},
+                {"version": 2, "components": {"document": base}}
+            )
+            restored = template_io.apply_delta(record, {"version": 2, "components": {"document": base}})
+            assert restored["components"]["document"] == text
+
+    @pytest.mark.unit
+    def test_should_reject_delta_with_invalid_base(self):
+        """자기 자신이나 이전 버전을 기준으로 하는 델타는 거부해야 한다"""
+        # Given
+        data = template_io.dumps_template(_history_template(3), "delta")
+        corrupted = data.replace(b'"base":2', b'"base":1', 1)
+        loaded = template_io.loads_template(corrupted)
+
+        # When/Then
+        assert loaded.get_current_version().version == 3
+        with pytest.raises(PromptValidationError):
+            loaded.get_version(1)
+
+    @pytest.mark.unit
+    def test_should_reconstruct_with_duplicate_version_numbers(self):
+        """버전 번호가 중복되어도 위치 기준으로 복원해야 한다"""
+        # Given: 삭제 후 추가로 번호가 중복된 템플릿
+        template = _history_template(4)
+        template.delete_version(2)
+        template.add_version(PromptComponent(goal="시스템 분석", document=_document(9)), "")
+
+        # When
+        loaded = template_io.loads_template(template_io.dumps_template(template, "delta"))
+
+        # Then
+        assert loaded.to_dict() == template.to_dict()
+
+
+class TestDeltaStorageService:
+    """서비스 델타 저장과 변환 테스트"""
+
+    @pytest.mark.unit
+    def test_should_save_and_load_with_delta_storage(self, config_file, test_templates_dir):
+        """델타 저장 서비스로 저장한 템플릿을 다시 읽을 수 있어야 한다"""
+        # Given
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir),
+            version_storage="delta"
+        )
+        template = _history_template(6)
+        service.save_template(template)
+
+        # When
+        reader = PromptMakerService(config_path=str(config_file), templates_dir=str(test_templates_dir))
+        reader.cleanup_service()
+        loaded = reader.load_template(template.template_id)
+
+        # Then
+        assert loaded.get_version(2).components.document == _document(1)
+        assert reader.list_templates() == [template.get_summary()]
+
+    @pytest.mark.unit
+    def test_should_reject_unknown_storage_mode(self, config_file, test_templates_dir):
+        """알 수 없는 버전 저장 방식은 거부해야 한다"""
+        with pytest.raises(ValueError):
+            PromptMakerService(
+                config_path=str(config_file), templates_dir=str(test_templates_dir),
+                version_storage="zip"
+            )
+
+    @pytest.mark.unit
+    def test_should_compact_existing_files(self, config_file, test_templates_dir):
+        """기존 파일(이전 형식 포함)을 델타 저장으로 변환해야 한다"""
+        # Given
+        legacy = _history_template(8)
+        (test_templates_dir / f"{legacy.template_id}.json").write_text(legacy.to_json(), encoding="utf-8")
+        service = PromptMakerService(config_path=str(config_file), templates_dir=str(test_templates_dir))
+        current = _history_template(8)
+        service.save_template(current)
+        (test_templates_dir / "broken.json").write_text("{", encoding="utf-8")
+
+        # When
+        result = service.compact_templates("delta")
+        again = template_io.compact_directory(str(test_templates_dir), "delta")
+
+        # Then
+        assert result["converted"] == 2
+        assert [name for name, _ in result["failed"]] == ["broken.json"]
+        assert result["bytes_after"] < result["bytes_before"]
+        assert again["skipped"] == 2 and again["converted"] == 0
+        assert service.load_template(legacy.template_id).to_dict() == legacy.to_dict()
+        assert service.load_template(current.template_id).to_dict() == current.to_dict()
+
+    @pytest.mark.unit
+    def test_command_should_convert_directory(self, test_templates_dir, capsys):
+        """명령행 compact는 디렉토리를 변환하고 결과를 출력해야 한다"""
+        # Given
+        template = _history_template(4)
+        template_io.write_template(test_templates_dir / f"{template.template_id}.json", template)
+
+        # When
+        template_io.main(["compact", str(test_templates_dir)])
+
+        # Then
+        assert "변환: 1개" in capsys.readouterr().out
+        header = template_io.read_header(test_templates_dir / f"{template.template_id}.json")
+        assert header["version_storage"] == "delta"
@@ -0,0 +1,222 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+파일 변경 감시기 테스트
+
+ai_prompt_maker.watcher 모듈과 서비스 캐시 무효화 연동을 테스트합니다.
+- inotify/폴링 방식의 추가/수정/삭제 감지와 세대 번호
+- 직접 쓴 파일(acknowledge) 제외, 나중에 생긴 디렉토리 감시
+- 다른 프로세스가 바꾼 템플릿/설정 파일의 캐시와 색인 행만 갱신
+"""
+
+import json
+
+import pytest
+
+from ai_prompt_maker import watcher as watcher_module
+from ai_prompt_maker.watcher import FileWatcher
+from ai_prompt_maker.service import PromptMakerService
+
+
+def _backends():
+    backends = ["poll"]
+    if watcher_module._Inotify.shared() is not None:
+        backends.append("inotify")
+    return backends
+
+
+@pytest.fixture(params=_backends())
+def file_watcher(request):
+    watcher = FileWatcher(poll_interval=0, backend=request.param)
+    yield watcher
+    watcher.close()
+
+
+@pytest.fixture
+def two_services(config_file, test_templates_dir):
+    """같은 디렉토리를 공유하는 두 서비스 (다른 워커 프로세스 흉내)"""
+    return [
+        PromptMakerService(config_path=str(config_file), templates_dir=str(test_templates_dir), watch_interval=0)
+        for _ in range(2)
+    ]
+
+
+class TestFileWatcher:
+    """FileWatcher 단위 테스트"""
+
+    @pytest.mark.unit
+    def test_should_report_added_modified_and_removed_files(self, file_watcher, temp_dir):
+        """추가/수정/삭제된 파일만 보고하고 세대 번호를 올려야 한다"""
+        # Given
+        (temp_dir / "a.json").write_text("1", encoding="utf-8")
+        (temp_dir / "b.json").write_text("1", encoding="utf-8")
+        file_watcher.watch(temp_dir, [".json"])
+        assert file_watcher.poll() == set()
+
+        # When
+        (temp_dir / "a.json").write_text("22", encoding="utf-8")
+        (temp_dir / "b.json").unlink()
+        (temp_dir / "c.json").write_text("3", encoding="utf-8")
+        (temp_dir / "ignored.txt").write_text("x", encoding="utf-8")
+        (temp_dir / ".c.json.123.tmp").write_text("x", encoding="utf-8")
+        changed = file_watcher.poll()
+
+        # Then
+        assert changed == {temp_dir / "a.json", temp_dir / "b.json", temp_dir / "c.json"}
+        assert file_watcher.generation == 1
+        assert file_watcher.poll() == set()
+        assert file_watcher.generation == 1
+
+    @pytest.mark.unit
+    def test_should_skip_acknowledged_writes(self, file_watcher, temp_dir):
+        """직접 쓰고 알린 파일은 다른 곳에서 다시 바꾸기 전까지 보고하지 않아야 한다"""
+        # Given
+        file_watcher.watch(temp_dir, [".json"])
+        path = temp_dir / "own.json"
+
+        # When
+        path.write_text("mine", encoding="utf-8")
+        file_watcher.acknowledge(path)
+        own = file_watcher.poll()
+        path.write_text("theirs!", encoding="utf-8")
+        theirs = file_watcher.poll()
+
+        # Then
+        assert own == set()
+        assert theirs == {path}
+
+    @pytest.mark.unit
+    def test_should_watch_directory_created_later(self, file_watcher, temp_dir):
+        """감시 시작 때 없던 디렉토리도 생기면 파일을 보고해야 한다"""
+        # Given
+        later = temp_dir / "later"
+        file_watcher.watch(later, [".jsonl"])
+        assert file_watcher.poll() == set()
+
+        # When
+        later.mkdir()
+        (later / "t1.jsonl").write_text("{}", encoding="utf-8")
+
+        # Then
+        assert file_watcher.poll() == {later / "t1.jsonl"}
+
+    @pytest.mark.unit
+    def test_should_throttle_polling_scans(self, temp_dir):
+        """폴링 방식은 간격 안에서는 스캔하지 않고 force면 바로 스캔해야 한다"""
+        # Given
+        watcher = FileWatcher(poll_interval=60, backend="poll")
+        watcher.watch(temp_dir, [".json"])
+
+        # When
+        (temp_dir / "a.json").write_text("1", encoding="utf-8")
+
+        # Then
+        assert watcher.backend == "poll"
+        assert watcher.poll() == set()
+        assert watcher.poll(force=True) == {temp_dir / "a.json"}
+        with pytest.raises(ValueError):
+            FileWatcher(backend="fsevents")
+
+    @pytest.mark.unit
+    @pytest.mark.skipif("inotify" not in _backends(), reason="inotify not available")
+    def test_should_share_one_inotify_instance(self, temp_dir):
+        """감시기를 사용자 한도(128)보다 많이 만들어도 inotify 인스턴스는 하나여야 한다"""
+        watchers = [FileWatcher(backend="inotify") for _ in range(200)]
+        for watcher in watchers:
+            watcher.watch(temp_dir, [".json"])
+
+        (temp_dir / "a.json").write_text("1", encoding="utf-8")
+
+        assert all(watcher.poll() == {temp_dir / "a.json"} for watcher in watchers)
+        assert len({id(watcher._inotify) for watcher in watchers}) == 1
+        for watcher in watchers:
+            watcher.close()
+
+
+class TestServiceWatcher:
+    """서비스 캐시 무효화 통합 테스트"""
+
+    @pytest.mark.integration
+    def test_should_reload_template_changed_by_other_worker(self, two_services, make_template):
+        """다른 워커가 바꾼 템플릿은 캐시 대신 새 내용을 돌려줘야 한다"""
+        # Given
+        mine, other = two_services
+        mine.save_template(make_template("shared", "처음"))
+        assert mine.load_template("shared").get_current_version().components.goal == "처음"
+        mine.load_template("shared")
+        generation = mine.file_generation
+
+        # When
+        other.save_template(make_template("shared", "바뀜"), overwrite=True)
+
+        # Then
+        assert mine.load_template("shared").get_current_version().components.goal == "바뀜"
+        assert mine.file_generation > generation
+        assert mine.list_templates()[0]["template_id"] == "shared"
+
+    @pytest.mark.integration
+    def test_should_keep_cache_for_own_writes(self, two_services, make_template):
+        """직접 저장한 템플릿은 감시기 때문에 다시 읽지 않아야 한다"""
+        # Given
+        mine, _ = two_services
+        template = make_template("own", "내 것")
+
+        # When
+        mine.save_template(template)
+        generation = mine.file_generation
+
+        # Then
+        assert mine.load_template("own") is template
+        assert mine.file_generation == generation
+
+    @pytest.mark.integration
+    def test_should_refresh_only_changed_index_rows(self, two_services, monkeypatch, make_template):
+        """첫 목록 이후에는 바뀐 템플릿의 매니페스트/검색 색인 행만 갱신해야 한다"""
+        # Given
+        mine, other = two_services
+        for n in range(3):
+            mine.save_template(make_template(f"t{n}", f"원래 {n}"))
+        assert mine.search_templates("원래")
+        refreshes = []
+        original = mine._manifest.refresh
+        monkeypatch.setattr(
+            mine._manifest, "refresh",
+            lambda template_ids=None: (refreshes.append(template_ids), original(template_ids))[1]
+        )
+
+        # When
+        other.save_template(make_template("t1", "외부 수정"), overwrite=True)
+        other.delete_template("t2")
+        listed = {t["template_id"] for t in mine.list_templates()}
+        found = [t["template_id"] for t in mine.search_templates("외부")]
+
+        # Then
+        assert listed == {"t0", "t1"}
+        assert found == ["t1"]
+        assert refreshes == [{"t1", "t2"}]
+
+    @pytest.mark.integration
+    def test_should_reload_config_after_external_edit(self, two_services):
+        """설정 파일이 바뀌면 다음 조회에서 새 설정을 돌려줘야 한다"""
+        # Given
+        mine, _ = two_services
+        config = mine.get_config()
+        assert mine.get_config() is config
+
+        # When
+        mine.config_path.write_text(
+            json.dumps({**config, "categories": ["전체", "새 분류"]}, ensure_ascii=False), encoding="utf-8"
+        )
+
+        # Then
+        assert mine.get_categories() == ["전체", "새 분류"]
+
+    @pytest.mark.unit
+    def test_should_disable_watcher(self, config_file, test_templates_dir):
+        """watch_files=False면 감시기를 만들지 않아야 한다"""
+        service = PromptMakerService(
+            config_path=str(config_file), templates_dir=str(test_templates_dir), watch_files=False
+        )
+
+        assert service._watcher is None
+        assert service.file_generation == 0
@@ -175,6 +175,28 @@ def sample_template(sample_version) -> PromptTemplate:
     )
 
 
+@pytest.fixture
+def make_template():
+    """ID를 지정한 단일 버전 템플릿 생성 헬퍼
+
+    Returns:
+        Callable: (template_id, goal, category, tags, name, **components) -> PromptTemplate
+            name을 생략하면 template_id를 이름으로 쓰고, 나머지 키워드는 PromptComponent에 전달
+    """
+    def _make_template(template_id: str, goal: str = "목표",
+                       category: PromptCategory = PromptCategory.PROGRAMMING,
+                       tags=(), name: str = None, **components) -> PromptTemplate:
+        template = PromptTemplate(
+            template_id=template_id,
+            name=name or template_id,
+            category=category,
+            tags=list(tags)
+        )
+        template.update_current_version(PromptComponent(goal=goal, **components), "v1")
+        return template
+    return _make_template
+
+
 # ==================== 서비스 픽스처 ====================
 
 @pytest.fixture
@@ -0,0 +1,17 @@
+# @TEST:TEST-001 | SPEC: .moai/specs/SPEC-TEST-001/spec.md
+
+"""
+utils 테스트 공용 픽스처
+
+DataHandler()가 인자 없이 쓰는 공유 서비스를 임시 디렉토리 서비스로 바꿔
+테스트가 패키지 기본 템플릿 디렉토리(서명 키, 저널, 잠금 파일)를 건드리지 않게 합니다.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_shared_service(monkeypatch, service):
+    """DataHandler 기본 서비스를 임시 디렉토리 서비스로 교체"""
+    monkeypatch.setattr("utils.data_handler.get_shared_service", lambda: service)
+    return service
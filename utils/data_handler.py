@@ -1,55 +1,109 @@
 """
 Data Handler - Wrapper around PromptMakerService for UI components
 """
+import copy
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 from ai_prompt_maker.service import PromptMakerService
+from ai_prompt_maker.registry import get_shared_service
+from ai_prompt_maker.bulk_export import template_to_text
 from ai_prompt_maker.models import PromptTemplate, PromptComponent, PromptCategory
+from ai_prompt_maker.tracing import traced
 from utils.template_storage import TemplateStorageManager
 
 
 class DataHandler:
     """데이터 핸들러 - UI 컴포넌트를 위한 서비스 래퍼"""
 
-    def __init__(self):
-        """데이터 핸들러 초기화"""
-        self.service = PromptMakerService()
+    def __init__(self, service: Optional[PromptMakerService] = None):
+        """데이터 핸들러 초기화
 
+        Args:
+            service: 사용할 서비스 (None이면 프로세스 공유 서비스)
+        """
+        self.service = service if service is not None else get_shared_service()
+
+    @traced("DataHandler.load_config")
     def load_config(self) -> Dict[str, Any]:
         """설정 파일 로드"""
         return self.service.get_config()
 
-    def list_templates(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
-        """템플릿 목록 조회 (파일시스템 + localStorage)"""
-        # 파일시스템 템플릿 로드
-        filesystem_templates = self.service.list_templates(category=category)
-
-        # localStorage 템플릿 로드
-        localstorage_templates = TemplateStorageManager.load_templates(use_cache=True)
+    @traced("DataHandler.list_templates")
+    def list_templates(self, category: Optional[str] = None, tags: Optional[List[str]] = None,
+                       tag_match: str = "any") -> List[Dict[str, Any]]:
+        """템플릿 목록 조회 (파일시스템 + localStorage)
 
-        # localStorage 템플릿을 딕셔너리로 변환하고 소스 표시 추가
-        localstorage_dicts = []
-        for template in localstorage_templates:
-            template_dict = template.to_dict()
-            template_dict['source'] = 'localStorage'  # 소스 표시
-
-            # 카테고리 필터링
-            if category:
-                if template.category.value == category:
-                    localstorage_dicts.append(template_dict)
-            else:
-                localstorage_dicts.append(template_dict)
+        Args:
+            category: 카테고리 필터 ("전체" 또는 None이면 필터 없음)
+            tags: 태그 필터
+            tag_match: "any"(태그 하나라도 일치) 또는 "all"(모두 일치)
+        """
+        # 파일시스템 템플릿 로드
+        filesystem_templates = self.service.list_templates(**self._filters(category, tags, tag_match))
 
         # 파일시스템 템플릿에도 소스 표시 추가
         for template_dict in filesystem_templates:
             template_dict['source'] = 'file'
 
         # 두 목록 병합 (localStorage가 먼저, 최신 저장이므로)
-        all_templates = localstorage_dicts + filesystem_templates
+        all_templates = self._localstorage_templates(category, tags, tag_match) + filesystem_templates
 
         return all_templates
 
+    @traced("DataHandler.list_templates_page")
+    def list_templates_page(self, category: Optional[str] = None, limit: Optional[int] = 20,
+                            cursor: Optional[str] = None, tags: Optional[List[str]] = None,
+                            tag_match: str = "any") -> Dict[str, Any]:
+        """템플릿 목록 한 페이지 조회 (파일시스템 + localStorage)
+
+        localStorage 템플릿은 첫 페이지 앞에만 붙이고, 파일시스템 템플릿은
+        서비스의 커서 방식 페이지를 그대로 사용합니다.
+
+        Returns:
+            {"templates": [...], "next_cursor": str 또는 None, "total": int}
+        """
+        page = self.service.list_templates_page(
+            limit=limit, cursor=cursor, **self._filters(category, tags, tag_match)
+        )
+
+        for template_dict in page["templates"]:
+            template_dict['source'] = 'file'
+
+        localstorage_dicts = self._localstorage_templates(category, tags, tag_match)
+        page["total"] += len(localstorage_dicts)
+        if cursor is None:
+            page["templates"] = localstorage_dicts + page["templates"]
+
+        return page
+
+    @traced("DataHandler.get_tag_counts")
+    def get_tag_counts(self, category: Optional[str] = None) -> Dict[str, int]:
+        """태그별 템플릿 수 (파일시스템 + localStorage, 많은 순)"""
+        counts = dict(self.service.get_tag_counts(category))
+        for tag, count in TemplateStorageManager.get_tag_counts(category).items():
+            counts[tag] = counts.get(tag, 0) + count
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+    @staticmethod
+    def _filters(category: Optional[str], tags: Optional[List[str]], tag_match: str) -> Dict[str, Any]:
+        """서비스 목록 조회 필터 인자 (태그가 없으면 카테고리만 전달)"""
+        if tags:
+            return {"category": category, "tags": tags, "tag_match": tag_match}
+        return {"category": category}
+
+    def _localstorage_templates(self, category: Optional[str] = None, tags: Optional[List[str]] = None,
+                                tag_match: str = "any") -> List[Dict[str, Any]]:
+        """localStorage 템플릿을 소스 표시가 붙은 딕셔너리 목록으로 변환 (카테고리/태그 색인으로 필터)"""
+        localstorage_dicts = []
+        for template in TemplateStorageManager.filter_templates(category, tags, tag_match):
+            template_dict = template.to_dict()
+            template_dict['source'] = 'localStorage'  # 소스 표시
+            localstorage_dicts.append(template_dict)
+
+        return localstorage_dicts
+
+    @traced("DataHandler.search_templates")
     def search_templates(self, query: str) -> List[Dict[str, Any]]:
         """템플릿 검색 (파일시스템 + localStorage)"""
         # 파일시스템 검색
@@ -78,6 +132,7 @@ class DataHandler:
 
         return all_results
 
+    @traced("DataHandler.load_template")
     def load_template(self, template_id: str) -> Optional[Dict[str, Any]]:
         """템플릿 로드 (파일시스템 + localStorage)"""
         # 먼저 파일시스템에서 시도
@@ -96,6 +151,7 @@ class DataHandler:
 
         return None
 
+    @traced("DataHandler.delete_template")
     def delete_template(self, template_id: str) -> bool:
         """템플릿 삭제 (파일시스템 + localStorage)"""
         # 먼저 어디에 있는지 확인
@@ -112,6 +168,7 @@ class DataHandler:
             # 파일시스템에서 삭제
             return self.service.delete_template(template_id)
 
+    @traced("DataHandler.duplicate_template")
     def duplicate_template(self, template_id: str, new_name: str) -> Optional[str]:
         """템플릿 복제"""
         try:
@@ -129,38 +186,57 @@ class DataHandler:
         if not template:
             return []
 
+        # 버전 인덱스만 사용하므로 버전 본문은 파싱하지 않음
         version_history = []
-        for version in template.versions:
+        for info in template.get_version_infos():
             version_info = {
-                'version': version.version,
-                'created_at': version.created_at,
-                'description': version.description,
-                'is_current': version.version == template.current_version,
-                'components_summary': {
-                    'role_count': len(version.components.role),
-                    'has_goal': bool(version.components.goal),
-                    'context_count': len(version.components.context),
-                    'has_output': bool(version.components.output),
-                    'rule_count': len(version.components.rule)
-                }
+                'version': info['version'],
+                'created_at': datetime.fromisoformat(info['created_at']),
+                'description': info['description'],
+                'is_current': info['version'] == template.current_version,
+                'components_summary': info['components_summary']
             }
             version_history.append(version_info)
 
         return version_history
 
+    def get_version(self, template_id: str, version_number: int) -> Optional[Dict[str, Any]]:
+        """특정 버전 하나만 조회 (파일시스템 + localStorage)"""
+        template = self.service.load_template(template_id)
+        if not template:
+            template = TemplateStorageManager.load_template(template_id)
+        if not template:
+            return None
+
+        version = template.get_version(version_number)
+        return version.to_dict() if version else None
+
+    def _load_for_edit(self, template_id: str) -> Optional[PromptTemplate]:
+        """수정용 템플릿 복사본 (service.edit_lock() 안에서 호출)
+
+        서비스 캐시의 템플릿은 세션끼리 공유하므로 직접 고치지 않고, 저장에 실패해도
+        캐시에는 수정 전 템플릿이 남습니다.
+        """
+        template = self.service.load_template(template_id)
+        return copy.deepcopy(template) if template else None
+
     def set_current_version(self, template_id: str, version_number: int) -> bool:
         """현재 버전 설정"""
         try:
-            template = self.service.load_template(template_id)
-            if not template:
-                return False
-
-            # 버전이 존재하는지 확인
-            if not template.get_version(version_number):
-                return False
-
-            template.current_version = version_number
-            return self.service.save_template(template)
+            with self.service.edit_lock(template_id):
+                template = self._load_for_edit(template_id)
+                if not template:
+                    return False
+
+                # 버전이 존재하는지 확인
+                if not template.get_version(version_number):
+                    return False
+
+                template.current_version = version_number
+                # 파일 전체 대신 작은 저널 레코드만 기록
+                return self.service.save_template(
+                    template, change={'op': 'set_current', 'version': version_number}
+                )
         except Exception as e:
             print(f"버전 설정 실패: {e}")
             return False
@@ -168,13 +244,16 @@ class DataHandler:
     def delete_version(self, template_id: str, version_number: int) -> bool:
         """버전 삭제"""
         try:
-            template = self.service.load_template(template_id)
-            if not template:
+            with self.service.edit_lock(template_id):
+                template = self._load_for_edit(template_id)
+                if not template:
+                    return False
+
+                if template.delete_version(version_number):
+                    return self.service.save_template(
+                        template, change={'op': 'delete_version', 'version': version_number}
+                    )
                 return False
-
-            if template.delete_version(version_number):
-                return self.service.save_template(template)
-            return False
         except Exception as e:
             print(f"버전 삭제 실패: {e}")
             return False
@@ -183,15 +262,6 @@ class DataHandler:
                                components: Dict[str, Any], description: str = "") -> bool:
         """템플릿 버전 업데이트"""
         try:
-            template = self.service.load_template(template_id)
-            if not template:
-                return False
-
-            # 버전 찾기
-            version = template.get_version(version_number)
-            if not version:
-                return False
-
             # 컴포넌트 생성
             prompt_component = PromptComponent(
                 role=components.get('role', []),
@@ -202,18 +272,30 @@ class DataHandler:
                 rule=components.get('rule', [])
             )
 
-            # 버전 업데이트
-            if version_number == template.current_version:
-                template.update_current_version(prompt_component, description)
-            else:
-                version.components = prompt_component
-                version.description = description
-                # 프롬프트 재생성
-                from ai_prompt_maker.prompt_generator import PromptGenerator
-                generator = PromptGenerator()
-                version.generated_prompt = generator.generate_prompt(prompt_component)
-
-            return self.service.save_template(template)
+            with self.service.edit_lock(template_id):
+                template = self._load_for_edit(template_id)
+                if not template:
+                    return False
+
+                # 버전 찾기
+                version = template.get_version(version_number)
+                if not version:
+                    return False
+
+                # 버전 업데이트
+                if version_number == template.current_version:
+                    template.update_current_version(prompt_component, description)
+                else:
+                    version.components = prompt_component
+                    version.description = description
+                    # 프롬프트 재생성
+                    from ai_prompt_maker.prompt_generator import PromptGenerator
+                    generator = PromptGenerator()
+                    version.generated_prompt = generator.generate_prompt(prompt_component)
+
+                return self.service.save_template(
+                    template, change={'op': 'update_version', 'version': version_number}
+                )
         except Exception as e:
             print(f"버전 업데이트 실패: {e}")
             return False
@@ -222,10 +304,6 @@ class DataHandler:
                                         components: Dict[str, Any], description: str = "") -> Optional[int]:
         """기존 버전으로부터 새 버전 생성"""
         try:
-            template = self.service.load_template(template_id)
-            if not template:
-                return None
-
             # 컴포넌트 생성
             prompt_component = PromptComponent(
                 role=components.get('role', []),
@@ -236,16 +314,23 @@ class DataHandler:
                 rule=components.get('rule', [])
             )
 
-            # 새 버전 추가
-            new_version_number = template.add_version(prompt_component, description)
+            with self.service.edit_lock(template_id):
+                template = self._load_for_edit(template_id)
+                if not template:
+                    return None
 
-            if self.service.save_template(template):
-                return new_version_number
-            return None
+                # 새 버전 추가
+                new_version_number = template.add_version(prompt_component, description)
+
+                change = {'op': 'add_version', 'version': new_version_number, 'base': base_version}
+                if self.service.save_template(template, change=change):
+                    return new_version_number
+                return None
         except Exception as e:
             print(f"새 버전 생성 실패: {e}")
             return None
 
+    @traced("DataHandler.export_template_to_text")
     def export_template_to_text(self, template_id: str, include_all_versions: bool = False) -> Optional[str]:
         """템플릿을 텍스트로 내보내기"""
         try:
@@ -253,37 +338,7 @@ class DataHandler:
             if not template:
                 return None
 
-            export_lines = []
-            export_lines.append(f"템플릿 이름: {template.name}")
-            export_lines.append(f"카테고리: {template.category.value}")
-            export_lines.append(f"태그: {', '.join(template.tags)}")
-            export_lines.append("=" * 80)
-            export_lines.append("")
-
-            if include_all_versions:
-                # 모든 버전 포함
-                for version in template.versions:
-                    export_lines.append(f"버전 {version.version}")
-                    if version.description:
-                        export_lines.append(f"설명: {version.description}")
-                    export_lines.append(f"생성일: {version.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-                    export_lines.append("-" * 80)
-                    export_lines.append(version.generated_prompt)
-                    export_lines.append("")
-                    export_lines.append("=" * 80)
-                    export_lines.append("")
-            else:
-                # 현재 버전만
-                current_version = template.get_current_version()
-                if current_version:
-                    export_lines.append(f"버전 {current_version.version} (현재)")
-                    if current_version.description:
-                        export_lines.append(f"설명: {current_version.description}")
-                    export_lines.append(f"생성일: {current_version.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-                    export_lines.append("-" * 80)
-                    export_lines.append(current_version.generated_prompt)
-
-            return "\n".join(export_lines)
+            return template_to_text(template, include_all_versions)
         except Exception as e:
             print(f"텍스트 내보내기 실패: {e}")
             return None
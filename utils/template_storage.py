@@ -14,6 +14,40 @@ import uuid
 from pathlib import Path
 
 from ai_prompt_maker.models import PromptTemplate, PromptCategory
+from ai_prompt_maker import journal, template_io
+from ai_prompt_maker.file_lock import template_lock
+from ai_prompt_maker.layout import TemplateLayout
+from ai_prompt_maker.filter_index import TemplateFilterIndex
+from ai_prompt_maker.tracing import traced
+
+
+class _SessionTemplateIndex:
+    """Category/tag index over the session template list.
+
+    Tied to one list object; TemplateStorageManager rebuilds it when the
+    session list is replaced and updates it in place on save/delete.
+    """
+
+    def __init__(self, templates: List[PromptTemplate]):
+        self.templates = templates
+        self.by_id: Dict[str, PromptTemplate] = {}
+        self.order: Dict[str, int] = {}
+        self.filters = TemplateFilterIndex()
+        for template in templates:
+            self.put(template)
+
+    def put(self, template: PromptTemplate):
+        self.by_id[template.template_id] = template
+        self.order.setdefault(template.template_id, len(self.order))
+        self.filters.put(template.template_id, template.category.value, template.tags)
+
+    def remove(self, template_id: str):
+        self.by_id.pop(template_id, None)
+        self.order.pop(template_id, None)
+        self.filters.remove(template_id)
+
+    def is_current(self, templates: List[PromptTemplate]) -> bool:
+        return self.templates is templates and len(self.by_id) == len(templates)
 
 
 class TemplateStorageManager:
@@ -24,7 +58,10 @@ class TemplateStorageManager:
     """
 
     STORAGE_KEY = "ai_prompt_maker_templates"
+    INDEX_KEY = "ai_prompt_maker_template_index"
     TEMPLATE_DIR = Path("ai_prompt_maker/templates")
+    FSYNC = False  # fsync template files on save (crash safety at the cost of latency)
+    LAYOUT = None  # "flat" or "sharded" for new template files (None: layout recorded in TEMPLATE_DIR)
 
     @classmethod
     def initialize(cls):
@@ -37,6 +74,7 @@ class TemplateStorageManager:
             cls._load_from_filesystem()
 
     @classmethod
+    @traced("TemplateStorageManager.save_template")
     def save_template(
         cls,
         name: str,
@@ -114,6 +152,11 @@ class TemplateStorageManager:
 
             st.session_state[cls.STORAGE_KEY] = templates
 
+            # Keep the category/tag index in step with the list
+            index = st.session_state.get(cls.INDEX_KEY)
+            if index is not None and index.templates is templates:
+                index.put(template)
+
             # Save to file system
             cls._save_to_filesystem(template)
 
@@ -126,6 +169,7 @@ class TemplateStorageManager:
             return False
 
     @classmethod
+    @traced("TemplateStorageManager.load_templates")
     def load_templates(cls, use_cache: bool = True) -> List[PromptTemplate]:
         """
         Load all templates from session state.
@@ -151,6 +195,7 @@ class TemplateStorageManager:
             return []
 
     @classmethod
+    @traced("TemplateStorageManager.load_template")
     def load_template(cls, template_id: str) -> Optional[PromptTemplate]:
         """
         Load a specific template by ID.
@@ -170,6 +215,55 @@ class TemplateStorageManager:
         return None
 
     @classmethod
+    def _index(cls) -> _SessionTemplateIndex:
+        """Category/tag index of the session templates (rebuilt if the list was replaced)."""
+        templates = cls.load_templates()
+        index = st.session_state.get(cls.INDEX_KEY)
+        if index is None or not index.is_current(templates):
+            index = _SessionTemplateIndex(templates)
+            st.session_state[cls.INDEX_KEY] = index
+        return index
+
+    @classmethod
+    @traced("TemplateStorageManager.filter_templates")
+    def filter_templates(
+        cls,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        tag_match: str = "any"
+    ) -> List[PromptTemplate]:
+        """
+        Filter session templates by category and tags using the secondary index.
+
+        Args:
+            category: Category value ("전체" or None means no filter)
+            tags: Tag filter
+            tag_match: "any" (at least one tag) or "all" (every tag)
+
+        Returns:
+            Matching templates in session order
+
+        Raises:
+            ValueError: Unknown tag_match
+        """
+        index = cls._index()
+        template_ids = index.filters.select(category, tags, tag_match)
+        if template_ids is None:
+            return list(index.templates)
+        return [index.by_id[template_id] for template_id in sorted(template_ids, key=index.order.__getitem__)]
+
+    @classmethod
+    def get_tag_counts(cls, category: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count session templates per tag (most used first).
+
+        Args:
+            category: Only count templates in this category ("전체" or None means all)
+        """
+        return cls._index().filters.tag_counts(category)
+
+    @classmethod
+    @traced("TemplateStorageManager.delete_template")
     def delete_template(cls, template_id: str) -> bool:
         """
         Delete a template from session state.
@@ -192,8 +286,15 @@ class TemplateStorageManager:
             templates = [t for t in templates if t.template_id != template_id]
 
             # Update session state
+            old_templates = st.session_state[cls.STORAGE_KEY]
             st.session_state[cls.STORAGE_KEY] = templates
 
+            # Move the category/tag index over to the new list
+            index = st.session_state.get(cls.INDEX_KEY)
+            if index is not None and index.templates is old_templates:
+                index.templates = templates
+                index.remove(template_id)
+
             # Delete from file system
             if len(templates) < original_count:
                 cls._delete_from_filesystem(template_id)
@@ -229,20 +330,25 @@ class TemplateStorageManager:
         }
 
     @classmethod
+    @traced("TemplateStorageManager._load_from_filesystem")
     def _load_from_filesystem(cls):
         """Load templates from file system into session state."""
         try:
             # Create directory if not exists
             cls.TEMPLATE_DIR.mkdir(parents=True, exist_ok=True)
 
-            # Load all JSON files
+            # Load all template files (flat and sharded layouts alike); an existing
+            # signing key lets signed files skip validation, but reading never creates one
+            signing_key = template_io.load_signing_key(cls.TEMPLATE_DIR, create=False)
             templates = []
-            for json_file in cls.TEMPLATE_DIR.glob("*.json"):
+            for json_file in template_io.template_files(cls.TEMPLATE_DIR):
                 try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        template = PromptTemplate.from_dict(data)
-                        templates.append(template)
+                    # Use the service loader so header-first and delta files load too,
+                    # with journaled version changes replayed on top of the snapshot.
+                    # It holds the shared template lock so writers in other workers
+                    # cannot swap the snapshot out from under us mid-read.
+                    template = journal.read_template(cls.TEMPLATE_DIR, json_file, signing_key)
+                    templates.append(template)
                 except Exception as e:
                     # Skip invalid files
                     print(f"Warning: Failed to load template from {json_file}: {e}")
@@ -263,12 +369,19 @@ class TemplateStorageManager:
             # Create directory if not exists
             cls.TEMPLATE_DIR.mkdir(parents=True, exist_ok=True)
 
-            # Save template as JSON file
-            filename = f"{template.template_id}.json"
-            filepath = cls.TEMPLATE_DIR / filename
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(template.to_dict(), f, ensure_ascii=False, indent=2)
+            # Write a signed header-first snapshot under the per-template lock shared
+            # with PromptMakerService, at the template's existing location (or where
+            # the directory's layout puts new files), and drop the now stale journal
+            layout = TemplateLayout(cls.TEMPLATE_DIR, cls.LAYOUT)
+            signing_key = template_io.load_signing_key(cls.TEMPLATE_DIR)
+            with template_lock(cls.TEMPLATE_DIR, template.template_id):
+                filepath = layout.resolve(template.template_id)
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                template_io.write_template(
+                    filepath, template, snapshot_id=uuid.uuid4().hex,
+                    fsync=cls.FSYNC, signing_key=signing_key
+                )
+                journal.TemplateJournal(cls.TEMPLATE_DIR).discard(template.template_id)
 
         except Exception as e:
             # Silent fail - template is still in session state
@@ -278,11 +391,12 @@ class TemplateStorageManager:
     def _delete_from_filesystem(cls, template_id: str):
         """Delete a template from file system."""
         try:
-            filename = f"{template_id}.json"
-            filepath = cls.TEMPLATE_DIR / filename
-
-            if filepath.exists():
-                filepath.unlink()
+            layout = TemplateLayout(cls.TEMPLATE_DIR, cls.LAYOUT)
+            with template_lock(cls.TEMPLATE_DIR, template_id):
+                filepath = layout.resolve(template_id)
+                if filepath.exists():
+                    filepath.unlink()
+                journal.TemplateJournal(cls.TEMPLATE_DIR).discard(template_id)
 
         except Exception as e:
             # Silent fail - template is already deleted from session state